@@ -2,6 +2,7 @@ import socket
 import struct
 import math
 from typing import Tuple, Union, Optional
+from lite6_client import get_client
 
 # =========================
 # CẤU HÌNH KẾT NỐI & HẰNG SỐ
@@ -91,64 +92,9 @@ def parse_response(resp: bytes):
 # =========================
 # CLIENT GIỮ KẾT NỐI
 # =========================
-class Lite6Client:
-    """Quản lý 1 socket giữ kết nối để giảm latency. KHÔNG thread-safe."""
-    def set_target(self, ip: str, port: int = 502):
-        self.ip = ip.strip()
-        self.port = int(port)
-        self.close()
-
-    def __init__(self, ip: str, port: int):
-        self.ip = ip
-        self.port = port
-        self.sock: Optional[socket.socket] = None
-
-    def _connect(self, timeout: float):
-        self.close()
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(timeout)
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        try:
-            s.connect((self.ip, self.port))
-        except Exception:
-            s.close()
-            raise
-        s.settimeout(SOCK_RECV_TIMEOUT)
-        self.sock = s
-
-    def close(self):
-        if self.sock is not None:
-            try:
-                self.sock.close()
-            finally:
-                self.sock = None
-
-    def send_and_recv(self, packet: bytes, timeout: float) -> bytes:
-        """Gửi packet và nhận phản hồi [header+body]. Tự reconnect 1 lần nếu rớt."""
-        if self.sock is None:
-            self._connect(timeout)
-        try:
-            self.sock.settimeout(timeout)
-            self.sock.sendall(packet)
-            header = recv_exact(self.sock, 6)
-            tid, proto, length = struct.unpack(">HHH", header)
-            if proto != PROTO_MAGIC:
-                raise ValueError(f"Sai PROTO: 0x{proto:04X}")
-            body = recv_exact(self.sock, length)
-            return header + body
-        except (TimeoutError, OSError, ValueError):
-            self._connect(timeout)
-            self.sock.settimeout(timeout)
-            self.sock.sendall(packet)
-            header = recv_exact(self.sock, 6)
-            tid, proto, length = struct.unpack(">HHH", header)
-            if proto != PROTO_MAGIC:
-                raise ValueError(f"Sai PROTO: 0x{proto:04X}")
-            body = recv_exact(self.sock, length)
-            return header + body
-
+# Dùng chung 1 socket với sdf.py (lite6_client): reader nền, khớp TID, thread-safe, tự reconnect
 # Singleton client cho module
-_client = Lite6Client(ROBOT_IP, ROBOT_PORT)
+_client = get_client(ROBOT_IP, ROBOT_PORT)
 
 # =========================
 # API TƯƠNG THÍCH GUI   
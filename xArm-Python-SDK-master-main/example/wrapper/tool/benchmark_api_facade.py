@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Benchmark: import time of the SDK and per call overhead of the XArmAPI facade (no robot required)
+
+The per call benchmark compares the forward method of XArmAPI (XArmAPI.get_position(arm), the old dispatch)
+with the method bound at construction (arm.get_position(), dispatches to XArm directly),
+the arm is not connected, so the call only goes through the decorators of XArm
+"""
+
+import os
+import sys
+import time
+import subprocess
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
+
+SDK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+
+
+def bench_import(count=10):
+    code = 'import time; t = time.perf_counter(); import xarm.wrapper; print(time.perf_counter() - t)'
+    env = dict(os.environ, PYTHONPATH=SDK_PATH)
+    costs = []
+    for _ in range(count):
+        out = subprocess.check_output([sys.executable, '-c', code], env=env, stderr=subprocess.DEVNULL)
+        costs.append(float(out.decode().strip().splitlines()[-1]))
+    costs.sort()
+    print('[import xarm.wrapper] count={}'.format(count))
+    print('    min: {:.2f} ms, median: {:.2f} ms'.format(costs[0] * 1000, costs[len(costs) // 2] * 1000))
+
+
+def bench_call(count=200000):
+    from xarm.wrapper import XArmAPI
+    from xarm.core.utils.log import logger
+    logger.setLevel(logger.CRITICAL)
+    arm = XArmAPI(do_not_open=True)
+
+    def bench(func):
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        return (time.perf_counter() - start) / count * 1e6
+
+    print('[get_position] count={}'.format(count))
+    print('    forward (XArmAPI.get_position): {:.3f} us/call'.format(bench(lambda: XArmAPI.get_position(arm))))
+    print('    direct  (arm.get_position):     {:.3f} us/call'.format(bench(lambda: arm.get_position())))
+
+
+if __name__ == '__main__':
+    bench_import()
+    bench_call()
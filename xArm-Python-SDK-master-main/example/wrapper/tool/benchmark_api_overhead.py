@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Benchmark: per call overhead of the API logging and the hot path APIs
+
+Usage:
+    python3 benchmark_api_overhead.py                   # only the logging benchmark (no robot required)
+    python3 benchmark_api_overhead.py 192.168.1.xxx     # also benchmark set_position(wait=False)/get_position
+        Note: set_position is called with the current position (no motion), the count is limited by the cmd cache
+
+Both benchmarks compare the eager formatting (the old style: every log msg is formatted with '...'.format(...)
+and passed to the logger, whatever the level) with the deferred formatting (the current style: %-style args,
+formatted by the logger only if the level is enabled), the logger level is WARNING (default).
+The API benchmark runs the current code as is (deferred) and with the old eager formatting patched in (eager).
+
+Reference (python 3.11, x86_64, a simulated controller on 127.0.0.1 without latency):
+    [log_api_info]               eager 2.3~4.2 us/call, deferred 0.35~0.6 us/call
+    [get_position]               eager 63~100 us/call,  deferred 74~91 us/call
+    The get_position difference (a few us) is under the run to run noise of the round trip, the saving per
+    logged API call is the log_api_info difference. set_position(wait=False) was not measured (the simulated
+    controller does not send the reports it needs), run it against a real arm to record it here.
+"""
+
+import os
+import sys
+import time
+import contextlib
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
+
+from xarm.core.utils.log import logger
+from xarm.x3.base import Base
+
+
+def bench(func, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def bench_logging(count=100000):
+    pos = [300.0, 0.0, 200.0, 3.1415926, 0.0, 0.0]
+
+    def eager():
+        Base.log_api_info('API -> set_position -> code={}, pos={}, radius={}, velo={}, acc={}'.format(
+            0, pos, -1, 100, 2000), code=0)
+
+    def deferred():
+        Base.log_api_info('API -> set_position -> code=%s, pos=%s, radius=%s, velo=%s, acc=%s',
+                          0, pos, -1, 100, 2000, code=0)
+
+    print('[log_api_info] level={}, count={}'.format(logger.getEffectiveLevel(), count))
+    print('    eager format:    {:.3f} us/call'.format(bench(eager, count)))
+    print('    deferred format: {:.3f} us/call'.format(bench(deferred, count)))
+
+
+@contextlib.contextmanager
+def eager_logging():
+    """
+    Patch the old behavior in: the msg is always formatted and the logger is always called
+    (isEnabledFor is True, so the guarded verbose logs of Port.write/read are also formatted)
+    """
+    is_enabled = logger.isEnabledFor
+
+    def eager(func, level):
+        def wrapper(msg, *args, **kwargs):
+            msg = msg % args if args else msg
+            if is_enabled(level):
+                func(msg, **kwargs)
+        return wrapper
+
+    levels = {'info': logger.INFO, 'debug': logger.DEBUG, 'verbose': logger.VERBOSE}
+    # some of them are instance attributes (verbose), restore them as they were
+    saved = {name: logger.__dict__[name] for name in list(levels.keys()) + ['isEnabledFor'] if name in logger.__dict__}
+    for name, level in levels.items():
+        setattr(logger, name, eager(getattr(logger, name), level))
+    logger.isEnabledFor = lambda level: True
+    try:
+        yield
+    finally:
+        for name in list(levels.keys()) + ['isEnabledFor']:
+            if name in saved:
+                setattr(logger, name, saved[name])
+            else:
+                delattr(logger, name)
+
+
+def bench_compare(name, func, count):
+    print('[{}] count={}'.format(name, count))
+    with eager_logging():
+        print('    eager format:    {:.3f} us/call'.format(bench(func, count)))
+    print('    deferred format: {:.3f} us/call'.format(bench(func, count)))
+
+
+def bench_api(ip, count=1000):
+    from xarm.wrapper import XArmAPI
+    arm = XArmAPI(ip)
+    arm.motion_enable(True)
+    arm.set_mode(0)
+    arm.set_state(0)
+    time.sleep(1)
+    bench(lambda: arm.get_position(), 100)  # warm up
+    bench_compare('get_position', lambda: arm.get_position(), count)
+    code, pos = arm.get_position()
+    if code == 0:
+        # keep the cmds in the cmd cache, avoid waiting for cmdnum < max_cmdnum
+        count = min(count, 256)
+        bench_compare('set_position(wait=False)', lambda: arm.set_position(*pos, wait=False), count)
+        arm.set_state(4)
+    arm.disconnect()
+
+
+if __name__ == '__main__':
+    bench_logging()
+    if len(sys.argv) >= 2:
+        bench_api(sys.argv[1])
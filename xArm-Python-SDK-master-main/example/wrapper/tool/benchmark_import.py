@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Benchmark: import time of the SDK, based on `python -X importtime` (no robot required)
+
+Usage:
+    python3 benchmark_import.py [top_n]
+        top_n: show the top n modules by the cumulative import time, default is 15
+
+Every statement is imported in a new process, the result is the median of several runs
+The heavy optional modules (numpy, multiprocessing, concurrent.futures) must not be loaded by the import,
+they are imported on first use
+"""
+
+import os
+import sys
+import subprocess
+
+SDK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+STATEMENTS = [
+    'import xarm',
+    'from xarm.wrapper import XArmAPI',
+]
+HEAVY_MODULES = ['numpy', 'multiprocessing', 'concurrent.futures']
+
+
+def importtime(statement):
+    env = dict(os.environ, PYTHONPATH=SDK_PATH)
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], env=env,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.PIPE).stderr.decode('utf-8')
+    modules = []
+    for line in out.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, self_us, cumulative_us, name = line.replace('import time:', '|').split('|')
+        name = name[1:].rstrip()
+        if name == 'site':
+            # the modules imported before are the interpreter startup
+            modules = []
+        else:
+            modules.append((int(cumulative_us), int(self_us), name))
+    return modules
+
+
+def bench(statement, count=5, top_n=15):
+    runs = [importtime(statement) for _ in range(count)]
+    # the top level modules (not indented) imported by the statement
+    totals = sorted(sum(cumulative for cumulative, _, name in modules if name == name.lstrip()) for modules in runs)
+    print('[{}] count={}, median: {:.2f} ms'.format(statement, count, totals[len(totals) // 2] / 1000))
+    loaded = sorted(set(name.strip() for _, _, name in runs[0]) & set(HEAVY_MODULES))
+    print('    heavy modules loaded: {}'.format(', '.join(loaded) if loaded else 'none'))
+    modules = sorted(runs[len(runs) // 2], reverse=True)[:top_n]
+    for cumulative, self_us, name in modules:
+        print('    {:>8.2f} ms (self {:>6.2f} ms)  {}'.format(cumulative / 1000, self_us / 1000, name.strip()))
+
+
+if __name__ == '__main__':
+    top_n = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    for statement in STATEMENTS:
+        bench(statement, top_n=top_n)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Benchmark: crc16 and the framing of the serial transport (no robot required, Linux/macOS)
+
+1. crc16: the per byte loop with the two tables (the old implementation) vs crc16.crc_modbus
+2. framing: Ux2HexProtocol.put called per byte (the old read pattern) vs per read
+3. pty: the frames are written to the master of a pty pair and read from the slave (the local stand-in of the RS485 link)
+    with pyserial (the same reads as SerialPort), or with os.read if pyserial is not installed
+"""
+
+import os
+import sys
+import time
+import queue
+import random
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
+
+from xarm.core.utils import crc16
+from xarm.core.comm.uxbus_cmd_protocol import Ux2HexProtocol
+from xarm.core.config.x_config import XCONF
+
+FROMID = XCONF.SerialConf.UXBUS_DEF_FROMID
+TOID = XCONF.SerialConf.UXBUS_DEF_TOID
+
+
+def crc_modbus_bytewise(data):
+    # the old implementation of crc16.crc_modbus
+    leng = len(data)
+    init_crch = 0xFF
+    init_crcl = 0xFF
+    i = 0
+    while leng > 0:
+        index = init_crch ^ data[i]
+        i += 1
+        init_crch = init_crcl ^ crc16.CRC_TABLE_H[index]
+        init_crcl = crc16.CRC_TABLE_L[index]
+        leng -= 1
+    s = init_crch << 8 | init_crcl
+    crc = bytes([s // 256 % 256])
+    crc += bytes([s % 256])
+    return crc
+
+
+def make_frames(count, max_len=40):
+    frames = []
+    for _ in range(count):
+        data = bytes([TOID, FROMID, random.randint(1, max_len)])
+        data += bytes(random.getrandbits(8) for _ in range(data[2]))
+        frames.append(data + crc16.crc_modbus(data))
+    return frames
+
+
+def bench_crc(count=20000):
+    print('[crc16] count={}'.format(count))
+    crc16.crc_modbus(bytes(8))  # build the table
+    for size in [8, 32, 64, 256]:
+        data = os.urandom(size)
+        assert crc_modbus_bytewise(data) == crc16.crc_modbus(data)
+        costs = []
+        for func in [crc_modbus_bytewise, crc16.crc_modbus]:
+            start = time.perf_counter()
+            for _ in range(count):
+                func(data)
+            costs.append((time.perf_counter() - start) / count * 1e6)
+        print('    {:>3d} bytes: bytewise {:.3f} us, crc_modbus {:.3f} us, x{:.2f}'.format(size, costs[0], costs[1], costs[0] / costs[1]))
+
+
+def bench_framing(count=20000):
+    frames = make_frames(count)
+    stream = b''.join(frames)
+    print('[framing] frames={}, bytes={}'.format(count, len(stream)))
+    for name, chunk in [('per byte', 1), ('per read (64 bytes)', 64), ('per read (4096 bytes)', 4096)]:
+        que = queue.Queue(count + 1)
+        parser = Ux2HexProtocol(que, FROMID, TOID)
+        start = time.perf_counter()
+        for i in range(0, len(stream), chunk):
+            parser.put(stream[i:i + chunk])
+        cost = time.perf_counter() - start
+        assert que.qsize() == count
+        print('    {:<22s} {:.3f} us/frame, {:.2f} MB/s'.format(name, cost / count * 1e6, len(stream) / cost / 1e6))
+
+
+def bench_pty(count=20000):
+    try:
+        import pty
+        import tty
+    except ImportError:
+        print('[pty] not supported on this platform')
+        return
+    try:
+        import serial
+    except ImportError:
+        serial = None
+    master, slave = pty.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    frames = make_frames(count)
+    stream = b''.join(frames)
+
+    def write_thread():
+        view = memoryview(stream)
+        while view:
+            n = os.write(master, view[:4096])
+            view = view[n:]
+
+    que = queue.Queue(count + 1)
+    parser = Ux2HexProtocol(que, FROMID, TOID)
+    if serial is not None:
+        com = serial.Serial(os.ttyname(slave), timeout=1)
+
+        def read():
+            data = com.read(com.in_waiting or 1)
+            in_waiting = com.in_waiting
+            if in_waiting:
+                data += com.read(in_waiting)
+            return data
+    else:
+        def read():
+            return os.read(slave, 4096)
+    t = threading.Thread(target=write_thread, daemon=True)
+    start = time.perf_counter()
+    t.start()
+    reads = 0
+    while que.qsize() < count and time.perf_counter() - start < 30:
+        data = read()
+        reads += 1
+        parser.put(data)
+    cost = time.perf_counter() - start
+    print('[pty] reader={}, frames={}/{}, reads={}, {:.3f} us/frame, {:.2f} MB/s'.format(
+        'pyserial' if serial is not None else 'os.read', que.qsize(), count, reads,
+        cost / count * 1e6, len(stream) / cost / 1e6))
+    os.close(master)
+    os.close(slave)
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    bench_crc()
+    bench_framing()
+    bench_pty()
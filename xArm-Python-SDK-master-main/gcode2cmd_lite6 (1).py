@@ -1,77 +1,43 @@
+import os
+
+from xarm.tools.gcode import compile_gcode
+
+HOME = (261., 0, 258.3)
+Z_OFFSET = 10
+DRAW_SPEED = 50      # mm/s, dùng khi G-code không có F
+TRAVEL_SPEED = 100   # mm/s
+BLEND_RADIUS = 1.0   # mm, bo góc giữa các đoạn vẽ để robot chạy liên tục
+
+
 if __name__ == "__main__":
     path = input("Enter path of G-code file:  ")
-    Z_offset = 10
     try:
         user_cordinate = input("Enter init coordinate in form x,y,z:  ").split(',')
         user_cordinate = list(map(float, user_cordinate))
     except ValueError:
         print("Invalid input format. Please enter coordinates in the form x,y,z.")
         exit()
-
-    try:
-        with open(path, 'r') as file:
-            data = file.readlines()
-    except FileNotFoundError:
+    if not os.path.isfile(path):
         print(f"File {path} not found.")
         exit()
 
-    with open('converted_output_lite6.txt', 'w') as output_file:
-        # Servo On & home position
-        output_file.write("arm.set_position(x=261., y=0, z=258.3, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-        output_file.write("time.sleep(0.1)\n")
-        # Initial pose
-        output_file.write(f"arm.set_position(x={user_cordinate[0]}, y={user_cordinate[1]}, z={user_cordinate[2] + Z_offset}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-        output_file.write("time.sleep(0.1)\n")
-        output_file.write(f"arm.set_position(x={user_cordinate[0]}, y={user_cordinate[1]}, z={user_cordinate[2]}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-        output_file.write("time.sleep(0.1)\n")
-        output_file.write(f"arm.set_position(x={user_cordinate[0]}, y={user_cordinate[1]}, z={user_cordinate[2] + Z_offset}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-        output_file.write("time.sleep(0.1)\n")
-        last_x = None
-        last_y = None
-
-        for line_index, line in enumerate(data, start=1):
-            line = line.strip()
-            if not (line.startswith("G00") or line.startswith("G01")):
-                continue
+    # G-code -> chương trình chuyển động trong bộ nhớ (poses/speeds/radii), không sinh file text nữa
+    program = compile_gcode(path, origin=user_cordinate, z_up=Z_OFFSET, orientation=(180, 0, 0),
+                            draw_speed=DRAW_SPEED, travel_speed=TRAVEL_SPEED, blend_radius=BLEND_RADIUS, home=HOME)
+    draw, travel = program.path_length()
+    print(f"Compiled {len(program)} points, draw {draw:.1f} mm, travel {travel:.1f} mm")
 
-            parts = line.split()
-            x_val = y_val = None
-            for p in parts:
-                if p.startswith("X"):
-                    x_val = float(p[1:])
-                elif p.startswith("Y"):
-                    y_val = float(p[1:])
-
-            if x_val is None or y_val is None:
-                continue  # bỏ nếu không đủ X, Y
-
-            real_x = user_cordinate[0] + x_val
-            real_y = user_cordinate[1] + y_val
-
-            if line.startswith("G00"):  # pen up → từ vị trí trước
-                if last_x is not None and last_y is not None:
-                    # Lên cao từ vị trí cũ
-                    output_file.write(f"arm.set_position(x={last_x:.4f}, y={last_y:.4f}, z={user_cordinate[2] + Z_offset:.4f}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-                    output_file.write("time.sleep(0.1)\n")
-                # Đến vị trí mới (cao)
-                output_file.write(f"arm.set_position(x={real_x:.4f}, y={real_y:.4f}, z={user_cordinate[2] + Z_offset:.4f}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-                output_file.write("time.sleep(0.1)\n")
-                # Hạ xuống
-                output_file.write(f"arm.set_position(x={real_x:.4f}, y={real_y:.4f}, z={user_cordinate[2]:.4f}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-                output_file.write("time.sleep(0.1)\n")
-
-            elif line.startswith("G01"):  # pen down
-                output_file.write(f"arm.set_position(x={real_x:.4f}, y={real_y:.4f}, z={user_cordinate[2]:.4f}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-                output_file.write("time.sleep(0.1)\n")
-
-            last_x = real_x
-            last_y = real_y
-
-        # Kết thúc → về home & tắt servo
-        output_file.write(f"arm.set_position(x={user_cordinate[0]}, y={user_cordinate[1]}, z={user_cordinate[2] + Z_offset}, roll=180, pitch=0, yaw=0, speed=50, wait=True)\n")
-        output_file.write("time.sleep(0.1)\n")
-        output_file.write("arm.set_position(x=261., y=0, z=258.3, roll=-180, pitch=0, yaw=0, speed=50, wait=True)\n")
-        output_file.write("time.sleep(0.1)\n")
-        output_file.write("arm.disconnect()\n")
+    ip = input("Enter robot IP (empty to exit):  ").strip()
+    if not ip:
+        exit()
 
-    print("Conversion completed. Output written to 'converted_output.txt'.")
+    from xarm.wrapper import XArmAPI
+    arm = XArmAPI(ip)
+    arm.motion_enable(enable=True)
+    arm.clean_error()
+    arm.set_mode(0)
+    arm.set_state(0)
+    # gửi theo lô (pipelined) và bo góc, robot không dừng ở từng điểm
+    code, codes = program.run(arm, wait=True)
+    print(f"Done, code={code}, sent={sum(1 for c in codes if c == 0)}/{len(program)}")
+    arm.disconnect()
@@ -0,0 +1,234 @@
+import socket
+import struct
+import threading
+import time
+from typing import Optional, Tuple
+
+from PySide2.QtCore import QThread, Signal
+
+from lite6_client import get_client
+
+# =========================
+# JOG (VELOCITY MODE) & REPORT WORKERS cho GUI (main.py, mcn/main.py)
+# =========================
+# JogThread: while a key is held, streams the cartesian velocity (reg 0x52, same as vc_set_cartesian_velocity)
+#   at a fixed rate on its own thread, every command carries a short duration, so the arm stops by itself
+#   if the stream stops (network hiccup, GUI freeze).
+# ReportThread: reads the real-time report (port 30003) and emits the TCP pose at most at the display rate.
+# Everything reaches the UI through Qt signals, the event loop never touches a socket.
+
+REG_SET_STATE = 0x0C
+REG_SET_MODE = 0x13
+REG_VC_SET_CARTV = 0x52
+
+MODE_POSITION = 0
+MODE_CARTESIAN_VELOCITY = 5
+
+JOG_RATE_HZ = 50.0           # tần số gửi vận tốc
+JOG_DURATION_FACTOR = 4.0    # duration = JOG_DURATION_FACTOR / rate, robot tự dừng nếu mất lệnh
+JOG_IDLE_EXIT_S = 1.0        # về position mode sau khi nhả phím
+JOG_SPEED_MAX = 50.0         # mm/s ứng với slider 100%
+JOG_RETRY_S = 0.2            # chờ sau lỗi, nhân đôi mỗi lần lỗi liên tiếp
+JOG_RETRY_MAX_S = 5.0
+JOG_RESTORE_MAX_FAILURES = 5  # bỏ khôi phục position mode sau số lần lỗi liên tiếp này
+REPORT_PORT = 30003
+REPORT_DISPLAY_HZ = 60.0
+
+
+def create_packet(register: int, params: bytes = b"") -> bytes:
+    # TID = 0, lite6_client gán TID riêng khi gửi
+    return struct.pack(">HHHB", 0, 0x0002, 1 + len(params), register) + params
+
+
+def cmd_set_mode(mode: int) -> bytes:
+    return create_packet(REG_SET_MODE, bytes([mode]))
+
+
+def cmd_set_state(state: int) -> bytes:
+    return create_packet(REG_SET_STATE, bytes([state]))
+
+
+def cmd_vc_set_cartesian_velocity(speeds, is_tool_coord: bool = False, duration: float = -1) -> bytes:
+    """speeds: [vx, vy, vz (mm/s), rx, ry, rz (rad/s)]"""
+    params = struct.pack("<6f", *speeds) + bytes([1 if is_tool_coord else 0])
+    if duration >= 0:
+        params += struct.pack("<f", duration)
+    return create_packet(REG_VC_SET_CARTV, params)
+
+
+class JogThread(QThread):
+    sent = Signal(bytes, bytes)     # (req, resp) của lệnh vận tốc
+    error = Signal(str)
+    mode_changed = Signal(int)
+
+    def __init__(self, ip: str, port: int = 502, rate: float = JOG_RATE_HZ, parent=None):
+        super().__init__(parent)
+        self._target = (ip, port)
+        self._rate = rate
+        self._lock = threading.Lock()
+        self._speeds = [0.0] * 6
+        self._running = True
+        # True chỉ khi chính thread này đã chuyển robot sang mode 5 và chưa trả về position mode
+        self._in_velocity_mode = False
+        self._reenter = False
+
+    def set_target(self, ip: str, port: int = 502):
+        with self._lock:
+            self._target = (ip.strip(), int(port))
+            self._speeds = [0.0] * 6
+
+    def set_velocity(self, vx: float = 0, vy: float = 0, vz: float = 0, rx: float = 0, ry: float = 0, rz: float = 0):
+        """Gọi từ GUI thread, chỉ cập nhật giá trị, không chặn."""
+        with self._lock:
+            self._speeds = [float(vx), float(vy), float(vz), float(rx), float(ry), float(rz)]
+
+    def stop_jog(self):
+        self.set_velocity()
+
+    def stop(self):
+        self._running = False
+        self.wait()
+
+    def _sleep(self, seconds: float):
+        # chờ theo từng đoạn ngắn để stop() không bị treo khi đang backoff
+        expired = time.monotonic() + seconds
+        while self._running and time.monotonic() < expired:
+            time.sleep(min(0.05, expired - time.monotonic()))
+
+    def _enter_mode(self, client, mode: int):
+        client.request(cmd_set_mode(mode), 1.0)
+        if mode == MODE_CARTESIAN_VELOCITY:
+            self._in_velocity_mode = True
+        client.request(cmd_set_state(0), 1.0)
+        # về position mode chỉ tính là xong khi cả hai lệnh thành công, lỗi thì thử lại
+        self._in_velocity_mode = mode == MODE_CARTESIAN_VELOCITY
+        self._reenter = False
+        self.mode_changed.emit(mode)
+
+    def run(self):
+        period = 1.0 / self._rate
+        duration = JOG_DURATION_FACTOR * period
+        last_move_time = 0.0
+        moving = False
+        failures = 0
+        next_time = time.monotonic()
+        while self._running:
+            with self._lock:
+                speeds = list(self._speeds)
+                ip, port = self._target
+            client = get_client(ip, port)
+            try:
+                if any(speeds):
+                    if not self._in_velocity_mode or self._reenter:
+                        self._enter_mode(client, MODE_CARTESIAN_VELOCITY)
+                    pkt = cmd_vc_set_cartesian_velocity(speeds, duration=duration)
+                    self.sent.emit(pkt, client.request(pkt, period * 5))
+                    moving = True
+                    last_move_time = time.monotonic()
+                elif moving:
+                    # nhả phím: gửi vận tốc 0 một lần
+                    pkt = cmd_vc_set_cartesian_velocity(speeds, duration=0)
+                    self.sent.emit(pkt, client.request(pkt, 1.0))
+                    moving = False
+                elif self._in_velocity_mode and time.monotonic() - last_move_time > JOG_IDLE_EXIT_S:
+                    self._enter_mode(client, MODE_POSITION)
+                failures = 0
+            except Exception as e:
+                moving = False
+                failures += 1
+                # chỉ vào lại mode 5 khi có phím giữ, không tự set_state(0) khi không có lệnh jog
+                self._reenter = self._in_velocity_mode
+                if self._in_velocity_mode and not any(speeds) and failures >= JOG_RESTORE_MAX_FAILURES:
+                    self._in_velocity_mode = False
+                    self.error.emit(f"Lỗi jog: {e}, bỏ qua khôi phục position mode sau {failures} lần lỗi")
+                else:
+                    self.error.emit(f"Lỗi jog: {e}")
+                self._sleep(min(JOG_RETRY_S * 2 ** (failures - 1), JOG_RETRY_MAX_S))
+                next_time = time.monotonic()
+            # nhịp cố định, không tích lũy trễ
+            next_time += period
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.monotonic()
+
+
+class ReportThread(QThread):
+    pose = Signal(tuple)    # (x, y, z, rx, ry, rz), mm / rad
+    state = Signal(int)
+    error = Signal(str)
+
+    def __init__(self, ip: str, port: int = REPORT_PORT, max_rate: float = REPORT_DISPLAY_HZ, parent=None):
+        super().__init__(parent)
+        self._target = (ip, port)
+        self._interval = 1.0 / max_rate
+        self._running = True
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    def set_target(self, ip: str, port: int = REPORT_PORT):
+        with self._lock:
+            self._target = (ip.strip(), int(port))
+        self._close()
+
+    def stop(self):
+        self._running = False
+        self._close()
+        self.wait()
+
+    def _close(self):
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    @staticmethod
+    def _decode(frame: bytes) -> Tuple[int, tuple]:
+        # real-time report: [len:4 BE][state/mode:1][cmdnum:2][angles:7f][pose:6f] ...
+        return frame[4] & 0x0F, struct.unpack_from("<6f", frame, 35)
+
+    def run(self):
+        last_emit = 0.0
+        last_state = None
+        while self._running:
+            with self._lock:
+                ip, port = self._target
+            try:
+                self._sock = socket.create_connection((ip, port), timeout=3.0)
+                self._sock.settimeout(3.0)
+                buf = bytearray()
+                while self._running:
+                    chunk = self._sock.recv(4096)
+                    if not chunk:
+                        raise ConnectionError("report socket closed")
+                    buf.extend(chunk)
+                    latest = None
+                    while len(buf) >= 4:
+                        size = struct.unpack_from(">I", buf)[0]
+                        if size < 59 or size > 4096:
+                            raise ConnectionError(f"report length sai: {size}")
+                        if len(buf) < size:
+                            break
+                        latest = bytes(buf[:size])
+                        del buf[:size]
+                    if latest is None:
+                        continue
+                    state, pose = self._decode(latest)
+                    if state != last_state:
+                        last_state = state
+                        self.state.emit(state)
+                    # chỉ emit theo tần số hiển thị, bỏ qua các frame ở giữa
+                    now = time.monotonic()
+                    if now - last_emit >= self._interval:
+                        last_emit = now
+                        self.pose.emit(pose)
+            except Exception as e:
+                if self._running:
+                    self.error.emit(f"Report {ip}:{port}: {e}")
+                    time.sleep(1.0)
+            finally:
+                self._close()
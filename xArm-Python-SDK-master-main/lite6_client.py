@@ -0,0 +1,218 @@
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Optional, Tuple
+
+# =========================
+# RAW-PROTOCOL CLIENT (Lite6, port 502)
+# =========================
+# One persistent socket per robot, shared by the GUI scripts (sdf.py, anhooa.py, mcn/anhooa.py):
+#   - a background reader thread matches the responses to the requests by the transaction id
+#   - request()/submit() are thread-safe, every request gets a Future
+#   - the connection is re-established automatically (with backoff) on the next request after a drop
+# The packets built by the scripts carry fixed TIDs (tid=71 ...), so the client rewrites the TID on the
+# wire with its own counter and puts the original TID back into the response.
+
+PROTO_MAGIC = 0x0002
+HEADER = struct.Struct(">HHH")
+
+CONNECT_TIMEOUT = 3.0
+REQUEST_TIMEOUT = 5.0
+RECONNECT_BACKOFF_BASE = 0.1
+RECONNECT_BACKOFF_MAX = 2.0
+
+
+class Lite6RawClient:
+    """Thread-safe client of the Lite6 raw protocol with a persistent socket."""
+
+    def __init__(self, ip: str, port: int = 502, connect_timeout: float = CONNECT_TIMEOUT):
+        self.ip = ip
+        self.port = int(port)
+        self.connect_timeout = connect_timeout
+        self.sock: Optional[socket.socket] = None
+        self.last_req: bytes = b""
+        self.last_resp: bytes = b""
+        self._lock = threading.Lock()          # socket/connect
+        self._pending_lock = threading.Lock()  # pending/tid
+        self._pending: Dict[int, Tuple[Future, bytes]] = {}
+        self._tid = 0
+        self._reader: Optional[threading.Thread] = None
+        self._reconnect_attempt = 0
+        self._next_connect_time = 0.0
+        self.stats = {"requests": 0, "connects": 0, "drops": 0, "timeouts": 0}
+
+    # ---------- connection ----------
+    @property
+    def connected(self) -> bool:
+        return self.sock is not None
+
+    def close(self):
+        with self._lock:
+            self._close_locked(ConnectionError("client closed"))
+
+    def _close_locked(self, exc: Exception):
+        sock, self.sock = self.sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        self._fail_pending(exc)
+
+    def _connect_locked(self):
+        # backoff between the failed attempts, so a dead robot does not block every key-repeat for the full timeout
+        delay = self._next_connect_time - time.monotonic()
+        if delay > 0:
+            raise ConnectionError(f"reconnect to {self.ip}:{self.port} in {delay:.2f}s")
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(self.connect_timeout)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            s.connect((self.ip, self.port))
+        except OSError:
+            s.close()
+            self._reconnect_attempt += 1
+            backoff = min(RECONNECT_BACKOFF_MAX, RECONNECT_BACKOFF_BASE * (2 ** (self._reconnect_attempt - 1)))
+            self._next_connect_time = time.monotonic() + backoff
+            raise
+        s.settimeout(None)
+        self._reconnect_attempt = 0
+        self._next_connect_time = 0.0
+        self.sock = s
+        self.stats["connects"] += 1
+        self._reader = threading.Thread(target=self._read_loop, args=(s,), name="lite6-reader", daemon=True)
+        self._reader.start()
+
+    # ---------- reader ----------
+    def _read_loop(self, sock: socket.socket):
+        buf = bytearray()
+        try:
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    raise ConnectionError("socket closed by the robot")
+                buf.extend(chunk)
+                # parse all the complete frames in the buffer
+                while len(buf) >= HEADER.size:
+                    tid, proto, length = HEADER.unpack_from(buf)
+                    if proto != PROTO_MAGIC:
+                        raise ConnectionError(f"Sai PROTO: 0x{proto:04X}")
+                    end = HEADER.size + length
+                    if len(buf) < end:
+                        break
+                    frame = bytes(buf[:end])
+                    del buf[:end]
+                    self._dispatch(tid, frame)
+        except (OSError, ConnectionError) as e:
+            with self._lock:
+                if self.sock is sock:
+                    self.stats["drops"] += 1
+                    self._close_locked(e if isinstance(e, ConnectionError) else ConnectionError(str(e)))
+
+    def _dispatch(self, tid: int, frame: bytes):
+        with self._pending_lock:
+            item = self._pending.pop(tid, None)
+        if item is None:
+            return  # late response of a timed-out request
+        future, orig_tid = item
+        resp = orig_tid + frame[2:]
+        self.last_resp = resp
+        if not future.done():
+            future.set_result(resp)
+
+    def _fail_pending(self, exc: Exception):
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    # ---------- requests ----------
+    def _alloc_tid(self) -> int:
+        # called with _pending_lock held, skip the TIDs still waiting for the response
+        for _ in range(0x10000):
+            self._tid = self._tid % 0xFFFF + 1
+            if self._tid not in self._pending:
+                return self._tid
+        raise RuntimeError("too many pending requests")
+
+    def submit(self, packet: bytes) -> Future:
+        """Send the packet (built with any TID) without waiting, the Future gets the response [header+body].
+        A failed connect is set on the Future as ConnectionError (future.sent=False), like a failed send."""
+        if len(packet) < HEADER.size + 1:
+            raise ValueError("Gói tin quá ngắn")
+        future: Future = Future()
+        with self._lock:
+            if self.sock is None:
+                try:
+                    self._connect_locked()
+                except OSError as e:
+                    future.sent = False  # the packet never left, request() may resend it after the backoff
+                    future.set_exception(e if isinstance(e, ConnectionError) else ConnectionError(str(e)))
+                    return future
+            with self._pending_lock:
+                tid = self._alloc_tid()
+                self._pending[tid] = (future, packet[:2])
+            self.last_req = packet
+            self.stats["requests"] += 1
+            try:
+                self.sock.sendall(struct.pack(">H", tid) + packet[2:])
+            except OSError as e:
+                self.stats["drops"] += 1
+                future.sent = False  # the packet never left, request() may resend it
+                self._close_locked(ConnectionError(str(e)))
+        return future
+
+    def request(self, packet: bytes, timeout: float = REQUEST_TIMEOUT, retries: int = 1, idempotent: bool = False) -> bytes:
+        """Send the packet and wait for the response.
+        If the connection drops, the packet is resent on a new connection only if it was never sent,
+        a sent packet (ex: a move) may already run on the controller, resend it only if idempotent=True (queries)."""
+        while True:
+            future = self.submit(packet)
+            try:
+                return future.result(timeout)
+            except FutureTimeoutError:
+                self.stats["timeouts"] += 1
+                with self._pending_lock:
+                    for tid, item in list(self._pending.items()):
+                        if item[0] is future:
+                            del self._pending[tid]
+                raise TimeoutError(f"Không nhận được phản hồi sau {timeout}s")
+            except ConnectionError:
+                if retries <= 0 or (getattr(future, "sent", True) and not idempotent):
+                    raise
+                retries -= 1
+                # wait for the backoff of the failed connect, else the next attempt fails at once
+                delay = self._next_connect_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+    def send_and_recv(self, packet: bytes, timeout: float) -> bytes:
+        # same signature as the old Lite6Client
+        return self.request(packet, timeout)
+
+    def get_last_io_hex(self) -> Tuple[str, str]:
+        def hx(b: bytes):
+            return " ".join(f"{x:02X}" for x in b[:1024])
+        return hx(self.last_req), hx(self.last_resp)
+
+
+# =========================
+# SHARED CLIENTS
+# =========================
+_clients: Dict[Tuple[str, int], Lite6RawClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(ip: str, port: int = 502) -> Lite6RawClient:
+    """The shared client of the robot, the scripts talking to the same robot share one socket."""
+    key = (ip.strip(), int(port))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = Lite6RawClient(*key)
+        return client
@@ -1,5 +1,5 @@
 from PySide2.QtWidgets import QApplication, QMainWindow
-from PySide2.QtCore import QTimer, QStringListModel
+from PySide2.QtCore import QStringListModel
 import sys
 from gui import Ui_MainWindow  # giữ nguyên .ui đã compile
 from PySide2.QtCore import Qt
@@ -20,6 +20,8 @@ from anhooa import (
 from sdf import (cmd_move_xyz_speed_based, send_cmd,parse_resp
     
 )
+from anhooa import ROBOT_IP, ROBOT_PORT
+from jog_worker import JogThread, ReportThread, JOG_SPEED_MAX
 
 
 class MainWindow(QMainWindow):
@@ -50,10 +52,11 @@ class MainWindow(QMainWindow):
         self.ui.label_16.setWordWrap(True)
 
 
-        # ==== Timer cập nhật vị trí TCP (5 Hz) ====
-        self.timer_pos = QTimer(self)
-        self.timer_pos.timeout.connect(self.update_position)
-        self.timer_pos.start(200)
+        # ==== Pose TCP từ report (port 30003), không poll trên GUI thread ====
+        self.report_thread = ReportThread(ROBOT_IP)
+        self.report_thread.pose.connect(self.update_position)
+        self.report_thread.error.connect(self.ui.label_16.setText)
+        self.report_thread.start()
 
         # ==== List log flags ====
         self.flag_model = QStringListModel([])
@@ -93,10 +96,11 @@ class MainWindow(QMainWindow):
         self.ui.pushButton_7.pressed.connect(lambda: self.set_key("zm", True))
         self.ui.pushButton_7.released.connect(lambda: self.set_key("zm", False))
 
-        # ==== Timer move liên tục (20 Hz) ====
-        self.move_timer = QTimer(self)
-        self.move_timer.timeout.connect(self.continuous_move)
-        self.move_timer.start(100)
+        # ==== Jog vận tốc liên tục (worker thread, 50 Hz) ====
+        self.jog_thread = JogThread(ROBOT_IP, ROBOT_PORT)
+        self.jog_thread.sent.connect(self._on_jog_sent)
+        self.jog_thread.error.connect(self.ui.label_16.setText)
+        self.jog_thread.start()
 
         # ==== Slider tốc độ ====
         self.ui.horizontalSlider_7.setMinimum(0)
@@ -106,6 +110,7 @@ class MainWindow(QMainWindow):
     
     def set_key(self, key, value):
         self.key_state[key] = value
+        self.continuous_move()
 
     def _hex0x(self, b: bytes) -> str:
         return " ".join(f"0x{x:02X}" for x in b)
@@ -218,21 +223,15 @@ class MainWindow(QMainWindow):
         self.ui.listView.scrollToBottom()
 
     # ---------- Live pose ----------
-    def update_position(self):
-        try:
-            res = read_cartesian_position()
-            if isinstance(res, tuple) and len(res) == 6:
-                x, y, z, rx, ry, rz = res
-                self.ui.textEdit_2.setPlainText(f"{x:.1f}")
-                self.ui.textEdit_3.setPlainText(f"{y:.1f}")
-                self.ui.textEdit_4.setPlainText(f"{z:.1f}")
-                self.ui.textEdit_5.setPlainText(f"{rx:.2f}")
-                self.ui.textEdit_7.setPlainText(f"{ry:.2f}")
-                self.ui.textEdit_6.setPlainText(f"{rz:.2f}")
-            else:
-                self.ui.label_16.setText(str(res))
-        except Exception as e:
-            self.ui.label_16.setText(f"Lỗi pose: {e}")
+    def update_position(self, pose):
+        # slot của ReportThread.pose (mm / rad)
+        x, y, z, rx, ry, rz = pose
+        self.ui.textEdit_2.setPlainText(f"{x:.1f}")
+        self.ui.textEdit_3.setPlainText(f"{y:.1f}")
+        self.ui.textEdit_4.setPlainText(f"{z:.1f}")
+        self.ui.textEdit_5.setPlainText(f"{rx:.2f}")
+        self.ui.textEdit_7.setPlainText(f"{ry:.2f}")
+        self.ui.textEdit_6.setPlainText(f"{rz:.2f}")
 
     # ---------- Command handlers ----------
     def handle_enable_robot(self):
@@ -315,29 +314,19 @@ class MainWindow(QMainWindow):
 
     # ---------- Move ----------
     def continuous_move(self):
+        # chỉ cập nhật vận tốc cho JogThread, việc gửi lệnh nằm ở worker thread
         speed_scale = max(0, min(100, self.ui.horizontalSlider_7.value())) / 100.0
-        step = 1.0 * speed_scale
-        dx = (self.key_state["xp"] - self.key_state["xm"]) * step
-        dy = (self.key_state["yp"] - self.key_state["ym"]) * step
-        dz = (self.key_state["zp"] - self.key_state["zm"]) * step
-        if dx or dy or dz:
-            try:
-                pose = read_cartesian_position()
-                if not (isinstance(pose, tuple) and len(pose) >= 3):
-                    self.ui.label_16.setText("Pose không hợp lệ để tính đích")
-                    return
-                cx, cy, cz = pose[0], pose[1], pose[2]
-                tx, ty, tz = cx + dx, cy + dy, cz + dz
-
-                req_b, resp_b = self._call_req_resp(move_xyz_offset_gui, dx=dx, dy=dy, dz=dz)
-
-                # hiển thị đúng format
-                self._show_req_resp_block(req_b, resp_b)
-
-                if isinstance(resp_b, (bytes, bytearray)) and len(resp_b) >= 8:
-                    self._append_flags(resp_b, f"Move tới X={tx:.2f} Y={ty:.2f} Z={tz:.2f}")
-            except Exception as e:
-                self.ui.label_16.setText(f"Lỗi move: {e}")
+        v = JOG_SPEED_MAX * speed_scale
+        vx = (self.key_state["xp"] - self.key_state["xm"]) * v
+        vy = (self.key_state["yp"] - self.key_state["ym"]) * v
+        vz = (self.key_state["zp"] - self.key_state["zm"]) * v
+        self.jog_thread.set_velocity(vx, vy, vz)
+
+    def _on_jog_sent(self, req_b: bytes, resp_b: bytes):
+        self._show_req_resp_block(req_b, resp_b)
+        # chỉ log flag khi robot báo lỗi/cảnh báo, tránh 50 dòng/giây
+        if len(resp_b) >= 8 and resp_b[7] & 0xF0:
+            self._append_flags(resp_b, "Jog")
 
     # đơn bước (nếu cần)
     def move_and_update(self, dx=0, dy=0, dz=0):
@@ -367,6 +356,8 @@ class MainWindow(QMainWindow):
         logs.append(result)
         self.flag_model.setStringList(logs)
         self.ui.listView.scrollToBottom()
+        self.continuous_move()
+
     def handle_move(self):
         try:
             # Lấy tọa độ từ các trường nhập liệu trong GUI
@@ -400,6 +391,10 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.ui.label_16.setText(f"Error: {e}")
 
+    def closeEvent(self, event):
+        self.jog_thread.stop()
+        self.report_thread.stop()
+        super().closeEvent(event)
 
 
 
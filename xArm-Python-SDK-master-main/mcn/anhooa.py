@@ -1,10 +1,15 @@
 
+import os
+import sys
 import socket
 import struct
 import time
 import math
 from typing import Tuple, Optional
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lite6_client import get_client
+
 # =========================
 # CẤU HÌNH KẾT NỐI & HẰNG SỐ
 # =========================
@@ -80,74 +85,15 @@ def create_lite6_packet(tid: int, register: int, params: bytes = b"") -> bytes:
     )
     return pkt
 
-class Lite6Client:
-    def __init__(self, ip: str, port: int):
-        self.ip = ip
-        self.port = port
-        self.sock: Optional[socket.socket] = None
-        self.last_req: bytes = b""
-        self.last_resp: bytes = b""
-
-    def close(self):
-        if self.sock:
-            try:
-                self.sock.close()
-            except Exception:
-                pass
-        self.sock = None
-
-    def _connect(self, timeout: float):
-        self.close()
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(timeout)
-        s.connect((self.ip, self.port))
-        self.sock = s
-
-    def set_target(self, ip: str, port: int = 502):
-        self.ip = ip.strip()
-        self.port = int(port)
-        self.close()
-
-    def get_last_io_hex(self) -> Tuple[str, str]:
-        def hx(b: bytes):
-            return " ".join(f"{x:02X}" for x in b[:1024])
-        return hx(self.last_req), hx(self.last_resp)
-
-    def send_and_recv(self, packet: bytes, timeout: float) -> bytes:
-        if self.sock is None:
-            self._connect(timeout)
-        try:
-            self.last_req = packet
-            self.sock.settimeout(timeout)
-            self.sock.sendall(packet)
-            header = recv_exact(self.sock, 6)
-            tid, proto, length = struct.unpack(">HHH", header)
-            if proto != PROTO_MAGIC:
-                raise ValueError(f"Sai PROTO: 0x{proto:04X}")
-            body = recv_exact(self.sock, length)
-            self.last_resp = header + body
-            return header + body
-        except (TimeoutError, OSError, ValueError):
-            # thử reconnect 1 lần
-            self._connect(timeout)
-            self.last_req = packet
-            self.sock.sendall(packet)
-            header = recv_exact(self.sock, 6)
-            tid, proto, length = struct.unpack(">HHH", header)
-            if proto != PROTO_MAGIC:
-                raise ValueError(f"Sai PROTO: 0x{proto:04X}")
-            body = recv_exact(self.sock, length)
-            self.last_resp = header + body
-            return header + body
-
-# client mặc định
-_client = Lite6Client(ROBOT_IP, ROBOT_PORT)
+# client mặc định, dùng chung 1 socket (lite6_client): reader nền, khớp TID, thread-safe, tự reconnect
+_client = get_client(ROBOT_IP, ROBOT_PORT)
 
 # =========================
 # API NGOÀI: TARGET & LOG IO
 # =========================
 def set_robot_target(ip: str, port: int = 502) -> str:
-    _client.set_target(ip, port)
+    global _client
+    _client = get_client(ip, port)
     return f"🔌 Target: {ip}:{port}"
 
 def get_last_io_hex() -> Tuple[str, str]:
@@ -1,6 +1,6 @@
 
 from PySide2.QtWidgets import QApplication, QMainWindow
-from PySide2.QtCore import QTimer
+from PySide2.QtCore import Qt
 from gui import Ui_MainWindow
 
 from anhooa import (
@@ -8,8 +8,10 @@ from anhooa import (
     read_cartesian_position, move_xyz_offset_gui, set_speed_percent,
     return_to_zero_from_speed,
     set_robot_target, get_last_io_hex,
-    open_gripper_safe, close_gripper_safe, stop_gripper_safe
+    open_gripper_safe, close_gripper_safe, stop_gripper_safe,
+    ROBOT_IP, ROBOT_PORT
 )
+from jog_worker import JogThread, ReportThread, JOG_SPEED_MAX  # anhooa đã thêm thư mục gốc vào sys.path
 
 import sys
 
@@ -57,15 +59,21 @@ class MainWindow(QMainWindow):
         if hasattr(self.ui, "pushButton_15"):
             self.ui.pushButton_15.clicked.connect(lambda: self.bump_speed(+5))
 
-        # Timer chuyển động liên tục (nếu có phím giữ)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.continuous_move)
-        self.timer.start(60)  # ~16Hz
+        # Jog vận tốc liên tục trên worker thread (phím mũi tên: X/Y, PageUp/PageDown: Z)
+        self.jog_thread = JogThread(ROBOT_IP, ROBOT_PORT)
+        self.jog_thread.sent.connect(lambda req, resp: self.update_req_resp_hex())
+        self.jog_thread.error.connect(self.show_status)
+        self.jog_thread.start()
 
-        # Timer đọc Pose định kỳ để hiển thị
-        self.pose_timer = QTimer(self)
-        self.pose_timer.timeout.connect(self.update_pose_view)
-        self.pose_timer.start(500)
+        # Pose từ report (port 30003) thay cho poll định kỳ
+        self.report_thread = ReportThread(ROBOT_IP)
+        self.report_thread.pose.connect(self.update_pose_view)
+        self.report_thread.error.connect(self.show_status)
+        self.report_thread.start()
+
+    def show_status(self, msg: str):
+        if hasattr(self.ui, "label_16"):
+            self.ui.label_16.setText(msg)
 
     # ======= Hiển thị gói tin hex =======
     def update_req_resp_hex(self):
@@ -86,6 +94,8 @@ class MainWindow(QMainWindow):
                 self.ui.label_16.setText("⚠️ Chưa nhập IP")
             return
         msg = set_robot_target(ip, 502)
+        self.jog_thread.set_target(ip, 502)
+        self.report_thread.set_target(ip)
         if hasattr(self.ui, "label_16"):
             self.ui.label_16.setText(msg)
 
@@ -140,33 +150,58 @@ class MainWindow(QMainWindow):
         result = set_speed_percent(val)
         if hasattr(self.ui, "label_14"):
             self.ui.label_14.setText(f"{val}%")
+        self.continuous_move()
         # không ghi đè label_16 để chừa hiển thị response
 
+    _JOG_KEYS = {
+        Qt.Key_Right: "xp", Qt.Key_Left: "xm",
+        Qt.Key_Up: "yp", Qt.Key_Down: "ym",
+        Qt.Key_PageUp: "zp", Qt.Key_PageDown: "zm",
+    }
+
+    def keyPressEvent(self, event):
+        key = self._JOG_KEYS.get(event.key())
+        if key is None or event.isAutoRepeat():
+            return super().keyPressEvent(event)
+        self.key_state[key] = 1
+        self.continuous_move()
+
+    def keyReleaseEvent(self, event):
+        key = self._JOG_KEYS.get(event.key())
+        if key is None or event.isAutoRepeat():
+            return super().keyReleaseEvent(event)
+        self.key_state[key] = 0
+        self.continuous_move()
+
     def continuous_move(self):
-        # Nếu bạn có phím giữ trong GUI, cập nhật self.key_state theo sự kiện phím
-        # Ở đây demo: không dùng phím, hàm sẽ không gửi move nếu không có dx/dy/dz
-        return
-
-    def update_pose_view(self):
-        pose = read_cartesian_position()
-        if isinstance(pose, tuple) and len(pose) == 6:
-            x, y, z, rx, ry, rz = pose
-            if hasattr(self.ui, "label_12"):
-                self.ui.label_12.setText(f"{x:.1f}")
-            if hasattr(self.ui, "label_17"):
-                self.ui.label_17.setText(f"{y:.1f}")
-            if hasattr(self.ui, "label_18"):
-                self.ui.label_18.setText(f"{z:.1f}")
-            if hasattr(self.ui, "label_19"):
-                self.ui.label_19.setText(f"{rx:.2f}")
-            if hasattr(self.ui, "label_20"):
-                self.ui.label_20.setText(f"{ry:.2f}")
-            if hasattr(self.ui, "label_21"):
-                self.ui.label_21.setText(f"{rz:.2f}")
-            self.update_req_resp_hex()
-        else:
-            # có thể hiển thị chuỗi lỗi nếu muốn
-            pass
+        # chỉ cập nhật vận tốc, JogThread gửi lệnh ở nhịp cố định khi còn giữ phím
+        speed = 100
+        if hasattr(self.ui, "horizontalSlider_7"):
+            speed = max(0, min(100, self.ui.horizontalSlider_7.value()))
+        v = JOG_SPEED_MAX * speed / 100.0
+        ks = self.key_state
+        self.jog_thread.set_velocity((ks["xp"] - ks["xm"]) * v, (ks["yp"] - ks["ym"]) * v, (ks["zp"] - ks["zm"]) * v)
+
+    def update_pose_view(self, pose):
+        # slot của ReportThread.pose (mm / rad)
+        x, y, z, rx, ry, rz = pose
+        if hasattr(self.ui, "label_12"):
+            self.ui.label_12.setText(f"{x:.1f}")
+        if hasattr(self.ui, "label_17"):
+            self.ui.label_17.setText(f"{y:.1f}")
+        if hasattr(self.ui, "label_18"):
+            self.ui.label_18.setText(f"{z:.1f}")
+        if hasattr(self.ui, "label_19"):
+            self.ui.label_19.setText(f"{rx:.2f}")
+        if hasattr(self.ui, "label_20"):
+            self.ui.label_20.setText(f"{ry:.2f}")
+        if hasattr(self.ui, "label_21"):
+            self.ui.label_21.setText(f"{rz:.2f}")
+
+    def closeEvent(self, event):
+        self.jog_thread.stop()
+        self.report_thread.stop()
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)
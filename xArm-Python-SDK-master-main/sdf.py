@@ -2,6 +2,7 @@ import socket
 import struct
 import time
 import math
+from lite6_client import get_client
 
 # ================== Cấu hình ==================
 ROBOT_IP = "192.168.1.165"
@@ -37,33 +38,15 @@ def create_packet(tid: int, register: int, params: bytes = b"") -> bytes:
     return to_be_u16(tid) + to_be_u16(proto) + to_be_u16(length) + bytes([register]) + params
 
 def send_cmd(packet: bytes, timeout: float) -> bytes:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.settimeout(timeout)
-        s.connect((ROBOT_IP, ROBOT_PORT))
-        s.sendall(packet)
-        
-        # Nhận header (6 byte)
-        header = recv_all(s, 6)
-        if len(header) != 6:
-            raise TimeoutError("Không nhận đủ 6 byte header.")
-        
-        # Giải mã thông tin từ header
-        _, _, length = struct.unpack(">HHH", header)
-        
-        # Nhận body
-        body = recv_all(s, length)
-        if len(body) != length:
-            raise TimeoutError(f"Không nhận đủ body ({len(body)}/{length}).")
-        
-        # Xử lý phản hồi
-        req_b = header + packet  # Gửi gói lệnh đi, lấy lại `header` và `packet` để làm `req_b`
-        resp_b = header + body   # Gọi body để lấy `resp_b`
-
-        # Debug: In ra request và response
-        print(f"Request: {req_b}")
-        print(f"Response: {resp_b}")
-        
-        return req_b, resp_b
+    # Dùng chung 1 socket giữ kết nối (lite6_client) thay vì mở TCP mới cho mỗi gói
+    resp_b = get_client(ROBOT_IP, ROBOT_PORT).request(packet, timeout)
+    req_b = packet
+
+    # Debug: In ra request và response
+    print(f"Request: {req_b}")
+    print(f"Response: {resp_b}")
+
+    return req_b, resp_b
 
 
 def parse_resp(data: bytes) -> str:
@@ -130,7 +113,7 @@ def main():
                      ("Enable All Joints", cmd_enable_all),
                      ("Enter Motion Mode", cmd_enter_motion_mode)]:
         try:
-            resp = send_cmd(fn(), SOCK_TIMEOUT_SHORT)
+            _, resp = send_cmd(fn(), SOCK_TIMEOUT_SHORT)
             print(f"{name}: {parse_resp(resp)}")
         except Exception as e:
             print(f"{name}: lỗi -> {e}")
@@ -162,7 +145,7 @@ def main():
             speed_mm_s=speed, acc_mm_s2=acc,
             coord_system=0, absolute_pose=0, tid=71
         )
-        resp = send_cmd(pkt, SOCK_TIMEOUT_MOVE)
+        _, resp = send_cmd(pkt, SOCK_TIMEOUT_MOVE)
         print("Move:", parse_resp(resp))
     except Exception as e:
         print("Move: lỗi ->", e)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import unittest
+
+from xarm.wrapper import arm_process
+
+
+class _FakeArm(object):
+    connected = True
+    _state = 2
+    _mode = 1
+    _error_code = 0
+    _warn_code = 0
+    _cmd_num = 3
+    _angles = [0.1 * i for i in range(7)]
+    _position = [100, 200, 300, 3.14, 0, 0]
+    _joints_torque = [0.5] * 7
+    _realtime_joint_speeds = [0.0] * 7
+    _ft_ext_force = [0.0] * 6
+    _cgpio_states = [0, 0, 255, 255, 0, 0, 1.0, 2.0, 3.0, 4.0]
+
+
+class TestStateSeqlock(unittest.TestCase):
+    def setUp(self):
+        self.buf = bytearray(arm_process._STATE_OFFSET + arm_process._STATE.size)
+        self.publisher = arm_process._StatePublisher(self.buf)
+
+    def test_layout(self):
+        # the counter, the crc and the state do not overlap
+        self.assertLessEqual(arm_process._CRC_OFFSET, arm_process._STATE_OFFSET - arm_process._CRC.size)
+        self.assertGreaterEqual(arm_process._CRC_OFFSET, arm_process._SEQ.size)
+        # read_state() slices the flat values into the ArmState fields
+        self.assertEqual(len(arm_process._STATE.unpack(bytes(arm_process._STATE.size))), 51)
+        self.assertEqual(len(arm_process.ArmState._fields), 16)
+
+    def test_publish_and_read(self):
+        self.assertEqual(arm_process._read_state(self.buf), (0, arm_process._STATE.unpack(bytes(arm_process._STATE.size))))
+        self.publisher.publish(_FakeArm())
+        self.publisher.publish(_FakeArm(), is_report=False)
+        seq, values = arm_process._read_state(self.buf)
+        self.assertEqual(seq, 2)
+        self.assertEqual(values[1:8], (1, 2, 1, 0, 0, 3, 1))
+        self.assertEqual(list(values[8:15]), _FakeArm._angles)
+        self.assertEqual(list(values[47:51]), [1.0, 2.0, 3.0, 4.0])
+
+    def test_torn_read_is_retried(self):
+        self.publisher.publish(_FakeArm())
+        # the counter is even but the data is not the published one (the stores are seen out of order)
+        self.buf[arm_process._STATE_OFFSET + 20] ^= 0xFF
+        self.assertIsNone(arm_process._read_state(self.buf, spins=10))
+        self.buf[arm_process._STATE_OFFSET + 20] ^= 0xFF
+        self.assertEqual(arm_process._read_state(self.buf, spins=10)[0], 1)
+
+    def test_writing_is_not_read(self):
+        self.publisher.publish(_FakeArm())
+        arm_process._SEQ.pack_into(self.buf, 0, 3)
+        self.assertIsNone(arm_process._read_state(self.buf, spins=10))
+
+
+class TestRing(unittest.TestCase):
+    def setUp(self):
+        self.buf = bytearray(arm_process._Ring.buffer_size(4, 64))
+        self.ring = arm_process._Ring(self.buf, 4, 64)
+
+    def test_push_pop_wrap(self):
+        for i in range(10):
+            self.assertTrue(self.ring.push(bytes([i]) * (i + 1)))
+            self.assertEqual(self.ring.pop(), bytes([i]) * (i + 1))
+        self.assertIsNone(self.ring.pop())
+
+    def test_full(self):
+        for i in range(4):
+            self.assertTrue(self.ring.push(b'x'))
+        self.assertFalse(self.ring.push(b'x'))
+        with self.assertRaises(ValueError):
+            self.ring.push(b'x' * 64)
+
+    def test_torn_slot_is_retried(self):
+        self.ring.push(b'hello')
+        offset = arm_process._RING_HEADER + arm_process._SLOT_LEN.size
+        self.buf[offset] ^= 0xFF
+        self.assertIsNone(self.ring.pop())
+        self.buf[offset] ^= 0xFF
+        self.assertEqual(self.ring.pop(), b'hello')
+
+
+if __name__ == '__main__':
+    unittest.main()
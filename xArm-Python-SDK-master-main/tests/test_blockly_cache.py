@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from xarm.tools.blockly import BlocklyCache
+
+
+class TestBlocklyCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _save(self, cache, key, mtime):
+        codes = 'x = {!r}\n'.format(key)
+        self.assertTrue(cache.save(key, True, codes, compile(codes, key, 'exec')))
+        os.utime(os.path.join(self.cache_dir, '{}.bin'.format(key)), (mtime, mtime))
+
+    def test_round_trip(self):
+        cache = BlocklyCache(self.cache_dir)
+        self.assertIsNone(cache.load('a'))
+        self._save(cache, 'a', 1000)
+        succeed, codes, code_obj = cache.load('a')
+        self.assertTrue(succeed)
+        self.assertEqual(codes, "x = 'a'\n")
+        scope = {}
+        exec(code_obj, scope)
+        self.assertEqual(scope['x'], 'a')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_depends_on_content_and_options(self):
+        path = os.path.join(self.cache_dir, 'app.xml')
+        with open(path, 'w') as f:
+            f.write('<xml></xml>')
+        key = BlocklyCache.get_key(path, wait_seconds=1)
+        self.assertEqual(key, BlocklyCache.get_key(path, wait_seconds=1))
+        self.assertNotEqual(key, BlocklyCache.get_key(path, wait_seconds=2))
+        with open(path, 'w') as f:
+            f.write('<xml> </xml>')
+        self.assertNotEqual(key, BlocklyCache.get_key(path, wait_seconds=1))
+
+    def test_lru_eviction(self):
+        cache = BlocklyCache(self.cache_dir, max_entries=-1)
+        for i in range(5):
+            self._save(cache, 'k{}'.format(i), 1000 + i)
+        # a hit marks k0 as the most recently used
+        self.assertIsNotNone(cache.load('k0'))
+        self.assertEqual(cache.evict(3), 2)
+        names = sorted(os.listdir(self.cache_dir))
+        self.assertEqual(names, ['k0.bin', 'k0.py', 'k3.bin', 'k3.py', 'k4.bin', 'k4.py'])
+        self.assertIsNone(cache.load('k1'))
+
+    def test_save_keeps_the_bound(self):
+        cache = BlocklyCache(self.cache_dir, max_entries=2)
+        for i in range(4):
+            self._save(cache, 'k{}'.format(i), 1000 + i)
+        self.assertEqual(len([name for name in os.listdir(self.cache_dir) if name.endswith('.bin')]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
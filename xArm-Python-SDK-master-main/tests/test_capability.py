@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import unittest
+
+from xarm.x3.capability import Capability
+from xarm.wrapper import XArmAPI
+
+
+class TestCapability(unittest.TestCase):
+    def test_thresholds(self):
+        for name, min_version in Capability.FEATURES.items():
+            major, minor, revision = min_version
+            self.assertTrue(getattr(Capability(min_version), name), name)
+            older = (major, minor, revision - 1) if revision else (major, minor - 1, 999) if minor else (major - 1, 999, 999)
+            self.assertFalse(getattr(Capability(older), name), name)
+
+    def test_update(self):
+        capability = Capability()
+        self.assertFalse(any(capability.to_dict().values()))
+        capability.update((2, 6, 109))
+        self.assertTrue(all(capability.to_dict().values()))
+        self.assertEqual(capability.version, (2, 6, 109))
+
+    def test_not_connected(self):
+        arm = XArmAPI('127.0.0.1', do_not_open=True)
+        # no version query while not connected, the defaults are returned
+        self.assertEqual(arm._arm.capability.version, (0, 0, 0))
+        self.assertFalse(arm._arm._capability.supports_feedback)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import random
+import unittest
+
+from xarm.core.utils import crc16
+
+
+def _crc_bitwise(data):
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return bytes((crc & 0xFF, crc >> 8))
+
+
+class TestCrc16(unittest.TestCase):
+    def test_known_frame(self):
+        # read holding registers: 01 03 00 00 00 0A -> C5 CD
+        self.assertEqual(crc16.crc_modbus(bytes([0x01, 0x03, 0x00, 0x00, 0x00, 0x0A])), bytes([0xC5, 0xCD]))
+
+    def test_tables(self):
+        self.assertEqual(len(crc16.CRC_TABLE), 256)
+        table_16 = crc16._get_crc_table_16()
+        for word in (0, 1, 0xFF, 0x100, 0x1234, 0xFFFF):
+            crc = (word >> 8) ^ crc16.CRC_TABLE[word & 0xFF]
+            self.assertEqual(table_16[word], (crc >> 8) ^ crc16.CRC_TABLE[crc & 0xFF])
+
+    def test_all_lengths(self):
+        rand = random.Random(0)
+        for length in range(0, 70):
+            data = bytes(rand.randrange(256) for _ in range(length))
+            expected = _crc_bitwise(data)
+            self.assertEqual(crc16.crc_modbus(data), expected, length)
+            self.assertEqual(crc16.crc_modbus(list(data)), expected, length)
+            self.assertEqual(crc16.crc_modbus(bytearray(data)), expected, length)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import time
+import threading
+import unittest
+
+from xarm.x3.dispatcher import CallbackDispatcher
+from xarm.wrapper import XArmAPI
+
+
+class _Blocker(object):
+    def __init__(self):
+        self.event = threading.Event()
+        self.msgs = []
+
+    def __call__(self, msg):
+        self.event.wait(5)
+        self.msgs.append(msg)
+
+
+def _wait_until(func, timeout=5):
+    expired = time.monotonic() + timeout
+    while not func() and time.monotonic() < expired:
+        time.sleep(0.001)
+    return func()
+
+
+class TestCallbackDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = CallbackDispatcher(workers=2, maxsize=4, block_timeout=0.01)
+
+    def tearDown(self):
+        self.dispatcher.close()
+
+    def _stats(self, name):
+        return [item for item in self.dispatcher.get_stats() if item['name'] == name][0]
+
+    def test_lossless_in_order(self):
+        msgs = []
+        for i in range(4):
+            self.assertTrue(self.dispatcher.submit(msgs.append, i, name='state'))
+        self.assertTrue(_wait_until(lambda: len(msgs) == 4))
+        self.assertEqual(msgs, [0, 1, 2, 3])
+
+    def test_lossless_is_bounded(self):
+        callback = _Blocker()
+        # the first msg is taken by the worker, the next 4 fill the queue
+        self.assertTrue(self.dispatcher.submit(callback, 0, name='state'))
+        self.assertTrue(_wait_until(lambda: self._stats('state')['pending'] == 0))
+        for i in range(1, 5):
+            self.assertTrue(self.dispatcher.submit(callback, i, name='state'))
+        start = time.monotonic()
+        self.assertFalse(self.dispatcher.submit(callback, 5, name='state'))
+        self.assertLess(time.monotonic() - start, 1)
+        stats = self._stats('state')
+        self.assertEqual((stats['pending'], stats['dropped']), (4, 1))
+        callback.event.set()
+        self.assertTrue(_wait_until(lambda: len(callback.msgs) == 5))
+        self.assertEqual(callback.msgs, [0, 1, 2, 3, 4])
+
+    def test_coalesce(self):
+        callback = _Blocker()
+        self.dispatcher.submit(callback, 0, name='location')
+        self.assertTrue(_wait_until(lambda: self._stats('location')['pending'] == 0))
+        for i in range(1, 10):
+            self.dispatcher.submit(callback, i, name='location')
+        self.assertEqual(self._stats('location')['pending'], 1)
+        self.assertEqual(self._stats('location')['coalesced'], 8)
+        callback.event.set()
+        self.assertTrue(_wait_until(lambda: len(callback.msgs) == 2))
+        self.assertEqual(callback.msgs, [0, 9])
+
+    def test_remove(self):
+        callback = _Blocker()
+        self.dispatcher.submit(callback, 0, name='state')
+        self.dispatcher.submit(callback, 1, name='state')
+        self.dispatcher.submit(callback, 2, name='error_warn_changed')
+        self.assertEqual(self.dispatcher.remove(callback), 2)
+        self.assertEqual(self.dispatcher.get_stats(), [])
+        callback.event.set()
+        time.sleep(0.05)
+        # only the msg already taken by a worker is delivered
+        self.assertLessEqual(len(callback.msgs), 2)
+        self.assertNotIn(1, callback.msgs)
+
+    def test_release_removes_channel(self):
+        arm = XArmAPI('127.0.0.1', do_not_open=True, max_callback_thread_count=1)
+        arm._arm._pool = self.dispatcher
+        msgs = []
+        callback = msgs.append
+        arm.register_state_changed_callback(callback)
+        arm._arm._run_callback(callback, {'state': 1}, name='state')
+        self.assertTrue(_wait_until(lambda: len(msgs) == 1))
+        self.assertEqual(len(self.dispatcher.get_stats()), 1)
+        arm.release_state_changed_callback(msgs.append)
+        self.assertEqual(self.dispatcher.get_stats(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from xarm.wrapper import fleet
+
+
+def _snapshot(time, code=0, error_code=0, temperature=30.0, error_history=None):
+    return {
+        'ip': ['192.168.1.10', '192.168.1.11'], 'sn': ['XI1300000000', ''],
+        'time': [time, time], 'elapsed': [0.1, 0.2], 'code': [code, 0],
+        'error_code': [error_code, 0], 'warn_code': [0, 0],
+        'servo_temperature': [[temperature, 31.0], [40.0, 41.0]],
+        'error_history': [error_history or [], []], 'warn_history': [[], []],
+    }
+
+
+class TestSnapshotDiff(unittest.TestCase):
+    def test_code_is_categorical(self):
+        diff = fleet.diff_snapshots(_snapshot(100), _snapshot(160, code=-1, error_code=22, temperature=35.5))
+        self.assertEqual(set(diff.keys()), {'XI1300000000', '192.168.1.11'})
+        item = diff['XI1300000000']
+        self.assertEqual(item['changed'], {'code': (0, -1), 'error_code': (0, 22)})
+        self.assertNotIn('code', item['delta'])
+        self.assertEqual(item['delta']['time'], 60)
+        self.assertEqual(item['delta']['servo_temperature'], [5.5, 0])
+        self.assertEqual(diff['192.168.1.11']['changed'], {})
+
+    def test_history(self):
+        rows = [{'ip': '192.168.1.10', 'sn': 'XI1300000000', 'time': 100, 'error_code': 0, 'warn_code': -1}]
+        fleet._update_histories(rows, None)
+        self.assertEqual(rows[0]['error_history'], [[100, 0]])
+        self.assertEqual(rows[0]['warn_history'], [])
+        prev = fleet._rows_to_columns([dict(rows[0], **{name: 0 for name in fleet.SNAPSHOT_CODE_COLUMNS + fleet.SNAPSHOT_VALUE_COLUMNS
+                                                        if name not in rows[0]})])
+        for t, code in [(160, 0), (220, 22)]:
+            rows = [{'ip': '192.168.1.10', 'sn': 'XI1300000000', 'time': t, 'error_code': code, 'warn_code': 0}]
+            fleet._update_histories(rows, prev)
+        self.assertEqual(rows[0]['error_history'], [[100, 0], [220, 22]])
+        self.assertEqual(rows[0]['warn_history'], [[220, 0]])
+        diff = fleet.diff_snapshots(_snapshot(100, error_history=[[100, 0]]),
+                                    _snapshot(220, error_code=22, error_history=rows[0]['error_history']))
+        self.assertEqual(diff['XI1300000000']['history']['error_history'], [[220, 22]])
+
+    def test_history_is_bounded(self):
+        history = [[i, i % 2] for i in range(fleet.SNAPSHOT_HISTORY_MAX)]
+        history = fleet._merge_history(history, 1000, 5)
+        self.assertEqual(len(history), fleet.SNAPSHOT_HISTORY_MAX)
+        self.assertEqual(history[-1], [1000, 5])
+
+
+class TestSnapshotFile(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_round_trip(self):
+        snapshot = _snapshot(100, error_history=[[90, 0], [100, 22]])
+        for ext in ['.json', '.npz']:
+            path = fleet.save_snapshot(snapshot, os.path.join(self.tmpdir, 'snapshot' + ext))
+            self.assertEqual(fleet.load_snapshot(path), snapshot, ext)
+
+    def test_npz_without_numpy(self):
+        path = os.path.join(self.tmpdir, 'snapshot.npz')
+        with mock.patch.object(fleet, 'import_numpy', return_value=None):
+            with self.assertRaises(ImportError):
+                fleet.save_snapshot(_snapshot(100), path)
+            with self.assertRaises(ImportError):
+                fleet.load_snapshot(path)
+
+    def test_unique_names(self):
+        paths = [fleet._new_snapshot_path(self.tmpdir, '.json') for _ in range(5)]
+        self.assertEqual(len(set(paths)), 5)
+        self.assertTrue(all(os.path.basename(path).startswith(fleet.SNAPSHOT_PREFIX) for path in paths))
+        self.assertEqual(fleet._latest_snapshot_path(self.tmpdir), max(paths))
+
+
+if __name__ == '__main__':
+    unittest.main()
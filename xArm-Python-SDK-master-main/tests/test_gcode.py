@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import unittest
+
+from xarm.tools.gcode import compile_gcode
+from xarm.wrapper import XArmAPI
+
+GCODE = '''
+G21 (mm)
+G90
+G0 X10 Y0
+G1 X20 Y0 F600
+X20 Y10 ; modal G1
+G0 X0 Y0
+M2
+'''
+
+
+def _rows(values):
+    return [[float(v) for v in row] for row in values]
+
+
+class TestCompileGcode(unittest.TestCase):
+    def test_points(self):
+        program = compile_gcode(GCODE, origin=(100, 200, 50), z_up=10, orientation=(180, 0, 0), travel_speed=100)
+        xyz = [row[:3] for row in _rows(program.poses)]
+        self.assertEqual(xyz, [
+            [100, 200, 60],  # above the origin
+            [110, 200, 60], [110, 200, 50],  # G0 X10: travel, pen down
+            [120, 200, 50], [120, 210, 50],  # G1 draws
+            [120, 210, 60], [100, 200, 60], [100, 200, 50],  # G0 X0 Y0
+            [100, 200, 60],  # pen up at the end
+        ])
+        self.assertTrue(all(row[3:] == [180, 0, 0] for row in _rows(program.poses)))
+        # F600 mm/min -> 10 mm/s for the drawing segments
+        self.assertEqual([float(v) for v in program.speeds][3:5], [10, 10])
+        self.assertEqual([int(v) for v in program.lines][:3], [0, 4, 4])
+
+    def test_radii(self):
+        program = compile_gcode(GCODE, blend_radius=2)
+        radii = [float(v) for v in program.radii]
+        # only the corner inside the drawing is blended, the end stops at the point
+        self.assertEqual(radii[4], 0)
+        self.assertEqual(radii[3], 2)
+        self.assertEqual(radii[-1], -1)
+        self.assertTrue(all(r == 0 for i, r in enumerate(radii[:-1]) if i != 3))
+
+    def test_relative_and_inch(self):
+        program = compile_gcode('G20\nG91\nG0 X1\nG1 Y1\n', z_up=5)
+        xyz = [row[:3] for row in _rows(program.poses)]
+        self.assertEqual(xyz[2], [25.4, 0, 0])
+        self.assertEqual(xyz[3], [25.4, 25.4, 0])
+
+    def test_path_length(self):
+        draw, travel = compile_gcode(GCODE, z_up=10).path_length()
+        self.assertAlmostEqual(draw, 20)
+        self.assertAlmostEqual(travel, 10 + 10 + 10 + 500 ** 0.5 + 10 + 10)
+
+    def test_run_not_connected(self):
+        arm = XArmAPI('127.0.0.1', do_not_open=True)
+        code, codes = compile_gcode(GCODE).run(arm)
+        self.assertNotEqual(code, 0)
+        self.assertEqual(codes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import unittest
+
+from xarm.wrapper import XArmAPI
+
+VERSION_1 = 'xArm6,1,XI1300000001,AC1300000001,v2.6.110'
+VERSION_2 = 'xArm6,1,XI1300000001,AC1300000001,v2.6.111'
+
+
+class _Controller(object):
+    def __init__(self, version):
+        self.version = version
+        self.version_queries = 0
+        self.sn_queries = 0
+
+
+def _create_arm(controller, port='192.168.1.200'):
+    arm = XArmAPI(port, do_not_open=True, check_robot_sn=True)
+    base = arm._arm
+
+    def get_version():
+        controller.version_queries += 1
+        base._version = controller.version
+        return 0, base._version
+
+    def get_robot_sn():
+        controller.sn_queries += 1
+        base._robot_sn = controller.version.split(',')[2]
+        base._control_box_sn = controller.version.split(',')[3]
+        return 0, base._robot_sn
+
+    base.get_version = get_version
+    base.get_robot_sn = get_robot_sn
+    return base
+
+
+class TestIdentityCache(unittest.TestCase):
+    def setUp(self):
+        XArmAPI.clear_identity_cache()
+
+    def tearDown(self):
+        XArmAPI.clear_identity_cache()
+
+    def test_warm_reconnect_reuses_sn(self):
+        controller = _Controller(VERSION_1)
+        self.assertEqual(_create_arm(controller)._check_version(is_first=True), 0)
+        self.assertEqual((controller.version_queries, controller.sn_queries), (1, 1))
+        base = _create_arm(controller)
+        self.assertEqual(base._check_version(is_first=True), 0)
+        # the version is always queried, the sn is reused
+        self.assertEqual((controller.version_queries, controller.sn_queries), (2, 1))
+        self.assertTrue(base.connect_timings['identity_cached'])
+        self.assertEqual(base._robot_sn, 'XI1300000001')
+
+    def test_firmware_upgrade_drops_cache(self):
+        controller = _Controller(VERSION_1)
+        _create_arm(controller)._check_version(is_first=True)
+        controller.version = VERSION_2
+        base = _create_arm(controller)
+        self.assertEqual(base._check_version(is_first=True), 0)
+        self.assertEqual(controller.sn_queries, 2)
+        self.assertFalse(base.connect_timings['identity_cached'])
+        self.assertEqual(base._capability.version, (2, 6, 111))
+
+    def test_controller_swap_drops_cache(self):
+        controller = _Controller(VERSION_1)
+        _create_arm(controller)._check_version(is_first=True)
+        controller.version = 'xArm6,1,XI1300000002,AC1300000002,v2.6.110'
+        base = _create_arm(controller)
+        base._check_version(is_first=True)
+        self.assertEqual(controller.sn_queries, 2)
+        self.assertEqual(base._robot_sn, 'XI1300000002')
+
+    def test_opt_out(self):
+        controller = _Controller(VERSION_1)
+        _create_arm(controller)._check_version(is_first=True)
+        base = _create_arm(controller)
+        base._cache_identity = False
+        base._check_version(is_first=True)
+        self.assertEqual(controller.sn_queries, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import os
+import sys
+import json
+import subprocess
+import unittest
+
+SDK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = ['numpy', 'multiprocessing', 'concurrent.futures', 'asyncio', 'xarm.x3.parse']
+
+
+def _loaded_modules(statement):
+    code = '{}\nimport sys, json\nprint(json.dumps(sorted(sys.modules.keys())))'.format(statement)
+    env = dict(os.environ, PYTHONPATH=SDK_PATH)
+    out = subprocess.check_output([sys.executable, '-c', code], env=env, cwd=SDK_PATH)
+    return set(json.loads(out.decode('utf-8').strip().splitlines()[-1]))
+
+
+class TestImport(unittest.TestCase):
+    def test_import_xarm_is_cheap(self):
+        modules = _loaded_modules('import xarm')
+        self.assertNotIn('xarm.wrapper', modules)
+        self.assertNotIn('logging', modules)
+
+    def test_wrapper_does_not_load_heavy_modules(self):
+        modules = _loaded_modules('from xarm.wrapper import XArmAPI')
+        self.assertEqual(modules & set(HEAVY_MODULES), set())
+
+    def test_lazy_attributes(self):
+        modules = _loaded_modules('from xarm.wrapper import ArmProcess, connect_many')
+        self.assertIn('xarm.wrapper.arm_process', modules)
+        self.assertIn('xarm.wrapper.fleet', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import time
+import queue
+import unittest
+
+from xarm.core.config.x_config import XCONF
+from xarm.core.utils import convert
+from xarm.core.wrapper.uxbus_cmd_tcp import UxbusCmdTcp
+
+
+class _FakePort(object):
+    """
+    Reply to the first `replies` requests (private protocol, state is ready), then stay silent
+    """
+    def __init__(self, replies, data=b'\x00\x00\x00\x00'):
+        self.connected = True
+        self.replies = replies
+        self.data = data
+        self.requests = []
+        self.rx_que = queue.Queue()
+
+    def flush(self):
+        return 0
+
+    def write(self, data):
+        if not self.connected:
+            return -1
+        self.requests.append(data)
+        if len(self.requests) <= self.replies:
+            self.rx_que.put(data[0:4] + convert.u16_to_bytes(len(self.data) + 2) + data[6:7] + b'\x00' + self.data)
+        return 0
+
+    def read(self, timeout=None):
+        if not self.connected:
+            return -1
+        try:
+            return self.rx_que.get(timeout=timeout)
+        except queue.Empty:
+            return -1
+
+
+class TestPipeline(unittest.TestCase):
+    def _requests(self, count):
+        return [(XCONF.UxbusReg.SERVO_R16B, bytes([i])) for i in range(count)]
+
+    def test_get_all_responded(self):
+        port = _FakePort(replies=40)
+        rets = UxbusCmdTcp(port).get_bytes_pipeline(self._requests(40), 4, timeout=1, window=8)
+        self.assertEqual(len(rets), 40)
+        self.assertTrue(all(ret[0] == 0 for ret in rets))
+
+    def test_get_timeout_shares_one_deadline(self):
+        port = _FakePort(replies=2)
+        start = time.monotonic()
+        rets = UxbusCmdTcp(port).get_bytes_pipeline(self._requests(20), 4, timeout=0.2, window=8)
+        elapsed = time.monotonic() - start
+        # one timeout for the first lost response, one shared by the other 7 in flight
+        self.assertLess(elapsed, 0.2 * 3)
+        self.assertEqual(len(port.requests), 10)
+        self.assertEqual([ret[0] for ret in rets[:2]], [0, 0])
+        self.assertTrue(all(ret[0] == XCONF.UxbusState.ERR_TOUT for ret in rets[2:]))
+        self.assertEqual(len(rets), 20)
+
+    def test_set_disconnect_does_not_wait(self):
+        port = _FakePort(replies=0)
+        cmd = UxbusCmdTcp(port)
+        port.connected = False
+        start = time.monotonic()
+        rets = cmd.set_bytes_pipeline(self._requests(5), timeout=1, window=4)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(rets, [[XCONF.UxbusState.ERR_NOTTCP, False]])
+
+    def test_set_timeout_shares_one_deadline(self):
+        port = _FakePort(replies=1)
+        start = time.monotonic()
+        rets = UxbusCmdTcp(port).set_bytes_pipeline(self._requests(20), timeout=0.2, window=8)
+        self.assertLess(time.monotonic() - start, 0.2 * 3)
+        self.assertEqual(len(rets), 9)
+        self.assertEqual(rets[0], [0, True])
+        self.assertTrue(all(ret[0] == XCONF.UxbusState.ERR_TOUT for ret in rets[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
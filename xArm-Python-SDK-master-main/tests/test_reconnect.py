@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import threading
+import unittest
+
+from xarm.x3.dispatcher import CallbackDispatcher
+from xarm.wrapper import XArmAPI
+
+
+class TestReconnect(unittest.TestCase):
+    def setUp(self):
+        self.arm = XArmAPI('127.0.0.1', do_not_open=True, auto_reconnect=True,
+                           reconnect_max_retries=3, reconnect_backoff_base=0.001, reconnect_backoff_max=0.001)
+        self.dispatcher = CallbackDispatcher(workers=1)
+        self.arm._arm._pool = self.dispatcher
+        self.changed = []
+        self.arm.register_connect_changed_callback(self.changed.append)
+
+    def tearDown(self):
+        self.dispatcher.close()
+
+    def test_failed_attempts_keep_the_dispatcher(self):
+        attempts = []
+
+        def failed_connect(*args, **kwargs):
+            # the failed connect disconnects before raising
+            attempts.append(threading.current_thread())
+            self.arm._arm.disconnect()
+            raise Exception('connect socket failed')
+
+        self.arm._arm.connect = failed_connect
+        self.assertFalse(self.arm._arm._Base__auto_reconnect())
+        self.assertEqual(len(attempts), 3)
+        self.assertIs(self.arm._arm._pool, self.dispatcher)
+        self.assertFalse(self.arm._arm._disconnect_requested)
+        self.assertEqual(self.arm.get_reconnect_stats()[1]['main']['failed'], 1)
+        self.assertIsNone(self.arm._arm._reconnect_thread)
+
+    def test_disconnect_requested_by_user(self):
+        self.arm.disconnect()
+        self.assertTrue(self.arm._arm._disconnect_requested)
+        self.assertIsNone(self.arm._arm._pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
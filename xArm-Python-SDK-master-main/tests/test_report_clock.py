@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import random
+import unittest
+
+from xarm.core.comm.base import Port
+from xarm.x3.report_clock import ReportClock
+from xarm.wrapper import XArmAPI
+
+
+def _feed(clock, seconds, rate=250, offset=1000.0, drift=50e-6, min_delay=0.0005, start_us=0, seed=0):
+    rand = random.Random(seed)
+    ctrl_us = start_us
+    for _ in range(int(seconds * rate)):
+        ctrl_us += 1000000 // rate
+        delay = min_delay + (0.02 if rand.random() < 0.05 else rand.random() * 0.0002)
+        clock.update(ctrl_us, offset + ctrl_us / 1000000.0 * (1 + drift) + delay)
+    return ctrl_us
+
+
+class TestReportClock(unittest.TestCase):
+    def test_not_ready(self):
+        clock = ReportClock()
+        self.assertFalse(clock.ready)
+        self.assertIsNone(clock.to_host(0))
+        self.assertIsNone(clock.to_controller(0))
+        self.assertIsNone(clock.offset)
+
+    def test_offset_and_drift(self):
+        clock = ReportClock()
+        ctrl_us = _feed(clock, 30)
+        self.assertTrue(clock.ready)
+        self.assertEqual(clock.count, 30 * 250)
+        self.assertAlmostEqual(clock.drift, 50e-6, delta=5e-6)
+        # the envelope is the minimum path delay
+        expected = 1000.0 + ctrl_us / 1000000.0 * (1 + 50e-6) + 0.0005
+        self.assertAlmostEqual(clock.to_host(ctrl_us), expected, delta=50e-6)
+        self.assertAlmostEqual(clock.to_controller(clock.to_host(ctrl_us)), ctrl_us, delta=1)
+
+    def test_late_report(self):
+        clock = ReportClock()
+        ctrl_us = _feed(clock, 10, drift=0)
+        clock.update(ctrl_us + 4000, 1000.0 + (ctrl_us + 4000) / 1000000.0 + 0.0005 + 0.03)
+        self.assertAlmostEqual(clock.delay, 0.03, delta=50e-6)
+
+    def test_controller_restart(self):
+        clock = ReportClock()
+        _feed(clock, 10)
+        # the controller clock jumps back, the model restarts from the new samples
+        _feed(clock, 5, offset=2000.0, start_us=0)
+        self.assertAlmostEqual(clock.to_host(5000000), 2000.0 + 5 * (1 + 50e-6) + 0.0005, delta=0.001)
+
+
+class TestReportTimestamp(unittest.TestCase):
+    def test_port_read(self):
+        port = Port(10)
+        port._connected = True
+        port.rx_que.put((b'report', 12.5))
+        port.rx_que.put(b'response')
+        self.assertEqual(port.read(0.1), b'report')
+        buf, recv_time = port.read_with_time(0.1)
+        self.assertEqual(buf, b'response')
+        self.assertGreater(recv_time, 0)
+        port.rx_que.put((b'report', 12.5))
+        self.assertEqual(port.read_with_time(0.1), (b'report', 12.5))
+        self.assertEqual(port.read(0.01), -1)
+
+    def test_no_controller_time(self):
+        arm = XArmAPI('127.0.0.1', do_not_open=True, report_type='real')
+        arm._arm._handle_report_data(bytes(87), 12.5)
+        self.assertEqual(arm.report_timestamp, (None, 12.5))
+        self.assertFalse(arm.report_clock.ready)
+
+
+if __name__ == '__main__':
+    unittest.main()
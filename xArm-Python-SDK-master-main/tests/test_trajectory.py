@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import os
+import math
+import shutil
+import tempfile
+import unittest
+
+from xarm.tools.trajectory import (TrajectoryWriter, TrajectoryReader, encode_chunk, decode_chunk,
+                                   resample, copy_trajectory, DEFAULT_SCALE)
+from xarm.wrapper import XArmAPI
+
+
+class TestChunkCodec(unittest.TestCase):
+    def test_round_trip_all_widths(self):
+        columns = [
+            list(range(0, 100, 10)),  # 1 byte deltas
+            [i * 1000 for i in range(10)],  # 2 bytes deltas
+            [(-1) ** i * i * 100000 for i in range(10)],  # 4 bytes deltas
+        ]
+        data = encode_chunk(columns)
+        decoded, offset = decode_chunk(data, 0, len(columns))
+        self.assertEqual(offset, len(data))
+        self.assertEqual([list(map(int, col)) for col in decoded], columns)
+
+    def test_single_sample(self):
+        data = encode_chunk([[5], [-7]])
+        decoded, _ = decode_chunk(data, 0, 2)
+        self.assertEqual([list(map(int, col)) for col in decoded], [[5], [-7]])
+
+
+class TestTrajectoryFile(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.xtraj')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, count=2500, chunk_size=1000):
+        with TrajectoryWriter(self.filename, columns=6, chunk_size=chunk_size, meta={'axis': 6}) as writer:
+            for i in range(count):
+                writer.append(10 + i * 0.004, [math.sin(i * 0.01 + j) for j in range(6)])
+        return count
+
+    def test_read_back(self):
+        count = self._write()
+        with TrajectoryReader(self.filename) as reader:
+            self.assertEqual(len(reader), count)
+            self.assertEqual(reader.chunk_count, 3)
+            self.assertEqual(reader.meta, {'axis': 6})
+            for i in (0, 999, 1000, 1001, count - 1):
+                t, values = reader[i]
+                self.assertAlmostEqual(t, i * 0.004, places=4)
+                for j in range(6):
+                    self.assertAlmostEqual(values[j], math.sin(i * 0.01 + j), delta=1.0 / DEFAULT_SCALE)
+            self.assertEqual(reader.index_of(4.0), 1000)
+            self.assertAlmostEqual(reader.duration, (count - 1) * 0.004, places=4)
+
+    def test_get_range_crosses_chunks(self):
+        self._write()
+        with TrajectoryReader(self.filename) as reader:
+            times, values = reader.get_range(3.9, 4.1)
+            self.assertLessEqual(times[0], 3.9)
+            self.assertGreaterEqual(times[-1], 4.1)
+            self.assertEqual(len(values), 6)
+            self.assertEqual(len(values[0]), len(times))
+
+    def test_incomplete_file(self):
+        writer = TrajectoryWriter(self.filename, columns=6)
+        writer.append(0, [0] * 6)
+        writer._fp.flush()
+        with self.assertRaises(ValueError):
+            TrajectoryReader(self.filename)
+        writer.close()
+
+    def test_copy(self):
+        count = self._write()
+        dst = os.path.join(self.tmpdir, 'copy.xtraj')
+        copy_trajectory(self.filename, dst)
+        with TrajectoryReader(self.filename) as src, TrajectoryReader(dst) as reader:
+            self.assertEqual(len(reader), count)
+            self.assertEqual(reader[count - 1], src[count - 1])
+
+    def test_resample(self):
+        result = resample([0, 1, 2], [[0, 10, 20]], [-1, 0.5, 1.5, 3])
+        self.assertEqual([float(v) for v in result[0]], [0, 5, 15, 20])
+
+
+class TestRecorderErrors(unittest.TestCase):
+    def test_write_error_stops_recording(self):
+        class BrokenRecorder(object):
+            filename = 'broken.xtraj'
+            closed = False
+
+            def append(self, timestamp, values):
+                raise IOError('No space left on device')
+
+            def close(self):
+                self.closed = True
+
+        arm = XArmAPI('127.0.0.1', do_not_open=True)
+        recorder = BrokenRecorder()
+        arm._arm._traj_recorder = recorder
+        # called by the report thread, must not raise
+        arm._arm._report_location_callback()
+        self.assertIsNone(arm._arm._traj_recorder)
+        self.assertTrue(recorder.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
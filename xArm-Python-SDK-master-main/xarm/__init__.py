@@ -1,2 +1,15 @@
-from .wrapper import XArmAPI
+import sys
 from .version import __version__
+
+if sys.version_info >= (3, 7):
+    # XArmAPI (and the whole SDK) is imported on first access, `import xarm` stays cheap
+    def __getattr__(name):
+        if name == 'XArmAPI':
+            from .wrapper import XArmAPI
+            return XArmAPI
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    def __dir__():
+        return sorted(list(globals().keys()) + ['XArmAPI'])
+else:
+    from .wrapper import XArmAPI
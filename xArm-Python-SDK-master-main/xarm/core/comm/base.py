@@ -85,23 +85,47 @@ class Port(threading.Thread):
             return -1
         try:
             with self.write_lock:
-                logger.verbose('[{}] send: {}'.format(self.port_type, data))
+                if logger.isEnabledFor(logger.VERBOSE):
+                    logger.verbose('[%s] send: %s', self.port_type, data)
                 self.com_write(data)
             return 0
         except Exception as e:
             self._connected = False
-            logger.error("[{}] send error: {}".format(self.port_type, e))
+            logger.error("[%s] send error: %s", self.port_type, e)
             return -1
 
     def read(self, timeout=None):
+        """
+        :return: the buffer, -1 if no data
+        """
         if not self.connected:
             return -1
         try:
             buf = self.rx_que.get(timeout=timeout)
-            logger.verbose('[{}] recv: {}'.format(self.port_type, buf))
+            if isinstance(buf, tuple):
+                # the report socket queues (buffer, receive time), see read_with_time
+                buf = buf[0]
+            if logger.isEnabledFor(logger.VERBOSE):
+                logger.verbose('[%s] recv: %s', self.port_type, buf)
             return buf
         except:
             return -1
+
+    def read_with_time(self, timeout=None):
+        """
+        :return: (buffer, time.monotonic() when the buffer was received), -1 if no data
+            the receive time is taken by the recv thread for the report socket, else it is the time of the read
+        """
+        if not self.connected:
+            return -1
+        try:
+            item = self.rx_que.get(timeout=timeout)
+            buf, recv_time = item if isinstance(item, tuple) else (item, time.monotonic())
+            if logger.isEnabledFor(logger.VERBOSE):
+                logger.verbose('[%s] recv: %s', self.port_type, buf)
+            return buf, recv_time
+        except:
+            return -1
         # if not self.connected:
         #     return -1
         # if not self.rx_que.empty():
@@ -137,7 +161,7 @@ class Port(threading.Thread):
 
     def recv_report_proc(self):
         self.alive = True
-        logger.debug('[{}] recv thread start'.format(self.port_type))
+        logger.debug('[%s] recv thread start', self.port_type)
         failed_read_count = 0
         timeout_count = 0
         size = 0
@@ -165,7 +189,7 @@ class Port(threading.Thread):
                     timeout_count += 1
                     if timeout_count > 3:
                         self._connected = False
-                        logger.error('[{}] socket read timeout'.format(self.port_type))
+                        logger.error('[%s] socket read timeout', self.port_type)
                         break
                     continue
                 else:
@@ -173,7 +197,7 @@ class Port(threading.Thread):
                         failed_read_count += 1
                         if failed_read_count > 5:
                             self._connected = False
-                            logger.error('[{}] socket read failed, len=0'.format(self.port_type))
+                            logger.error('[%s] socket read failed, len=0', self.port_type)
                             break
                         time.sleep(0.1)
                         continue
@@ -186,7 +210,7 @@ class Port(threading.Thread):
                         if size == 233:
                             size_is_not_confirm = True
                             size = 245
-                        logger.info('report_data_size: {}, size_is_not_confirm={}'.format(size, size_is_not_confirm))
+                        logger.info('report_data_size: %s, size_is_not_confirm=%s', size, size_is_not_confirm)
                     else:
                         if data_num < size:
                             continue
@@ -198,7 +222,7 @@ class Port(threading.Thread):
                                 continue
 
                         if convert.bytes_to_u32(buffer[0:4]) != size and not (size_is_not_confirm and size == 245 and convert.bytes_to_u32(buffer[0:4]) == 233):
-                            logger.error('report data error, close, length={}, size={}'.format(convert.bytes_to_u32(buffer[0:4]), size))
+                            logger.error('report data error, close, length=%s, size=%s', convert.bytes_to_u32(buffer[0:4]), size)
                             break
 
                         # # buffer[494:502]
@@ -236,7 +260,8 @@ class Port(threading.Thread):
 
                         if self.rx_que.qsize() > 1:
                             self.rx_que.get()
-                        self.rx_parse.put(buffer, True)
+                        # the receive time is taken here, the frame may wait in rx_que before decoded (see read_with_time)
+                        self.rx_parse.put((buffer, time.monotonic()), True)
                         buffer = b''
                         data_num = 0
 
@@ -244,15 +269,15 @@ class Port(threading.Thread):
                     failed_read_count = 0
         except Exception as e:
             if self.alive:
-                logger.error('[{}] recv error: {}'.format(self.port_type, e))
+                logger.error('[%s] recv error: %s', self.port_type, e)
         finally:
             self.close()
-        logger.debug('[{}] recv thread had stopped'.format(self.port_type))
+        logger.debug('[%s] recv thread had stopped', self.port_type)
         self._connected = False
 
     def recv_proc(self):
         self.alive = True
-        logger.debug('[{}] recv thread start'.format(self.port_type))
+        logger.debug('[%s] recv thread start', self.port_type)
         is_main_tcp = self.port_type == 'main-socket'
         is_main_serial = self.port_type == 'main-serial'
         try:
@@ -268,7 +293,7 @@ class Port(threading.Thread):
                         failed_read_count += 1
                         if failed_read_count > 5:
                             self._connected = False
-                            logger.error('[{}] socket read failed, len=0'.format(self.port_type))
+                            logger.error('[%s] socket read failed, len=0', self.port_type)
                             break
                         time.sleep(0.1)
                         continue
@@ -284,16 +309,21 @@ class Port(threading.Thread):
                         self.rx_parse.put(rx_data)
                 elif is_main_serial:
                     rx_data = self.com_read(self.com.in_waiting or self.buffer_size)
+                    # the rest of the frame arrives while the first byte is handled,
+                    # read it at once so that the parser handles the whole frame in one put
+                    in_waiting = self.com.in_waiting
+                    if in_waiting:
+                        rx_data += self.com_read(in_waiting)
                     self.rx_parse.put(rx_data)
                 else:
                     break
                 failed_read_count = 0
         except Exception as e:
             if self.alive:
-                logger.error('[{}] recv error: {}'.format(self.port_type, e))
+                logger.error('[%s] recv error: %s', self.port_type, e)
         finally:
             self.close()
-        logger.debug('[{}] recv thread had stopped'.format(self.port_type))
+        logger.debug('[%s] recv thread had stopped', self.port_type)
         self._connected = False
         # if self.heartbeat_thread:
         #     try:
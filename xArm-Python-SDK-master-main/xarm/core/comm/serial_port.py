@@ -25,7 +25,7 @@ class SerialPort(Port):
             if not self.com.isOpen():
                 self._connected = False
                 raise Exception('serial is not open')
-            logger.info('{} connect {}:{} success'.format(self.port_type, port, baud))
+            logger.info('%s connect %s:%s success', self.port_type, port, baud)
 
             self._connected = True
 
@@ -39,6 +39,6 @@ class SerialPort(Port):
             self.com_write = self.com.write
             self.start()
         except Exception as e:
-            logger.info('{} connect {}:{} failed, {}'.format(self.port_type, port, baud, e))
+            logger.info('%s connect %s:%s failed, %s', self.port_type, port, baud, e)
             self._connected = False
 
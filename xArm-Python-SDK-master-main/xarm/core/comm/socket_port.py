@@ -78,14 +78,14 @@ class HeartBeatThread(threading.Thread):
         self.daemon = True
 
     def run(self):
-        logger.debug('{} heartbeat thread start'.format(self.sock_class.port_type))
+        logger.debug('%s heartbeat thread start', self.sock_class.port_type)
         heat_data = bytes([0, 0, 0, 1, 0, 2, 0, 0])
 
         while self.sock_class.connected:
             if self.sock_class.write(heat_data) == -1:
                 break
             time.sleep(1)
-        logger.debug('{} heartbeat thread had stopped'.format(self.sock_class.port_type))
+        logger.debug('%s heartbeat thread had stopped', self.sock_class.port_type)
 
 
 class SocketPort(Port):
@@ -112,7 +112,7 @@ class SocketPort(Port):
                         self.com.setblocking(True)
                         self.com.settimeout(1)
                         self.com.connect(uds_path)
-                        logger.info('{} connect {} success, uds_{}'.format(self.port_type, server_ip, server_port))
+                        logger.info('%s connect %s success, uds_%s', self.port_type, server_ip, server_port)
                         use_uds = True
                     except Exception as e:
                         pass
@@ -129,7 +129,7 @@ class SocketPort(Port):
                 self.com.setblocking(True)
                 self.com.settimeout(1)
                 self.com.connect((server_ip, server_port))
-                logger.info('{} connect {} success'.format(self.port_type, server_ip))
+                logger.info('%s connect %s success', self.port_type, server_ip)
                 # logger.info('{} connect {}:{} success'.format(self.port_type, server_ip, server_port))
 
             self._connected = True
@@ -144,7 +144,7 @@ class SocketPort(Port):
                 self.heartbeat_thread = HeartBeatThread(self)
                 self.heartbeat_thread.start()
         except Exception as e:
-            logger.info('{} connect {} failed, {}'.format(self.port_type, server_ip, e))
+            logger.info('%s connect %s failed, %s', self.port_type, server_ip, e)
             # logger.error('{} connect {}:{} failed, {}'.format(self.port_type, server_ip, server_port, e))
             self._connected = False
 
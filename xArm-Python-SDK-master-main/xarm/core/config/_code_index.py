@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+# Generated by `python3 -m xarm.core.config._gen_code_index` from x_code_data.py, do not edit
+
+NORMAL_ENTRY = 0
+ENTRY_COUNT = 132
+LANGS = ('en', 'cn')
+
+# name: (sorted codes, first entry, entry of other, entry of failed)
+CODE_TABLES = {
+    'BioGripperErrorCodeMap': (
+        (11, 12),
+        1, 3, 3),
+    'ControllerErrorCodeMap': (
+        (1, 2, 3, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 50, 51, 52, 53, 60, 110, 111),
+        4, 45, 45),
+    'ControllerWarnCodeMap': (
+        (11, 12, 13, 14, 15),
+        46, 51, 51),
+    'FtSensorErrorCodeMap': (
+        (64, 65, 66, 67, 68, 69, 70, 71, 73),
+        52, 61, 61),
+    'GripperErrorCodeMap': (
+        (9, 11, 12, 14, 15, 20, 21, 23, 25, 26, 33, 34, 36),
+        62, 75, 76),
+    'LinearMotorErrorCodeMap': (
+        (10, 11, 12, 13, 14, 20, 21, 25, 26, 33, 34, 35, 36, 39, 40, 49),
+        77, 93, 93),
+    'RobotiqErrorCodeMap': (
+        (5, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+        94, 104, 104),
+    'ServoCodeMap': (
+        (10, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 26, 27, 28, 33, 34, 35, 36, 39, 40, 49, 52, 58),
+        105, 130, 131),
+}
+CODE_TABLES['LinearTrackErrorCodeMap'] = CODE_TABLES['LinearMotorErrorCodeMap']
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+# Generated by `python3 -m xarm.core.config._gen_code_index` from x_code_data.py, do not edit
+
+TEXTS = (
+    '正常',
+    '',
+    'BIO 机械爪过流',
+    '电流过大，请点击“确认”重新使能机械爪。如反复报错，请联系技术支持。',
+    'BIO 机械爪夹取的物体脱落',
+    'BIO 机械爪夹取的物体脱落，请清除错误后重试',
+    'BIO 机械爪',
+    '其它故障',
+    '控制器上的紧急停止按钮被按下',
+    '请释放紧急停止按钮，然后重新使能机械臂',
+    '控制器上的紧急停止IO被触发',
+    '请将控制器的2组EI接地，然后重新使能机械臂',
+    '三态开关的紧急停止按钮被按下',
+    '请释放三态开关的紧急停止按钮，然后重新使能机械臂',
+    '关节错误',
+    '关节1错误',
+    '关节2错误',
+    '关节3错误',
+    '关节4错误',
+    '关节5错误',
+    '关节6错误',
+    '关节7错误',
+    '力矩传感器通信失败',
+    '请检查力矩传感器是否安装',
+    '末端工具通信失败',
+    '请检查末端工具是否安装，波特率设置是否正确',
+    '运动学错误',
+    '请重新规划路径。',
+    '自碰撞错误',
+    '机械臂即将发生自碰撞，请重新规划路径。如果机械臂持续报自碰撞错误，请开启手动模式将机械臂拖回正常位置。',
+    '关节角度超出限制',
+    '请到”实时控制“界面按住”初始点“按钮让机械臂回到初始点。',
+    '速度超出限制',
+    '请检查机械臂是否超出运动范围，或减小运动速度和加速度值。',
+    '规划错误',
+    '请重新规划路径或者减小运动速度。',
+    'Linux RT 错误',
+    '请联系技术支持。',
+    '回复指令错误 ',
+    '请重试，或通过控制器上的紧急停止按钮重启机械臂。如多次重启无效，请联系技术支持。',
+    '末端通信失败',
+    '请通过控制器上的紧急停止按钮重启机械臂。如多次重启无效，请联系技术支持。',
+    '反馈速度超出限制',
+    '碰撞导致电流异常',
+    '请检查是否碰撞、负载设置是否正确，碰撞灵敏度与速度是否匹配。',
+    '三点圆弧指令计算出错',
+    '三点圆弧指令计算出错，请重新设置圆弧指令。',
+    '控制器GPIO模块报错',
+    '请检查控制器GPIO模块的连接, 并重新上下电。如该错误反复出现, 请联系技术支持。',
+    '轨迹录制超时',
+    '轨迹录制时间超过最大限制5分钟, 建议重新录制。',
+    '机械臂到达安全边界',
+    '机械臂到达安全边界，请到实时控制界面开启手动模式后将机械臂移动到安全边界内。',
+    '延时指令数量超限',
+    '待执行的延时指令或位置检测指令超过36个，请检查代码中延时指令或位置检测指令是否过多。',
+    '手动模式运动异常',
+    '请检查机械臂的TCP负载设置和机械臂安装方式是否与实际匹配。',
+    '关节角度异常',
+    '请通过控制器上的紧急停止按钮停止机械臂，并联系技术支持。',
+    '电源板主从IC通信异常',
+    '无报错的关节轨迹求解失败',
+    '请调整点位。',
+    '摩擦力文件内容无效。',
+    '请通过控制器上的紧急停止按钮重启机械臂。如多次重启无效，请联系技术支持',
+    '校准文件内容无效。',
+    '六维力矩传感器读取数据错误',
+    '六维力矩传感器设置模式错误',
+    '六维力矩传感器设置零点错误',
+    '六维力矩传感器过载或读数超限',
+    '关节伺服模式线速度超过限制',
+    '线速度限制值{}mm/s,当前线速度{}mm/s',
+    '机械臂底座板通信异常',
+    '控制器外接485设备通信异常',
+    '其他错误',
+    '当前控制器缓存已满',
+    '用户指令参数错误',
+    '用户指令控制码不存在',
+    '用户指令和参数无解',
+    'Modbus指令已满',
+    '其它警告',
+    '力矩出现通讯中断',
+    '力矩采集数据不变化',
+    '六维力矩传感器的Fx超限',
+    '六维力矩传感器的Fy超限',
+    '六维力矩传感器的Fz超限',
+    '六维力矩传感器的Tx超限',
+    '六维力矩传感器的Ty超限',
+    '六维力矩传感器的Tz超限',
+    '六维力矩传感器初始化不成功',
+    '六维力矩传感器异常',
+    '机械爪电流检测异常',
+    '机械爪电流过大',
+    '请点击“确认”重新使能机械爪。如反复报错，请联系技术支持。',
+    '机械爪速度过大',
+    '机械爪位置指令过大',
+    '机械爪EEPROM读写错误',
+    '机械爪驱动IC硬件异常',
+    '机械爪驱动IC初始化异常',
+    '机械爪电机位置偏差过大',
+    '请检查机械爪运动是否受阻，如机械爪运动未受阻，请点击“确认”重新使能机械爪。如频繁出现，请联系技术支持。',
+    '机械爪指令超软件限位',
+    '请检测机械爪指令是否设置超出软件限制。如频繁出现，请联系技术支持。',
+    '机械爪反馈位置超限软件限位',
+    '机械爪驱动器过载',
+    '机械爪电机过载',
+    '机械爪驱动器类型错误',
+    '请点击“确认”重新使能机械爪。如频繁出现，请联系技术支持。',
+    '机械爪异常',
+    '机械爪通信失败',
+    '请确认机械爪正确安装，或在软件上取消机械爪的安装',
+    '直线滑轨电流检测异常',
+    '请重启控制器。如多次重启无效，请联系技术支持。',
+    '直线滑轨电流过大',
+    '请清除直线滑轨报错。如反复报错，请联系技术支持。',
+    '直线滑轨速度过大',
+    '直线滑轨电机位置偏差过大',
+    '请检查直线滑轨运动是否受阻，如直线滑轨运动未受阻，请清除直线滑轨报错。如反复报错，请联系技术支持。',
+    '直线滑轨位置指令过大',
+    '直线滑轨驱动IC硬件异常',
+    '直线滑轨驱动IC初始化异常',
+    '直线滑轨指令超软件限位',
+    '请检测直线滑轨指令是否设置超出软件限制。如频繁出现，请联系技术支持。',
+    '直线滑轨反馈位置超限软件限位',
+    '直线滑轨驱动器过载',
+    '直线滑轨电机过载',
+    '直线滑轨电机类型错误',
+    '直线滑轨驱动器类型错误',
+    '直线滑轨过压',
+    '直线滑轨欠压',
+    '直线滑轨EEPROM读写错误',
+    '直线滑轨异常',
+    'Robotiq 机械爪',
+    '运动延迟, 机械爪运动之前必须先完成激活（重新激活）',
+    '激活位必须在机械爪运动前设置',
+    '超过最高工作温度，请等待机械爪冷却',
+    '通信中断超过1秒',
+    '低于最小工作电压',
+    '正在自动释放',
+    '内部故障，请联系技术支持 support@robotiq.com',
+    '激活故障，请确认没有干扰或其他错误发生',
+    '过流',
+    '自动松开完成',
+    '电流检测异常',
+    '关节电流过大',
+    '关节速度过大',
+    '位置指令过大',
+    '关节过热',
+    '如果机械臂长时间运行温度过高，请停并机冷却后重启机械臂。如多次重启无效，请联系技术支持。',
+    '编码器初始化异常',
+    '请确保机械臂通电时，无外力推动机械臂运动。请通过控制器上的紧急停止按钮重启机械臂，如多次重启无效，请联系技术支持。',
+    '单圈编码器故障',
+    '请重新使能机械臂。',
+    '多圈编码器故障',
+    '电池电压过低',
+    '驱动IC硬件异常',
+    '请重新使能机械臂。如频繁出现，请联系技术支持。',
+    '驱动IC初始化异常',
+    '请通过控制器上的紧急停止按钮重启机械臂，如多次重启无效，请联系技术支持。',
+    '编码器配置错误',
+    '电机位置偏差过大',
+    '请检查机械臂运动是否受阻，末端负载是否超过机械臂额定负载，机械臂加速度值是否设置过大。如频繁出现，请联系技术支持。',
+    '第N关节正向超限',
+    '请检测N关节角度值是否设置过大。',
+    '第N关节负向超限',
+    '请检测第N关节角度值是否设置过大，如果是，请点击清除报错后，手动解锁该关节并转动该关节至其运动范围内。',
+    '关节指令错误',
+    '机械臂未使能,请点击“使能机械臂”。',
+    '驱动器过载',
+    '请确保机械臂负载处于额定负载内。',
+    '电机过载',
+    '电机类型错误',
+    '驱动器类型错误',
+    '关节过压',
+    '请在运动设置中减少加速度值。',
+    '关节欠压',
+    '请在运动设置中减少加速度值。请检查控制器紧急停止开关是否松开。',
+    'EEPROM读写错误',
+    '电机角度初始化失败',
+    '转矩指令超时',
+    '请检查控制器与机械臂的连接。',
+    '关节异常',
+    '关节通信失败',
+)
+TITLE_IDS = (
+    0, 2, 4, 6, 8, 10, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22,
+    24, 26, 28, 30, 32, 34, 36, 38, 40, 42, 43, 45, 47, 49, 51, 53,
+    55, 57, 59, 60, 62, 64, 65, 66, 67, 68, 69, 71, 72, 73, 74, 75,
+    76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91,
+    93, 94, 95, 96, 97, 98, 100, 102, 103, 104, 105, 107, 108, 110, 112, 114,
+    115, 117, 118, 119, 120, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 131,
+    131, 131, 131, 131, 131, 131, 131, 131, 131, 142, 143, 144, 145, 146, 148, 150,
+    152, 153, 154, 156, 158, 159, 161, 163, 165, 167, 169, 170, 171, 172, 174, 176,
+    177, 178, 180, 181,
+)
+DESC_IDS = (
+    1, 3, 5, 7, 9, 11, 13, 1, 1, 1, 1, 1, 1, 1, 1, 23,
+    25, 27, 29, 31, 33, 35, 37, 39, 41, 37, 44, 46, 48, 50, 52, 54,
+    56, 58, 37, 61, 63, 63, 1, 1, 1, 1, 70, 37, 37, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 41, 92,
+    92, 92, 92, 92, 92, 99, 101, 37, 37, 37, 106, 106, 109, 111, 113, 113,
+    116, 113, 113, 113, 121, 37, 37, 37, 37, 113, 37, 37, 113, 113, 132, 133,
+    134, 135, 136, 137, 138, 139, 140, 141, 7, 41, 41, 41, 41, 147, 149, 151,
+    37, 37, 155, 157, 37, 160, 162, 164, 166, 168, 168, 41, 41, 173, 175, 41,
+    41, 179, 41, 41,
+)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+# Generated by `python3 -m xarm.core.config._gen_code_index` from x_code_data.py, do not edit
+
+TEXTS = (
+    'Normal',
+    '',
+    'BIO Gripper Current Overlimit',
+    'Current Overlimit, please click “OK” to re-enable the Gripper. If it reports the same error repeatedly, please contact technical support.',
+    'The object slipped from the BIO Gripper',
+    'The object slipped from the BIO Gripper, please clear the error and try again',
+    'BIO Gripper',
+    'Other fault',
+    'The Emergency Stop Button on the xArm Controller is pushed in to stop',
+    'Please release the Emergency Stop Button, and then re-enable the robot',
+    'The Emergency IO of the Control Box is triggered',
+    'Please ground the 2 EIs of the Control Box, and then re-enable the robot',
+    'The Emergency Stop Button of the Three-state Switch is pressed',
+    'Please release the Emergency Stop Button of the Three-state Switch, and then re-enable the robot',
+    'Servo motor error',
+    'Servo motor 1 error',
+    'Servo motor 2 error',
+    'Servo motor 3 error',
+    'Servo motor 4 error',
+    'Servo motor 5 error',
+    'Servo motor 6 error',
+    'Servo motor 7 error',
+    'Force Torque Sensor Communication Error',
+    'Please check whether the force torque sensor is installed.',
+    'End Effector Communication Error',
+    'Please check whether end effector is installed and the baud rate setting is correct',
+    'Kinematic Error',
+    'Please re-plan the path.',
+    'Self-Collision Error',
+    'The robot is about to collide with itself. Please re-plan the path. If the robot reports the self-collision error continually, please turn on the manual mode and drag the robotic back to the normal area.',
+    'Joints Angle Exceed Limit',
+    'Please go to the "Live Control" page and press the "INITIAL POSITION" button to let the robot go to the initial position.',
+    'Speed Exceeds Limit',
+    'Please check if the xArm is out of working range, or reduce the speed and acceleration values.',
+    'Planning Error',
+    'Please re-plan the path or reduce the speed.',
+    'Linux RT Error',
+    'Please contact technical support.',
+    'Command Reply Error',
+    'Pleas retry, or restart the xArm with the Emergency Stop Button on the xArm Controller. If multiple reboots are not working, please contact technical support.',
+    'End Module Communication Error',
+    'Please restart the xArm with the Emergency Stop Button on the Control Box. If multiple reboots are not working, please contact technical support.',
+    'Feedback Speed Exceeds limit',
+    'Collision Caused Abnormal Current',
+    'Please check for collisions, check that the payload settings are correct, and that the collision sensitivity matches the speed.',
+    'Three-point drawing circle calculation error',
+    'Three-point drawing circle calculation error, please reset the arc command.',
+    'Controller GPIO Error',
+    'Please check the connection of the controller GPIO module and power on and off again. If the error occurs repeatedly, please contact technical support.',
+    'Recording Timeout',
+    'The trajectory recording duration exceeds the maximum duration limit of 5 minutes. It is recommended to re-record.',
+    'Safety Boundary Limit',
+    'The xArm reaches the safety boundary. Please move the xArm to the safety boundary after turning on the Manual mode on the Live Control interface.',
+    'The number of delay commands exceeds the limit',
+    'The number of delay commands or position detection commands to be executed cannot exceed 36, please check whether there are too many delay commands or position detection commands in the code.',
+    'Abnormal movement in Manual Mode',
+    'Please check whether the TCP payload setting and mounting setting of the robot arm are correct.',
+    'Abnormal Joint Angle',
+    'Please stop the xArm by pressing the Emergency Stop Button on the Control Box and then contact technical support.',
+    'Abnormal Communication Between Master and Slave IC of Power Board',
+    'Please contact technical support',
+    'Solution failure of error-free joint trajectory',
+    'Please adjust the position.',
+    'The content of the friction file is invalid.',
+    'Please restart the robot with the Emergency Stop Button on the Control Box. If multiple reboots do not work, please contact technical support.',
+    'The content of the calibration file is invalid.',
+    'Six-axis Force Torque Sensor read error',
+    'Six-axis Force Torque Sensor set mode error',
+    'Six-axis Force Torque Sensor set zero error',
+    'Six-axis Force Torque Sensor is overloaded or the reading exceeds the limit',
+    'Linear speed exceeded limit in servo_j mode.',
+    'Linear speed limit is {} mm/s, current linear speed {} mm/s.',
+    'Robot Arm Base Board Communication Error',
+    'Control Box External 485 Device Communication Error',
+    'Other Errors',
+    'Current controller cache is full',
+    'User instruction parameter error',
+    'User command control code does not exist',
+    'User instructions and parameters have no solution',
+    'Modbus cmd full',
+    'Other Warnings',
+    'Six-axis Force Torque Sensor Communication Failure',
+    'The Data Collected by the Six-axis Force Torque Sensor is Abnormal',
+    'Six-axis Force Torque Sensor X-direction Torque Exceeds Limit',
+    'Six-axis Force Torque Sensor Y-direction Torque Exceeds Limit',
+    'Six-axis Force Torque Sensor Z-direction Torque Exceeds Limitrection',
+    'Six-axis Force Torque Sensor Tx Torque Exceeds Limit',
+    'Six-axis Force Torque Sensor Ty direction Torque Exceeds Limit',
+    'Six-axis Force Torque Sensor Tz direction Torque Exceeds Limit',
+    'Six-axis Force Torque Sensor Failed to Initialize',
+    'Six-axis Force Torque Sensor Error',
+    'Gripper Current Detection Error',
+    'Please restart the xArm with the Emergency Stop Button on the xArm Controller. If multiple reboots are not working, please contact technical support.',
+    'Gripper Current Overlimit',
+    'Please click “OK” to re-enable the Gripper. If it reports the same error repeatedly, please contact technical support.',
+    'Gripper Speed Overlimit',
+    'Gripper Position Command Overlimit',
+    'Gripper EEPROM Read and Write Error',
+    'Gripper Driver IC Hardware Error',
+    'Gripper Driver IC Initialization Error',
+    'Gripper Large Motor Position Deviation',
+    'Please check if the movement of the Gripper is blocked, if not, please click “OK” to re-enable the Gripper. If it reports the same error repeatedly, please contact technical support.',
+    'Gripper Command Over Software Limit',
+    'Please check if the gripper command is set beyond the software limit. If it reports the same error repeatedly, please contact technical support.',
+    'Gripper Feedback Position Software Limit',
+    'Gripper Drive Overloaded',
+    'Gripper Motor Overload',
+    'Gripper Driver Type Error',
+    'Gripper Error',
+    'Gripper Communication failure',
+    'Please confirm that the mechanical grip is properly installed, or cancel the installation of the mechanical claws on the software.',
+    'Linear Motor Current Detection Error',
+    'Please restart the Controller. If multiple reboots are not working, please contact technical support.',
+    'Linear Motor Current Overlimit',
+    'Please clear the Linear Motor error. If it reports the same error repeatedly, please contact technical support.',
+    'Linear Motor Speed Overlimit',
+    'Linear Motor Large Motor Position Deviation',
+    'Please check if the movement of the Linear Motor is blocked, if not, please clear the Linear Motor error. If it reports the same error repeatedly, please contact technical support.',
+    'Linear Motor Position Command Overlimit',
+    'Linear Motor Driver IC Hardware Error',
+    'Linear Motor Driver IC Initialization Error',
+    'Linear Motor Command Over Software Limit',
+    'Please check if the Linear Motor command is set beyond the software limit. If it reports the same error repeatedly, please contact technical support.',
+    'Linear Motor Feedback Position Software Limit',
+    'Linear Motor Drive Overloaded',
+    'Linear Motor Motor Overload',
+    'Linear Motor type error',
+    'Linear Motor Driver Type Error',
+    'Linear Motor over voltage',
+    'please contact technical support.',
+    'Linear Moter undervoltage',
+    'Linear Motor EEPROM Read and Write Error',
+    'Linear Motor Error',
+    'Robotiq Gripper',
+    'Action delayed, activation(reactivation) must be completed prior to perfmoring the action',
+    'The activation bit must be set prior to action',
+    'Maximum operating temperature exceeded, wait for cool-down.',
+    'No communication during at least 1 second',
+    'Under minimum operating voltage',
+    'Automatic release in progress',
+    'Internal fault, please contact support@robotiq.com',
+    'Activation fault, please verify that no interference or other erroro ccurred',
+    'Over current triggered',
+    'Automatic release completed',
+    'Current Detection Error',
+    'Joint Current Overlimit',
+    'Joint Speed Overlimit',
+    'Position Command Overlimit',
+    'Joints Overheat',
+    "If the robot arm is running for a long time, please stop running and restart the xArm after it's cool down. If multiple reboots are not working, please contact technical support.",
+    'Encoder Initialization Error',
+    "Please ensure that there is no external force to push the robotic arm when the  it's energized. Please restart the xArm with the Emergency Stop Button on the xArm Controller. If multiple reboots are not working, please contact technical support.",
+    'Single Ring Encoder Error',
+    'Please re-enable the robot.',
+    'Multi-turn Encoder Error ',
+    'Low Battery Voltage',
+    'Driver IC Hardware Error',
+    'Please re-enable the robot. If it appears frequently, please contact technical support.',
+    'Driver IC Initialization Error',
+    'Please restart the xArm with the Emergency Stop Button on the xArm Controller. If multiple reboots are not working, please contact technical support.If multiple reboots are invalid, please contact technical support.',
+    'Encoder Configuration Error',
+    'Large Motor Position Deviation',
+    'Please check whether the xArm movement is blocked, whether the payload exceeds the rated payload of xArm, and whether the acceleration value is too large. If it appears frequently, please contact technical support.',
+    'Joint N Positive Overrun',
+    'Please check if angle value of the joint N is too large.',
+    'Joint N Negative Overrun',
+    'Please check if the angle value of  joint N is too large, if so, please click Clear Error and manually unlock the joint and rotate the joint to the allowed range of motion.',
+    'Joint Commands Error',
+    'The xArm is not enabled, please click Enable Robot.',
+    'Drive Overloaded',
+    'Please make sure the payload is within the rated load.',
+    'Motor Overload',
+    'Motor Type Error',
+    'Driver Type Error',
+    'Joint Voltage Overload',
+    'Please reduce the acceleration value in the Motion Settings.',
+    'Joint Voltage Insufficient',
+    'Please reduce the acceleration value in the Motion Settings.Please check if the controller emergency stop switch is released.',
+    'EEPROM Read and Write Error.',
+    'Motor Angle Initialization Error',
+    'Torque Command Timeout',
+    'Please check the connection between the Control Box and the robot.',
+    'Joint Error',
+    'Joint Communication failure',
+)
+TITLE_IDS = (
+    0, 2, 4, 6, 8, 10, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22,
+    24, 26, 28, 30, 32, 34, 36, 38, 40, 42, 43, 45, 47, 49, 51, 53,
+    55, 57, 59, 61, 63, 65, 66, 67, 68, 69, 70, 72, 73, 74, 75, 76,
+    77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 93,
+    95, 96, 97, 98, 99, 100, 102, 104, 105, 106, 107, 108, 109, 111, 113, 115,
+    116, 118, 119, 120, 121, 123, 124, 125, 126, 127, 128, 130, 131, 132, 133, 133,
+    133, 133, 133, 133, 133, 133, 133, 133, 133, 144, 145, 146, 147, 148, 150, 152,
+    154, 155, 156, 158, 160, 161, 163, 165, 167, 169, 171, 172, 173, 174, 176, 178,
+    179, 180, 182, 183,
+)
+DESC_IDS = (
+    1, 3, 5, 7, 9, 11, 13, 1, 1, 1, 1, 1, 1, 1, 1, 23,
+    25, 27, 29, 31, 33, 35, 37, 39, 41, 37, 44, 46, 48, 50, 52, 54,
+    56, 58, 60, 62, 64, 64, 1, 1, 1, 1, 71, 37, 37, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 92, 94,
+    94, 94, 94, 94, 94, 101, 103, 37, 37, 37, 94, 94, 110, 112, 114, 114,
+    117, 114, 114, 114, 122, 37, 37, 37, 37, 114, 129, 129, 114, 114, 134, 135,
+    136, 137, 138, 139, 140, 141, 142, 143, 7, 92, 92, 92, 92, 149, 151, 153,
+    37, 37, 157, 159, 37, 162, 164, 166, 168, 170, 170, 92, 92, 175, 177, 92,
+    92, 181, 92, 92,
+)
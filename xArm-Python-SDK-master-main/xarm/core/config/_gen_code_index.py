@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Generate the compact index of the error/warning codes from x_code_data.py, run it after modifying x_code_data.py
+    python3 -m xarm.core.config._gen_code_index
+
+Output:
+    _code_index.py: for every code map a table (sorted codes, first entry, entry of 'other', entry of 'failed'),
+        the entry of a code is the first entry + the index of the code in the sorted codes
+    _code_text_<lang>.py: the deduplicated texts of the language and the title/desc text id of every entry,
+        only imported when a text of the language is required
+"""
+
+import os
+from . import x_code_data
+
+DIR = os.path.dirname(os.path.abspath(__file__))
+LANGS = ('en', 'cn')
+NORMAL = {'en': {'title': 'Normal', 'desc': ''}, 'cn': {'title': '正常', 'desc': ''}}
+
+HEADER = '''#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+# Generated by `python3 -m xarm.core.config._gen_code_index` from x_code_data.py, do not edit
+'''
+
+
+def _code_maps():
+    names = sorted(name for name in dir(x_code_data) if name.endswith('CodeMap'))
+    maps, aliases = [], []
+    for name in names:
+        code_map = getattr(x_code_data, name)
+        same = next((item for item in maps if item[1] is code_map), None)
+        if same is not None:
+            aliases.append((name, same[0]))
+        else:
+            maps.append((name, code_map))
+    return maps, aliases
+
+
+def build():
+    maps, aliases = _code_maps()
+    entries = [NORMAL]
+    tables = []
+    for name, code_map in maps:
+        codes = sorted(code for code in code_map if isinstance(code, int))
+        first = len(entries)
+        entries.extend(code_map[code] for code in codes)
+        other = len(entries)
+        entries.append(code_map['other'])
+        if 'failed' in code_map:
+            failed = len(entries)
+            entries.append(code_map['failed'])
+        else:
+            failed = other
+        tables.append((name, tuple(codes), first, other, failed))
+    texts = {}
+    for lang in LANGS:
+        strings, ids = [], {}
+        title_ids, desc_ids = [], []
+        for info in entries:
+            for key, out in (('title', title_ids), ('desc', desc_ids)):
+                text = info[lang][key]
+                if text not in ids:
+                    ids[text] = len(strings)
+                    strings.append(text)
+                out.append(ids[text])
+        texts[lang] = (strings, title_ids, desc_ids)
+    return tables, aliases, len(entries), texts
+
+
+def _write_tuple(f, name, values, per_line=16):
+    f.write('{} = (\n'.format(name))
+    for i in range(0, len(values), per_line):
+        f.write('    {},\n'.format(', '.join(repr(v) for v in values[i:i + per_line])))
+    f.write(')\n')
+
+
+def write():
+    tables, aliases, count, texts = build()
+    with open(os.path.join(DIR, '_code_index.py'), 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.write('\nNORMAL_ENTRY = 0\nENTRY_COUNT = {}\nLANGS = {!r}\n\n'.format(count, LANGS))
+        f.write('# name: (sorted codes, first entry, entry of other, entry of failed)\nCODE_TABLES = {\n')
+        for name, codes, first, other, failed in tables:
+            f.write('    {!r}: (\n        {!r},\n        {}, {}, {}),\n'.format(name, codes, first, other, failed))
+        f.write('}\n')
+        for name, target in aliases:
+            f.write('CODE_TABLES[{!r}] = CODE_TABLES[{!r}]\n'.format(name, target))
+    for lang, (strings, title_ids, desc_ids) in texts.items():
+        with open(os.path.join(DIR, '_code_text_{}.py'.format(lang)), 'w', encoding='utf-8') as f:
+            f.write(HEADER)
+            f.write('\n')
+            f.write('TEXTS = (\n')
+            for text in strings:
+                f.write('    {!r},\n'.format(text))
+            f.write(')\n')
+            _write_tuple(f, 'TITLE_IDS', title_ids)
+            _write_tuple(f, 'DESC_IDS', desc_ids)
+    print('generate {} entries of {} code maps, texts: {}'.format(
+        count, len(tables) + len(aliases), ', '.join('{}={}'.format(lang, len(texts[lang][0])) for lang in LANGS)))
+
+
+if __name__ == '__main__':
+    write()
@@ -32,12 +32,7 @@ def int32s_to_bytes(data, n):
 
 def bytes_to_fp32(data):
     """小端字节序"""
-    byte = bytes([data[0]])
-    byte += bytes([data[1]])
-    byte += bytes([data[2]])
-    byte += bytes([data[3]])
-    ret = struct.unpack('<f', byte)
-    return ret[0]
+    return struct.unpack('<f', bytes(data[0:4]))[0]
 
 
 def fp32s_to_bytes(data, n):
@@ -51,10 +46,7 @@ def fp32s_to_bytes(data, n):
 
 def bytes_to_fp32s(data, n):
     """小端字节序"""
-    ret = [0] * n
-    for i in range(n):
-        ret[i] = bytes_to_fp32(data[i * 4:i * 4 + 4])
-    return ret
+    return list(struct.unpack('<{}f'.format(n), bytes(data[0:n * 4])))
 
 
 def u16_to_bytes(data):
@@ -82,18 +74,12 @@ def bytes_to_u16(data):
 
 def bytes_to_u16s(data, n):
     """大端字节序"""
-    ret = [0] * n
-    for i in range(n):
-        ret[i] = bytes_to_u16(data[i * 2: i * 2 + 2])
-    return ret
+    return list(struct.unpack('>{}H'.format(n), bytes(data[0:n * 2])))
 
 
 def bytes_to_16s(data, n):
     """大端字节序"""
-    ret = [0] * n
-    for i in range(n):
-        ret[i] = struct.unpack('>h', bytes(data[i * 2: i * 2 + 2]))[0]
-    return ret
+    return list(struct.unpack('>{}h'.format(n), bytes(data[0:n * 2])))
 
 
 def bytes_to_u32(data):
@@ -7,6 +7,7 @@
 #                       <jimy92@163.com>
 #
 
+import sys
 
 CRC_TABLE_H = (
 0x00, 0xC1, 0x81, 0x40, 0x01, 0xC0, 0x80, 0x41, 0x01, 0xC0, 0x80, 0x41, 0x00,
@@ -57,20 +58,51 @@ CRC_TABLE_L = (
 0x80, 0x40)
 
 
-def crc_modbus(data):
-    leng = len(data)
-    init_crch = 0xFF
-    init_crcl = 0xFF
-    i = 0
+# the crc register keeps CRC_TABLE_H in the low byte and CRC_TABLE_L in the high byte,
+# so one step is `crc = (crc >> 8) ^ CRC_TABLE[(crc ^ byte) & 0xFF]` and the result is (crc & 0xFF, crc >> 8)
+CRC_TABLE = tuple(h | (l << 8) for h, l in zip(CRC_TABLE_H, CRC_TABLE_L))
 
-    while leng > 0:
-        index = init_crch ^ data[i]
-        i += 1
-        init_crch = init_crcl ^ CRC_TABLE_H[index]
-        init_crcl = CRC_TABLE_L[index]
-        leng -= 1
-    s = init_crch << 8 | init_crcl
-    crc = bytes([s // 256 % 256])
-    crc += bytes([s % 256])
-    return crc
+# two bytes a step: crc = CRC_TABLE_16[crc ^ word], word is the little-endian u16 of the two bytes
+# 65536 items, built on the first use (only the serial port uses the crc)
+_CRC_TABLE_16 = None
+_CRC_WORD_MIN_LEN = 16
+_CRC_WORD_ENABLED = sys.byteorder == 'little'
 
+
+def _get_crc_table_16():
+    global _CRC_TABLE_16
+    if _CRC_TABLE_16 is None:
+        table = CRC_TABLE
+        table_16 = [0] * 65536
+        for i in range(65536):
+            crc = (i >> 8) ^ table[i & 0xFF]
+            table_16[i] = (crc >> 8) ^ table[crc & 0xFF]
+        _CRC_TABLE_16 = table_16
+    return _CRC_TABLE_16
+
+
+def crc_modbus(data, _table_h=CRC_TABLE_H, _table_l=CRC_TABLE_L):
+    """
+    Modbus crc16
+    :param data: bytes/bytearray/memoryview or list of int
+    :return: 2 bytes, low byte first (the byte order on the wire)
+    """
+    length = len(data)
+    if _CRC_WORD_ENABLED and length >= _CRC_WORD_MIN_LEN:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+        view = memoryview(data)
+        table_16 = _get_crc_table_16()
+        crc = 0xFFFF
+        for word in view[:length & ~1].cast('H'):
+            crc = table_16[crc ^ word]
+        if length & 1:
+            crc = (crc >> 8) ^ CRC_TABLE[(crc ^ view[-1]) & 0xFF]
+        return bytes((crc & 0xFF, crc >> 8))
+    # short data, a byte a step with the two tables (no setup cost)
+    crch = crcl = 0xFF
+    for byte in data:
+        index = crch ^ byte
+        crch = crcl ^ _table_h[index]
+        crcl = _table_l[index]
+    return bytes((crch, crcl))
@@ -12,8 +12,6 @@ import sys
 import os
 
 log_path = os.path.join(os.path.expanduser('~'), '.UFACTORY', 'log', 'xarm', 'sdk')
-if not os.path.exists(log_path):
-    os.makedirs(log_path)
 
 logging.VERBOSE = 5
 logging.addLevelName(logging.VERBOSE, 'VERBOSE')
@@ -50,6 +48,26 @@ logger.CRITICAL = logging.CRITICAL
 
 logger.verbose = functools.partial(logger.log, logger.VERBOSE)
 
+
+def enable_file_logging(filename=None, level=logging.INFO):
+    """
+    Write the log of the SDK to the file, the log directory is only created here (not at import)
+    :param filename: log file path, default is ~/.UFACTORY/log/xarm/sdk/sdk.log
+    :param level: the level of the file handler
+    :return: the file handler, remove it by logger.removeHandler(handler)
+    """
+    filename = filename if filename else os.path.join(log_path, 'sdk.log')
+    dirname = os.path.dirname(os.path.abspath(filename))
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    handler = logging.FileHandler(filename, encoding='utf-8')
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter(Logger.logger_fmt.format(''), Logger.logger_date_fmt))
+    logger.addHandler(handler)
+    if logger.level > level:
+        logger.setLevel(level)
+    return handler
+
 # findCaller = logger.findCaller
 #
 #
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+The optional dependencies, imported on first use (importing numpy takes ~50-70ms, `import xarm` must stay cheap)
+"""
+
+_numpy = None
+_numpy_checked = False
+
+
+def import_numpy():
+    """
+    :return: the numpy module, None if numpy is not installed
+    """
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+        _numpy_checked = True
+    return _numpy
@@ -9,8 +9,10 @@
 
 import time
 import math
+import struct
 import threading
 import functools
+from collections import deque
 from ..utils import convert
 from ..config.x_config import XCONF
 
@@ -24,6 +26,7 @@ def lock_require(func):
 
 
 class UxbusCmd(object):
+    SUPPORT_PIPELINE = False
     BAUDRATES = (4800, 9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600,
                  1000000, 1500000, 2000000, 2500000)
 
@@ -74,7 +77,7 @@ class UxbusCmd(object):
     def set_debug(self, debug):
         self._debug = debug
     
-    def send_modbus_request(self, unit_id, pdu_data, pdu_len, prot_id=-1, t_id=None):
+    def send_modbus_request(self, unit_id, pdu_data, pdu_len, prot_id=-1, t_id=None, flush=True):
         raise NotImplementedError
     
     def recv_modbus_response(self, t_unit_id, t_trans_id, num, timeout, t_prot_id=-1, ret_raw=False):
@@ -172,6 +175,91 @@ class UxbusCmd(object):
             self._set_feedback_type_no_lock(self._feedback_type)
         return ret
 
+    def _get_pipeline_deadline(self, code, timeout):
+        """
+        The deadline of the responses still in flight after a pipelined request failed:
+          the connection is broken: no wait
+          others (timeout/error): all of them share one timeout, instead of one timeout for each of them
+        """
+        if code == XCONF.UxbusState.ERR_NOTTCP or not getattr(self.arm_port, 'connected', True):
+            return time.monotonic()
+        return time.monotonic() + timeout
+
+    @lock_require
+    def set_bytes_pipeline(self, requests, rx_len=0, timeout=None, window=16):
+        """
+        Send the requests one after another without waiting for the response,
+        at most window requests are waiting for the response at the same time (window is 1 if not support pipeline)
+        Stop sending the remaining requests once a response is failed or the state is not ready,
+        the responses still in flight after the failure share one deadline (see _get_pipeline_deadline)
+        :param requests: list of (funcode, payload)
+        :return: list of [code, state_is_ready], one for each sent request
+        """
+        timeout = self._S_TOUT if timeout is None else timeout
+        window = max(1, window) if self.SUPPORT_PIPELINE else 1
+        rets = []
+        pending = deque()
+        index = 0
+        deadline = None
+        self.arm_port.flush()
+        while pending or (deadline is None and index < len(requests)):
+            while deadline is None and index < len(requests) and len(pending) < window:
+                funcode, payload = requests[index]
+                trans_id = self.send_modbus_request(funcode, payload, len(payload), flush=False)
+                if trans_id == -1:
+                    deadline = self._get_pipeline_deadline(XCONF.UxbusState.ERR_NOTTCP, timeout)
+                    break
+                pending.append((funcode, trans_id))
+                index += 1
+            if not pending:
+                rets.append([XCONF.UxbusState.ERR_NOTTCP, self._state_is_ready])
+                break
+            funcode, trans_id = pending.popleft()
+            ret = self.recv_modbus_response(funcode, trans_id, rx_len, timeout if deadline is None else max(0, deadline - time.monotonic()))
+            rets.append([ret[0], self._state_is_ready])
+            if deadline is None and (ret[0] not in [0, XCONF.UxbusState.WAR_CODE] or not self._state_is_ready):
+                deadline = self._get_pipeline_deadline(ret[0], timeout)
+        return rets
+
+    @lock_require
+    def get_bytes_pipeline(self, requests, rx_len, timeout=None, window=16):
+        """
+        Same as set_bytes_pipeline, but for the queries, the responses with the error/warn code are also returned
+        Stop sending the remaining requests once the connection is broken or a response is timeout,
+        the responses still in flight after the failure share one deadline (see _get_pipeline_deadline)
+        :param requests: list of (funcode, payload)
+        :return: list of the response ([code, byte1, byte2, ...]), one for each request
+        """
+        timeout = self._G_TOUT if timeout is None else timeout
+        window = max(1, window) if self.SUPPORT_PIPELINE else 1
+        rets = []
+        pending = deque()
+        index = 0
+        failed_code = 0
+        deadline = None
+        self.arm_port.flush()
+        while pending or (not failed_code and index < len(requests)):
+            while not failed_code and index < len(requests) and len(pending) < window:
+                funcode, payload = requests[index]
+                trans_id = self.send_modbus_request(funcode, payload, len(payload), flush=False)
+                if trans_id == -1:
+                    failed_code = XCONF.UxbusState.ERR_NOTTCP
+                    deadline = self._get_pipeline_deadline(failed_code, timeout)
+                    break
+                pending.append((funcode, trans_id))
+                index += 1
+            if not pending:
+                break
+            funcode, trans_id = pending.popleft()
+            ret = self.recv_modbus_response(funcode, trans_id, rx_len, timeout if deadline is None else max(0, deadline - time.monotonic()))
+            rets.append(ret)
+            if not failed_code and ret[0] in [XCONF.UxbusState.ERR_TOUT, XCONF.UxbusState.ERR_NOTTCP]:
+                failed_code = ret[0]
+                deadline = self._get_pipeline_deadline(failed_code, timeout)
+        # the requests not sent or not responded
+        rets.extend([failed_code] + [0] * rx_len for _ in range(len(requests) - len(rets)))
+        return rets
+
     @lock_require
     def set_nint32(self, funcode, datas, num, feedback_key=None, feedback_type=XCONF.FeedbackType.MOTION_FINISH):
         need_set_fb = feedback_type != 0 and (self._feedback_type & feedback_type) != feedback_type
@@ -427,6 +515,16 @@ class UxbusCmd(object):
             byte_data = bytes([coord, int(is_axis_angle), only_check_type, int(motion_type)])
         return self.set_nfp32_with_bytes(XCONF.UxbusReg.MOVE_LINE, txdata, 10, byte_data, 3, timeout=10, feedback_key=feedback_key)
 
+    def move_line_common_batch(self, mvposes, mvvelos, mvaccs, mvtimes, radii, coord=0, motion_type=0, window=16):
+        """
+        Pipelined move_line_common, the params are lists with the same length
+        """
+        pack = struct.Struct('<10f').pack
+        byte_data = bytes([coord, 0, 0]) if motion_type == 0 else bytes([coord, 0, 0, int(motion_type)])
+        requests = [(XCONF.UxbusReg.MOVE_LINE, pack(*mvposes[i][:6], mvvelos[i], mvaccs[i], mvtimes[i], -1 if radii[i] is None else radii[i]) + byte_data)
+                    for i in range(len(mvposes))]
+        return self.set_bytes_pipeline(requests, rx_len=3, timeout=10, window=window)
+
     def move_line_aa(self, mvpose, mvvelo, mvacc, mvtime, mvcoord, relative, only_check_type=0, motion_type=0):
         float_data = [mvpose[i] for i in range(6)]
         float_data += [mvvelo, mvacc, mvtime]
@@ -514,6 +612,20 @@ class UxbusCmd(object):
             byte_data = bytes([only_check_type])
             return self.set_nfp32_with_bytes(XCONF.UxbusReg.MOVE_JOINTB, txdata, 10, byte_data, 3, timeout=10, feedback_key=feedback_key)
 
+    def move_joint_batch(self, mvjoints, mvvelos, mvaccs, mvtimes, radii, window=16):
+        """
+        Pipelined move_joint/move_jointb, the params are lists with the same length
+        the point with radius (not None and >= 0) uses move_jointb
+        """
+        pack = struct.Struct('<10f').pack
+        requests = []
+        for i in range(len(mvjoints)):
+            if radii[i] is not None and radii[i] >= 0:
+                requests.append((XCONF.UxbusReg.MOVE_JOINTB, pack(*mvjoints[i][:7], mvvelos[i], mvaccs[i], radii[i])))
+            else:
+                requests.append((XCONF.UxbusReg.MOVE_JOINT, pack(*mvjoints[i][:7], mvvelos[i], mvaccs[i], mvtimes[i])))
+        return self.set_bytes_pipeline(requests, window=window)
+
     def move_gohome(self, mvvelo, mvacc, mvtime, only_check_type=0, feedback_key=None):
         txdata = [mvvelo, mvacc, mvtime]
         if only_check_type <= 0:
@@ -1003,6 +1115,19 @@ class UxbusCmd(object):
         return [ret[0], convert.bytes_to_long_big(ret[1:5])]
         # return [ret[0], convert.bytes_to_long_big(ret[1:5])[0]]
 
+    def servo_addr_r_batch(self, regs, window=16):
+        """
+        Pipelined servo_addr_r16/servo_addr_r32
+        :param regs: list of (axis_id, addr, width), width is 16 or 32
+        :return: list of [code, value], one for each register
+        """
+        requests = []
+        for axis_id, addr, width in regs:
+            funcode = XCONF.UxbusReg.SERVO_R32B if width == 32 else XCONF.UxbusReg.SERVO_R16B
+            requests.append((funcode, bytes([axis_id]) + convert.u16_to_bytes(addr)))
+        rets = self.get_bytes_pipeline(requests, 4, window=window)
+        return [[ret[0], convert.bytes_to_long_big(ret[1:5])] for ret in rets]
+
     # -----------------------------------------------------
     # controler gpio
     # -----------------------------------------------------
@@ -1361,6 +1486,10 @@ class UxbusCmd(object):
             return [XCONF.UxbusState.ERR_NOTTCP]
         return self.recv_modbus_response(XCONF.UxbusReg.SET_FEEDBACK_TYPE, ret, 0, self._S_TOUT)
 
+    @property
+    def feedback_type(self):
+        return self._feedback_type
+
     @lock_require
     def set_feedback_type(self, feedback_type):
         ret = self._set_feedback_type_no_lock(feedback_type)
@@ -62,12 +62,14 @@ class UxbusCmdSer(UxbusCmd):
             self._has_err_warn = False
             return 0
     
-    def send_modbus_request(self, reg, txdata, num, prot_id=-1, t_id=None):
-        send_data = bytes([self.fromid, self.toid, num + 1, reg])
-        for i in range(num):
-            send_data += bytes([txdata[i]])
+    def send_modbus_request(self, reg, txdata, num, prot_id=-1, t_id=None, flush=True):
+        send_data = bytearray([self.fromid, self.toid, num + 1, reg])
+        if num > 0:
+            send_data += bytes(txdata[:num])
         send_data += crc16.crc_modbus(send_data)
-        self.arm_port.flush()
+        send_data = bytes(send_data)
+        if flush:
+            self.arm_port.flush()
         if self._debug:
             debug_log_datas(send_data, label='send')
         return self.arm_port.write(send_data)
@@ -29,6 +29,8 @@ def debug_log_datas(datas, label=''):
 
 
 class UxbusCmdTcp(UxbusCmd):
+    SUPPORT_PIPELINE = True
+
     def __init__(self, arm_port, set_feedback_key_tranid=None):
         super(UxbusCmdTcp, self).__init__(set_feedback_key_tranid=set_feedback_key_tranid)
         self.arm_port = arm_port
@@ -87,16 +89,20 @@ class UxbusCmdTcp(UxbusCmd):
         self._has_err_warn = False
         return 0
     
-    def send_modbus_request(self, unit_id, pdu_data, pdu_len, prot_id=-1, t_id=None):
+    def send_modbus_request(self, unit_id, pdu_data, pdu_len, prot_id=-1, t_id=None, flush=True):
         trans_id = self._transaction_id if t_id is None else t_id
         prot_id = self._protocol_identifier if prot_id < 0 else prot_id
         send_data = convert.u16_to_bytes(trans_id)
         send_data += convert.u16_to_bytes(prot_id)
         send_data += convert.u16_to_bytes(pdu_len + 1)
         send_data += bytes([unit_id])
-        for i in range(pdu_len):
-            send_data += bytes([pdu_data[i]])
-        self.arm_port.flush()
+        if isinstance(pdu_data, bytes):
+            send_data += pdu_data[:pdu_len]
+        else:
+            for i in range(pdu_len):
+                send_data += bytes([pdu_data[i]])
+        if flush:
+            self.arm_port.flush()
         if self._debug:
             debug_log_datas(send_data, label='send({})'.format(unit_id))
         ret = self.arm_port.write(send_data)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import os
+import json
+import uuid
+import marshal
+import hashlib
+from importlib.util import MAGIC_NUMBER
+from ...version import __version__
+from ...core.utils.log import logger
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.UFACTORY', 'cache', 'xarm', 'blockly')
+DEFAULT_MAX_ENTRIES = 128
+
+# the to_python options which change the generated codes
+_OPTION_KEYS = ['init', 'wait_seconds', 'mode', 'state', 'error_exit', 'stop_exit',
+                'is_exec', 'is_ide', 'vacuum_version', 'axis_type', 'loop_max_frequency']
+
+
+class BlocklyCache(object):
+    """
+    Compile cache of the blockly app
+    key: sha1(app.xml content + SDK version + to_python options)
+    files: {key}.py (generated codes), {key}.bin (MAGIC_NUMBER + succeed + marshalled code object)
+    eviction: LRU by the mtime of the .bin file (touched on every hit), at most max_entries entries are kept
+    """
+    def __init__(self, cache_dir=None, max_entries=None):
+        self.cache_dir = cache_dir if cache_dir else DEFAULT_CACHE_DIR
+        # a negative value disables the eviction
+        self.max_entries = DEFAULT_MAX_ENTRIES if max_entries is None else max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(xml_path, arm=None, **kwargs):
+        with open(xml_path, 'rb') as f:
+            content = f.read()
+        options = {key: kwargs[key] for key in _OPTION_KEYS if key in kwargs}
+        options['highlight_callback'] = kwargs.get('highlight_callback', None) is not None
+        options['arm'] = arm if arm is None or isinstance(arm, str) else '__instance__'
+        sha = hashlib.sha1(content)
+        sha.update(__version__.encode('utf-8'))
+        sha.update(json.dumps(options, sort_keys=True, default=str).encode('utf-8'))
+        return sha.hexdigest()
+
+    def load(self, key):
+        """
+        :return: (succeed, codes, code_obj) or None if not cached
+        """
+        bin_path = os.path.join(self.cache_dir, '{}.bin'.format(key))
+        py_path = os.path.join(self.cache_dir, '{}.py'.format(key))
+        try:
+            with open(bin_path, 'rb') as f:
+                data = f.read()
+            if data[:len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+                self.misses += 1
+                return None
+            succeed = bool(data[len(MAGIC_NUMBER)])
+            code_obj = marshal.loads(data[len(MAGIC_NUMBER) + 1:])
+            with open(py_path, 'r', encoding='utf-8') as f:
+                codes = f.read()
+        except Exception:
+            self.misses += 1
+            return None
+        try:
+            # mark as recently used
+            os.utime(bin_path, None)
+        except Exception:
+            pass
+        self.hits += 1
+        return succeed, codes, code_obj
+
+    def save(self, key, succeed, codes, code_obj):
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            tmp = '.{}'.format(uuid.uuid4().hex)
+            py_path = os.path.join(self.cache_dir, '{}.py'.format(key))
+            bin_path = os.path.join(self.cache_dir, '{}.bin'.format(key))
+            with open(py_path + tmp, 'w', encoding='utf-8') as f:
+                f.write(codes)
+            with open(bin_path + tmp, 'wb') as f:
+                f.write(MAGIC_NUMBER + bytes([int(bool(succeed))]) + marshal.dumps(code_obj))
+            # write the source first, the .bin file is the commit flag of the entry
+            os.replace(py_path + tmp, py_path)
+            os.replace(bin_path + tmp, bin_path)
+            self.evict()
+            return True
+        except Exception as e:
+            logger.warning('save blockly cache failed, %s', e)
+            return False
+
+    def evict(self, max_entries=None):
+        """
+        Remove the least recently used entries until at most max_entries are left
+        :return: the number of the removed entries
+        """
+        max_entries = self.max_entries if max_entries is None else max_entries
+        if max_entries < 0 or not os.path.exists(self.cache_dir):
+            return 0
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.bin'):
+                try:
+                    entries.append((os.path.getmtime(os.path.join(self.cache_dir, name)), name[:-4]))
+                except Exception:
+                    pass
+        if len(entries) <= max_entries:
+            return 0
+        entries.sort()
+        count = 0
+        for _, key in entries[:len(entries) - max_entries]:
+            # remove the .bin first, an entry without the .bin file is never loaded
+            for ext in ['.bin', '.py']:
+                try:
+                    os.remove(os.path.join(self.cache_dir, '{}{}'.format(key, ext)))
+                except Exception:
+                    pass
+            count += 1
+        return count
+
+    def clear(self):
+        if not os.path.exists(self.cache_dir):
+            return 0
+        count = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.bin') or name.endswith('.py'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    count += 1
+                except Exception:
+                    pass
+        return count
@@ -925,6 +925,10 @@ class _BlocklyHandler(_BlocklyBase):
         self._append_main_code(
             'self._holding_callbacks.append({{\'trigger\': \'{}\', \'addr\': \'{}\', \'callback\': self.{}}})'.format(
                 trigger, addr, name), indent=indent + 2)
+        self._append_main_code('if self._event_bus is not None:', indent=indent + 2)
+        self._append_main_code(
+            '    self._event_listeners.append(self._event_bus.subscribe(\'holding_register:{}\', lambda value, prev, index={}: self._on_holding_event(index, value, prev)))'.format(
+                addr, len(self._holding_callbacks) - 1), indent=indent + 2)
     
     def __handle_count_event(self, count_type, block, indent=0, arg_map=None):
         fields = self._get_nodes('field', root=block)
@@ -20,6 +20,25 @@ class BlocklyTool(_BlocklyHandler):
     def codes(self):
         return '\n'.join(self._codes)
 
+    def _has_listen_tgpio_digital(self):
+        return self._listen_tgpio_digital or len(self._tgpio_digital_callbacks) > 0
+
+    def _has_listen_tgpio_analog(self):
+        return self._listen_tgpio_analog or len(self._tgpio_analog_callbacks) > 0
+
+    def _has_listen_cgpio_state(self):
+        return self._listen_cgpio_state or len(self._cgpio_digital_callbacks) > 0 or len(self._cgpio_analog_callbacks) > 0
+
+    def _has_listen_count(self):
+        return self._listen_count or len(self._count_callbacks) > 0
+
+    def _has_listen_holding(self):
+        return self._listen_holding or len(self._holding_callbacks) > 0
+
+    def _has_listen_events(self):
+        return self._has_listen_tgpio_digital() or self._has_listen_tgpio_analog() or self._has_listen_cgpio_state() \
+            or self._has_listen_count() or self._has_listen_holding()
+
     def to_python(self, path=None, arm=None, init=True, wait_seconds=1, mode=0, state=0, error_exit=True, stop_exit=True, **kwargs):
         if not self._is_converted:
             self._is_exec = kwargs.get('is_exec', False)
@@ -105,6 +124,10 @@ class BlocklyTool(_BlocklyHandler):
         self._append_main_code('            self.pprint(\'MainException: {}\'.format(e))', indent=-1)
         self._append_main_code('        finally:', indent=-1)
         self._append_main_code('            self.alive = False', indent=-1)
+        if self._has_listen_events():
+            self._append_main_code('            if self._event_bus is not None:', indent=-1)
+            self._append_main_code('                for listener in self._event_listeners:', indent=-1)
+            self._append_main_code('                    self._event_bus.unsubscribe(listener)', indent=-1)
         if stop_exit or error_exit:
             if error_exit:
                 self._append_main_code('            self._arm.release_error_warn_changed_callback(self._error_warn_changed_callback)', indent=-1)
@@ -173,32 +196,43 @@ class BlocklyTool(_BlocklyHandler):
             self._append_main_init_code('        self._callback_in_thread = kwargs.get(\'callback_in_thread\', True)')
             self._append_main_init_code('        self._callback_que = queue.Queue()')
 
-        if self._listen_tgpio_digital or self._listen_tgpio_analog or self._listen_cgpio_state \
-            or len(self._tgpio_digital_callbacks) or len(self._tgpio_analog_callbacks) or len(self._cgpio_digital_callbacks) or len(self._cgpio_analog_callbacks):
-            self._append_main_init_code('        gpio_t = threading.Thread(target=self._listen_gpio_thread, daemon=True)')
-            self._append_main_init_code('        gpio_t.start()')
-
         if len(self._tgpio_digital_callbacks) or len(self._tgpio_analog_callbacks) or len(self._cgpio_digital_callbacks) or len(self._cgpio_analog_callbacks)\
                 or len(self._count_callbacks) or len(self._holding_callbacks):
             self._append_main_init_code('        callback_t = threading.Thread(target=self._event_callback_handle_thread, daemon=True)')
             self._append_main_init_code('        callback_t.start()')
-        
-        if self._listen_count or len(self._count_callbacks):
-            self._append_main_init_code(
-                '        count_t = threading.Thread(target=self._listen_count_thread, daemon=True)')
-            self._append_main_init_code('        count_t.start()')
-        
-        if self._holding_callbacks or len(self._holding_callbacks):
-            self._append_main_init_code(
-                '        holding_t = threading.Thread(target=self._listen_holding_thread, daemon=True)')
-            self._append_main_init_code('        holding_t.start()')
-        
+
+        if self._has_listen_events():
+            # listen the events on the event bus of the SDK (one dispatcher for all the listeners),
+            # fallback to the polling threads if the SDK does not support it
+            self._append_main_init_code('        self._event_bus = getattr(self._arm, \'event_bus\', None)')
+            self._append_main_init_code('        self._event_listeners = []')
+            self._append_main_init_code('        if self._event_bus is not None:')
+            if self._has_listen_tgpio_digital():
+                self._append_main_init_code('            self._event_listeners.append(self._event_bus.subscribe(\'tgpio_digital\', self._on_tgpio_digital_event))')
+            if self._has_listen_tgpio_analog():
+                self._append_main_init_code('            self._event_listeners.append(self._event_bus.subscribe(\'tgpio_analog\', self._on_tgpio_analog_event))')
+            if self._has_listen_cgpio_state():
+                self._append_main_init_code('            self._event_listeners.append(self._event_bus.subscribe(\'cgpio_state\', self._on_cgpio_state_event))')
+            if self._has_listen_count():
+                self._append_main_init_code('            self._event_listeners.append(self._event_bus.subscribe(\'count\', self._on_count_event))')
+            if not (self._has_listen_tgpio_digital() or self._has_listen_tgpio_analog() or self._has_listen_cgpio_state() or self._has_listen_count()):
+                # holding registers listeners are subscribed when the callbacks are registered
+                self._append_main_init_code('            pass')
+            self._append_main_init_code('        else:')
+            if self._has_listen_tgpio_digital() or self._has_listen_tgpio_analog() or self._has_listen_cgpio_state():
+                self._append_main_init_code('            gpio_t = threading.Thread(target=self._listen_gpio_thread, daemon=True)')
+                self._append_main_init_code('            gpio_t.start()')
+            if self._has_listen_count():
+                self._append_main_init_code('            count_t = threading.Thread(target=self._listen_count_thread, daemon=True)')
+                self._append_main_init_code('            count_t.start()')
+            if self._has_listen_holding():
+                self._append_main_init_code('            holding_t = threading.Thread(target=self._listen_holding_thread, daemon=True)')
+                self._append_main_init_code('            holding_t.start()')
+
         self._append_main_init_code('')
 
         self.__define_callback_thread_func()
-        self.__define_listen_gpio_thread_func()
-        self.__define_listen_count_thread_func()
-        self.__define_listen_holding_registers_thread_func()
+        self.__define_listen_event_funcs()
         self.__define_run_blockly_func()
         self.__define_robot_init_func(init=init, wait_seconds=wait_seconds, mode=mode, state=state, error_exit=error_exit, stop_exit=stop_exit)
         self.__define_error_warn_changed_callback_func(error_exit=error_exit)
@@ -264,107 +298,103 @@ class BlocklyTool(_BlocklyHandler):
             self._append_main_init_code('            except Exception as e:')
             self._append_main_init_code('                self.pprint(e)\n')
 
-    def __define_listen_gpio_thread_func(self):
-        # Define listen gpio thread function
-        if self._listen_tgpio_digital or self._listen_tgpio_analog or self._listen_cgpio_state \
-            or len(self._tgpio_digital_callbacks) or len(self._tgpio_analog_callbacks) or len(self._cgpio_digital_callbacks) or len(self._cgpio_analog_callbacks):
-            
-            self._append_main_init_code('    def _listen_gpio_thread(self):')
-            if self._listen_tgpio_digital or len(self._tgpio_digital_callbacks):
-                self._append_main_init_code('        _, values2 = self._arm.get_tgpio_digital(2)')
-                self._append_main_init_code('        _, values = self._arm.get_tgpio_digital()')
-                self._append_main_init_code('        values.insert(2, values2)')
-                self._append_main_init_code('        tgpio_digitals = values if _ == 0 else [0] * 5')
-            if self._listen_tgpio_analog or len(self._tgpio_analog_callbacks):
-                self._append_main_init_code('        _, values = self._arm.get_tgpio_analog()')
-                self._append_main_init_code('        tgpio_analogs = values if _ == 0 else [0] * 2')
-            if self._listen_cgpio_state or len(self._cgpio_digital_callbacks) or len(self._cgpio_analog_callbacks):
-                self._append_main_init_code('        _, values = self._arm.get_cgpio_state()')
-            if self._listen_cgpio_state or len(self._cgpio_digital_callbacks):
-                self._append_main_init_code('        cgpio_digitals = [values[3] >> i & 0x0001 if values[10][i] in [0, 255] else 1 for i in range(len(values[10]))] if _ == 0 else [0] * 16')
-            if self._listen_cgpio_state or len(self._cgpio_analog_callbacks):
-                self._append_main_init_code('        cgpio_analogs = [values[6], values[7]] if _ == 0 else [0] * 2')
+    def __define_listen_event_funcs(self):
+        # Define the event handlers, called by the event bus of the SDK or the polling threads with (value, prev_value)
+        if self._has_listen_tgpio_digital():
+            self._append_main_init_code('    def _on_tgpio_digital_event(self, values, prev):')
+            if len(self._tgpio_digital_callbacks):
+                self._append_main_init_code('        if prev is None:')
+                self._append_main_init_code('            return')
+                self._append_main_init_code('        for item in self._tgpio_digital_callbacks:')
+                self._append_main_init_code('            io = item[\'io\']')
+                self._append_main_init_code('            if io < len(values) and eval(\'{} {} {}\'.format(values[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(prev[io], item[\'op\'], item[\'trigger\'])):')
+                self._append_main_init_code('                self._callback_que.put(item[\'callback\'])\n')
+            else:
+                self._append_main_init_code('        pass\n')
+        if self._has_listen_tgpio_analog():
+            self._append_main_init_code('    def _on_tgpio_analog_event(self, values, prev):')
+            if len(self._tgpio_analog_callbacks):
+                self._append_main_init_code('        if prev is None:')
+                self._append_main_init_code('            return')
+                self._append_main_init_code('        for item in self._tgpio_analog_callbacks:')
+                self._append_main_init_code('            io = item[\'io\']')
+                self._append_main_init_code('            if io < len(values) and eval(\'{} {} {}\'.format(values[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(prev[io], item[\'op\'], item[\'trigger\'])):')
+                self._append_main_init_code('                self._callback_que.put(item[\'callback\'])\n')
+            else:
+                self._append_main_init_code('        pass\n')
+        if self._has_listen_cgpio_state():
+            self._append_main_init_code('    def _on_cgpio_state_event(self, values, prev):')
+            if len(self._cgpio_digital_callbacks) or len(self._cgpio_analog_callbacks):
+                self._append_main_init_code('        if prev is not None and self._cgpio_state is not None:')
+                if len(self._cgpio_digital_callbacks):
+                    self._append_main_init_code('            digitals = [values[3] >> i & 0x0001 if values[10][i] in [0, 255] else 1 for i in range(len(values[10]))]')
+                    self._append_main_init_code('            prev_digitals = [prev[3] >> i & 0x0001 if prev[10][i] in [0, 255] else 1 for i in range(len(prev[10]))]')
+                    self._append_main_init_code('            for item in self._cgpio_digital_callbacks:')
+                    self._append_main_init_code('                io = item[\'io\']')
+                    self._append_main_init_code('                if io < min(len(digitals), len(prev_digitals)) and eval(\'{} {} {}\'.format(digitals[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(prev_digitals[io], item[\'op\'], item[\'trigger\'])):')
+                    self._append_main_init_code('                    self._callback_que.put(item[\'callback\'])')
+                if len(self._cgpio_analog_callbacks):
+                    self._append_main_init_code('            analogs = [values[6], values[7]]')
+                    self._append_main_init_code('            prev_analogs = [prev[6], prev[7]]')
+                    self._append_main_init_code('            for item in self._cgpio_analog_callbacks:')
+                    self._append_main_init_code('                io = item[\'io\']')
+                    self._append_main_init_code('                if io < len(analogs) and eval(\'{} {} {}\'.format(analogs[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(prev_analogs[io], item[\'op\'], item[\'trigger\'])):')
+                    self._append_main_init_code('                    self._callback_que.put(item[\'callback\'])')
+            self._append_main_init_code('        self._cgpio_state = values\n')
+        if self._has_listen_count():
+            self._append_main_init_code('    def _on_count_event(self, value, prev):')
+            if len(self._count_callbacks):
+                self._append_main_init_code('        if self._counter_val is not None and self._counter_val != value:')
+                self._append_main_init_code('            for item in self._count_callbacks:')
+                self._append_main_init_code('                if eval(\'{} {} {}\'.format(value, item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(self._counter_val, item[\'op\'], item[\'trigger\'])):')
+                self._append_main_init_code('                    self._callback_que.put(item[\'callback\'])')
+            self._append_main_init_code('        self._counter_val = value\n')
+        if self._has_listen_holding():
+            self._append_main_init_code('    def _on_holding_event(self, index, value, prev):')
+            self._append_main_init_code('        item = self._holding_callbacks[index]')
+            self._append_main_init_code('        if self._holding_dict.get(index, None) is not None:')
+            self._append_main_init_code('            if eval(\'{} == {}\'.format(value, item[\'trigger\'])) and not eval(\'{} == {}\'.format(self._holding_dict[index], item[\'trigger\'])):')
+            self._append_main_init_code('                self._callback_que.put(item[\'callback\'])')
+            self._append_main_init_code('        self._holding_dict[index] = value\n')
 
+        # Define the polling threads, only used if the SDK does not support the event bus
+        if self._has_listen_tgpio_digital() or self._has_listen_tgpio_analog() or self._has_listen_cgpio_state():
+            self._append_main_init_code('    def _listen_gpio_thread(self):')
+            if self._has_listen_tgpio_digital():
+                self._append_main_init_code('        tgpio_digitals = None')
+            if self._has_listen_tgpio_analog():
+                self._append_main_init_code('        tgpio_analogs = None')
             self._append_main_init_code('        while self.alive:')
-            if self._listen_tgpio_digital or len(self._tgpio_digital_callbacks):
+            if self._has_listen_tgpio_digital():
                 self._append_main_init_code('            _, values2 = self._arm.get_tgpio_digital(2)')
                 self._append_main_init_code('            _, values = self._arm.get_tgpio_digital()')
-                self._append_main_init_code('            values.insert(2, values2)')
-                self._append_main_init_code('            if _ == 0 and tgpio_digitals is not None:')
-                self._append_main_init_code('                for item in self._tgpio_digital_callbacks:')
-                self._append_main_init_code('                    for io in range(5):')
-                self._append_main_init_code('                        if item[\'io\'] == io and eval(\'{} {} {}\'.format(values[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(tgpio_digitals[io], item[\'op\'], item[\'trigger\'])):')
-                self._append_main_init_code('                            self._callback_que.put(item[\'callback\'])')
-                self._append_main_init_code('            tgpio_digitals = values if _ == 0 else tgpio_digitals')
-            if self._listen_tgpio_digital or len(self._tgpio_analog_callbacks):
+                self._append_main_init_code('            if _ == 0:')
+                self._append_main_init_code('                values.insert(2, values2)')
+                self._append_main_init_code('                self._on_tgpio_digital_event(values, tgpio_digitals)')
+                self._append_main_init_code('                tgpio_digitals = values')
+            if self._has_listen_tgpio_analog():
                 self._append_main_init_code('            _, values = self._arm.get_tgpio_analog()')
-                self._append_main_init_code('            if _ == 0 and tgpio_analogs is not None:')
-                self._append_main_init_code('                for item in self._tgpio_analog_callbacks:')
-                self._append_main_init_code('                    for io in range(2):')
-                self._append_main_init_code('                        if item[\'io\'] == io and eval(\'{} {} {}\'.format(values[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(tgpio_analogs[io], item[\'op\'], item[\'trigger\'])):')
-                self._append_main_init_code('                            self._callback_que.put(item[\'callback\'])')
-                self._append_main_init_code('            tgpio_analogs = values if _ == 0 else tgpio_analogs')
-
-            if not self._listen_cgpio_state and len(self._cgpio_digital_callbacks) == 0 and len(self._cgpio_analog_callbacks) == 0:
-                self._append_main_init_code('            time.sleep(0.01)\n')
-                return
-
-            self._append_main_init_code('            _, values = self._arm.get_cgpio_state()')
-            self._append_main_init_code('            if _ == 0 and self._cgpio_state is not None and self._cgpio_state != values:')
-            if self._listen_cgpio_state or len(self._cgpio_digital_callbacks):
-                self._append_main_init_code('                digitals = [values[3] >> i & 0x0001 if values[10][i] in [0, 255] else 1 for i in range(len(values[10]))]')
-                self._append_main_init_code('                for item in self._cgpio_digital_callbacks:')
-                self._append_main_init_code('                    for io in range(len(digitals)):')
-                self._append_main_init_code('                        if item[\'io\'] == io and eval(\'{} {} {}\'.format(digitals[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(cgpio_digitals[io], item[\'op\'], item[\'trigger\'])):')
-                self._append_main_init_code('                            self._callback_que.put(item[\'callback\'])')
-                self._append_main_init_code('                cgpio_digitals = digitals')
-            if self._listen_cgpio_state or len(self._cgpio_analog_callbacks):
-                self._append_main_init_code('                analogs = [values[6], values[7]]')
-                self._append_main_init_code('                for item in self._cgpio_analog_callbacks:')
-                self._append_main_init_code('                    for io in range(len(analogs)):')
-                self._append_main_init_code('                        if item[\'io\'] == io and eval(\'{} {} {}\'.format(analogs[io], item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(cgpio_analogs[io], item[\'op\'], item[\'trigger\'])):')
-                self._append_main_init_code('                            self._callback_que.put(item[\'callback\'])')
-                self._append_main_init_code('                cgpio_analogs = analogs')
-            self._append_main_init_code('            self._cgpio_state = values if _ == 0 else self._cgpio_state')
+                self._append_main_init_code('            if _ == 0:')
+                self._append_main_init_code('                self._on_tgpio_analog_event(values, tgpio_analogs)')
+                self._append_main_init_code('                tgpio_analogs = values')
+            if self._has_listen_cgpio_state():
+                self._append_main_init_code('            _, values = self._arm.get_cgpio_state()')
+                self._append_main_init_code('            if _ == 0 and self._cgpio_state != values:')
+                self._append_main_init_code('                self._on_cgpio_state_event(values, self._cgpio_state)')
             self._append_main_init_code('            time.sleep(0.01)\n')
-
-    def __define_listen_count_thread_func(self):
-        # Define listen counter value thread function
-        if self._listen_count or len(self._count_callbacks):
+        if self._has_listen_count():
             self._append_main_init_code('    def _listen_count_thread(self):')
-            if self._listen_count or len(self._count_callbacks):
-                self._append_main_init_code('        values = self._arm.count')
-
             self._append_main_init_code('        while self.alive:')
-
-            self._append_main_init_code('            values = self._arm.count')
-            self._append_main_init_code(
-                '            if self._counter_val is not None and self._counter_val != values:')
-            if self._listen_count or len(self._count_callbacks):
-                self._append_main_init_code('                for item in self._count_callbacks:')
-                self._append_main_init_code(
-                    '                    if eval(\'{} {} {}\'.format(values, item[\'op\'], item[\'trigger\'])) and not eval(\'{} {} {}\'.format(self._counter_val, item[\'op\'], item[\'trigger\'])):')
-                self._append_main_init_code('                            self._callback_que.put(item[\'callback\'])')
-            self._append_main_init_code('            self._counter_val = values')
+            self._append_main_init_code('            self._on_count_event(self._arm.count, self._counter_val)')
             self._append_main_init_code('            time.sleep(0.01)\n')
-    
-    def __define_listen_holding_registers_thread_func(self):
-        # Define listen holding registers value thread function
-        if self._listen_holding or len(self._holding_callbacks):
+        if self._has_listen_holding():
             self._append_main_init_code('    def _listen_holding_thread(self):')
-
             self._append_main_init_code('        while self.alive:')
             self._append_main_init_code('            for index, item in enumerate(self._holding_callbacks):')
-            self._append_main_init_code('                for i in range(2):')
-            self._append_main_init_code('                    _, values = self._arm.read_holding_registers(int(item[\'addr\']), 1)')
-            self._append_main_init_code(
-                '                    if _ == 0 and self._holding_dict.get(index, None) is not None:')
-            self._append_main_init_code(
-                '                        if eval(\'{} == {}\'.format(values[0], item[\'trigger\'])) and not eval(\'{} == {}\'.format(self._holding_dict[index], item[\'trigger\'])):')
-            self._append_main_init_code('                            self._callback_que.put(item[\'callback\'])')
-            self._append_main_init_code('                    self._holding_dict[index] = values[0] if _ == 0 else self._holding_dict.get(index, None)')
-            self._append_main_init_code('                    time.sleep(0.01)\n')
-
+            self._append_main_init_code('                _, values = self._arm.read_holding_registers(int(item[\'addr\']), 1)')
+            self._append_main_init_code('                if _ == 0:')
+            self._append_main_init_code('                    self._on_holding_event(index, values[0], self._holding_dict.get(index, None))')
+            self._append_main_init_code('                time.sleep(0.01)\n')
     def __define_run_blockly_func(self):
         if self._is_run_blockly and not self._is_exec:
             self._append_main_init_code('    def _start_run_blockly(self, fileName, times):')
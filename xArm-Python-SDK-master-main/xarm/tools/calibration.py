@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Client side TCP / user coordinate calibration (NumPy required)
+
+The controller calibration APIs (calibrate_tcp_coordinate_offset, ...) take a fixed number of points,
+the solvers here take any number of (noisy) samples and solve the over-determined problems in the least-squares sense:
+    solve_tcp_offset:              pivot calibration, the TCP stays on the same point while the orientation changes
+    solve_tcp_orientation_offset:  mean rotation between the poses taught without / with the TCP orientation offset
+    solve_user_frame:              origin samples, samples along x+ and samples in the xy plane (x+/y+ side)
+    solve_user_frame_from_points:  pairs of points known in the base and in the user coordinate
+Every solver returns a CalibrationResult with the residual of every sample and the outlier flags,
+the outliers (residual > max(tolerance, median + outlier_sigma * robust sigma)) are excluded and the problem is solved again.
+
+Note: the poses are [x, y, z, roll, pitch, yaw] in the base coordinate, R = Rz(yaw) * Ry(pitch) * Rx(roll),
+    the TCP poses used for the TCP calibration must be reported with the TCP offset set to zero
+"""
+
+import math
+import threading
+import numpy as np
+
+DEFAULT_OUTLIER_SIGMA = 3.0
+DEFAULT_MAX_ITER = 5
+_MAD_SCALE = 1.4826  # MAD to the standard deviation of a normal distribution
+
+
+class CalibrationResult(object):
+    """
+    value: the calibrated value (see the solver)
+    residuals: ndarray (n,), the residual of every sample (mm or rad/°, same as the value)
+    outliers: ndarray (n,) of bool, the samples excluded from the final solution
+    rms: the rms of the residuals of the inliers
+    extra: dict, the other values solved with the value (see the solver)
+    """
+    __slots__ = ('value', 'residuals', 'outliers', 'rms', 'extra')
+
+    def __init__(self, value, residuals, outliers, extra=None):
+        self.value = value
+        self.residuals = residuals
+        self.outliers = outliers
+        inliers = residuals[~outliers]
+        self.rms = float(np.sqrt(np.mean(inliers * inliers))) if len(inliers) else float('nan')
+        self.extra = extra or {}
+
+    @property
+    def count(self):
+        """
+        the number of the inliers
+        """
+        return int(len(self.outliers) - np.count_nonzero(self.outliers))
+
+    def __repr__(self):
+        return 'CalibrationResult(value={}, rms={:.4f}, inliers={}/{})'.format(
+            self.value, self.rms, self.count, len(self.outliers))
+
+
+def rpy_to_matrix(rpy, is_radian=False):
+    """
+    :param rpy: [roll, pitch, yaw] or array (n, 3)
+    :return: ndarray (3, 3) or (n, 3, 3)
+    """
+    rpy = np.asarray(rpy, dtype=np.float64)
+    if not is_radian:
+        rpy = np.radians(rpy)
+    cr, cp, cy = np.cos(rpy[..., 0]), np.cos(rpy[..., 1]), np.cos(rpy[..., 2])
+    sr, sp, sy = np.sin(rpy[..., 0]), np.sin(rpy[..., 1]), np.sin(rpy[..., 2])
+    mat = np.empty(rpy.shape[:-1] + (3, 3), dtype=np.float64)
+    mat[..., 0, 0] = cy * cp
+    mat[..., 0, 1] = cy * sp * sr - sy * cr
+    mat[..., 0, 2] = cy * sp * cr + sy * sr
+    mat[..., 1, 0] = sy * cp
+    mat[..., 1, 1] = sy * sp * sr + cy * cr
+    mat[..., 1, 2] = sy * sp * cr - cy * sr
+    mat[..., 2, 0] = -sp
+    mat[..., 2, 1] = cp * sr
+    mat[..., 2, 2] = cp * cr
+    return mat
+
+
+def matrix_to_rpy(mat, is_radian=False):
+    """
+    :param mat: rotation matrix (3, 3)
+    :return: [roll, pitch, yaw]
+    """
+    pitch = math.atan2(-mat[2, 0], math.hypot(mat[0, 0], mat[1, 0]))
+    if abs(math.cos(pitch)) > 1e-9:
+        roll = math.atan2(mat[2, 1], mat[2, 2])
+        yaw = math.atan2(mat[1, 0], mat[0, 0])
+    else:
+        # gimbal lock, the yaw is put into the roll
+        roll = math.atan2(-mat[1, 2], mat[1, 1])
+        yaw = 0.0
+    rpy = [roll, pitch, yaw]
+    return rpy if is_radian else [math.degrees(v) for v in rpy]
+
+
+def _split_poses(poses, is_radian):
+    poses = np.asarray(poses, dtype=np.float64)
+    if poses.ndim != 2 or poses.shape[1] < 6:
+        raise ValueError('each pose must contain x/y/z/roll/pitch/yaw')
+    return poses[:, :3], rpy_to_matrix(poses[:, 3:6], is_radian=is_radian)
+
+
+def _robust_fit(fit, residual, n, min_count, outlier_sigma, tolerance, max_iter, valid=None):
+    """
+    fit(mask) -> model, residual(model) -> residuals of all the samples, valid(mask) -> the mask can be fitted or not
+    refit without the outliers until the inliers do not change
+    """
+    if n < min_count:
+        raise ValueError('at least {} samples are required, got {}'.format(min_count, n))
+    mask = np.ones(n, dtype=bool)
+    model = fit(mask)
+    res = residual(model)
+    for _ in range(max_iter):
+        if not outlier_sigma:
+            break
+        inliers = res[mask]
+        sigma = _MAD_SCALE * np.median(np.abs(inliers - np.median(inliers)))
+        limit = max(tolerance, np.median(inliers) + outlier_sigma * sigma)
+        new_mask = res <= limit
+        if np.count_nonzero(new_mask) < min_count or np.array_equal(new_mask, mask) \
+                or (valid is not None and not valid(new_mask)):
+            break
+        mask = new_mask
+        model = fit(mask)
+        res = residual(model)
+    return model, res, ~mask
+
+
+def _solve_pivot(p, rot):
+    # R_i * t + p_i = c  ==>  [R_i, -I] * [t; c] = -p_i, normal equations (R_i^T * R_i = I)
+    n = len(p)
+    sum_rt = rot.sum(axis=0).T
+    normal = np.empty((6, 6), dtype=np.float64)
+    normal[:3, :3] = np.eye(3) * n
+    normal[3:, 3:] = np.eye(3) * n
+    normal[:3, 3:] = -sum_rt
+    normal[3:, :3] = -sum_rt.T
+    rhs = np.concatenate((-np.einsum('nji,nj->i', rot, p), p.sum(axis=0)))
+    if np.linalg.cond(normal) > 1e10:
+        raise ValueError('degenerate samples, the orientations must be different enough')
+    sol = np.linalg.solve(normal, rhs)
+    return sol[:3], sol[3:]
+
+
+def _pivot_residuals(p, rot, tcp, pivot):
+    return np.linalg.norm(np.einsum('nij,j->ni', rot, tcp) + p - pivot, axis=1)
+
+
+def solve_tcp_offset(poses, is_radian=False, outlier_sigma=DEFAULT_OUTLIER_SIGMA, tolerance=0.5, max_iter=DEFAULT_MAX_ITER):
+    """
+    TCP position offset by the pivot method (the least-squares version of calibrate_tcp_coordinate_offset):
+    the tool tip touches the same fixed point with different orientations
+
+    :param poses: list/ndarray (n, 6) of the flange poses [x, y, z, roll, pitch, yaw], n >= 4
+    :param is_radian: the roll/pitch/yaw in radians or not, default is False
+    :param outlier_sigma: outlier threshold in robust sigma, 0/None means no outlier rejection
+    :param tolerance: the residuals (mm) under the tolerance are never outliers
+    :param max_iter: max number of the refits
+    :return: CalibrationResult
+        value: [x, y, z] TCP offset (mm)
+        residuals: the distance (mm) between the tool tip of the sample and the pivot
+        extra: {'pivot': [x, y, z] the fixed point in the base coordinate}
+    """
+    p, rot = _split_poses(poses, is_radian)
+    (tcp, pivot), res, outliers = _robust_fit(
+        lambda mask: _solve_pivot(p[mask], rot[mask]),
+        lambda model: _pivot_residuals(p, rot, *model),
+        len(p), 4, outlier_sigma, tolerance, max_iter)
+    return CalibrationResult(tcp.tolist(), res, outliers, {'pivot': pivot.tolist()})
+
+
+def _mean_rotation(rots):
+    # chordal L2 mean, the rotation nearest to the sum of the matrices
+    u, _, vt = np.linalg.svd(rots.sum(axis=0))
+    d = np.sign(np.linalg.det(u @ vt))
+    return u @ np.diag([1.0, 1.0, d]) @ vt
+
+
+def _rotation_angles(rots, mean):
+    # angle of mean^T * R_i, trace = 1 + 2 * cos(angle)
+    trace = np.einsum('ji,nji->n', mean, rots)
+    return np.arccos(np.clip((trace - 1) / 2, -1.0, 1.0))
+
+
+def solve_tcp_orientation_offset(rpy_be, rpy_bt, input_is_radian=False, return_is_radian=False,
+                                 outlier_sigma=DEFAULT_OUTLIER_SIGMA, tolerance=0.2, max_iter=DEFAULT_MAX_ITER):
+    """
+    TCP orientation offset (the least-squares version of calibrate_tcp_orientation_offset): R_bt = R_be * R_offset
+
+    :param rpy_be: list/ndarray (n, 3), the rpy of the teaching points without the TCP offset
+    :param rpy_bt: list/ndarray (n, 3), the rpy of the same teaching points with the TCP offset
+    :param input_is_radian: the rpy_be/rpy_bt in radians or not, default is False
+    :param return_is_radian: the value/residuals/tolerance in radians or not, default is False
+    :param outlier_sigma: outlier threshold in robust sigma, 0/None means no outlier rejection
+    :param tolerance: the residuals under the tolerance are never outliers, default is 0.2°
+    :return: CalibrationResult
+        value: [roll, pitch, yaw] TCP orientation offset
+        residuals: the rotation angle between the offset of the sample and the value
+    """
+    rot_be = rpy_to_matrix(np.asarray(rpy_be, dtype=np.float64)[:, :3], is_radian=input_is_radian)
+    rot_bt = rpy_to_matrix(np.asarray(rpy_bt, dtype=np.float64)[:, :3], is_radian=input_is_radian)
+    if len(rot_be) != len(rot_bt):
+        raise ValueError('rpy_be and rpy_bt must have the same length')
+    offsets = np.einsum('nji,njk->nik', rot_be, rot_bt)
+    tolerance = tolerance if return_is_radian else math.radians(tolerance)
+    mean, res, outliers = _robust_fit(
+        lambda mask: _mean_rotation(offsets[mask]),
+        lambda model: _rotation_angles(offsets, model),
+        len(offsets), 1, outlier_sigma, tolerance, max_iter)
+    return CalibrationResult(matrix_to_rpy(mean, is_radian=return_is_radian),
+                             res if return_is_radian else np.degrees(res), outliers)
+
+
+def _frame_result(rot, origin, is_radian):
+    return [float(v) for v in origin] + matrix_to_rpy(rot, is_radian=is_radian)
+
+
+def solve_user_frame(origin_points, x_points, plane_points, return_is_radian=False,
+                     outlier_sigma=DEFAULT_OUTLIER_SIGMA, tolerance=0.5, max_iter=DEFAULT_MAX_ITER):
+    """
+    User coordinate (the least-squares version of the three-point method of
+    calibrate_user_orientation_offset + calibrate_user_coordinate_offset)
+        the origin is the mean of origin_points
+        the x axis is the line fitted through origin_points + x_points (pointing to x_points)
+        the xy plane is the plane fitted through all the points, the y axis points to the plane_points side
+
+    :param origin_points: list/ndarray (n, >=3), the TCP positions (mm) at the origin, only x/y/z are used
+    :param x_points: list/ndarray (n, >=3), the TCP positions along x+
+    :param plane_points: list/ndarray (n, >=3), the TCP positions in the xy plane on the y+ side (the y+ direction of the three-point method)
+    :param return_is_radian: the roll/pitch/yaw of the value in radians or not, default is False
+    :param outlier_sigma: outlier threshold in robust sigma, 0/None means no outlier rejection
+    :param tolerance: the residuals (mm) under the tolerance are never outliers
+    :return: CalibrationResult
+        value: [x, y, z, roll, pitch, yaw], the user coordinate in the base coordinate (set_world_offset)
+        residuals: origin_points: the distance to the origin, x_points: the distance to the x axis,
+            plane_points: the distance to the xy plane, in the order origin_points + x_points + plane_points
+    """
+    groups = [np.asarray(pts, dtype=np.float64)[:, :3].reshape(-1, 3) for pts in (origin_points, x_points, plane_points)]
+    if not all(len(g) for g in groups):
+        raise ValueError('origin_points, x_points and plane_points must not be empty')
+    pts = np.concatenate(groups)
+    kind = np.repeat([0, 1, 2], [len(g) for g in groups])
+
+    def fit(mask):
+        origin = pts[mask & (kind == 0)].mean(axis=0)
+        line = pts[mask & (kind <= 1)]
+        center = line.mean(axis=0)
+        x_axis = np.linalg.svd(line - center)[2][0]
+        if np.dot(pts[mask & (kind == 1)].mean(axis=0) - origin, x_axis) < 0:
+            x_axis = -x_axis
+        plane = pts[mask]
+        normal = np.linalg.svd(plane - plane.mean(axis=0))[2][2]
+        y_axis = np.cross(normal, x_axis)
+        y_axis /= np.linalg.norm(y_axis)
+        if np.dot(pts[mask & (kind == 2)].mean(axis=0) - origin, y_axis) < 0:
+            y_axis = -y_axis
+        z_axis = np.cross(x_axis, y_axis)
+        # the origin is projected on the fitted x axis and xy plane
+        origin = center + np.dot(origin - center, x_axis) * x_axis
+        origin -= np.dot(origin - plane.mean(axis=0), z_axis) * z_axis
+        return np.stack((x_axis, y_axis, z_axis), axis=1), origin
+
+    def residual(model):
+        rot, origin = model
+        local = (pts - origin) @ rot
+        return np.where(kind == 0, np.linalg.norm(local, axis=1),
+                        np.where(kind == 1, np.hypot(local[:, 1], local[:, 2]), np.abs(local[:, 2])))
+
+    def valid(mask):
+        # every group keeps at least one point
+        return all(np.any(mask & (kind == k)) for k in range(3))
+
+    (rot, origin), res, outliers = _robust_fit(fit, residual, len(pts), 3, outlier_sigma, tolerance, max_iter, valid=valid)
+    return CalibrationResult(_frame_result(rot, origin, return_is_radian), res, outliers)
+
+
+def solve_user_frame_from_points(base_points, user_points, return_is_radian=False,
+                                 outlier_sigma=DEFAULT_OUTLIER_SIGMA, tolerance=0.5, max_iter=DEFAULT_MAX_ITER):
+    """
+    User coordinate from the points known in both coordinates (Kabsch): base = R * user + t
+
+    :param base_points: list/ndarray (n, >=3), the TCP positions (mm) in the base coordinate, n >= 3 and not collinear
+    :param user_points: list/ndarray (n, >=3), the same points in the user coordinate (mm)
+    :param return_is_radian: the roll/pitch/yaw of the value in radians or not, default is False
+    :param outlier_sigma: outlier threshold in robust sigma, 0/None means no outlier rejection
+    :param tolerance: the residuals (mm) under the tolerance are never outliers
+    :return: CalibrationResult
+        value: [x, y, z, roll, pitch, yaw], the user coordinate in the base coordinate (set_world_offset)
+        residuals: the distance (mm) between the base point and the transformed user point
+    """
+    base = np.asarray(base_points, dtype=np.float64)[:, :3]
+    user = np.asarray(user_points, dtype=np.float64)[:, :3]
+    if base.shape != user.shape:
+        raise ValueError('base_points and user_points must have the same length')
+
+    def fit(mask):
+        b, u = base[mask], user[mask]
+        bc, uc = b.mean(axis=0), u.mean(axis=0)
+        left, sv, vt = np.linalg.svd((b - bc).T @ (u - uc))
+        if sv[1] < 1e-9 * max(sv[0], 1e-12):
+            raise ValueError('degenerate samples, the points must not be collinear')
+        d = np.sign(np.linalg.det(left @ vt))
+        rot = left @ np.diag([1.0, 1.0, d]) @ vt
+        return rot, bc - rot @ uc
+
+    def residual(model):
+        rot, t = model
+        return np.linalg.norm(user @ rot.T + t - base, axis=1)
+
+    (rot, t), res, outliers = _robust_fit(fit, residual, len(base), 3, outlier_sigma, tolerance, max_iter)
+    return CalibrationResult(_frame_result(rot, t, return_is_radian), res, outliers)
+
+
+class TcpCalibrator(object):
+    """
+    Continuous pivot calibration of the TCP offset from the report stream (teach session):
+    while the tool tip is kept on a fixed point and the arm is rotated around it (manual mode),
+    the reported poses are collected (a new sample only when the orientation changed more than min_angle)
+    and the TCP offset can be solved at any time, the solve is O(n) with a 6x6 system
+
+    ex:
+        calibrator = TcpCalibrator()
+        calibrator.attach(arm)  # the TCP offset of the arm must be zero
+        ...
+        result = calibrator.solve()
+        calibrator.detach()
+    """
+
+    def __init__(self, capacity=2000, min_angle=2.0, is_radian=False, **solve_kwargs):
+        """
+        :param capacity: max number of the samples, the oldest are dropped
+        :param min_angle: min orientation change (°) between two samples
+        :param is_radian: the roll/pitch/yaw of the added poses in radians or not
+        :param solve_kwargs: outlier_sigma/tolerance/max_iter, see solve_tcp_offset
+        """
+        assert capacity >= 4
+        self._capacity = int(capacity)
+        self._min_angle = math.radians(min_angle)
+        self._is_radian = is_radian
+        self._solve_kwargs = solve_kwargs
+        self._poses = np.empty((self._capacity, 6), dtype=np.float64)
+        self._count = 0
+        self._last_rot = None
+        self._lock = threading.Lock()
+        self._arm = None
+        self._callback = None
+
+    def __len__(self):
+        return min(self._count, self._capacity)
+
+    def clear(self):
+        with self._lock:
+            self._count = 0
+            self._last_rot = None
+
+    def add_pose(self, pose):
+        """
+        :param pose: [x, y, z, roll, pitch, yaw] of the flange
+        :return: True if the pose is added
+        """
+        rot = rpy_to_matrix(pose[3:6], is_radian=self._is_radian)
+        with self._lock:
+            if self._last_rot is not None and _rotation_angles(rot[None], self._last_rot)[0] < self._min_angle:
+                return False
+            self._poses[self._count % self._capacity] = pose[:6]
+            self._count += 1
+            self._last_rot = rot
+        return True
+
+    def solve(self):
+        """
+        :return: CalibrationResult, see solve_tcp_offset (the samples are in the order added, the oldest dropped)
+        """
+        with self._lock:
+            n = len(self)
+            if self._count > self._capacity:
+                poses = np.roll(self._poses, -(self._count % self._capacity), axis=0)
+            else:
+                poses = self._poses[:n].copy()
+        return solve_tcp_offset(poses, is_radian=self._is_radian, **self._solve_kwargs)
+
+    def attach(self, arm):
+        """
+        Collect the poses from the report location callback of the arm (XArmAPI)
+        """
+        self.detach()
+        self._is_radian = arm.default_is_radian
+
+        def callback(ret):
+            self.add_pose(ret['cartesian'])
+
+        self._arm, self._callback = arm, callback
+        arm.register_report_location_callback(callback, report_cartesian=True, report_joints=False)
+
+    def detach(self):
+        if self._arm is not None:
+            self._arm.release_report_location_callback(self._callback)
+            self._arm, self._callback = None, None
@@ -10,8 +10,10 @@ import os
 import re
 import sys
 import socket
+import math
 import logging
 import threading
+from ..core.utils.optional import import_numpy
 
 def create_logger(name):
     logger = logging.Logger(name)
@@ -40,7 +42,7 @@ class GcodeClient(object):
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.sock.setblocking(True)
         self.sock.connect((robot_ip, 504))
-        self.logger.info('Connetc to GcodeServer({}) success'.format(robot_ip))
+        self.logger.info('Connetc to GcodeServer(%s) success', robot_ip)
         self._lock = threading.Lock()
 
     def close(self):
@@ -65,9 +67,9 @@ class GcodeClient(object):
         state, mode = mode_state & 0x0F, mode_state >> 4
         cmdnum = ret[3] << 8 | ret[4]
         if code != 0 or err != 0:
-            self.logger.error('[{}], code={}, err={}, mode={}, state={}, cmdnum={}'.format(cmd, code, err, mode, state, cmdnum))
+            self.logger.error('[%s], code=%s, err=%s, mode=%s, state=%s, cmdnum=%s', cmd, code, err, mode, state, cmdnum)
         elif state >= 4:
-            self.logger.warning('[{}], code={}, err={}, mode={}, state={}, cmdnum={}'.format(cmd, code, err, mode, state, cmdnum))
+            self.logger.warning('[%s], code=%s, err=%s, mode=%s, state=%s, cmdnum=%s', cmd, code, err, mode, state, cmdnum)
         return code, [mode, state, err, cmdnum]
     
     def execute_file(self, filepath):
@@ -85,6 +87,192 @@ class GcodeClient(object):
                     if code != 1 and code != 2:
                         return code
                 if cmd in ['M2', 'M02', 'M30']:
-                    self.logger.info('[{}] Program End'.format(cmd))
+                    self.logger.info('[%s] Program End', cmd)
                     break
         return 0
+
+
+class GcodeProgram(object):
+    """
+    In-memory motion program compiled from G-code by compile_gcode
+    poses: [[x, y, z, roll, pitch, yaw], ...] (mm, °), speeds: [mm/s], radii: [mm] (-1 means stop at the point)
+    pen_down: whether the pen is down at the point, lines: the G-code line number of the point (0 for the added points)
+    numpy arrays if numpy is installed, else lists
+    """
+    is_radian = False
+
+    def __init__(self, poses, speeds, radii, pen_down, lines):
+        self.poses = poses
+        self.speeds = speeds
+        self.radii = radii
+        self.pen_down = pen_down
+        self.lines = lines
+
+    def __len__(self):
+        return len(self.poses)
+
+    def path_length(self):
+        """
+        :return: tuple((draw_length, travel_length)), mm
+        """
+        draw = travel = 0.0
+        for i in range(1, len(self.poses)):
+            length = math.sqrt(sum((self.poses[i][j] - self.poses[i - 1][j]) ** 2 for j in range(3)))
+            if self.pen_down[i] and self.pen_down[i - 1]:
+                draw += length
+            else:
+                travel += length
+        return draw, travel
+
+    def run(self, arm, mvacc=None, wait=True, timeout=None, window=16, **kwargs):
+        """
+        Execute the program with XArmAPI.set_positions, the points are queued in the controller in pipelined batches
+        and blended with the radii, so the arm does not stop at every point
+
+        :param arm: XArmAPI instance, the arm must be in position mode and ready
+        :param mvacc: move acceleration (mm/s^2), default is arm.last_used_tcp_acc
+        :param wait: whether to wait for the arm to complete the program, default is True
+        :return: tuple((code, codes)), see set_positions
+        """
+        return arm.set_positions(self.poses, speeds=self.speeds, mvacc=mvacc, radii=self.radii, is_radian=self.is_radian,
+                                 wait=wait, timeout=timeout, window=window, **kwargs)
+
+
+def _iter_gcode_lines(source):
+    if isinstance(source, str) and '\n' not in source and os.path.isfile(source):
+        with open(source, 'r') as f:
+            for line in f:
+                yield line
+    elif isinstance(source, str):
+        for line in source.splitlines():
+            yield line
+    else:
+        for line in source:
+            yield line
+
+
+def compile_gcode(source, origin=(0, 0, 0), z_up=10, orientation=(180, 0, 0), draw_speed=50, travel_speed=100,
+                  blend_radius=1.0, home=None, use_feed=True):
+    """
+    Compile the G-code of a drawing job (pen plotter style) to an in-memory motion program
+    Supported: G00/G0 (travel, pen up), G01/G1 (draw, pen down), G90/G91, G20/G21, F (mm/min), modal motion and X/Y,
+        the Z words and the other codes are ignored
+    Every travel lifts the pen to origin_z + z_up at the last point, moves above the target and lowers the pen
+
+    :param source: G-code file path, G-code text, or an iterable of lines
+    :param origin: the work offset [x, y, z] (mm) in the base coordinate, z is the pen down height
+    :param z_up: the pen up height above origin_z (mm)
+    :param orientation: [roll, pitch, yaw] of the tool (°)
+    :param draw_speed: drawing speed (mm/s), used if use_feed is False or before the first F word
+    :param travel_speed: travel speed (mm/s), also used to lift/lower the pen
+    :param blend_radius: blend radius of the drawing corners (mm), limited to the half of the adjacent segments,
+        the pen up/down points are not blended
+    :param home: [x, y, z] (mm) to start and to end at, default is None
+    :param use_feed: use the F words of the G-code as the drawing speed or not
+    :return: GcodeProgram
+    """
+    ox, oy, oz = [float(v) for v in origin[:3]]
+    z_draw, z_travel = oz, oz + float(z_up)
+    travel_speed = float(travel_speed)
+    orientation = [float(v) for v in orientation[:3]]
+    points, speeds, pen, lines = [], [], [], []
+
+    def add(x, y, z, speed, down, lineno):
+        if points and points[-1][:3] == [x, y, z]:
+            return
+        points.append([x, y, z] + orientation)
+        speeds.append(speed)
+        pen.append(down)
+        lines.append(lineno)
+
+    if home is not None:
+        add(float(home[0]), float(home[1]), float(home[2]), travel_speed, False, 0)
+    add(ox, oy, z_travel, travel_speed, False, 0)
+
+    motion, absolute, unit = None, True, 1.0
+    x = y = 0.0
+    speed = float(draw_speed)
+    for lineno, line in enumerate(_iter_gcode_lines(source), start=1):
+        words = re.findall(GCODE_PATTERN, re.sub(CLEAN_PATTERN, '', line.strip().upper()))
+        if not words:
+            continue
+        nx = ny = None
+        for letter, value in words:
+            try:
+                number = float(value)
+            except ValueError:
+                continue
+            if letter == 'G':
+                if number in (0, 1):
+                    motion = int(number)
+                elif number == 90:
+                    absolute = True
+                elif number == 91:
+                    absolute = False
+                elif number == 20:
+                    unit = 25.4
+                elif number == 21:
+                    unit = 1.0
+            elif letter == 'X':
+                nx = number * unit
+            elif letter == 'Y':
+                ny = number * unit
+            elif letter == 'F' and use_feed and number > 0:
+                speed = number * unit / 60
+        if motion is None or (nx is None and ny is None):
+            continue
+        if absolute:
+            x = x if nx is None else nx
+            y = y if ny is None else ny
+        else:
+            x += nx or 0
+            y += ny or 0
+        tx, ty = ox + x, oy + y
+        if motion == 0:
+            last = points[-1]
+            add(last[0], last[1], z_travel, travel_speed, False, lineno)
+            add(tx, ty, z_travel, travel_speed, False, lineno)
+            add(tx, ty, z_draw, travel_speed, True, lineno)
+        else:
+            if points[-1][2] != z_draw:
+                add(points[-1][0], points[-1][1], z_draw, travel_speed, True, lineno)
+            add(tx, ty, z_draw, speed, True, lineno)
+
+    last = points[-1]
+    add(last[0], last[1], z_travel, travel_speed, False, 0)
+    if home is not None:
+        add(float(home[0]), float(home[1]), float(home[2]), travel_speed, False, 0)
+
+    radii = _blend_radii(points, pen, float(blend_radius))
+    np = import_numpy()
+    if np is not None:
+        return GcodeProgram(np.array(points, dtype=np.float64), np.array(speeds, dtype=np.float64),
+                            radii, np.array(pen, dtype=bool), np.array(lines, dtype=np.int32))
+    return GcodeProgram(points, speeds, radii, pen, lines)
+
+
+def _blend_radii(points, pen, blend_radius):
+    # radius of the point i blends the segment (i-1, i) into (i, i+1), limited to the half of the shorter one
+    n = len(points)
+    np = import_numpy()
+    if np is not None:
+        xyz = np.array(points, dtype=np.float64)[:, :3]
+        seg = np.linalg.norm(np.diff(xyz, axis=0), axis=1)
+        radii = np.full(n, blend_radius, dtype=np.float64)
+        if n > 2:
+            radii[1:-1] = np.minimum(radii[1:-1], np.minimum(seg[:-1], seg[1:]) / 2)
+        down = np.array(pen, dtype=bool)
+        drawing = np.zeros(n, dtype=bool)
+        drawing[1:-1] = down[:-2] & down[1:-1] & down[2:]
+        radii[~drawing] = 0
+        radii[-1] = -1
+        return radii
+    radii = []
+    for i in range(n):
+        if i == 0 or i == n - 1 or not (pen[i - 1] and pen[i] and pen[i + 1]):
+            radii.append(0)
+            continue
+        seg = [math.sqrt(sum((points[k][j] - points[k - 1][j]) ** 2 for j in range(3))) for k in (i, i + 1)]
+        radii.append(min(blend_radius, min(seg) / 2))
+    radii[-1] = -1
+    return radii
@@ -36,7 +36,7 @@ class ModbusTcpClient(object):
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.sock.setblocking(True)
         self.sock.connect((ip, port))
-        self.logger.info('Connetc to ModbusTcpServer({}) success'.format(ip))
+        self.logger.info('Connetc to ModbusTcpServer(%s) success', ip)
         self._transaction_id = 0
         self._protocol_id = 0x00
         self._unit_id = unit_id
@@ -70,22 +70,22 @@ class ModbusTcpClient(object):
             unit_id = recv_data[6]
             func_code = recv_data[7]
             if transaction_id != send_transaction_id:
-                self.logger.warning('Receive a reply with a mismatched transaction id (S: {}, R: {}), discard it and continue waiting.'.format(send_transaction_id, transaction_id))
+                self.logger.warning('Receive a reply with a mismatched transaction id (S: %s, R: %s), discard it and continue waiting.', send_transaction_id, transaction_id)
                 length = 0
                 recv_data = b''
                 continue
             elif protocol_id != self._protocol_id:
-                self.logger.warning('Receive a reply with a mismatched protocol id (S: {}, R: {}), discard it and continue waiting.'.format(self._protocol_id, protocol_id))
+                self.logger.warning('Receive a reply with a mismatched protocol id (S: %s, R: %s), discard it and continue waiting.', self._protocol_id, protocol_id)
                 length = 0
                 recv_data = b''
                 continue
             elif unit_id != send_unit_id:
-                self.logger.warning('Receive a reply with a mismatched unit id (S: {}, R: {}), discard it and continue waiting.'.format(send_unit_id, unit_id))
+                self.logger.warning('Receive a reply with a mismatched unit id (S: %s, R: %s), discard it and continue waiting.', send_unit_id, unit_id)
                 length = 0
                 recv_data = b''
                 continue
             elif func_code != send_func_code and func_code != send_func_code + 0x80:
-                self.logger.warning('Receive a reply with a mismatched func code (S: {}, R: {}), discard it and continue waiting.'.format(send_func_code, func_code))
+                self.logger.warning('Receive a reply with a mismatched func code (S: %s, R: %s), discard it and continue waiting.', send_func_code, func_code)
                 length = 0
                 recv_data = b''
                 continue
@@ -93,10 +93,10 @@ class ModbusTcpClient(object):
                 code = 0
                 break
         if code == 0 and len(recv_data) == 9:
-            self.logger.error('modbus tcp data exception, exp={}, res={}'.format(recv_data[8], recv_data))
+            self.logger.error('modbus tcp data exception, exp=%s, res=%s', recv_data[8], recv_data)
             return recv_data[8], recv_data
         elif code != 0:
-            self.logger.error('recv timeout, len={}, res={}'.format(len(recv_data), recv_data))
+            self.logger.error('recv timeout, len=%s, res=%s', len(recv_data), recv_data)
         return code, recv_data
 
     def __pack_to_send(self, pdu_data, unit_id=None):
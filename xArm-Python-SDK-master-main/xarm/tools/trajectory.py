@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Client side trajectory file (*.xtraj)
+
+File layout (little-endian):
+    header:  magic(4s) version(B) columns(B) reserved(H) chunk_size(I) scale(d) meta_len(I) meta(json)
+    chunks:  count(I), then for every column (time first): width(B) base(i) deltas(width * (count - 1))
+    index:   [offset(Q) first_time(i)] * chunk_count
+    trailer: index_offset(Q) sample_count(Q) chunk_count(I) magic(4s)
+
+Every column is stored as int32 fixed-point (time in 0.1ms, joints in 1/scale rad),
+the first value of a chunk is absolute and the others are deltas packed with the
+smallest width (1/2/4 bytes) that fits the chunk, so every chunk can be decoded alone.
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import time
+import bisect
+import threading
+from array import array
+from itertools import accumulate
+from ..core.utils.optional import import_numpy
+
+TRAJ_MAGIC = b'XTRJ'
+TRAJ_END_MAGIC = b'XTRE'
+TRAJ_VERSION = 1
+TIME_SCALE = 10000  # 0.1ms
+DEFAULT_SCALE = 100000  # 0.00001rad
+DEFAULT_CHUNK_SIZE = 1000
+
+_HEADER = struct.Struct('<4sBBHIdI')
+_CHUNK_HEAD = struct.Struct('<I')
+_COLUMN_HEAD = struct.Struct('<Bi')
+_INDEX_ITEM = struct.Struct('<Qi')
+_TRAILER = struct.Struct('<QQI4s')
+
+_WIDTH_TYPECODES = {1: 'b', 2: 'h', 4: 'i'}
+_NP_DTYPES = {1: '<i1', 2: '<i2', 4: '<i4'}
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _delta_width(deltas):
+    if not deltas:
+        return 1
+    lo, hi = min(deltas), max(deltas)
+    if -0x80 <= lo and hi <= 0x7F:
+        return 1
+    if -0x8000 <= lo and hi <= 0x7FFF:
+        return 2
+    return 4
+
+
+def encode_chunk(columns):
+    """
+    Encode a chunk
+    :param columns: list of int columns, all with the same length
+    :return: bytes
+    """
+    count = len(columns[0]) if columns else 0
+    data = bytearray(_CHUNK_HEAD.pack(count))
+    for column in columns:
+        deltas = [column[i] - column[i - 1] for i in range(1, count)]
+        width = _delta_width(deltas)
+        data += _COLUMN_HEAD.pack(width, column[0] if count else 0)
+        arr = array(_WIDTH_TYPECODES[width], deltas)
+        if _BIG_ENDIAN and width > 1:
+            arr.byteswap()
+        data += arr.tobytes()
+    return bytes(data)
+
+
+def decode_chunk(buf, offset, column_count):
+    """
+    Decode a chunk
+    :param buf: bytes/mmap/memoryview
+    :param offset: chunk offset in buf
+    :param column_count: number of columns (include time column)
+    :return: (columns, next_offset), columns is a list of int list (or numpy int64 array)
+    """
+    np = import_numpy()
+    count, = _CHUNK_HEAD.unpack_from(buf, offset)
+    offset += _CHUNK_HEAD.size
+    columns = []
+    for _ in range(column_count):
+        width, base = _COLUMN_HEAD.unpack_from(buf, offset)
+        offset += _COLUMN_HEAD.size
+        size = width * max(count - 1, 0)
+        if np is not None:
+            column = np.empty(count, dtype=np.int64)
+            if count:
+                column[0] = base
+                column[1:] = np.frombuffer(buf, dtype=_NP_DTYPES[width], count=count - 1, offset=offset)
+                np.cumsum(column, out=column)
+        else:
+            arr = array(_WIDTH_TYPECODES[width])
+            arr.frombytes(bytes(buf[offset:offset + size]))
+            if _BIG_ENDIAN and width > 1:
+                arr.byteswap()
+            column = list(accumulate([base] + arr.tolist())) if count else []
+        columns.append(column)
+        offset += size
+    return columns, offset
+
+
+class TrajectoryWriter(object):
+    def __init__(self, filename, columns=7, scale=DEFAULT_SCALE, chunk_size=DEFAULT_CHUNK_SIZE, meta=None):
+        assert 0 < columns < 256 and chunk_size > 0 and scale > 0
+        self.filename = filename
+        self.columns = columns
+        self.scale = scale
+        self.chunk_size = chunk_size
+        self.meta = meta if isinstance(meta, dict) else {}
+        self._lock = threading.Lock()
+        self._fp = open(filename, 'wb')
+        meta_bytes = json.dumps(self.meta).encode('utf-8')
+        self._fp.write(_HEADER.pack(TRAJ_MAGIC, TRAJ_VERSION, columns, 0, chunk_size, float(scale), len(meta_bytes)))
+        self._fp.write(meta_bytes)
+        self._index = []
+        self._buffer = [[] for _ in range(columns + 1)]
+        self._start_time = None
+        self._count = 0
+        self._closed = False
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def append(self, timestamp, values):
+        """
+        Append a sample
+        :param timestamp: seconds (monotonic)
+        :param values: joint values (rad), only the first `columns` values are used
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if self._start_time is None:
+                self._start_time = timestamp
+            self._buffer[0].append(int(round((timestamp - self._start_time) * TIME_SCALE)))
+            for i in range(self.columns):
+                self._buffer[i + 1].append(int(round(values[i] * self.scale)))
+            self._count += 1
+            if len(self._buffer[0]) >= self.chunk_size:
+                self._flush_chunk()
+
+    def append_chunk_bytes(self, data):
+        """
+        Append an encoded chunk (from TrajectoryReader.get_chunk_bytes) as is, used to transfer a file chunk by chunk
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if self._buffer[0]:
+                self._flush_chunk()
+            count, = _CHUNK_HEAD.unpack_from(data, 0)
+            if count == 0:
+                return
+            _, first_time = _COLUMN_HEAD.unpack_from(data, _CHUNK_HEAD.size)
+            self._index.append((self._fp.tell(), first_time))
+            self._fp.write(data)
+            self._count += count
+
+    def _flush_chunk(self):
+        if not self._buffer[0]:
+            return
+        self._index.append((self._fp.tell(), self._buffer[0][0]))
+        self._fp.write(encode_chunk(self._buffer))
+        self._buffer = [[] for _ in range(self.columns + 1)]
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_chunk()
+            index_offset = self._fp.tell()
+            for item in self._index:
+                self._fp.write(_INDEX_ITEM.pack(*item))
+            self._fp.write(_TRAILER.pack(index_offset, self._count, len(self._index), TRAJ_END_MAGIC))
+            self._fp.close()
+            self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class TrajectoryReader(object):
+    def __init__(self, filename):
+        self.filename = filename
+        self._fp = open(filename, 'rb')
+        try:
+            self._mm = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._fp.close()
+            raise
+        try:
+            magic, version, columns, _, chunk_size, scale, meta_len = _HEADER.unpack_from(self._mm, 0)
+            if magic != TRAJ_MAGIC or version > TRAJ_VERSION:
+                raise ValueError('{} is not a valid trajectory file'.format(filename))
+            index_offset, count, chunk_count, end_magic = _TRAILER.unpack_from(self._mm, len(self._mm) - _TRAILER.size)
+            if end_magic != TRAJ_END_MAGIC:
+                raise ValueError('{} is incomplete'.format(filename))
+        except struct.error:
+            self.close()
+            raise ValueError('{} is not a valid trajectory file'.format(filename))
+        except ValueError:
+            self.close()
+            raise
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.scale = scale
+        self.meta = json.loads(bytes(self._mm[_HEADER.size:_HEADER.size + meta_len]).decode('utf-8')) if meta_len else {}
+        self._count = count
+        self._offsets = []
+        self._first_times = []
+        self._first_indexes = []
+        index = 0
+        for i in range(chunk_count):
+            offset, first_time = _INDEX_ITEM.unpack_from(self._mm, index_offset + i * _INDEX_ITEM.size)
+            self._offsets.append(offset)
+            self._first_times.append(first_time)
+            self._first_indexes.append(index)
+            index += _CHUNK_HEAD.unpack_from(self._mm, offset)[0]
+        self._cache_chunk = -1
+        self._cache_columns = None
+        self._pos = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def chunk_count(self):
+        return len(self._offsets)
+
+    @property
+    def duration(self):
+        if not self._count:
+            return 0
+        return self.get_sample(self._count - 1)[0]
+
+    def close(self):
+        try:
+            self._mm.close()
+        except:
+            pass
+        try:
+            self._fp.close()
+        except:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _load_chunk(self, chunk_index):
+        if chunk_index != self._cache_chunk:
+            self._cache_columns, _ = decode_chunk(self._mm, self._offsets[chunk_index], self.columns + 1)
+            self._cache_chunk = chunk_index
+        return self._cache_columns
+
+    def get_chunk(self, chunk_index):
+        """
+        Decode a chunk
+        :return: (times, values), times unit is second, values is a list of columns (rad)
+        """
+        columns = self._load_chunk(chunk_index)
+        if import_numpy() is not None:
+            return columns[0] / TIME_SCALE, [col / self.scale for col in columns[1:]]
+        return [t / TIME_SCALE for t in columns[0]], [[v / self.scale for v in col] for col in columns[1:]]
+
+    def get_chunk_bytes(self, chunk_index):
+        """
+        Get the encoded bytes of a chunk, see TrajectoryWriter.append_chunk_bytes
+        """
+        start = self._offsets[chunk_index]
+        end = self._offsets[chunk_index + 1] if chunk_index + 1 < len(self._offsets) else len(self._mm) - _TRAILER.size - len(self._offsets) * _INDEX_ITEM.size
+        return bytes(self._mm[start:end])
+
+    def iter_chunk_bytes(self):
+        for i in range(len(self._offsets)):
+            yield self.get_chunk_bytes(i)
+
+    def get_sample(self, index):
+        """
+        Get the sample by index
+        :return: (timestamp, values)
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('trajectory index out of range')
+        chunk_index = bisect.bisect_right(self._first_indexes, index) - 1
+        columns = self._load_chunk(chunk_index)
+        i = index - self._first_indexes[chunk_index]
+        return float(columns[0][i]) / TIME_SCALE, [float(col[i]) / self.scale for col in columns[1:]]
+
+    __getitem__ = get_sample
+
+    def index_of(self, timestamp):
+        """
+        Get the index of the last sample whose time <= timestamp
+        """
+        t = int(round(timestamp * TIME_SCALE))
+        chunk_index = max(bisect.bisect_right(self._first_times, t) - 1, 0)
+        if not self._offsets:
+            return 0
+        times = self._load_chunk(chunk_index)[0]
+        i = max(bisect.bisect_right(times, t) - 1, 0)
+        return self._first_indexes[chunk_index] + i
+
+    def seek(self, timestamp):
+        """
+        Move the read position to the sample at timestamp (seconds)
+        """
+        self._pos = self.index_of(timestamp)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def read(self, n=-1):
+        """
+        Read n samples from the current position
+        :return: list of (timestamp, values)
+        """
+        end = self._count if n < 0 else min(self._count, self._pos + n)
+        samples = [self.get_sample(i) for i in range(self._pos, end)]
+        self._pos = end
+        return samples
+
+    def get_range(self, start_time, end_time):
+        """
+        Get the samples covering [start_time, end_time] (include the neighbouring samples), only the needed chunks are decoded
+        :return: (times, values), times unit is second, values is a list of columns (rad)
+        """
+        if not self._count:
+            return [], [[] for _ in range(self.columns)]
+        start = self.index_of(start_time)
+        end = min(self.index_of(end_time) + 1, self._count - 1)
+        first_chunk = bisect.bisect_right(self._first_indexes, start) - 1
+        last_chunk = bisect.bisect_right(self._first_indexes, end) - 1
+        parts = []
+        for chunk_index in range(first_chunk, last_chunk + 1):
+            times, values = self.get_chunk(chunk_index)
+            lo = max(start - self._first_indexes[chunk_index], 0)
+            hi = end - self._first_indexes[chunk_index] + 1
+            parts.append((times[lo:hi], [col[lo:hi] for col in values]))
+        if len(parts) == 1:
+            return parts[0]
+        np = import_numpy()
+        if np is not None:
+            return np.concatenate([p[0] for p in parts]), [np.concatenate([p[1][i] for p in parts]) for i in range(self.columns)]
+        times, values = [], [[] for _ in range(self.columns)]
+        for part in parts:
+            times.extend(part[0])
+            for i in range(self.columns):
+                values[i].extend(part[1][i])
+        return times, values
+
+    def __iter__(self):
+        for i in range(len(self._offsets)):
+            times, values = self.get_chunk(i)
+            for j in range(len(times)):
+                yield float(times[j]), [float(col[j]) for col in values]
+
+
+def resample(times, values, new_times):
+    """
+    Linear interpolation of every column at new_times (clamped at both ends)
+    :return: list of columns
+    """
+    np = import_numpy()
+    if np is not None:
+        return [np.interp(new_times, times, col) for col in values]
+    count = len(times)
+    result = [[] for _ in range(len(values))]
+    for t in new_times:
+        i = bisect.bisect_right(times, t)
+        if i <= 0 or i >= count:
+            j = 0 if i <= 0 else count - 1
+            for k, col in enumerate(values):
+                result[k].append(col[j])
+            continue
+        t0, t1 = times[i - 1], times[i]
+        r = (t - t0) / (t1 - t0) if t1 > t0 else 0
+        for k, col in enumerate(values):
+            result[k].append(col[i - 1] + (col[i] - col[i - 1]) * r)
+    return result
+
+
+class TrajectoryPlayer(threading.Thread):
+    """
+    Stream a trajectory file at a fixed rate through `send(values) -> code`
+    The samples are resampled by blocks (block_size ticks) on the trajectory time axis,
+    the trajectory time advances `time_scale / rate` per tick and the ticks are scheduled
+    on absolute deadlines, so sleep jitter, pause/resume and scale changes do not accumulate drift.
+    """
+    def __init__(self, reader, send, rate=100, time_scale=1.0, start_time=0, end_time=None, block_size=50):
+        assert rate > 0 and time_scale > 0 and block_size > 0
+        super(TrajectoryPlayer, self).__init__(daemon=True)
+        self.reader = reader
+        self.send = send
+        self.rate = rate
+        self.block_size = block_size
+        self.code = 0
+        self.sent_count = 0
+        self.late_count = 0
+        self._time_scale = time_scale
+        self._end_time = reader.duration if end_time is None else min(end_time, reader.duration)
+        self._time = max(0, min(start_time, self._end_time))
+        self._cond = threading.Condition()
+        self._paused = False
+        self._stopped = False
+        self._block_version = 0
+
+    @property
+    def time(self):
+        return self._time
+
+    @property
+    def duration(self):
+        return self._end_time
+
+    @property
+    def time_scale(self):
+        return self._time_scale
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def set_time_scale(self, time_scale):
+        assert time_scale > 0
+        with self._cond:
+            self._time_scale = time_scale
+            self._block_version += 1
+
+    def pause(self):
+        with self._cond:
+            self._paused = True
+            self._cond.notify_all()
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def run(self):
+        period = 1.0 / self.rate
+        block_times, block_values, block_version, step, k = [], [], -1, 0, 0
+        next_tick = time.monotonic()
+        while True:
+            with self._cond:
+                if self._paused and not self._stopped:
+                    while self._paused and not self._stopped:
+                        self._cond.wait()
+                    next_tick = time.monotonic()
+                    block_version = -1
+                if self._stopped:
+                    break
+                if block_version != self._block_version or k >= len(block_times):
+                    block_version = self._block_version
+                    step = period * self._time_scale
+                    start = self._time
+                    block_times = [min(start + i * step, self._end_time) for i in range(self.block_size)]
+                    times, values = self.reader.get_range(block_times[0], block_times[-1])
+                    block_values = resample(times, values, block_times)
+                    k = 0
+            code = self.send([float(col[k]) for col in block_values])
+            if code != 0:
+                self.code = code
+                break
+            self.sent_count += 1
+            if block_times[k] >= self._end_time:
+                self._time = self._end_time
+                break
+            self._time = block_times[0] + (k + 1) * step
+            k += 1
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                with self._cond:
+                    if not self._stopped:
+                        self._cond.wait(delay)
+            elif delay < -period:
+                # too late, skip the missed ticks on both the wall clock and the trajectory time
+                missed = int(-delay / period)
+                self.late_count += missed
+                next_tick += missed * period
+                self._time = min(self._time + missed * step, self._end_time)
+                block_version = -1
+
+
+def copy_trajectory(src, dst, chunk_callback=None):
+    """
+    Copy a trajectory file chunk by chunk
+    :param chunk_callback: called with (chunk_index, chunk_count) after each chunk
+    """
+    with TrajectoryReader(src) as reader:
+        with TrajectoryWriter(dst, columns=reader.columns, scale=reader.scale, chunk_size=reader.chunk_size, meta=reader.meta) as writer:
+            for i, data in enumerate(reader.iter_chunk_bytes()):
+                writer.append_chunk_bytes(data)
+                if callable(chunk_callback):
+                    chunk_callback(i + 1, reader.chunk_count)
+    return os.path.getsize(dst)
@@ -1 +1,26 @@
+import sys
 from .xarm_api import XArmAPI
+
+# the fleet helpers (concurrent.futures) and ArmProcess (multiprocessing.shared_memory) are imported on first access
+_LAZY_ATTRS = {
+    'connect_many': 'fleet',
+    'collect_diagnostics': 'fleet',
+    'load_snapshot': 'fleet',
+    'diff_snapshots': 'fleet',
+    'ArmProcess': 'arm_process',
+    'ArmState': 'arm_process',
+}
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _LAZY_ATTRS:
+            import importlib
+            module = importlib.import_module('.{}'.format(_LAZY_ATTRS[name]), __name__)
+            return getattr(module, name)
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    def __dir__():
+        return sorted(list(globals().keys()) + list(_LAZY_ATTRS.keys()))
+else:
+    from .fleet import connect_many, collect_diagnostics, load_snapshot, diff_snapshots
+    from .arm_process import ArmProcess, ArmState
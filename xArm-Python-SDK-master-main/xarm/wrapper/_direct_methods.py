@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+# Generated by `python3 -m xarm.wrapper._gen_direct_methods`, do not edit
+# The methods of XArmAPI which only forward to the same method of XArm with the same signature
+
+DIRECT_METHODS = (
+    'calibrate_tcp_coordinate_offset',
+    'calibrate_tcp_orientation_offset',
+    'calibrate_user_coordinate_offset',
+    'calibrate_user_orientation_offset',
+    'check_verification',
+    'clean_bio_gripper_error',
+    'clean_conf',
+    'clean_error',
+    'clean_linear_motor_error',
+    'clean_warn',
+    'close_bio_gripper',
+    'close_lite6_gripper',
+    'copy_local_trajectory',
+    'emergency_stop',
+    'get_allow_approx_motion',
+    'get_base_board_version',
+    'get_bio_gripper_error',
+    'get_bio_gripper_g2_position',
+    'get_bio_gripper_status',
+    'get_callback_stats',
+    'get_cgpio_analog',
+    'get_cgpio_digital',
+    'get_cgpio_state',
+    'get_checkset_default_baud',
+    'get_cmdnum',
+    'get_dh_params',
+    'get_err_warn_code',
+    'get_forward_kinematics',
+    'get_ft_admittance_ctrl_threshold',
+    'get_ft_collision_detection',
+    'get_ft_collision_reb_distance',
+    'get_ft_collision_rebound',
+    'get_ft_collision_threshold',
+    'get_ft_sensor_config',
+    'get_ft_sensor_data',
+    'get_ft_sensor_error',
+    'get_ft_sensor_mode',
+    'get_gripper_status',
+    'get_gripper_version',
+    'get_harmonic_type',
+    'get_hd_types',
+    'get_imu_data',
+    'get_inverse_kinematics',
+    'get_is_moving',
+    'get_joint_states',
+    'get_linear_motor_error',
+    'get_linear_motor_is_enabled',
+    'get_linear_motor_on_zero',
+    'get_linear_motor_pos',
+    'get_linear_motor_sci',
+    'get_linear_motor_sco',
+    'get_linear_motor_status',
+    'get_local_playback_status',
+    'get_local_record_count',
+    'get_pose_offset',
+    'get_position',
+    'get_position_aa',
+    'get_query_cache_stats',
+    'get_reconnect_stats',
+    'get_reduced_mode',
+    'get_reduced_states',
+    'get_report_tau_or_i',
+    'get_robot_sn',
+    'get_servo_angle',
+    'get_servo_debug_msg',
+    'get_servo_registers',
+    'get_servo_version',
+    'get_state',
+    'get_tgpio_analog',
+    'get_tgpio_digital',
+    'get_tgpio_modbus_baudrate',
+    'get_tgpio_output_digital',
+    'get_tgpio_version',
+    'get_tool_digital_input',
+    'get_traj_speeding',
+    'get_trajectory_rw_status',
+    'get_version',
+    'iden_ft_sensor_load_offset',
+    'iden_joint_friction',
+    'iden_tcp_load',
+    'is_joint_limit',
+    'is_tcp_limit',
+    'load_local_trajectory',
+    'load_trajectory',
+    'mask_write_holding_register',
+    'motion_enable',
+    'move_arc_lines',
+    'move_circle',
+    'move_gohome',
+    'open_bio_gripper',
+    'open_lite6_gripper',
+    'pause_local_playback',
+    'playback_local_trajectory',
+    'read_coil_bits',
+    'read_holding_registers',
+    'read_input_bits',
+    'read_input_registers',
+    'register_cmdnum_changed_callback',
+    'register_connect_changed_callback',
+    'register_count_changed_callback',
+    'register_error_warn_changed_callback',
+    'register_feedback_callback',
+    'register_iden_progress_changed_callback',
+    'register_mode_changed_callback',
+    'register_mtable_mtbrake_changed_callback',
+    'register_report_callback',
+    'register_state_changed_callback',
+    'register_temperature_changed_callback',
+    'release_cmdnum_changed_callback',
+    'release_connect_changed_callback',
+    'release_count_changed_callback',
+    'release_error_warn_changed_callback',
+    'release_feedback_callback',
+    'release_iden_progress_changed_callback',
+    'release_mode_changed_callback',
+    'release_mtable_mtbrake_changed_callback',
+    'release_report_callback',
+    'release_report_location_callback',
+    'release_state_changed_callback',
+    'release_temperature_changed_callback',
+    'reset',
+    'resume_local_playback',
+    'robotiq_close',
+    'robotiq_get_status',
+    'robotiq_open',
+    'robotiq_reset',
+    'robotiq_set_activate',
+    'robotiq_set_position',
+    'run_blockly_app',
+    'run_gcode_file',
+    'save_conf',
+    'send_cmd_sync',
+    'set_allow_approx_motion',
+    'set_baud_checkset_enable',
+    'set_bio_gripper_control_mode',
+    'set_bio_gripper_force',
+    'set_bio_gripper_g2_position',
+    'set_bio_gripper_speed',
+    'set_cartesian_velo_continuous',
+    'set_cgpio_analog',
+    'set_cgpio_analog_with_xyz',
+    'set_cgpio_digital_input_function',
+    'set_cgpio_digital_output_function',
+    'set_cgpio_digital_with_xyz',
+    'set_checkset_default_baud',
+    'set_collision_sensitivity',
+    'set_collision_tool_model',
+    'set_control_modbus_baudrate',
+    'set_counter_increase',
+    'set_counter_reset',
+    'set_dh_params',
+    'set_feedback_type',
+    'set_ft_admittance_ctrl_threshold',
+    'set_ft_collision_detection',
+    'set_ft_collision_reb_distance',
+    'set_ft_collision_rebound',
+    'set_ft_collision_threshold',
+    'set_ft_sensor_admittance_parameters',
+    'set_ft_sensor_enable',
+    'set_ft_sensor_force_parameters',
+    'set_ft_sensor_load_offset',
+    'set_ft_sensor_mode',
+    'set_ft_sensor_zero',
+    'set_gravity_direction',
+    'set_joint_jerk',
+    'set_linear_motor_back_origin',
+    'set_linear_motor_enable',
+    'set_linear_motor_pos',
+    'set_linear_motor_speed',
+    'set_linear_motor_stop',
+    'set_local_playback_time_scale',
+    'set_mode',
+    'set_mount_direction',
+    'set_pause_time',
+    'set_position',
+    'set_positions',
+    'set_reduced_joint_range',
+    'set_reduced_max_joint_speed',
+    'set_reduced_max_tcp_speed',
+    'set_reduced_tcp_boundary',
+    'set_report_tau_or_i',
+    'set_self_collision_detection',
+    'set_servo_angle',
+    'set_servo_angle_j',
+    'set_servo_angles',
+    'set_servo_attach',
+    'set_servo_detach',
+    'set_simulation_robot',
+    'set_state',
+    'set_tcp_jerk',
+    'set_tcp_load',
+    'set_tcp_maxacc',
+    'set_tcp_offset',
+    'set_teach_sensitivity',
+    'set_tgpio_digital_with_xyz',
+    'set_tgpio_modbus_baudrate',
+    'set_tgpio_modbus_timeout',
+    'set_tgpio_modbus_use_503_port',
+    'set_timeout',
+    'set_tool_position',
+    'set_world_offset',
+    'start_ft_sensor_stream',
+    'start_local_record_trajectory',
+    'start_record_trajectory',
+    'stop_ft_sensor_stream',
+    'stop_lite6_gripper',
+    'stop_local_playback',
+    'stop_local_record_trajectory',
+    'stop_record_trajectory',
+    'system_control',
+    'wait_local_playback',
+    'write_and_read_holding_registers',
+    'write_multiple_coil_bits',
+    'write_multiple_holding_registers',
+    'write_single_coil_bit',
+    'write_single_holding_register',
+)
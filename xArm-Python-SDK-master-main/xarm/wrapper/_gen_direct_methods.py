@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Generate xarm/wrapper/_direct_methods.py, run it after modifying the XArmAPI/XArm interfaces
+    python3 -m xarm.wrapper._gen_direct_methods
+
+A method of XArmAPI is direct if:
+    1. the body (except the docstring) is only `return self._arm.<same name>(...)`
+    2. all the params are forwarded as is (same name, positional or keyword, *args, **kwargs)
+    3. the signature of the XArm method is the same (name, kind, order and default of every param)
+The direct methods of the XArm instance are bound to the XArmAPI instance at construction
+"""
+
+import os
+import ast
+import inspect
+from .xarm_api import XArmAPI
+from ..x3 import XArm
+
+TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_direct_methods.py')
+
+HEADER = '''#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+# Generated by `python3 -m xarm.wrapper._gen_direct_methods`, do not edit
+# The methods of XArmAPI which only forward to the same method of XArm with the same signature
+
+DIRECT_METHODS = (
+'''
+
+
+def _is_pure_forward(node):
+    body = node.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(getattr(body[0], 'value', None), (ast.Str, ast.Constant)):
+        body = body[1:]
+    if len(body) != 1 or not isinstance(body[0], ast.Return) or not isinstance(body[0].value, ast.Call):
+        return False
+    call = body[0].value
+    func = call.func
+    if not (isinstance(func, ast.Attribute) and func.attr == node.name and isinstance(func.value, ast.Attribute)
+            and func.value.attr == '_arm' and isinstance(func.value.value, ast.Name) and func.value.value.id == 'self'):
+        return False
+    args = node.args
+    params = [arg.arg for arg in args.args[1:]]
+    kwonly = [arg.arg for arg in args.kwonlyargs]
+    forwarded = []
+    vararg_ok = args.vararg is None
+    for arg in call.args:
+        if isinstance(arg, ast.Starred):
+            if args.vararg is None or not isinstance(arg.value, ast.Name) or arg.value.id != args.vararg.arg:
+                return False
+            vararg_ok = True
+        elif isinstance(arg, ast.Name) and len(forwarded) < len(params) and arg.id == params[len(forwarded)]:
+            forwarded.append(arg.id)
+        else:
+            return False
+    kwarg_ok = args.kwarg is None
+    for kw in call.keywords:
+        if kw.arg is None:
+            if args.kwarg is None or not isinstance(kw.value, ast.Name) or kw.value.id != args.kwarg.arg:
+                return False
+            kwarg_ok = True
+        elif isinstance(kw.value, ast.Name) and kw.value.id == kw.arg and kw.arg in params + kwonly:
+            forwarded.append(kw.arg)
+        else:
+            return False
+    return vararg_ok and kwarg_ok and sorted(forwarded) == sorted(params + kwonly)
+
+
+def _same_signature(name):
+    try:
+        api_sig = inspect.signature(getattr(XArmAPI, name))
+        arm_sig = inspect.signature(getattr(XArm, name))
+    except (AttributeError, ValueError, TypeError):
+        return False
+    api_params = list(api_sig.parameters.values())
+    arm_params = list(arm_sig.parameters.values())
+    if len(api_params) != len(arm_params):
+        return False
+    for p1, p2 in zip(api_params, arm_params):
+        if p1.name != p2.name or p1.kind != p2.kind:
+            return False
+        if p1.default is not p2.default and (type(p1.default) != type(p2.default) or p1.default != p2.default):
+            return False
+    return True
+
+
+def get_direct_methods():
+    with open(inspect.getsourcefile(XArmAPI), 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    cls = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == 'XArmAPI')
+    methods = []
+    for node in cls.body:
+        if not isinstance(node, ast.FunctionDef) or node.name.startswith('_') or node.decorator_list:
+            continue
+        if _is_pure_forward(node) and _same_signature(node.name):
+            methods.append(node.name)
+    return sorted(methods)
+
+
+if __name__ == '__main__':
+    methods = get_direct_methods()
+    with open(TARGET, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        for name in methods:
+            f.write("    '{}',\n".format(name))
+        f.write(')\n')
+    print('generate {} direct methods to {}'.format(len(methods), TARGET))
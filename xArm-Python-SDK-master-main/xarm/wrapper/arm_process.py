@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Run the XArmAPI of an arm in a child process (the socket I/O, the report decoding, the heartbeat and the callbacks
+do not share the GIL with the control loop of the user process)
+
+    state:    the child publishes the latest state after every report into a shared memory block guarded by a seqlock,
+              read_state() in the user process only reads the shared memory (no syscall, no lock)
+    commands: single-producer/single-consumer rings in shared memory (user -> child, child -> user),
+              the head/tail counters are only written by one side, so the rings need no lock between the processes
+
+Note:
+    1. multiprocessing.shared_memory requires python >= 3.8
+    2. the child is started with the 'spawn' method, the script must be guarded by `if __name__ == '__main__':`
+    3. the state is in the internal units (mm, rad), regardless of is_radian
+    4. memory ordering: python has no memory barrier, the seqlock counter and the ring head are plain stores.
+       The stores of a process are seen in order by the others on x86 (TSO), but not on the weakly ordered CPUs
+       (ARM, such as the Raspberry Pi / Jetson), where the reader may see the new counter/head before the data.
+       So the state and every ring message carry a crc32 of their bytes, a torn read fails the crc and is retried
+"""
+
+import time
+import zlib
+import struct
+import pickle
+import threading
+import multiprocessing
+from collections import namedtuple
+from queue import Full
+from .xarm_api import XArmAPI
+from ..core.utils.log import logger
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+# state block: seq (u64) | crc32 of the state (u32) | ... | state (from _STATE_OFFSET)
+_SEQ = struct.Struct('<Q')
+_CRC = struct.Struct('<I')
+_CRC_OFFSET = 8
+_STATE = struct.Struct('<dQ6i7d6d7d7d6d6i4d')
+_STATE_OFFSET = 64
+# ring block: head (u64) | ... | tail (u64) | ... | slots, slot: length (u32) | crc32 of the data (u32) | data
+_RING_HEAD = 0     # written by the producer
+_RING_TAIL = 64    # written by the consumer
+_RING_HEADER = 128
+_SLOT_LEN = struct.Struct('<II')
+
+_CLOSE_CMD = '__close__'
+
+ArmState = namedtuple('ArmState', [
+    'seq',              # the seqlock counter / 2, increased by every publish
+    'timestamp',        # time.monotonic() of the publish (the same clock in all the processes)
+    'report_count',     # the number of the reports published
+    'state', 'mode', 'error_code', 'warn_code', 'cmdnum', 'connected',
+    'angles',           # 7 joints (rad)
+    'position',         # [x, y, z (mm), roll, pitch, yaw (rad)]
+    'joints_torque',    # 7 joints
+    'joint_speeds',     # 7 joints (rad/s)
+    'ft_ext_force',     # [fx, fy, fz, tx, ty, tz]
+    'cgpio_digitals',   # cgpio_states[0:6]: state, code, digital inputs (2 x u16), digital outputs (2 x u16)
+    'cgpio_analogs',    # cgpio_states[6:10]: analog inputs (2), analog outputs (2), V
+])
+
+
+class _StatePublisher(object):
+    """
+    The writer of the seqlock (child process), the counter is odd while the state is written,
+    the crc32 of the state is written before the counter is even again
+    """
+    def __init__(self, buf):
+        self._buf = buf
+        self._seq = 0
+        self._count = 0
+        self._lock = threading.Lock()  # the report thread and the idle publish of the child main loop
+        self.last_time = 0
+
+    def publish(self, arm, is_report=True):
+        cgpio = arm._cgpio_states
+        with self._lock:
+            self._count += 1 if is_report else 0
+            self.last_time = time.monotonic()
+            values = (self.last_time, self._count, arm._state, arm._mode, arm._error_code, arm._warn_code,
+                      arm._cmd_num, int(arm.connected)) + tuple(arm._angles[:7]) + tuple(arm._position[:6]) \
+                + tuple(arm._joints_torque[:7]) + tuple(arm._realtime_joint_speeds[:7]) + tuple(arm._ft_ext_force[:6]) \
+                + tuple(cgpio[:6]) + tuple(cgpio[6:10])
+            data = _STATE.pack(*values)
+            _SEQ.pack_into(self._buf, 0, self._seq + 1)
+            self._buf[_STATE_OFFSET:_STATE_OFFSET + _STATE.size] = data
+            _CRC.pack_into(self._buf, _CRC_OFFSET, zlib.crc32(data))
+            self._seq += 2
+            _SEQ.pack_into(self._buf, 0, self._seq)
+
+
+def _read_state(buf, spins=10000):
+    """
+    :return: (seq, values), None if no consistent state is read in the spins (the writer is slow or died in a write)
+    """
+    for _ in range(spins):
+        seq = _SEQ.unpack_from(buf, 0)[0]
+        if seq & 1:
+            continue
+        data = bytes(buf[_STATE_OFFSET:_STATE_OFFSET + _STATE.size])
+        crc = _CRC.unpack_from(buf, _CRC_OFFSET)[0]
+        if _SEQ.unpack_from(buf, 0)[0] == seq and (seq == 0 or zlib.crc32(data) == crc):
+            return seq >> 1, _STATE.unpack(data)
+    return None
+
+
+class _Ring(object):
+    """
+    Single-producer/single-consumer ring of the length prefixed messages in a shared memory buffer
+    """
+    def __init__(self, buf, slots, slot_size):
+        self._buf = buf
+        self._slots = slots
+        self._slot_size = slot_size
+
+    @staticmethod
+    def buffer_size(slots, slot_size):
+        return _RING_HEADER + slots * slot_size
+
+    def push(self, data):
+        if len(data) > self._slot_size - _SLOT_LEN.size:
+            raise ValueError('message too large: {} > {}'.format(len(data), self._slot_size - _SLOT_LEN.size))
+        head = _SEQ.unpack_from(self._buf, _RING_HEAD)[0]
+        if head - _SEQ.unpack_from(self._buf, _RING_TAIL)[0] >= self._slots:
+            return False
+        offset = _RING_HEADER + (head % self._slots) * self._slot_size
+        _SLOT_LEN.pack_into(self._buf, offset, len(data), zlib.crc32(data))
+        self._buf[offset + _SLOT_LEN.size:offset + _SLOT_LEN.size + len(data)] = data
+        # publish the slot after the data is written
+        _SEQ.pack_into(self._buf, _RING_HEAD, head + 1)
+        return True
+
+    def pop(self):
+        tail = _SEQ.unpack_from(self._buf, _RING_TAIL)[0]
+        if tail == _SEQ.unpack_from(self._buf, _RING_HEAD)[0]:
+            return None
+        offset = _RING_HEADER + (tail % self._slots) * self._slot_size
+        length, crc = _SLOT_LEN.unpack_from(self._buf, offset)
+        data = bytes(self._buf[offset + _SLOT_LEN.size:offset + _SLOT_LEN.size + min(length, self._slot_size - _SLOT_LEN.size)])
+        if len(data) != length or zlib.crc32(data) != crc:
+            # the new head is seen before the data (weakly ordered CPU), read it again later
+            return None
+        _SEQ.pack_into(self._buf, _RING_TAIL, tail + 1)
+        return data
+
+
+def _child_main(port, names, slots, slot_size, poll_interval, kwargs):
+    # the spawned child shares the resource tracker of the user process, which owns (and unlinks) the blocks
+    shms = [shared_memory.SharedMemory(name=name) for name in names]
+    publisher = _StatePublisher(shms[0].buf)
+    cmd_ring = _Ring(shms[1].buf, slots, slot_size)
+    ret_ring = _Ring(shms[2].buf, slots, slot_size)
+    arm = XArmAPI(port, **kwargs)
+    arm.arm._state_publisher = publisher
+    publisher.publish(arm.arm, is_report=False)
+    try:
+        while True:
+            data = cmd_ring.pop()
+            if data is None:
+                if time.monotonic() - publisher.last_time > 0.1:
+                    # no report, keep the connected/timestamp fields fresh
+                    publisher.publish(arm.arm, is_report=False)
+                time.sleep(poll_interval)
+                continue
+            cmd_id, reply, name, args, kw = pickle.loads(data)
+            if name == _CLOSE_CMD:
+                break
+            try:
+                if name.startswith('_'):
+                    raise AttributeError('{} is not a public method'.format(name))
+                ret = (True, getattr(arm, name)(*args, **kw))
+            except Exception as e:
+                ret = (False, '{}: {}'.format(type(e).__name__, e))
+            if reply:
+                try:
+                    msg = pickle.dumps((cmd_id,) + ret, protocol=pickle.HIGHEST_PROTOCOL)
+                    if len(msg) > slot_size - _SLOT_LEN.size:
+                        msg = pickle.dumps((cmd_id, False, 'the result is too large'), protocol=pickle.HIGHEST_PROTOCOL)
+                except Exception as e:
+                    msg = pickle.dumps((cmd_id, False, 'the result can not be pickled: {}'.format(e)))
+                while not ret_ring.push(msg):
+                    time.sleep(poll_interval)
+    finally:
+        arm.arm._state_publisher = None
+        arm.disconnect()
+        for shm in shms:
+            shm.close()
+
+
+class ArmProcess(object):
+    """
+    XArmAPI running in a child process, see the module docstring
+
+    ex:
+        with ArmProcess('192.168.1.xxx', is_radian=True) as proc:
+            proc.call('set_mode', 1)
+            proc.call('set_state', 0)
+            while ...:
+                state = proc.read_state()
+                proc.send('set_servo_angle_j', target)
+    """
+
+    def __init__(self, port, slots=64, slot_size=4096, poll_interval=0.0005, start=True, **kwargs):
+        """
+        :param port: ip-address (or the serial port) of the arm
+        :param slots: the number of the slots of the command/result rings
+        :param slot_size: max bytes of a pickled command/result
+        :param poll_interval: the sleep of the child (and of call()) when the ring is empty
+        :param start: start the child process or not
+        :param kwargs: the keyword parameters of XArmAPI (enable_report is always True)
+        """
+        if shared_memory is None:
+            raise RuntimeError('ArmProcess requires multiprocessing.shared_memory (python >= 3.8)')
+        kwargs['enable_report'] = True
+        self._port = port
+        self._kwargs = kwargs
+        self._slots = slots
+        self._slot_size = slot_size
+        self._poll_interval = poll_interval
+        ring_size = _Ring.buffer_size(slots, slot_size)
+        self._shms = [
+            shared_memory.SharedMemory(create=True, size=_STATE_OFFSET + _STATE.size),
+            shared_memory.SharedMemory(create=True, size=ring_size),
+            shared_memory.SharedMemory(create=True, size=ring_size),
+        ]
+        for shm in self._shms:
+            shm.buf[:] = bytes(shm.size)
+        self._state_buf = self._shms[0].buf
+        self._cmd_ring = _Ring(self._shms[1].buf, slots, slot_size)
+        self._ret_ring = _Ring(self._shms[2].buf, slots, slot_size)
+        self._send_lock = threading.Lock()
+        self._ret_lock = threading.Lock()
+        self._results = {}
+        self._abandoned = set()  # ids of the timed-out calls, their late results are discarded
+        self._cmd_id = 0
+        self._process = None
+        if start:
+            self.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def alive(self):
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        if self._process is not None:
+            return
+        ctx = multiprocessing.get_context('spawn')
+        self._process = ctx.Process(
+            target=_child_main, name='xarm-{}'.format(self._port), daemon=True,
+            args=(self._port, [shm.name for shm in self._shms], self._slots, self._slot_size, self._poll_interval, self._kwargs))
+        self._process.start()
+
+    def _read_state(self):
+        while True:
+            ret = _read_state(self._state_buf)
+            if ret is not None:
+                return ret
+            if not self.alive:
+                raise RuntimeError('the child process of {} exited while publishing the state'.format(self._port))
+
+    def read_state(self):
+        """
+        :return: ArmState, the latest state published by the child (seq == 0 means not published yet)
+        """
+        seq, values = self._read_state()
+        return ArmState(seq, *values[:8], values[8:15], values[15:21], values[21:28], values[28:35],
+                        values[35:41], values[41:47], values[47:51])
+
+    def read_state_raw(self):
+        """
+        :return: tuple((seq, values)), values is the flat tuple in the order of the ArmState fields (without seq)
+        """
+        return self._read_state()
+
+    def wait_state(self, timeout=None):
+        """
+        Wait until the child publishes the first state
+        :return: True if published
+        """
+        expired = None if timeout is None else time.monotonic() + timeout
+        while self._read_state()[0] == 0:
+            if (expired is not None and time.monotonic() >= expired) or not self.alive:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _push(self, name, args, kwargs, reply):
+        with self._send_lock:
+            self._cmd_id += 1
+            cmd_id = self._cmd_id
+            data = pickle.dumps((cmd_id, reply, name, args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+            if not self._cmd_ring.push(data):
+                raise Full('the command ring is full')
+        return cmd_id
+
+    def send(self, name, *args, **kwargs):
+        """
+        Send a command (the name of a public XArmAPI method and the params) without waiting for the result
+
+        :return: the command id
+        :raise: queue.Full if the command ring is full
+        """
+        return self._push(name, args, kwargs, False)
+
+    def _drain_results(self):
+        # called with self._ret_lock
+        while True:
+            data = self._ret_ring.pop()
+            if data is None:
+                break
+            ret = pickle.loads(data)
+            if ret[0] in self._abandoned:
+                self._abandoned.discard(ret[0])
+            else:
+                self._results[ret[0]] = ret[1:]
+
+    def call(self, name, *args, call_timeout=None, **kwargs):
+        """
+        Call a public XArmAPI method in the child process and wait for the result
+
+        :param call_timeout: max seconds to wait for the result, default is None (no timeout)
+        :return: the return value of the method
+        :raise: TimeoutError if timeout, RuntimeError if the method raises an exception in the child
+        """
+        cmd_id = self._push(name, args, kwargs, True)
+        expired = None if call_timeout is None else time.monotonic() + call_timeout
+        while True:
+            with self._ret_lock:
+                self._drain_results()
+                ret = self._results.pop(cmd_id, None)
+            if ret is not None:
+                if not ret[0]:
+                    raise RuntimeError(ret[1])
+                return ret[1]
+            if expired is not None and time.monotonic() >= expired:
+                with self._ret_lock:
+                    self._drain_results()
+                    if self._results.pop(cmd_id, None) is None:
+                        self._abandoned.add(cmd_id)
+                raise TimeoutError('{} timeout'.format(name))
+            if not self.alive:
+                raise RuntimeError('the child process of {} exited'.format(self._port))
+            time.sleep(self._poll_interval)
+
+    def close(self, timeout=3):
+        """
+        Stop the child process (disconnect the arm) and release the shared memory
+        """
+        if self._process is not None:
+            if self._process.is_alive():
+                expired = time.monotonic() + timeout
+                while self._process.is_alive():
+                    # the child may wait for a free slot of the result ring before it reads the next command
+                    with self._ret_lock:
+                        self._drain_results()
+                        self._results.clear()
+                    try:
+                        self._push(_CLOSE_CMD, (), {}, False)
+                        break
+                    except Full:
+                        if time.monotonic() >= expired:
+                            break
+                        time.sleep(self._poll_interval)
+                while self._process.is_alive() and time.monotonic() < expired:
+                    with self._ret_lock:
+                        self._drain_results()
+                        self._results.clear()
+                    self._process.join(0.01)
+                if self._process.is_alive():
+                    logger.warning('terminate the child process of %s', self._port)
+                    self._process.terminate()
+                    self._process.join(1)
+            self._process = None
+        if self._shms:
+            self._state_buf = None
+            self._cmd_ring = self._ret_ring = None
+            for shm in self._shms:
+                try:
+                    shm.close()
+                    shm.unlink()
+                except Exception:
+                    pass
+            self._shms = []
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .xarm_api import XArmAPI
+from ..core.config.x_config import XCONF
+from ..core.utils.log import logger
+from ..core.utils.optional import import_numpy
+
+SNAPSHOT_PREFIX = 'diag_'
+SNAPSHOT_FORMATS = ('.npz', '.arrow', '.json')
+SERVO_COUNT = 7
+
+# the columns of the diagnostic snapshot (one row per arm)
+# the values of the code columns are compared, the values of the value columns are subtracted by the diff,
+# the new entries of the history columns are reported by the diff
+SNAPSHOT_KEY_COLUMNS = ['ip', 'sn']
+SNAPSHOT_CODE_COLUMNS = ['code', 'error_code', 'warn_code', 'servo_status', 'servo_code', 'ft_mode', 'ft_is_started']
+SNAPSHOT_VALUE_COLUMNS = ['time', 'elapsed', 'servo_temperature', 'servo_voltage', 'servo_current',
+                          'ft_type', 'ft_id', 'ft_freq', 'ft_mass', 'ft_zero', 'imu']
+SNAPSHOT_HISTORY_COLUMNS = ['error_history', 'warn_history']
+# the max entries kept in a history column
+SNAPSHOT_HISTORY_MAX = 100
+# (addr, scale) of the servo registers read in one pipelined batch
+_SERVO_DIAG_REGS = [('servo_temperature', 0x000E, 1), ('servo_voltage', 0x0018, 100), ('servo_current', 0x0003, 100)]
+
+
+def _connect_one(ip, api_class, kwargs):
+    start_time = time.monotonic()
+    arm = None
+    try:
+        arm = api_class(ip, **kwargs)
+        error = None if arm.connected else 'not connected'
+    except Exception as e:
+        error = str(e)
+    info = {
+        'ip': ip,
+        'code': 0 if error is None else -1,
+        'error': error,
+        'elapsed': time.monotonic() - start_time,
+        'timings': dict(arm.connect_timings) if arm is not None else {},
+    }
+    if error is not None:
+        logger.error('connect %s failed: %s', ip, error)
+        if arm is not None:
+            try:
+                arm.disconnect()
+            except:
+                pass
+        arm = None
+    return arm, info
+
+
+def connect_many(ips, concurrency=8, api_class=XArmAPI, **kwargs):
+    """
+    Connect many arms concurrently, every arm connects the sockets and queries the version/sn in its own thread
+    Note: the identity (version/sn) of every ip is cached, the reconnect (connect_many again, arm.connect) reuses the sn
+        if the version queried on connect is the same
+
+    :param ips: the list of the ip-address
+    :param concurrency: the max number of the arms connecting at the same time, default is 8
+    :param api_class: the class of the arm object, default is XArmAPI
+    :param kwargs: the keyword parameters of the api_class, such as is_radian/enable_report/report_type
+    :return: tuple((arms, infos)), in the same order as the ips
+        arms: the list of the connected arm object, None if failed to connect
+        infos: the list of the connect info
+            {
+                'ip': ip,
+                'code': 0 if connected else -1,
+                'error': None if connected else the reason,
+                'elapsed': the seconds of the whole connect (including the construction),
+                'timings': the time breakdown of the connect, see XArmAPI.connect_timings
+            }
+    """
+    ips = list(ips)
+    if not ips:
+        return [], []
+    kwargs.pop('do_not_open', None)
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(ips)))) as executor:
+        results = list(executor.map(lambda ip: _connect_one(ip, api_class, kwargs), ips))
+    return [result[0] for result in results], [result[1] for result in results]
+
+
+class _RateLimiter(object):
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._last_time = 0
+
+    def wait(self):
+        if self.min_interval > 0:
+            delay = self._last_time + self.min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        self._last_time = time.monotonic()
+
+
+def _collect_one(arm, min_interval):
+    nan = float('nan')
+    row = {
+        'ip': '', 'sn': '', 'time': time.time(), 'elapsed': 0, 'code': 0,
+        'error_code': -1, 'warn_code': -1,
+        'servo_status': [-1] * (SERVO_COUNT + 1), 'servo_code': [-1] * (SERVO_COUNT + 1),
+        'servo_temperature': [nan] * SERVO_COUNT, 'servo_voltage': [nan] * SERVO_COUNT, 'servo_current': [nan] * SERVO_COUNT,
+        'ft_mode': -1, 'ft_is_started': -1, 'ft_type': nan, 'ft_id': nan, 'ft_freq': nan, 'ft_mass': nan,
+        'ft_zero': [nan] * 6, 'imu': [nan] * 3, 'error_history': [], 'warn_history': [],
+    }
+    start_time = time.monotonic()
+    limiter = _RateLimiter(min_interval)
+
+    def _query(name, func, *args, **kwargs):
+        limiter.wait()
+        try:
+            ret = func(*args, **kwargs)
+        except Exception as e:
+            logger.error('collect %s of %s exception: %s', name, row['ip'], e)
+            ret = (-1, None)
+        if ret[0] != 0:
+            row['code'] = ret[0]
+        return ret
+
+    row['ip'] = str(getattr(arm.arm, '_port', ''))
+    row['sn'] = arm.sn or _query('robot_sn', arm.get_robot_sn)[1] or ''
+    code, err_warn = _query('err_warn', arm.get_err_warn_code)
+    if code == 0:
+        row['error_code'], row['warn_code'] = err_warn[0], err_warn[1]
+    code, dbmsg = _query('servo_debug_msg', arm.get_servo_debug_msg)
+    if dbmsg:
+        for i, item in enumerate(dbmsg[:SERVO_COUNT + 1]):
+            row['servo_status'][i] = item['status']
+            row['servo_code'][i] = item['code']
+    axis = min(arm.axis, SERVO_COUNT)
+    regs = [(i + 1, addr, 16) for _, addr, _ in _SERVO_DIAG_REGS for i in range(axis)]
+    code, table = _query('servo_registers', arm.get_servo_registers, regs)
+    if table is not None:
+        for k, (name, _, scale) in enumerate(_SERVO_DIAG_REGS):
+            for i in range(axis):
+                item = table[k * axis + i]
+                if item[3] in [0, XCONF.UxbusState.ERR_CODE, XCONF.UxbusState.WAR_CODE]:
+                    row[name][i] = float(item[4]) / scale
+    code, ft_config = _query('ft_sensor_config', arm.get_ft_sensor_config)
+    if code == 0 and ft_config and len(ft_config) >= 9:
+        for i, name in enumerate(['ft_mode', 'ft_is_started', 'ft_type', 'ft_id', 'ft_freq', 'ft_mass']):
+            row[name] = ft_config[i]
+        row['ft_zero'] = list(ft_config[8][:6])
+    code, imu = _query('imu_data', arm.get_imu_data)
+    if code == 0:
+        row['imu'] = list(imu[:3])
+    row['elapsed'] = time.monotonic() - start_time
+    return row
+
+
+def _snapshot_key(ip, sn):
+    return sn or ip
+
+
+def _merge_history(history, timestamp, code):
+    """
+    Append [timestamp, code] to the history (list of [unix_time, code]) if the code changed, the unknown code (<0) is skipped
+    """
+    history = [list(item) for item in history or []]
+    if code >= 0 and (not history or history[-1][1] != code):
+        history.append([timestamp, code])
+    return history[-SNAPSHOT_HISTORY_MAX:]
+
+
+def _update_histories(rows, prev):
+    """
+    The controller does not keep the error/warn history, so the history is built by the snapshots:
+    the history of the previous snapshot (same arm) is carried over and the changed code of this run is appended
+    """
+    prev_index = {}
+    if prev:
+        for j, (ip, sn) in enumerate(zip(prev.get('ip', []), prev.get('sn', []))):
+            prev_index[_snapshot_key(ip, sn)] = j
+    for row in rows:
+        j = prev_index.get(_snapshot_key(row['ip'], row['sn']))
+        for name, code_name in zip(SNAPSHOT_HISTORY_COLUMNS, ['error_code', 'warn_code']):
+            history = prev[name][j] if j is not None and name in prev else []
+            row[name] = _merge_history(history, row['time'], row[code_name])
+
+
+def _rows_to_columns(rows):
+    columns = SNAPSHOT_KEY_COLUMNS + SNAPSHOT_CODE_COLUMNS + SNAPSHOT_VALUE_COLUMNS + SNAPSHOT_HISTORY_COLUMNS
+    return {name: [row[name] for row in rows] for name in columns}
+
+
+def _new_snapshot_path(directory, ext):
+    """
+    diag_{YYYYmmdd_HHMMSS_mmm}.ext, the file is created (exclusively) to reserve the name,
+    a counter is appended if the name is already used (such as two runs in the same millisecond)
+    """
+    now = time.time()
+    name = '{}{}_{:03d}'.format(SNAPSHOT_PREFIX, time.strftime('%Y%m%d_%H%M%S', time.localtime(now)), int(now * 1000) % 1000)
+    cnt = 0
+    while True:
+        path = os.path.join(directory, '{}{}{}'.format(name, '_{}'.format(cnt) if cnt else '', ext))
+        try:
+            with open(path, 'x'):
+                return path
+        except FileExistsError:
+            cnt += 1
+
+
+def _import_numpy_for(path):
+    np = import_numpy()
+    if np is None:
+        raise ImportError('numpy is required by the snapshot {}, use .json instead'.format(path))
+    return np
+
+
+def save_snapshot(snapshot, path):
+    """
+    Save the columnar snapshot, the format is decided by the extension of the path
+        .npz: numpy is required (ImportError if not installed), the history columns are saved as json strings
+        .arrow: the Arrow IPC file, pyarrow is required
+        .json: always available
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npz':
+        np = _import_numpy_for(path)
+        np.savez_compressed(path, **{name: np.array([json.dumps(value) for value in values] if name in SNAPSHOT_HISTORY_COLUMNS else values)
+                                     for name, values in snapshot.items()})
+    elif ext == '.arrow':
+        import pyarrow
+        table = pyarrow.Table.from_pydict(snapshot)
+        with pyarrow.OSFile(path, 'wb') as sink:
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        with open(path, 'w') as f:
+            json.dump(snapshot, f)
+    return path
+
+
+def load_snapshot(path):
+    """
+    Load the snapshot saved by save_snapshot/collect_diagnostics
+
+    :return: dict, {column: [value of every arm]}
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npz':
+        np = _import_numpy_for(path)
+        with np.load(path) as data:
+            return {name: [json.loads(value) for value in data[name].tolist()] if name in SNAPSHOT_HISTORY_COLUMNS else data[name].tolist()
+                    for name in data.files}
+    elif ext == '.arrow':
+        import pyarrow
+        with pyarrow.memory_map(path, 'r') as source:
+            return pyarrow.ipc.open_file(source).read_all().to_pydict()
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _latest_snapshot_path(directory):
+    names = [name for name in os.listdir(directory)
+             if name.startswith(SNAPSHOT_PREFIX) and os.path.splitext(name)[1].lower() in SNAPSHOT_FORMATS]
+    return os.path.join(directory, max(names)) if names else None
+
+
+def _sub(curr, prev):
+    if isinstance(curr, list):
+        return [_sub(c, p) for c, p in zip(curr, prev)]
+    try:
+        return curr - prev
+    except TypeError:
+        return None
+
+
+def diff_snapshots(prev, curr):
+    """
+    Diff two snapshots, the arms are matched by the sn (the ip if the sn is empty)
+
+    :return: dict, {sn_or_ip: diff}, only the arms in both snapshots
+        diff: {
+            'changed': {column: (prev_value, curr_value)}, the code columns whose value changed
+            'delta': {column: curr_value - prev_value}, the value columns (nan if not available)
+            'history': {column: [[unix_time, code], ...]}, the entries of the history columns newer than the previous snapshot
+        }
+    """
+    def _index(snapshot):
+        keys = [_snapshot_key(ip, sn) for ip, sn in zip(snapshot.get('ip', []), snapshot.get('sn', []))]
+        return {key: i for i, key in enumerate(keys)}
+
+    prev_index = _index(prev)
+    diffs = {}
+    for key, i in _index(curr).items():
+        j = prev_index.get(key)
+        if j is None:
+            continue
+        changed = {}
+        for name in SNAPSHOT_CODE_COLUMNS:
+            if name in curr and name in prev and curr[name][i] != prev[name][j]:
+                changed[name] = (prev[name][j], curr[name][i])
+        delta = {name: _sub(curr[name][i], prev[name][j])
+                 for name in SNAPSHOT_VALUE_COLUMNS if name in curr and name in prev}
+        history = {}
+        for name in SNAPSHOT_HISTORY_COLUMNS:
+            if name in curr:
+                prev_history = prev[name][j] if name in prev else []
+                last_time = prev_history[-1][0] if prev_history else None
+                history[name] = [item for item in curr[name][i] if last_time is None or item[0] > last_time]
+        diffs[key] = {'changed': changed, 'delta': delta, 'history': history}
+    return diffs
+
+
+def collect_diagnostics(arms, path=None, prev=None, concurrency=8, min_interval=0.02):
+    """
+    Collect the diagnostic snapshot of many arms concurrently, every arm is queried in its own thread
+    Columns (one row per arm):
+        ip, sn, time (the unix time of the collection), elapsed (seconds), code (the last failed code, 0 if all succeed)
+        error_code, warn_code
+        error_history, warn_history: [[unix_time, code], ...], the changes of the error/warn code seen by the snapshots,
+            carried over from the previous snapshot of the same arm (at most SNAPSHOT_HISTORY_MAX entries)
+        servo_status, servo_code: [servo-1, ..., servo-7, gripper], see get_servo_debug_msg
+        servo_temperature, servo_voltage, servo_current: [servo-1, ..., servo-7], nan if not available
+        ft_mode, ft_is_started, ft_type, ft_id, ft_freq, ft_mass, ft_zero: see get_ft_sensor_config
+        imu: [x, y, z] of the base board, see get_imu_data
+
+    :param arms: the list of the connected arm object (the None in the list is ignored), such as the arms of connect_many
+    :param path: where to save the snapshot, None means not save
+        directory: saved as diag_{YYYYmmdd_HHMMSS_mmm}.npz (.json if numpy is not installed) in the directory,
+            a counter is appended to the name if it is already used
+        file: the format is decided by the extension, .npz/.arrow/.json
+    :param prev: the previous snapshot (dict or path) to diff against, default is the latest diag_* file in the directory of the path
+    :param concurrency: the max number of the arms collected at the same time, default is 8
+    :param min_interval: the min interval (seconds) between two queries on the same arm, default is 0.02
+    :return: tuple((snapshot, diff, path))
+        snapshot: dict, {column: [value of every arm]}
+        diff: see diff_snapshots, None if there is no previous snapshot
+        path: the path of the saved snapshot, None if not saved
+    """
+    arms = [arm for arm in arms if arm is not None]
+    if arms:
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(arms)))) as executor:
+            rows = list(executor.map(lambda arm: _collect_one(arm, min_interval), arms))
+    else:
+        rows = []
+    if path is not None and os.path.isdir(path):
+        if prev is None:
+            prev = _latest_snapshot_path(path)
+        path = _new_snapshot_path(path, '.npz' if import_numpy() is not None else '.json')
+    elif path is not None and prev is None:
+        prev = _latest_snapshot_path(os.path.dirname(os.path.abspath(path)))
+    if isinstance(prev, str):
+        try:
+            prev = load_snapshot(prev)
+        except Exception as e:
+            logger.error('load the previous snapshot %s failed: %s', prev, e)
+            prev = None
+    _update_histories(rows, prev)
+    snapshot = _rows_to_columns(rows)
+    diff = diff_snapshots(prev, snapshot) if prev else None
+    if path is not None:
+        save_snapshot(snapshot, path)
+    return snapshot, diff, path
@@ -8,6 +8,7 @@
 
 import math
 from ..x3 import XArm, Studio
+from ._direct_methods import DIRECT_METHODS
 
 
 class XArmAPI(object):
@@ -80,6 +81,27 @@ class XArmAPI(object):
                 Note: only available in the param `check_cmdnum_limit` is True
             check_is_ready: check if the arm is ready to move or not, default is True
                 Note: only available if firmware_version < 1.5.20
+            max_callback_thread_count: the callback dispatch mode, default is 0
+                0: call the callbacks in the report thread
+                > 0: dispatch the callbacks to the given number of worker threads,
+                    the location/report callbacks only keep the latest msg, others are lossless with a bounded queue
+                < 0: run the callbacks (coroutine) in the asyncio loop thread
+            callback_queue_size: the queue size of every lossless callback, default is 256
+                Note: only available if max_callback_thread_count > 0
+            callback_block_timeout: the max seconds the report thread waits when the callback queue is full, default is 0.01
+                Note: only available if max_callback_thread_count > 0, the msg is dropped (and counted) after timeout
+            cache_identity: reuse the sn of the last connection to the same ip (warm reconnect), default is True
+                Note: the version is always queried, the cached sn is only reused if the version string
+                    (firmware version + sn of the arm/control box) is the same, so a firmware upgrade
+                    or a controller swap on the same ip drops the cache
+            auto_reconnect: reconnect automatically when the connection is lost, default is False
+                Note: only available if the connect way is socket
+                Note: if enable_report is False, the main socket is watched by a thread (polled every 0.1s)
+                Note: a failed attempt only closes the sockets, the callbacks and the queued msgs are kept
+                Note: the callbacks, the last used speed/acc, the feedback type, the protocol identifier and the timeouts are restored
+            reconnect_max_retries: the max attempts of the reconnect, default is 10, < 0 means retry forever
+            reconnect_backoff_base: the delay (seconds) of the first attempt, doubled every attempt (with jitter), default is 0.1
+            reconnect_backoff_max: the max delay (seconds) between the attempts, default is 5.0
         """
         self._is_radian = is_radian
         self._arm = XArm(port=port,
@@ -87,6 +109,11 @@ class XArmAPI(object):
                          do_not_open=do_not_open,
                          instance=self,
                          **kwargs)
+        # bind the methods which only forward to XArm, the call dispatches to XArm directly
+        # the methods overridden by the subclass are not bound
+        for name in DIRECT_METHODS:
+            if getattr(self.__class__, name, None) is getattr(XArmAPI, name, None):
+                setattr(self, name, getattr(self._arm, name))
         self._studio = Studio(port, True)
         self.__attr_alias_map = {
             'get_ik': self.get_inverse_kinematics,
@@ -218,6 +245,36 @@ class XArmAPI(object):
         """
         return self._arm.version
 
+    @property
+    def capability(self):
+        """
+        Firmware capability table, computed once from the firmware version after connected
+        Usage: arm.capability.supports_feedback, arm.capability.to_dict()
+        """
+        return self._arm.capability
+
+    @property
+    def connect_timings(self):
+        """
+        The time breakdown (seconds) of the last connect
+            socket: connect the main socket
+            report: connect the report socket (concurrently with the version/sn queries)
+            version: query the version
+            sn: query the sn (0 if identity_cached is True)
+            identity_cached: the sn is reused from the last connection to the same ip or not
+            total: the whole connect
+        """
+        return self._arm.connect_timings
+
+    @staticmethod
+    def clear_identity_cache(port=None):
+        """
+        Clear the cached version/sn used by the warm reconnect
+
+        :param port: ip-address, default is None, clear all
+        """
+        XArm.clear_identity_cache(port)
+
     @property
     def sn(self):
         """
@@ -666,6 +723,23 @@ class XArmAPI(object):
         """
         return self._arm.cgpio_states
 
+    @property
+    def event_bus(self):
+        """
+        Shared event bus of the arm, one dispatcher thread for all the listeners
+        Usage: listener = arm.event_bus.subscribe(topic, callback), arm.event_bus.unsubscribe(listener)
+            callback(value, prev_value) is called when the value of the topic changed
+        Topics:
+            'cgpio_state': fed by the report (report_type='rich'), value is the same as cgpio_states
+            'count': fed by the report (report_type='rich')
+            'tgpio_digital': [io0, io1, io2, io3, io4], polled in the shared poll thread
+            'tgpio_analog': [io0, io1], polled in the shared poll thread
+            'holding_register:{addr}': value of the holding register, polled in the shared poll thread
+
+        :return: instance of EventBus
+        """
+        return self._arm.event_bus
+
     @property
     def self_collision_params(self):
         """
@@ -692,6 +766,42 @@ class XArmAPI(object):
         """
         return self._arm.ft_raw_force
 
+    @property
+    def ft_stream(self):
+        """
+        The stream of the Six-axis Force Torque Sensor, None if not started, see start_ft_sensor_stream
+
+        :return: instance of FtStream or None
+        """
+        return self._arm.ft_stream
+
+    @property
+    def report_timestamp(self):
+        """
+        The timestamps of the latest report, read it in the report callbacks to tag the reported data
+        Note: the controller timestamp is only available in the rich report (report_type='rich') of the firmware
+            which appends it to the report (report length >= 516), the normal/real reports carry no controller timestamp,
+            so it is None for them (and the report_clock is not updated), the receive time is available for all the reports
+
+        :return: (controller timestamp in microseconds or None, time.monotonic() when the report was received)
+        """
+        return self._arm.report_timestamp
+
+    @property
+    def report_clock(self):
+        """
+        The estimator of the offset and the drift between the controller timestamp and the host time.monotonic(),
+        updated by every report with the controller timestamp
+        Note: only the rich report (report_type='rich') carries the controller timestamp, see report_timestamp,
+            with the normal/real reports the clock is never ready (to_host/to_controller return None)
+            arm.report_clock.to_host(ctrl_us): controller timestamp (us) -> host time (s)
+            arm.report_clock.to_controller(host_time): host time (s) -> controller timestamp (us)
+            arm.report_clock.offset / drift / delay
+
+        :return: instance of ReportClock
+        """
+        return self._arm.report_clock
+
     def connect(self, port=None, baudrate=None, timeout=None, axis=None, **kwargs):
         """
         Connect to xArm
@@ -776,18 +886,22 @@ class XArmAPI(object):
         """
         return self._arm.send_cmd_sync(command=command)
 
-    def get_position(self, is_radian=None):
+    def get_position(self, is_radian=None, max_age=None):
         """
         Get the cartesian position
         Note:
             1. If the value(roll/pitch/yaw) you want to return is an radian unit, please set the parameter is_radian to True
                 ex: code, pos = arm.get_position(is_radian=True)
+            2. If the position reported by the report socket is fresh enough, it can be returned without querying the controller
+                ex: code, pos = arm.get_position(max_age=0.01)
 
         :param is_radian: the returned value (only roll/pitch/yaw) is in radians or not, default is self.default_is_radian
+        :param max_age: the max age (seconds) of the reported/queried position, default is None (always query the controller)
+            Note: the hits/misses are counted, see get_query_cache_stats
         :return: tuple((code, [x, y, z, roll, pitch, yaw])), only when code is 0, the returned result is correct.
             code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
         """
-        return self._arm.get_position(is_radian=is_radian)
+        return self._arm.get_position(is_radian=is_radian, max_age=max_age)
 
     def set_position(self, x=None, y=None, z=None, roll=None, pitch=None, yaw=None, radius=None,
                      speed=None, mvacc=None, mvtime=None, relative=False, is_radian=None,
@@ -843,6 +957,35 @@ class XArmAPI(object):
                                       speed=speed, mvacc=mvacc, mvtime=mvtime, relative=relative,
                                       is_radian=is_radian, wait=wait, timeout=timeout, **kwargs)
 
+    def set_positions(self, poses, speeds=None, mvacc=None, mvtime=None, radii=None, is_radian=None,
+                      wait=False, timeout=None, window=16, **kwargs):
+        """
+        Set a batch of cartesian positions (queued in the controller one after another), the API will modify self.last_used_position value
+        Note:
+            1. The whole batch is validated and encoded at once, and the cmds are sent pipelined (at most window cmds are waiting for the response)
+            2. The cmds are sent in chunks limited by the free space of the controller cmd cache (max_cmdnum - cmdnum),
+                the API blocks until all the points are accepted by the controller or a cmd is failed
+            3. Only available if firmware_version >= 1.11.100, otherwise the points are sent one by one by set_position
+
+        :param poses: list/ndarray of the cartesian positions, each is [x, y, z, roll, pitch, yaw]
+            Note: None means the value of the previous point (the last used position for the first point)
+        :param speeds: move speed (mm/s), a number for all the points or a list for each point, default is self.last_used_tcp_speed
+        :param mvacc: move acceleration (mm/s^2), default is self.last_used_tcp_acc
+        :param mvtime: 0, reserved
+        :param radii: move radius, a number for all the points or a list for each point, default is None (MoveLine)
+        :param is_radian: the roll/pitch/yaw in radians or not, default is self.default_is_radian
+        :param wait: whether to wait for the arm to complete the last point, default is False
+        :param timeout: maximum waiting time(unit: second), default is None(no timeout), only valid if wait is True
+        :param window: max number of the cmds waiting for the response, default is 16
+        :param kwargs: extra parameters
+            :param motion_type: motion planning type, default is 0, see the `set_position` interface
+        :return: tuple((code, codes))
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            codes: the code of each point, None means the point is not sent
+        """
+        return self._arm.set_positions(poses, speeds=speeds, mvacc=mvacc, mvtime=mvtime, radii=radii, is_radian=is_radian,
+                                       wait=wait, timeout=timeout, window=window, **kwargs)
+
     def set_tool_position(self, x=0, y=0, z=0, roll=0, pitch=0, yaw=0,
                           speed=None, mvacc=None, mvtime=None, is_radian=None,
                           wait=False, timeout=None, radius=None, **kwargs):
@@ -894,7 +1037,7 @@ class XArmAPI(object):
                                            speed=speed, mvacc=mvacc, mvtime=mvtime,
                                            is_radian=is_radian, wait=wait, timeout=timeout, radius=radius, **kwargs)
 
-    def get_servo_angle(self, servo_id=None, is_radian=None, is_real=False):
+    def get_servo_angle(self, servo_id=None, is_radian=None, is_real=False, max_age=None):
         """
         Get the servo angle
         Note:
@@ -906,10 +1049,13 @@ class XArmAPI(object):
 
         :param servo_id: 1-(Number of axes), None(8), default is None
         :param is_radian: the returned value is in radians or not, default is self.default_is_radian
+        :param is_real: get the real angles of the joints or not, default is False
+        :param max_age: the max age (seconds) of the reported/queried angles, default is None (always query the controller)
+            Note: only available if is_real is False, the hits/misses are counted, see get_query_cache_stats
         :return: tuple((code, angle list if servo_id is None or 8 else angle)), only when code is 0, the returned result is correct.
             code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
         """
-        return self._arm.get_servo_angle(servo_id=servo_id, is_radian=is_radian, is_real=is_real)
+        return self._arm.get_servo_angle(servo_id=servo_id, is_radian=is_radian, is_real=is_real, max_age=max_age)
 
     def set_servo_angle(self, servo_id=None, angle=None, speed=None, mvacc=None, mvtime=None,
                         relative=False, is_radian=None, wait=False, timeout=None, radius=None, **kwargs):
@@ -957,6 +1103,33 @@ class XArmAPI(object):
         return self._arm.set_servo_angle(servo_id=servo_id, angle=angle, speed=speed, mvacc=mvacc, mvtime=mvtime,
                                          relative=relative, is_radian=is_radian, wait=wait, timeout=timeout, radius=radius, **kwargs)
 
+    def set_servo_angles(self, angles, speeds=None, mvacc=None, mvtime=None, radii=None, is_radian=None,
+                         wait=False, timeout=None, window=16, **kwargs):
+        """
+        Set a batch of joint angles (queued in the controller one after another), the API will modify self.last_used_angles value
+        Note:
+            1. The whole batch is validated and encoded at once, and the cmds are sent pipelined (at most window cmds are waiting for the response)
+            2. The cmds are sent in chunks limited by the free space of the controller cmd cache (max_cmdnum - cmdnum),
+                the API blocks until all the points are accepted by the controller or a cmd is failed
+
+        :param angles: list/ndarray of the joint angles, each is [angle1, angle2, ..., angle7], None means the same as the previous point
+        :param speeds: move speed (rad/s or °/s), a number for all the points or a list for each point, default is self.last_used_joint_speed
+        :param mvacc: move acceleration (rad/s^2 or °/s^2), default is self.last_used_joint_acc
+        :param mvtime: 0, reserved
+        :param radii: move radius, a number for all the points or a list for each point, default is None
+            Note: only available if firmware_version >= 1.5.20
+        :param is_radian: the angles/speeds/mvacc in radians or not, default is self.default_is_radian
+        :param wait: whether to wait for the arm to complete the last point, default is False
+        :param timeout: maximum waiting time(unit: second), default is None(no timeout), only valid if wait is True
+        :param window: max number of the cmds waiting for the response, default is 16
+        :param kwargs: reserved
+        :return: tuple((code, codes))
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            codes: the code of each point, None means the point is not sent
+        """
+        return self._arm.set_servo_angles(angles, speeds=speeds, mvacc=mvacc, mvtime=mvtime, radii=radii, is_radian=is_radian,
+                                          wait=wait, timeout=timeout, window=window, **kwargs)
+
     def set_servo_angle_j(self, angles, speed=None, mvacc=None, mvtime=None, is_radian=None, **kwargs):
         """
         Set the servo angle, execute only the last instruction, need to be set to servo motion mode(self.set_mode(1))
@@ -1269,6 +1442,138 @@ class XArmAPI(object):
         """
         return self._arm.get_trajectory_rw_status()
 
+    def start_local_record_trajectory(self, filename, scale=100000, chunk_size=1000):
+        """
+        Start recording the joint angles from the report stream into a local file (client side)
+        Note:
+            1. Every report is recorded, use report_type='real' for the highest rate
+            2. The file is a compact columnar file (*.xtraj), the joint angles are stored as delta-encoded int32 fixed-point
+            3. It is independent of the controller recording (start_record_trajectory)
+
+        :param filename: local file path, if there is no extension, '.xtraj' will be appended
+        :param scale: fixed-point scale of the joint angles, default is 100000 (0.00001 rad)
+        :param chunk_size: number of samples per chunk, every chunk can be decoded (seeked) independently
+        :return: code
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+        """
+        return self._arm.start_local_record_trajectory(filename, scale=scale, chunk_size=chunk_size)
+
+    def stop_local_record_trajectory(self):
+        """
+        Stop the local recording and finish the file
+
+        :return: tuple((code, count))
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            count: number of recorded samples
+        """
+        return self._arm.stop_local_record_trajectory()
+
+    def get_local_record_count(self):
+        """
+        Get the number of samples recorded by the current local recording
+
+        :return: tuple((code, count))
+        """
+        return self._arm.get_local_record_count()
+
+    def load_local_trajectory(self, filename):
+        """
+        Open a local trajectory file (memory-mapped, chunks are decoded on demand)
+
+        :param filename: local file path
+        :return: tuple((code, reader))
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            reader: instance of xarm.tools.trajectory.TrajectoryReader (None if failed), support:
+                len(reader), reader[index] => (timestamp, angles(rad)), reader.seek(timestamp), reader.read(n),
+                reader.get_chunk(chunk_index), reader.get_chunk_bytes(chunk_index), reader.close()
+        """
+        return self._arm.load_local_trajectory(filename)
+
+    def copy_local_trajectory(self, src, dst, chunk_callback=None):
+        """
+        Copy a local trajectory file chunk by chunk (encoded chunks are transferred as is)
+
+        :param src: source file path
+        :param dst: target file path
+        :param chunk_callback: callback(chunk_index, chunk_count), called after each chunk
+        :return: tuple((code, size))
+        """
+        return self._arm.copy_local_trajectory(src, dst, chunk_callback=chunk_callback)
+
+    def playback_local_trajectory(self, filename, time_scale=1.0, rate=100, wait=True, start_time=0, end_time=None, start_tolerance=0.1):
+        """
+        Playback a local trajectory file (see start_local_record_trajectory) through the servo motion (set_servo_angle_j)
+        Note:
+            1. Only available in servo mode, you need to set the mode to 1 (and the state to 0) before
+            2. The arm must be at the start of the trajectory (within start_tolerance), otherwise return code -8
+            3. The file is memory-mapped and decoded chunk by chunk, the samples are linear resampled to the rate
+
+        :param filename: local file path
+        :param time_scale: time scale (continuous), 2 means twice as fast, 0.5 means half speed, default is 1.0
+        :param rate: servo rate (Hz), default is 100
+        :param wait: wait the playback finish or not, default is True
+        :param start_time: start time of the trajectory (seconds), default is 0
+        :param end_time: end time of the trajectory (seconds), default is None (the end of the trajectory)
+        :param start_tolerance: allowed joint difference (rad) between the current angles and the start of the trajectory
+        :return: code
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+        """
+        return self._arm.playback_local_trajectory(filename, time_scale=time_scale, rate=rate, wait=wait,
+                                                   start_time=start_time, end_time=end_time, start_tolerance=start_tolerance)
+
+    def wait_local_playback(self, timeout=None):
+        """
+        Wait the local playback finish
+
+        :param timeout: timeout (seconds), default is None (wait forever)
+        :return: code
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+        """
+        return self._arm.wait_local_playback(timeout=timeout)
+
+    def pause_local_playback(self):
+        """
+        Pause the local playback, resume_local_playback continues from the paused position
+
+        :return: code
+        """
+        return self._arm.pause_local_playback()
+
+    def resume_local_playback(self):
+        """
+        Resume the local playback
+
+        :return: code
+        """
+        return self._arm.resume_local_playback()
+
+    def stop_local_playback(self):
+        """
+        Stop the local playback
+
+        :return: code
+        """
+        return self._arm.stop_local_playback()
+
+    def set_local_playback_time_scale(self, time_scale):
+        """
+        Change the time scale of the running local playback
+
+        :param time_scale: time scale, must be greater than 0
+        :return: code
+        """
+        return self._arm.set_local_playback_time_scale(time_scale)
+
+    def get_local_playback_status(self):
+        """
+        Get the local playback status
+
+        :return: tuple((code, status))
+            status: {'playing': bool, 'paused': bool, 'time': current trajectory time(s), 'duration': end time(s),
+                     'time_scale': time scale, 'late_count': number of skipped ticks}
+        """
+        return self._arm.get_local_playback_status()
+
     def get_reduced_mode(self):
         """
         Get reduced mode
@@ -1432,10 +1737,13 @@ class XArmAPI(object):
         """
         return self._arm.get_is_moving()
 
-    def get_state(self):
+    def get_state(self, max_age=None):
         """
         Get state
 
+        :param max_age: the max age (seconds) of the state reported by the report socket, default is None
+            None: always query the controller
+            ex: max_age=0.01, return the reported state if it was received within 10ms, else query the controller
         :return: tuple((code, state)), only when code is 0, the returned result is correct.
             code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
             state:
@@ -1444,7 +1752,7 @@ class XArmAPI(object):
                 3: suspended
                 4: stopping
         """
-        return self._arm.get_state()
+        return self._arm.get_state(max_age=max_age)
 
     def set_state(self, state=0):
         """
@@ -2413,6 +2721,54 @@ class XArmAPI(object):
         """
         return self._arm.release_iden_progress_changed_callback(callback=callback)
 
+    def get_callback_stats(self, reset=False):
+        """
+        Get the dispatch stats of the callbacks
+        Note: only available if max_callback_thread_count > 0
+
+        :param reset: reset the stats after get or not, default is False
+        :return: tuple((code, stats)), only when code is 0, the returned result is correct.
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            stats: list of dict, each dict is the stats of one callback
+                name: callback name, like 'location', 'report', 'state_changed', ...
+                coalesce: only the latest msg is delivered or not
+                pending: the number of msgs waiting to be delivered
+                submitted/delivered: the number of msgs submitted/delivered
+                coalesced: the number of msgs replaced by the newer msg (coalesce callback)
+                dropped: the number of msgs dropped because the queue was full (lossless callback)
+                max_pending: the max number of the pending msgs
+                failed: the number of callback calls which raised exception
+                avg_latency/max_latency: the latency (seconds) from submit to call
+        """
+        return self._arm.get_callback_stats(reset=reset)
+
+    def get_reconnect_stats(self, reset=False):
+        """
+        Get the reconnect stats of the main socket and the report socket
+        Note: the main socket only reconnects if auto_reconnect is True
+
+        :param reset: reset the stats after get or not, default is False
+        :return: tuple((code, stats)), only when code is 0, the returned result is correct.
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            stats: {'main': {...}, 'report': {...}}
+                count: the number of the successful reconnects
+                attempts: the number of the connect attempts
+                failed: the number of the reconnects which gave up
+                last_latency/max_latency/avg_latency: the seconds from the connection lost to reconnected
+        """
+        return self._arm.get_reconnect_stats(reset=reset)
+
+    def get_query_cache_stats(self, reset=False):
+        """
+        Get the hits/misses of the queries with max_age (get_state/get_position/get_servo_angle)
+
+        :param reset: reset the stats after get or not, default is False
+        :return: tuple((code, stats)), only when code is 0, the returned result is correct.
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            stats: {'state': {'hits': n, 'misses': n}, 'position': {...}, 'angles': {...}}
+        """
+        return self._arm.get_query_cache_stats(reset=reset)
+
     def get_servo_debug_msg(self, show=False, lang='en'):
         """
         Get the servo debug msg, used only for debugging
@@ -2428,6 +2784,12 @@ class XArmAPI(object):
         """
         Run the app generated by xArmStudio software
         :param path: app path
+        :param kwargs:
+            blockly_cache: cache the converted codes or not, default is True
+                Note: the cache key is the app.xml content + SDK version + conversion options,
+                    the generated codes and the compiled code object are stored in the cache dir
+            blockly_cache_dir: cache dir, default is ~/.UFACTORY/cache/xarm/blockly
+            blockly_cache_max_entries: the max number of the cached apps, the least recently used are removed, default is 128
         """
         return self._arm.run_blockly_app(path, **kwargs)
 
@@ -2457,6 +2819,33 @@ class XArmAPI(object):
         """
         return self._arm.get_servo_version(servo_id=servo_id)
 
+    def get_servo_registers(self, regs, window=16, use_cache=True):
+        """
+        Read many servo registers at once, only for debug
+        Note:
+            1. the requests are pipelined on TCP (at most window requests are waiting for the response), sequential on serial
+            2. the immutable registers (the versions and the harmonic type) are cached per robot sn,
+                get_servo_version/get_harmonic_type share the cache
+
+        :param regs: list of (servo_id, addr, width), width is 16 or 32
+        :param window: the max number of the requests waiting for the response, default is 16
+        :param use_cache: use the cached value of the immutable registers or not, default is True
+        :return: tuple((code, table))
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            table: one row [servo_id, addr, width, code, value] for each register (in the same order as the regs),
+                numpy array (int64, shape (n, 5)) if numpy is installed, else list
+        """
+        return self._arm.get_servo_registers(regs, window=window, use_cache=use_cache)
+
+    @staticmethod
+    def clear_servo_register_cache(robot_sn=None):
+        """
+        Clear the cache of the immutable servo registers
+
+        :param robot_sn: clear the cache of the robot sn, None means clear all
+        """
+        XArm.clear_servo_register_cache(robot_sn=robot_sn)
+
     def get_tgpio_version(self):
         """
         Get tool gpio version, only for debug
@@ -3415,6 +3804,53 @@ class XArmAPI(object):
         """
         return self._arm.get_ft_sensor_data(is_raw=is_raw)
 
+    def start_ft_sensor_stream(self, size=1000):
+        """
+        Start capturing every ft sample of the report into a fixed-size ring buffer (with the receive timestamp),
+            no extra query to the controller
+        Note:
+            1. only available if enable_report is True and report_type is 'real' or 'rich'
+            2. the stream is kept until stop_ft_sensor_stream (also across the reconnect),
+                calling it again with another size creates a new (empty) stream
+            3. numpy is used if installed, the results are numpy arrays, else lists
+        Usage:
+            code, stream = arm.start_ft_sensor_stream(size=2000)
+            timestamps, data = stream.get_samples(n=100, is_raw=False)  # oldest first, data: [[fx, fy, fz, tx, ty, tz], ...]
+            timestamps, data = stream.low_pass(alpha=0.2, n=100)  # first-order low-pass filter
+            timestamps, data = stream.median(window=5, n=100)  # causal median filter
+            stats = stream.stats(window=0.5)  # int: the latest samples, float: the latest seconds
+                # {'count': n, 'duration': s, 'mean': [6], 'rms': [6], 'peak': [6], 'min': [6], 'max': [6]}
+            trigger = stream.add_trigger(callback, threshold=20, axes=(0, 1, 2), is_raw=False, hysteresis=2)
+                # callback(msg) is called once when the value goes over the threshold, re-armed when under (threshold - hysteresis)
+                # msg: {'timestamp': t, 'value': v, 'threshold': threshold, 'data': [fx, fy, fz, tx, ty, tz]}
+            stream.remove_trigger(trigger)
+
+        :param size: the size of the ring buffer (samples), default is 1000
+        :return: tuple((code, stream))
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+            stream: instance of FtStream
+        """
+        return self._arm.start_ft_sensor_stream(size=size)
+
+    def stop_ft_sensor_stream(self):
+        """
+        Stop capturing the ft samples of the report, the buffer and the triggers are released
+
+        :return: code
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+        """
+        return self._arm.stop_ft_sensor_stream()
+
+    def get_imu_data(self, board_id=10):
+        """
+        Get the imu data of the base board (or the end board), only for debug
+
+        :param board_id: 10 (base board) or 9 (end board), default is 10
+        :return: tuple((code, [x, y, z]))
+            code: See the [API Code Documentation](./xarm_api_code.md#api-code) for details.
+        """
+        return self._arm.get_imu_data(board_id=board_id)
+
     def get_ft_sensor_config(self):
         """
         Get the config of the Six-axis Force Torque Sensor
@@ -8,6 +8,7 @@
 
 import re
 import sys
+import copy
 import time
 import math
 import uuid
@@ -15,22 +16,19 @@ import queue
 import struct
 import threading
 from collections.abc import Iterable
-try:
-    from multiprocessing.pool import ThreadPool
-except:
-    ThreadPool = None
-try:
-    import asyncio
-
-    if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
-        from .grammar_async import AsyncObject as BaseObject
-    else:
-        from .grammar_coroutine import CoroutineObject as BaseObject
-except:
-    asyncio = None
+# asyncio is only imported when the asyncio callback mode is used (max_callback_thread_count < 0)
+asyncio = None
+if sys.version_info.major >= 3 and sys.version_info.minor >= 5:
+    from .grammar_async import AsyncObject as BaseObject
+else:
+    from .grammar_coroutine import CoroutineObject as BaseObject
 if not hasattr(math, 'inf'):
     setattr(math, 'inf', float('inf'))
 from .events import Events
+from .event_bus import EventBus, TOPIC_CGPIO_STATE
+from .dispatcher import CallbackDispatcher
+from .capability import Capability
+from .report_clock import ReportClock
 from ..core.config.x_config import XCONF
 from ..core.comm import SocketPort
 try:
@@ -40,22 +38,51 @@ except:
 from ..core.wrapper import UxbusCmdSer, UxbusCmdTcp
 from ..core.utils.log import logger, pretty_print
 from ..core.utils import convert, crc16
-from ..core.config.x_code import ControllerWarn, ControllerError, ControllerErrorCodeMap, ControllerWarnCodeMap
-from .utils import compare_time, compare_version, filter_invaild_number
+from ..core.config.x_code import ControllerWarn, ControllerError, get_code_keys
+from .utils import compare_time, compare_version, filter_invaild_number, get_backoff_delay
 from .decorator import xarm_is_connected, xarm_is_ready, xarm_is_not_simulation_mode, xarm_wait_until_cmdnum_lt_max, xarm_wait_until_not_pause
 from .code import APIState
 from ..tools.threads import ThreadManage
 from ..version import __version__
 
-controller_error_keys = ControllerErrorCodeMap.keys()
-controller_warn_keys = ControllerWarnCodeMap.keys()
+controller_error_keys = get_code_keys('ControllerErrorCodeMap')
+controller_warn_keys = get_code_keys('ControllerWarnCodeMap')
 
-print('SDK_VERSION: {}'.format(__version__))
+# the groups of the rich report which are only read by the properties and the subscribers (callbacks, event bus,
+# ft stream), decoded with the report only if subscribed, otherwise decoded from the last report when read
+REPORT_GROUP_TEMPERATURE = 0x01
+REPORT_GROUP_SPEED = 0x02
+REPORT_GROUP_ELECTRIC = 0x04  # voltages and currents
+REPORT_GROUP_CGPIO = 0x08
+REPORT_GROUP_FT = 0x10
+_REPORT_GROUPS = (REPORT_GROUP_TEMPERATURE, REPORT_GROUP_SPEED, REPORT_GROUP_ELECTRIC, REPORT_GROUP_CGPIO, REPORT_GROUP_FT)
+
+
+
+def _import_asyncio():
+    global asyncio
+    if asyncio is None:
+        try:
+            import asyncio as _asyncio
+            asyncio = _asyncio
+        except ImportError:
+            pass
+    return asyncio
 
 
 class Base(BaseObject, Events):
+    _sdk_version_printed = False
+    # port => identity (version/sn) of the controller, reused by the warm reconnect, see _check_version
+    _identity_cache = {}
+    # the state polled by wait_move/_wait_feedback is served from the report if it is not older than this (seconds)
+    _WAIT_POLL_MAX_AGE = 0.02
+
     def __init__(self, port=None, is_radian=False, do_not_open=False, **kwargs):
         if kwargs.get('init', False):
+            if not Base._sdk_version_printed:
+                # print once when the first arm is created (not at import)
+                Base._sdk_version_printed = True
+                print('SDK_VERSION: {}'.format(__version__))
             super(Base, self).__init__()
             self._port = port
             self._debug = kwargs.get('debug', False)
@@ -83,6 +110,17 @@ class Base(BaseObject, Events):
             self._timed_comm_t = None
             self._timed_comm_t_alive = False
 
+            # reconnect the sockets automatically with exponential backoff (only socket)
+            self._auto_reconnect = kwargs.get('auto_reconnect', False)
+            self._reconnect_max_retries = kwargs.get('reconnect_max_retries', 10)  # < 0 means forever
+            self._reconnect_backoff_base = kwargs.get('reconnect_backoff_base', 0.1)
+            self._reconnect_backoff_max = kwargs.get('reconnect_backoff_max', 5.0)
+            self._disconnect_requested = False
+            self._reconnecting = False
+            self._reconnect_thread = None
+            self._reconnect_stats = {}
+            self._reset_reconnect_stats()
+
             self._baud_checkset = kwargs.get('baud_checkset', True)
             self._default_bio_baud = kwargs.get('default_bio_baud', 2000000)
             self._default_gripper_baud = kwargs.get('default_gripper_baud', 2000000)
@@ -93,7 +131,11 @@ class Base(BaseObject, Events):
             self._asyncio_loop = None
             self._asyncio_loop_alive = False
             self._asyncio_loop_thread = None
+            self._callback_queue_size = kwargs.get('callback_queue_size', 256)
+            self._callback_block_timeout = kwargs.get('callback_block_timeout', 0.01)
             self._pool = None
+            self._cache_identity = kwargs.get('cache_identity', True)
+            self._connect_timings = {}
             self._thread_manage = ThreadManage()
 
             self._rewrite_modbus_baudrate_method = kwargs.get('rewrite_modbus_baudrate_method', True)
@@ -174,6 +216,8 @@ class Base(BaseObject, Events):
             self._major_version_number = 0  # 固件主版本号
             self._minor_version_number = 0  # 固件次版本号
             self._revision_version_number = 0  # 固件修正版本号
+            self._capability_table = Capability()
+            self._version_checking = False
 
             self._temperatures = [0, 0, 0, 0, 0, 0, 0]
             self._voltages = [0, 0, 0, 0, 0, 0, 0]
@@ -230,6 +274,11 @@ class Base(BaseObject, Events):
             self._last_update_err_time = 0
             self._last_update_state_time = 0
             self._last_update_cmdnum_time = 0
+            self._last_update_position_time = 0
+            self._last_update_angles_time = 0
+            # the hits/misses of the queries with max_age (get_state/get_position/get_servo_angle)
+            self._query_cache_stats = {}
+            self._reset_query_cache_stats()
 
             self._arm_type_is_1300 = False
             self._control_box_type_is_1300 = False
@@ -239,6 +288,7 @@ class Base(BaseObject, Events):
             self.linear_motor_is_enabled = False
             self._ft_ext_force = [0, 0, 0, 0, 0, 0]
             self._ft_raw_force = [0, 0, 0, 0, 0, 0]
+            self._ft_stream = None
             self._only_check_result = 0
             self._keep_heart = True
 
@@ -252,6 +302,17 @@ class Base(BaseObject, Events):
             self._fb_transid_type_map = {}
             self._fb_transid_result_map = {}
 
+            self._traj_recorder = None
+            self._traj_player = None
+            self._state_publisher = None  # see wrapper/arm_process.py, called by the report thread after every report
+            self._report_clock = ReportClock()
+            self._report_ctrl_us = None
+            self._report_recv_time = 0
+            self._report_group_lock = threading.Lock()
+            self._report_group_seqs = dict.fromkeys(_REPORT_GROUPS, 0)
+            self._report_rich_last = (0, None)  # (seq, data) of the last rich report
+            self._event_bus = None
+
             if not do_not_open:
                 self.connect()
 
@@ -302,6 +363,7 @@ class Base(BaseObject, Events):
         self._major_version_number = 0  # 固件主版本号
         self._minor_version_number = 0  # 固件次版本号
         self._revision_version_number = 0  # 固件修正版本号
+        self._capability_table.update((0, 0, 0))
 
         self._temperatures = [0, 0, 0, 0, 0, 0, 0]
         self._voltages = [0, 0, 0, 0, 0, 0, 0]
@@ -359,6 +421,8 @@ class Base(BaseObject, Events):
         self._last_update_err_time = 0
         self._last_update_state_time = 0
         self._last_update_cmdnum_time = 0
+        self._last_update_position_time = 0
+        self._last_update_angles_time = 0
 
         self._arm_type_is_1300 = False
         self._control_box_type_is_1300 = False
@@ -377,17 +441,31 @@ class Base(BaseObject, Events):
 
     @staticmethod
     def log_api_info(msg, *args, code=0, **kwargs):
+        # the msg is formatted with args by the logger only if the level is enabled
         if code == 0:
-            logger.info(msg, *args, **kwargs)
+            if logger.isEnabledFor(logger.INFO):
+                logger.info(msg, *args, **kwargs)
         else:
             logger.error(msg, *args, **kwargs)
 
     def _check_version(self, is_first=False):
+        self._version_checking = True
+        try:
+            return self.__check_version(is_first=is_first)
+        finally:
+            self._version_checking = False
+
+    def __check_version(self, is_first=False):
+        identity = None
         if is_first:
+            identity = Base._identity_cache.get(self._port) if self._cache_identity else None
+            if identity and self._check_robot_sn and not identity['robot_sn_checked']:
+                identity = None
             self._version = None
             self._robot_sn = None
             self._control_box_sn = None
         try:
+            start_time = time.monotonic()
             if not self._version:
                 self.get_version()
             if is_first:
@@ -400,6 +478,12 @@ class Base(BaseObject, Events):
                 if not self._version and fail_cnt >= 100:
                     logger.error('failed to get version')
                     return -2
+                if identity and identity['version'] != self._version:
+                    # the version string has the firmware version and the sn of the arm/control box,
+                    # it changes after a firmware upgrade or a controller swap on the same ip
+                    logger.info('the identity of %s changed, %s -> %s', self._port, identity['version'], self._version)
+                    Base._identity_cache.pop(self._port, None)
+                    identity = None
 
             if self._version and isinstance(self._version, str):
                 # pattern = re.compile(
@@ -407,6 +491,9 @@ class Base(BaseObject, Events):
                 pattern = re.compile(
                     r'.*(\d+),(\d+),(.*),(.*),.*[vV]*(\d+)\.(\d+)\.(\d+).*')
                 m = re.match(pattern, self._version)
+                if not m:
+                    # no sn in the version string, a controller swap can not be detected, do not reuse the sn
+                    identity = None
                 if m:
                     (xarm_axis, xarm_type, xarm_sn, ac_version,
                      major_version_number,
@@ -441,8 +528,17 @@ class Base(BaseObject, Events):
                             self._major_version_number = 0
                             self._minor_version_number = 1
                             self._revision_version_number = 0
+            self._capability_table.update((self._major_version_number, self._minor_version_number, self._revision_version_number))
             if is_first:
-                if self._check_robot_sn:
+                self._connect_timings['version'] = time.monotonic() - start_time
+                start_time = time.monotonic()
+                if identity:
+                    # warm reconnect, the sn is the same as the last connection
+                    self._robot_sn = identity['robot_sn']
+                    self._control_box_sn = identity['control_box_sn']
+                    self._arm_type_is_1300 = identity['arm_type_is_1300']
+                    self._control_box_type_is_1300 = identity['control_box_type_is_1300']
+                elif self._check_robot_sn:
                     count = 2
                     self.get_robot_sn()
                     while not self._robot_sn and count and self.warn_code == 0:
@@ -453,6 +549,17 @@ class Base(BaseObject, Events):
                         count -= 1
                 if self.warn_code != 0:
                     self.clean_warn()
+                self._connect_timings['sn'] = time.monotonic() - start_time
+                self._connect_timings['identity_cached'] = identity is not None
+                if self._cache_identity and self._version and not identity:
+                    Base._identity_cache[self._port] = {
+                        'version': self._version,
+                        'robot_sn': self._robot_sn,
+                        'control_box_sn': self._control_box_sn,
+                        'arm_type_is_1300': self._arm_type_is_1300,
+                        'control_box_type_is_1300': self._control_box_type_is_1300,
+                        'robot_sn_checked': self._check_robot_sn,
+                    }
                 print('ROBOT_IP: {}, VERSION: v{}, PROTOCOL: {}, DETAIL: {}, TYPE1300: [{:d}, {:d}]'.format(
                     self._port,
                     '{}.{}.{}'.format(self._major_version_number, self._minor_version_number, self._revision_version_number),
@@ -469,10 +576,12 @@ class Base(BaseObject, Events):
 
     @property
     def realtime_tcp_speed(self):
+        self._sync_report_group(REPORT_GROUP_SPEED)
         return self._realtime_tcp_speed
 
     @property
     def realtime_joint_speeds(self):
+        self._sync_report_group(REPORT_GROUP_SPEED)
         return [speed if self._default_is_radian else math.degrees(speed) for speed in self._realtime_joint_speeds]
 
     @property
@@ -651,6 +760,7 @@ class Base(BaseObject, Events):
 
     @property
     def temperatures(self):
+        self._sync_report_group(REPORT_GROUP_TEMPERATURE)
         return self._temperatures
 
     @property
@@ -729,16 +839,25 @@ class Base(BaseObject, Events):
 
     @property
     def voltages(self):
+        self._sync_report_group(REPORT_GROUP_ELECTRIC)
         return self._voltages
 
     @property
     def currents(self):
+        self._sync_report_group(REPORT_GROUP_ELECTRIC)
         return self._currents
 
     @property
     def cgpio_states(self):
+        self._sync_report_group(REPORT_GROUP_CGPIO)
         return self._cgpio_states
 
+    @property
+    def event_bus(self):
+        if self._event_bus is None:
+            self._event_bus = EventBus(self)
+        return self._event_bus
+
     @property
     def self_collision_params(self):
         return [self._is_collision_detection, self._collision_tool_type, self._collision_tool_params]
@@ -773,16 +892,53 @@ class Base(BaseObject, Events):
     
     @property
     def ft_ext_force(self):
+        self._sync_report_group(REPORT_GROUP_FT)
         return self._ft_ext_force
 
     @property
     def ft_raw_force(self):
+        self._sync_report_group(REPORT_GROUP_FT)
         return self._ft_raw_force
+
+    @property
+    def ft_stream(self):
+        return self._ft_stream
+
+    @property
+    def report_timestamp(self):
+        return self._report_ctrl_us, self._report_recv_time
+
+    @property
+    def report_clock(self):
+        return self._report_clock
     
     @property
     def support_feedback(self):
         return self._support_feedback
 
+    @property
+    def capability(self):
+        return self._capability
+
+    @property
+    def _capability(self):
+        # the version is queried on the first read if it is unknown (like version_is_ge),
+        # the reads while the version is being checked (the report thread at connect) get the current table
+        if self._version is None and not self._version_checking and self.connected:
+            self._check_version()
+        return self._capability_table
+
+    @property
+    def connect_timings(self):
+        return self._connect_timings
+
+    @staticmethod
+    def clear_identity_cache(port=None):
+        if port is None:
+            Base._identity_cache.clear()
+        else:
+            Base._identity_cache.pop(port, None)
+
     def version_is_ge(self, major, minor=0, revision=0):
         if self._version is None:
             self._check_version()
@@ -810,7 +966,7 @@ class Base(BaseObject, Events):
 
     @property
     def check_xarm_is_ready(self):
-        if self._check_is_ready and not self.version_is_ge(1, 5, 20):
+        if self._check_is_ready and not self._capability.supports_skip_ready_check:
             return self.ready
         else:
             # no check if version >= 1.5.20
@@ -820,7 +976,8 @@ class Base(BaseObject, Events):
         self._timed_comm_t_alive = True
         cnt = 0
         last_send_time = 0
-        while self.connected and self._timed_comm_t_alive:
+        # the thread is kept alive while reconnecting
+        while (self.connected or self._reconnecting) and self._timed_comm_t_alive:
             curr_time = time.monotonic()
             if not self._keep_heart:
                 time.sleep(1)
@@ -844,10 +1001,10 @@ class Base(BaseObject, Events):
         self._thread_manage.join(1)
         if self._pool:
             try:
-                self._pool.close()
-                self._pool.join()
+                self._pool.close(1)
             except:
                 pass
+            self._pool = None
     
     def connect_503(self):
         self._stream_503 = SocketPort(self._port, XCONF.SocketConf.TCP_CONTROL_PORT + 1,
@@ -861,6 +1018,8 @@ class Base(BaseObject, Events):
     def connect(self, port=None, baudrate=None, timeout=None, axis=None, arm_type=None):
         if self.connected:
             return
+        if not self._reconnecting:
+            self._disconnect_requested = False
         if axis in [5, 6, 7]:
             self._arm_axis = axis
         if arm_type in [3, 5, 6, 7, 8, 9, 11]:
@@ -871,7 +1030,7 @@ class Base(BaseObject, Events):
         self._timeout = timeout if timeout is not None else self._timeout
         if not self._port:
             raise Exception('can not connect to port/ip {}'.format(self._port))
-        if self._timed_comm_t is not None:
+        if self._timed_comm_t is not None and not (self._reconnecting and self._timed_comm_t.is_alive()):
             try:
                 self._timed_comm_t_alive = False
                 self._timed_comm_t.join()
@@ -881,6 +1040,8 @@ class Base(BaseObject, Events):
         self._is_first_report = True
         self._first_report_over = False
         self._init()
+        self._connect_timings = {}
+        connect_start_time = time.monotonic()
         if isinstance(self._port, (str, bytes)):
             if self._port == 'localhost' or re.match(
                     r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$",
@@ -890,17 +1051,19 @@ class Base(BaseObject, Events):
                                           buffer_size=XCONF.SocketConf.TCP_CONTROL_BUF_SIZE, forbid_uds=self._forbid_uds, fb_que=self._feedback_que)
                 if not self.connected:
                     raise Exception('connect socket failed')
+                self._connect_timings['socket'] = time.monotonic() - connect_start_time
 
                 self._report_error_warn_changed_callback()
-                self._feedback_thread = threading.Thread(target=self._feedback_thread_handle, daemon=True)
-                self._feedback_thread.start()
+                if self._feedback_thread is None or not self._feedback_thread.is_alive():
+                    self._feedback_thread = threading.Thread(target=self._feedback_thread_handle, daemon=True)
+                    self._feedback_thread.start()
 
                 self.arm_cmd = UxbusCmdTcp(self._stream, set_feedback_key_tranid=self._set_feedback_key_tranid)
                 self.arm_cmd.set_protocol_identifier(2)
                 self._stream_type = 'socket'
 
                 try:
-                    if self._timed_comm:
+                    if self._timed_comm and (self._timed_comm_t is None or not self._timed_comm_t.is_alive()):
                         self._timed_comm_t = threading.Thread(target=self._timed_comm_thread, daemon=True)
                         self._timed_comm_t.start()
                 except:
@@ -908,29 +1071,37 @@ class Base(BaseObject, Events):
 
                 self._stream_report = None
 
-                try:
-                    self._connect_report()
-                except:
-                    self._stream_report = None
-
-                if self._check_version(is_first=True) < 0:
+                # the report socket is connected while the version/sn are queried
+                report_t = threading.Thread(target=self.__connect_report_with_timing, args=(self._is_old_protocol,), daemon=True)
+                report_t.start()
+                code = self._check_version(is_first=True)
+                report_t.join()
+                if code < 0:
                     self.disconnect()
                     raise Exception('failed to check version, close')
-                self._support_feedback = self.version_is_ge(2, 0, 102)
+                self._support_feedback = self._capability.supports_feedback
                 self.arm_cmd.set_debug(self._debug)
 
-                if self._max_callback_thread_count < 0 and asyncio is not None:
-                    self._asyncio_loop = asyncio.new_event_loop()
-                    self._asyncio_loop_thread = threading.Thread(target=self._run_asyncio_loop, daemon=True)
-                    self._thread_manage.append(self._asyncio_loop_thread)
-                    self._asyncio_loop_thread.start()
-                elif self._max_callback_thread_count > 0 and ThreadPool is not None:
-                    self._pool = ThreadPool(self._max_callback_thread_count)
+                if self._max_callback_thread_count < 0 and _import_asyncio() is not None:
+                    if self._asyncio_loop_thread is None or not self._asyncio_loop_thread.is_alive():
+                        self._asyncio_loop = asyncio.new_event_loop()
+                        self._asyncio_loop_thread = threading.Thread(target=self._run_asyncio_loop, daemon=True)
+                        self._thread_manage.append(self._asyncio_loop_thread)
+                        self._asyncio_loop_thread.start()
+                elif self._max_callback_thread_count > 0 and self._pool is None:
+                    # the dispatcher (and the queued msgs) is kept by the reconnect
+                    self._pool = CallbackDispatcher(self._max_callback_thread_count, maxsize=self._callback_queue_size,
+                                                    block_timeout=self._callback_block_timeout)
 
                 if self._stream.connected and self._enable_report:
                     self._report_thread = threading.Thread(target=self._report_thread_handle, daemon=True)
                     self._report_thread.start()
                     self._thread_manage.append(self._report_thread)
+                elif self._stream.connected and self._auto_reconnect:
+                    # without the report thread, the main socket is watched by another thread
+                    self._report_thread = threading.Thread(target=self._connection_watch_thread_handle, daemon=True)
+                    self._report_thread.start()
+                    self._thread_manage.append(self._report_thread)
 
                 self._report_connect_changed_callback()
             else:
@@ -944,13 +1115,14 @@ class Base(BaseObject, Events):
                 self.arm_cmd = UxbusCmdSer(self._stream)
                 self._stream_type = 'serial'
 
-                if self._max_callback_thread_count < 0 and asyncio is not None:
+                if self._max_callback_thread_count < 0 and _import_asyncio() is not None:
                     self._asyncio_loop = asyncio.new_event_loop()
                     self._asyncio_loop_thread = threading.Thread(target=self._run_asyncio_loop, daemon=True)
                     self._thread_manage.append(self._asyncio_loop_thread)
                     self._asyncio_loop_thread.start()
-                elif self._max_callback_thread_count > 0 and ThreadPool is not None:
-                    self._pool = ThreadPool(self._max_callback_thread_count)
+                elif self._max_callback_thread_count > 0:
+                    self._pool = CallbackDispatcher(self._max_callback_thread_count, maxsize=self._callback_queue_size,
+                                                    block_timeout=self._callback_block_timeout)
 
                 if self._enable_report:
                     self._report_thread = threading.Thread(target=self._auto_get_report_thread, daemon=True)
@@ -962,33 +1134,33 @@ class Base(BaseObject, Events):
                 self._check_version(is_first=True)
                 self.arm_cmd.set_debug(self._debug)
             self.set_timeout(self._cmd_timeout)
+            self._connect_timings['total'] = time.monotonic() - connect_start_time
             if self._rewrite_modbus_baudrate_method:
                 setattr(self.arm_cmd, 'set_modbus_baudrate_old', self.arm_cmd.set_modbus_baudrate)
                 setattr(self.arm_cmd, 'set_modbus_baudrate', self._core_set_modbus_baudrate)
 
-    if asyncio:
-        def _run_asyncio_loop(self):
-            # @asyncio.coroutine
-            # def _asyncio_loop():
-            #     logger.debug('asyncio thread start ...')
-            #     while self.connected:
-            #         yield from asyncio.sleep(0.001)
-            #     logger.debug('asyncio thread exit ...')
+    def _run_asyncio_loop(self):
+        # @asyncio.coroutine
+        # def _asyncio_loop():
+        #     logger.debug('asyncio thread start ...')
+        #     while self.connected:
+        #         yield from asyncio.sleep(0.001)
+        #     logger.debug('asyncio thread exit ...')
 
-            try:
-                asyncio.set_event_loop(self._asyncio_loop)
-                self._asyncio_loop_alive = True
-                # self._asyncio_loop.run_until_complete(_asyncio_loop())
-                self._asyncio_loop.run_until_complete(self._asyncio_loop_func())
-            except Exception as e:
-                pass
+        try:
+            asyncio.set_event_loop(self._asyncio_loop)
+            self._asyncio_loop_alive = True
+            # self._asyncio_loop.run_until_complete(_asyncio_loop())
+            self._asyncio_loop.run_until_complete(self._asyncio_loop_func())
+        except Exception as e:
+            pass
 
-            self._asyncio_loop_alive = False
+        self._asyncio_loop_alive = False
 
-        # @staticmethod
-        # @asyncio.coroutine
-        # def _async_run_callback(callback, msg):
-        #     yield from callback(msg)
+    # @staticmethod
+    # @asyncio.coroutine
+    # def _async_run_callback(callback, msg):
+    #     yield from callback(msg)
 
     def _run_callback(self, callback, msg, name='', enable_callback_thread=True):
         try:
@@ -996,11 +1168,38 @@ class Base(BaseObject, Events):
                 coroutine = self._async_run_callback(callback, msg)
                 asyncio.run_coroutine_threadsafe(coroutine, self._asyncio_loop)
             elif self._pool is not None and enable_callback_thread:
-                self._pool.apply_async(callback, args=(msg,))
+                self._pool.submit(callback, msg, name=name)
             else:
                 callback(msg)
         except Exception as e:
-            logger.error('run {} callback exception: {}'.format(name, e))
+            logger.error('run %s callback exception: %s', name, e)
+
+    def _release_report_callback(self, report_id, callback):
+        callbacks = self._report_callbacks.get(report_id, [])
+        released = [cb for cb in callbacks if callback is None or cb == callback
+                    or (isinstance(cb, dict) and cb['callback'] == callback)]
+        ret = super(Base, self)._release_report_callback(report_id, callback)
+        pool = self._pool
+        if ret and pool is not None:
+            # drop the dispatch channels of the callbacks which are not registered any more
+            registered = [cb['callback'] if isinstance(cb, dict) else cb for cbs in self._report_callbacks.values() for cb in cbs]
+            for cb in released:
+                cb = cb['callback'] if isinstance(cb, dict) else cb
+                if all(cb != item for item in registered):
+                    pool.remove(cb)
+        return ret
+
+    def get_callback_stats(self, reset=False):
+        """
+        :return: tuple((code, stats)), stats is the list of the dispatch stats of every callback,
+            only available when max_callback_thread_count > 0
+        """
+        if self._pool is None:
+            return 0, []
+        stats = self._pool.get_stats()
+        if reset:
+            self._pool.reset_stats()
+        return 0, stats
 
     def _core_set_modbus_baudrate(self, baudrate, use_old=False):
         """
@@ -1019,6 +1218,9 @@ class Base(BaseObject, Events):
             return self.arm_cmd.set_modbus_baudrate_old(baudrate)
 
     def disconnect(self):
+        if threading.current_thread() is not self._reconnect_thread:
+            # the disconnect of the failed connect while reconnecting does not stop the reconnect
+            self._disconnect_requested = True
         try:
             self._stream.close()
         except:
@@ -1043,6 +1245,10 @@ class Base(BaseObject, Events):
                 self._stream_report.join()
             except:
                 pass
+        if threading.current_thread() is self._reconnect_thread:
+            # a failed attempt of the reconnect only closes the sockets,
+            # the callbacks/dispatcher and the threads are kept for the next attempt
+            return
         self._report_connect_changed_callback(False, False)
         with self._pause_cond:
             self._pause_cond.notifyAll()
@@ -1082,28 +1288,38 @@ class Base(BaseObject, Events):
             return 0, self._default_linear_motor_baud
         return APIState.API_EXCEPTION, 0
 
-    def _connect_report(self):
+    def __connect_report_with_timing(self, is_old_protocol):
+        start_time = time.monotonic()
+        try:
+            self._connect_report(is_old_protocol=is_old_protocol)
+        except:
+            self._stream_report = None
+        self._connect_timings['report'] = time.monotonic() - start_time
+
+    def _connect_report(self, is_old_protocol=None, close_wait=2):
+        is_old_protocol = self._is_old_protocol if is_old_protocol is None else is_old_protocol
         if self._enable_report:
             if self._stream_report:
                 try:
                     self._stream_report.close()
                 except:
                     pass
-                time.sleep(2)
+                if close_wait > 0:
+                    time.sleep(close_wait)
             if self._report_type == 'real':
                 self._stream_report = SocketPort(
                     self._port, XCONF.SocketConf.TCP_REPORT_REAL_PORT,
-                    buffer_size=1024 if not self._is_old_protocol else 87,
+                    buffer_size=1024 if not is_old_protocol else 87,
                     forbid_uds=self._forbid_uds)
             elif self._report_type == 'normal':
                 self._stream_report = SocketPort(
                     self._port, XCONF.SocketConf.TCP_REPORT_NORM_PORT,
-                    buffer_size=XCONF.SocketConf.TCP_REPORT_NORMAL_BUF_SIZE if not self._is_old_protocol else 87,
+                    buffer_size=XCONF.SocketConf.TCP_REPORT_NORMAL_BUF_SIZE if not is_old_protocol else 87,
                     forbid_uds=self._forbid_uds)
             else:
                 self._stream_report = SocketPort(
                     self._port, XCONF.SocketConf.TCP_REPORT_RICH_PORT,
-                    buffer_size=1024 if not self._is_old_protocol else 187,
+                    buffer_size=1024 if not is_old_protocol else 187,
                     forbid_uds=self._forbid_uds)
 
     def __report_callback(self, report_id, item, name=''):
@@ -1157,7 +1373,22 @@ class Base(BaseObject, Events):
     def _report_iden_progress_changed_callback(self):
         self.__report_callback(self.REPORT_IDEN_PROGRESS_CHANGED_ID, {'progress': self._iden_progress}, name='iden_progress_changed')
 
+    def __record_trajectory_sample(self):
+        recorder = self._traj_recorder
+        try:
+            recorder.append(self._report_recv_time, self._angles)
+        except Exception as e:
+            # never let a write error (disk full, file removed, ...) break the report thread, stop recording instead
+            logger.error('local record failed, stop recording, file=%s, exception=%s', recorder.filename, e)
+            self._traj_recorder = None
+            try:
+                recorder.close()
+            except Exception:
+                pass
+
     def _report_location_callback(self):
+        if self._traj_recorder is not None:
+            self.__record_trajectory_sample()
         if self.REPORT_LOCATION_ID in self._report_callbacks.keys():
             for item in self._report_callbacks[self.REPORT_LOCATION_ID]:
                 callback = item['callback']
@@ -1200,12 +1431,13 @@ class Base(BaseObject, Events):
         last_send_time = 0
         max_reconnect_cnts = 10
         connect_failed_cnt = 0
+        report_lost_time = None
 
         while self.connected:
             try:
                 curr_time = time.monotonic()
                 if self._keep_heart:
-                    if protocol_identifier != 3 and self.version_is_ge(1, 8, 6) and self.arm_cmd.set_protocol_identifier(3) == 0:
+                    if protocol_identifier != 3 and self._capability.supports_protocol_v3 and self.arm_cmd.set_protocol_identifier(3) == 0:
                         protocol_identifier = 3
                     if protocol_identifier == 3 and curr_time - last_send_time > 10 and curr_time - self.arm_cmd.last_comm_time > 30:
                         code, _ = self.get_state()
@@ -1220,27 +1452,34 @@ class Base(BaseObject, Events):
                     if report_socket_connected:
                         report_socket_connected = False
                         self._report_connect_changed_callback(main_socket_connected, report_socket_connected)
-                    self._connect_report()
+                    report_lost_time = curr_time if report_lost_time is None else report_lost_time
+                    self._connect_report(close_wait=0 if self._auto_reconnect else 2)
                     if not self.reported:
                         connect_failed_cnt += 1
+                        self._reconnect_stats['report']['attempts'] += 1
                         if self.connected and (connect_failed_cnt <= max_reconnect_cnts or protocol_identifier == 3):
-                            time.sleep(2)
+                            time.sleep(get_backoff_delay(connect_failed_cnt - 1, self._reconnect_backoff_base, self._reconnect_backoff_max)
+                                       if self._auto_reconnect else 2)
                         elif not self.connected or protocol_identifier == 2:
-                            logger.error('report thread is break, connected={}, failed_cnts={}'.format(self.connected, connect_failed_cnt))
+                            logger.error('report thread is break, connected=%s, failed_cnts=%s', self.connected, connect_failed_cnt)
+                            self._reconnect_stats['report']['failed'] += 1
                             break
                         continue
                     else:
                         connect_failed_cnt = 0
+                        self.__update_reconnect_stats('report', time.monotonic() - report_lost_time)
+                        report_lost_time = None
                 connect_failed_cnt = 0
                 if not report_socket_connected:
                     report_socket_connected = True
                     self._report_connect_changed_callback(main_socket_connected, report_socket_connected)
-                recv_data = self._stream_report.read(1)
+                recv_data = self._stream_report.read_with_time(1)
                 if recv_data != -1:
+                    recv_data, recv_time = recv_data
                     size = convert.bytes_to_u32(recv_data)
                     if self._is_old_protocol and size > 256:
                         self._is_old_protocol = False
-                    self._handle_report_data(recv_data)
+                    self._handle_report_data(recv_data, recv_time)
                 # else:
                 #     if self.connected:
                 #         code, err_warn = self.get_err_warn_code()
@@ -1262,9 +1501,162 @@ class Base(BaseObject, Events):
         if self._pause_cnts > 0:
             with self._pause_cond:
                 self._pause_cond.notifyAll()
+        if self._auto_reconnect and not self._disconnect_requested and self.__auto_reconnect():
+            # the new report thread is started by the reconnect
+            return
         self.disconnect()
 
-    def _handle_report_data(self, data):
+    def _connection_watch_thread_handle(self):
+        """
+        Watch the main socket if the report is disabled, reconnect after it dropped (auto_reconnect)
+        """
+        while self.connected:
+            time.sleep(0.1)
+        if self._auto_reconnect and not self._disconnect_requested and self.__auto_reconnect():
+            # the new watch thread is started by the reconnect
+            return
+        self.disconnect()
+
+    # the state of the session which is kept by the reconnect (reset by _init)
+    _SESSION_ATTRS = ['_last_position', '_last_angles', '_last_tcp_speed', '_last_tcp_acc',
+                      '_last_joint_speed', '_last_joint_acc', '_mvtime']
+
+    def __auto_reconnect(self):
+        """
+        Reconnect the sockets with exponential backoff after the main socket dropped (called in the report thread or the watch thread)
+        The session is resumed: the callbacks/dispatcher, the last used speed/acc/position, the feedback type,
+        the protocol identifier and the timeouts, the sn is reused from the identity cache if the version is the same
+        """
+        lost_time = time.monotonic()
+        stats = self._reconnect_stats['main']
+        feedback_type = self.arm_cmd.feedback_type if self.arm_cmd is not None else 0
+        protocol_identifier = self.arm_cmd.get_protocol_identifier() if self.arm_cmd is not None else 2
+        session = {name: copy.deepcopy(getattr(self, name)) for name in self._SESSION_ATTRS}
+        self._reconnect_thread = threading.current_thread()
+        self._reconnecting = True
+        self._thread_manage.remove(self._reconnect_thread)
+        self._report_connect_changed_callback(False, False)
+        logger.warning('connection of %s is lost, reconnecting ...', self._port)
+        attempt = 0
+        try:
+            while not self._disconnect_requested and (self._reconnect_max_retries < 0 or attempt < self._reconnect_max_retries):
+                time.sleep(get_backoff_delay(attempt, self._reconnect_backoff_base, self._reconnect_backoff_max))
+                attempt += 1
+                stats['attempts'] += 1
+                for stream in [self._stream, self._stream_report, self._stream_503]:
+                    try:
+                        if stream is not None:
+                            stream.close()
+                    except:
+                        pass
+                try:
+                    self.connect()
+                except Exception as e:
+                    logger.warning('reconnect %s failed, attempt=%s, %s', self._port, attempt, e)
+                    continue
+                if not self.connected:
+                    continue
+                for name, value in session.items():
+                    setattr(self, name, value)
+                self.arm_cmd.set_protocol_identifier(protocol_identifier)
+                if feedback_type != 0 and self._support_feedback:
+                    self.set_feedback_type(feedback_type)
+                self.__update_reconnect_stats('main', time.monotonic() - lost_time)
+                logger.info('reconnect %s success, attempts=%s, latency=%.3fs', self._port, attempt, time.monotonic() - lost_time)
+                return True
+            stats['failed'] += 1
+            logger.error('reconnect %s failed after %s attempts', self._port, attempt)
+            return False
+        finally:
+            self._reconnecting = False
+            self._reconnect_thread = None
+
+    def _reset_reconnect_stats(self):
+        self._reconnect_stats = {
+            name: {'count': 0, 'attempts': 0, 'failed': 0, 'last_latency': 0, 'max_latency': 0, 'total_latency': 0}
+            for name in ['main', 'report']
+        }
+
+    def __update_reconnect_stats(self, name, latency):
+        stats = self._reconnect_stats[name]
+        stats['count'] += 1
+        stats['last_latency'] = latency
+        stats['max_latency'] = max(stats['max_latency'], latency)
+        stats['total_latency'] += latency
+
+    def get_reconnect_stats(self, reset=False):
+        """
+        :return: tuple((code, stats)), stats: {'main': {...}, 'report': {...}}
+            count: the number of the successful reconnects
+            attempts: the number of the connect attempts
+            failed: the number of the reconnects which gave up
+            last_latency/max_latency/avg_latency: the seconds from the connection lost to reconnected
+        """
+        stats = {}
+        for name, item in self._reconnect_stats.items():
+            stat = dict(item)
+            total_latency = stat.pop('total_latency')
+            stat['avg_latency'] = total_latency / stat['count'] if stat['count'] else 0
+            stats[name] = stat
+        if reset:
+            self._reset_reconnect_stats()
+        return 0, stats
+
+    def _report_subscribed_groups(self):
+        groups = 0
+        if self._report_callbacks.get(self.REPORT_TEMPERATURE_CHANGED_ID):
+            groups |= REPORT_GROUP_TEMPERATURE
+        if self._event_bus is not None and self._event_bus.has_listener(TOPIC_CGPIO_STATE):
+            groups |= REPORT_GROUP_CGPIO
+        if self._ft_stream is not None:
+            groups |= REPORT_GROUP_FT
+        if self._state_publisher is not None:
+            groups |= REPORT_GROUP_SPEED | REPORT_GROUP_CGPIO | REPORT_GROUP_FT
+        return groups
+
+    def _decode_report_group(self, group, rx_data):
+        length = len(rx_data)
+        if group == REPORT_GROUP_TEMPERATURE:
+            if length >= 252:
+                self._temperatures = list(struct.unpack('>7b', rx_data[245:252]))
+        elif group == REPORT_GROUP_SPEED:
+            if length >= 284:
+                speeds = convert.bytes_to_fp32s(rx_data[252:8 * 4 + 252], 8)
+                self._realtime_tcp_speed = speeds[0]
+                self._realtime_joint_speeds = speeds[1:]
+        elif group == REPORT_GROUP_ELECTRIC:
+            if length >= 417:
+                self._voltages = [x / 100 for x in convert.bytes_to_u16s(rx_data[341:355], 7)]
+                self._currents = convert.bytes_to_fp32s(rx_data[355:383], 7)
+        elif group == REPORT_GROUP_CGPIO:
+            if length >= 417:
+                cgpio_states = []
+                cgpio_states.extend(rx_data[383:385])
+                cgpio_states.extend(convert.bytes_to_u16s(rx_data[385:401], 8))
+                cgpio_states[6:10] = list(map(lambda x: x / 4095.0 * 10.0, cgpio_states[6:10]))
+                cgpio_states.append(list(map(int, rx_data[401:409])))
+                cgpio_states.append(list(map(int, rx_data[409:417])))
+                if self._control_box_type_is_1300 and length >= 433:
+                    cgpio_states[-2].extend(list(map(int, rx_data[417:425])))
+                    cgpio_states[-1].extend(list(map(int, rx_data[425:433])))
+                self._cgpio_states = cgpio_states
+        elif group == REPORT_GROUP_FT:
+            if length >= 481:
+                # FT_SENSOR
+                self._ft_ext_force = convert.bytes_to_fp32s(rx_data[433:457], 6)
+                self._ft_raw_force = convert.bytes_to_fp32s(rx_data[457:481], 6)
+
+    def _sync_report_group(self, group):
+        # decode the group from the last rich report if it was skipped (nobody subscribed it)
+        seq, rx_data = self._report_rich_last
+        if rx_data is not None and self._report_group_seqs[group] != seq:
+            with self._report_group_lock:
+                seq, rx_data = self._report_rich_last
+                if self._report_group_seqs[group] != seq:
+                    self._decode_report_group(group, rx_data)
+                    self._report_group_seqs[group] = seq
+
+    def _handle_report_data(self, data, recv_time=None):
         def __handle_report_normal_old(rx_data):
             report_time = time.monotonic()
             interval = report_time - self._last_report_time
@@ -1291,9 +1683,8 @@ class Base(BaseObject, Events):
                     else:
                         pretty_print('Warnning had clean', color='blue')
                 self._report_error_warn_changed_callback()
-                logger.info('OnReport -> err={}, warn={}, state={}, cmdnum={}, mtbrake={}, mtable={}'.format(
-                    error_code, warn_code, state, cmd_num, mtbrake, mtable
-                ))
+                logger.info('OnReport -> err=%s, warn=%s, state=%s, cmdnum=%s, mtbrake=%s, mtable=%s',
+                    error_code, warn_code, state, cmd_num, mtbrake, mtable)
             elif not self._only_report_err_warn_changed:
                 self._report_error_warn_changed_callback()
 
@@ -1393,8 +1784,10 @@ class Base(BaseObject, Events):
 
             if not (0 < self._error_code <= 17):
                 self._position = pose
+                self._last_update_position_time = time.monotonic()
             if not (0 < self._error_code <= 17):
                 self._angles = angles
+                self._last_update_angles_time = self._last_update_position_time
             if not (0 < self._error_code <= 17):
                 self._position_offset = pose_offset
 
@@ -1469,6 +1862,7 @@ class Base(BaseObject, Events):
             if state != self._state:
                 self._state = state
                 self._report_state_changed_callback()
+            self._last_update_state_time = time.monotonic()
             if state in [4, 5]:
                 self._is_ready = False
             else:
@@ -1484,8 +1878,10 @@ class Base(BaseObject, Events):
 
             if not (0 < self._error_code <= 17):
                 self._position = pose
+                self._last_update_position_time = time.monotonic()
             if not (0 < self._error_code <= 17):
                 self._angles = angles
+                self._last_update_angles_time = self._last_update_position_time
             self._joints_torque = torque
 
             self._report_location_callback()
@@ -1499,6 +1895,8 @@ class Base(BaseObject, Events):
                 # FT_SENSOR
                 self._ft_ext_force = convert.bytes_to_fp32s(rx_data[87:111], 6)
                 self._ft_raw_force = convert.bytes_to_fp32s(rx_data[111:135], 6)
+                if self._ft_stream is not None:
+                    self._ft_stream.push(self._ft_ext_force, self._ft_raw_force, self._report_recv_time)
 
         def __handle_report_normal(rx_data):
             report_time = time.monotonic()
@@ -1527,12 +1925,11 @@ class Base(BaseObject, Events):
             if (length != data_len and (length != 233 or data_len != 245)) or collis_sens not in list(range(6)) or teach_sens not in list(range(6)) \
                 or mode not in list(range(12)) or state not in list(range(10)):
                 self._stream_report.close()
-                logger.warn('ReportDataException: length={}, data_len={}, '
-                            'state={}, mode={}, collis_sens={}, teach_sens={}, '
-                            'error_code={}, warn_code={}'.format(
+                logger.warn('ReportDataException: length=%s, data_len=%s, '
+                            'state=%s, mode=%s, collis_sens=%s, teach_sens=%s, '
+                            'error_code=%s, warn_code=%s',
                     length, data_len,
-                    state, mode, collis_sens, teach_sens, error_code, warn_code
-                ))
+                    state, mode, collis_sens, teach_sens, error_code, warn_code)
                 return
             self._gravity_direction = convert.bytes_to_fp32s(rx_data[133:3*4 + 133], 3)
 
@@ -1590,9 +1987,8 @@ class Base(BaseObject, Events):
                     else:
                         pretty_print('ControllerWarning had clean', color='blue')
                 self._report_error_warn_changed_callback()
-                logger.info('OnReport -> err={}, warn={}, state={}, cmdnum={}, mtbrake={}, mtable={}, mode={}'.format(
-                    error_code, warn_code, state, cmd_num, mtbrake, mtable, mode
-                ))
+                logger.info('OnReport -> err=%s, warn=%s, state=%s, cmdnum=%s, mtbrake=%s, mtable=%s, mode=%s',
+                    error_code, warn_code, state, cmd_num, mtbrake, mtable, mode)
             elif not self._only_report_err_warn_changed:
                 self._report_error_warn_changed_callback()
 
@@ -1672,8 +2068,10 @@ class Base(BaseObject, Events):
 
             if not (0 < self._error_code <= 17):
                 self._position = pose
+                self._last_update_position_time = time.monotonic()
             if not (0 < self._error_code <= 17):
                 self._angles = angles
+                self._last_update_angles_time = self._last_update_position_time
             if not (0 < self._error_code <= 17):
                 self._position_offset = pose_offset
 
@@ -1741,17 +2139,17 @@ class Base(BaseObject, Events):
 
             # length = convert.bytes_to_u32(rx_data[0:4])
             length = len(rx_data)
-            if length >= 252:
-                temperatures = list(struct.unpack('>7b', struct.pack('>7B', *rx_data[245:252])))
-                # temperatures = list(map(int, rx_data[245:252]))
-                if temperatures != self.temperatures:
-                    self._temperatures = temperatures
-                    self._report_temperature_changed_callback()
-            if length >= 284:
-                speeds = convert.bytes_to_fp32s(rx_data[252:8 * 4 + 252], 8)
-                self._realtime_tcp_speed = speeds[0]
-                self._realtime_joint_speeds = speeds[1:]
-                # print(speeds[0], speeds[1:])
+            groups = self._report_subscribed_groups()
+            temperatures = self._temperatures
+            with self._report_group_lock:
+                seq = self._report_rich_last[0] + 1
+                for group in _REPORT_GROUPS:
+                    if groups & group:
+                        self._decode_report_group(group, rx_data)
+                        self._report_group_seqs[group] = seq
+                self._report_rich_last = (seq, rx_data)
+            if groups & REPORT_GROUP_TEMPERATURE and self._temperatures != temperatures:
+                self._report_temperature_changed_callback()
             if length >= 288:
                 count = convert.bytes_to_u32(rx_data[284:288])
                 # print(count, rx_data[284:288])
@@ -1759,6 +2157,8 @@ class Base(BaseObject, Events):
                     self._count = count
                     self._report_count_changed_callback()
                 self._count = count
+                if self._event_bus is not None:
+                    self._event_bus.publish('count', count, from_report=True)
             if length >= 312:
                 world_offset = convert.bytes_to_fp32s(rx_data[288:6 * 4 + 288], 6)
                 for i in range(len(world_offset)):
@@ -1774,28 +2174,10 @@ class Base(BaseObject, Events):
                 self._is_simulation_robot = bool(rx_data[314])
                 self._is_collision_detection, self._collision_tool_type = rx_data[315:317]
                 self._collision_tool_params = convert.bytes_to_fp32s(rx_data[317:341], 6)
-
-                voltages = convert.bytes_to_u16s(rx_data[341:355], 7)
-                voltages = list(map(lambda x: x / 100, voltages))
-                self._voltages = voltages
-
-                currents = convert.bytes_to_fp32s(rx_data[355:383], 7)
-                self._currents = currents
-
-                cgpio_states = []
-                cgpio_states.extend(rx_data[383:385])
-                cgpio_states.extend(convert.bytes_to_u16s(rx_data[385:401], 8))
-                cgpio_states[6:10] = list(map(lambda x: x / 4095.0 * 10.0, cgpio_states[6:10]))
-                cgpio_states.append(list(map(int, rx_data[401:409])))
-                cgpio_states.append(list(map(int, rx_data[409:417])))
-                if self._control_box_type_is_1300 and length >= 433:
-                    cgpio_states[-2].extend(list(map(int, rx_data[417:425])))
-                    cgpio_states[-1].extend(list(map(int, rx_data[425:433])))
-                self._cgpio_states = cgpio_states
-            if length >= 481:
-                # FT_SENSOR
-                self._ft_ext_force = convert.bytes_to_fp32s(rx_data[433:457], 6)
-                self._ft_raw_force = convert.bytes_to_fp32s(rx_data[457:481], 6)
+                if groups & REPORT_GROUP_CGPIO and self._event_bus is not None:
+                    self._event_bus.publish(TOPIC_CGPIO_STATE, self._cgpio_states, from_report=True)
+            if length >= 481 and groups & REPORT_GROUP_FT and self._ft_stream is not None:
+                self._ft_stream.push(self._ft_ext_force, self._ft_raw_force, self._report_recv_time)
             if length >= 482:
                 iden_progress = rx_data[481]
                 if iden_progress != self._iden_progress:
@@ -1816,6 +2198,15 @@ class Base(BaseObject, Events):
                 self._reduced_mode_is_on = rx_data[495]
                 self._reduced_tcp_boundary = convert.bytes_to_16s(rx_data[496:508], 6)
 
+        self._report_recv_time = time.monotonic() if recv_time is None else recv_time
+        if self._report_type == 'rich' and not self._is_old_protocol and len(data) >= 516:
+            # the rich report after the last field (rx_data[496:508]) ends with the controller timestamp (us)
+            self._report_ctrl_us = convert.bytes_to_u64(data[-8:])
+            self._report_clock.update(self._report_ctrl_us, self._report_recv_time)
+        else:
+            # the normal/real reports and the rich report of the old firmware carry no controller timestamp
+            self._report_ctrl_us = None
+
         try:
             if self._report_type == 'real':
                 __handle_report_real(data)
@@ -1829,6 +2220,8 @@ class Base(BaseObject, Events):
                     __handle_report_normal_old(data)
                 else:
                     __handle_report_normal(data)
+            if self._state_publisher is not None:
+                self._state_publisher.publish(self)
         except Exception as e:
             logger.error(e)
 
@@ -2014,7 +2407,7 @@ class Base(BaseObject, Events):
             if code in [0, XCONF.UxbusState.WAR_CODE]:
                 if self.arm_cmd.state_is_ready:
                     if mode >= 0 and mode != self.mode:
-                        logger.warn('The mode may be incorrect, just as a reminder, mode: {} ({})'.format(mode, self.mode))
+                        logger.warn('The mode may be incorrect, just as a reminder, mode: %s (%s)', mode, self.mode)
                     return 0
                     # return 0 if mode < 0 or mode == self.mode else APIState.MODE_IS_NOT_CORRECT
                 else:
@@ -2065,26 +2458,34 @@ class Base(BaseObject, Events):
         return ret[0], ret[1]
 
     @xarm_is_connected(_type='get')
-    def get_position(self, is_radian=None):
+    def get_position(self, is_radian=None, max_age=None):
         is_radian = self._default_is_radian if is_radian is None else is_radian
-        ret = self.arm_cmd.get_tcp_pose()
-        ret[0] = self._check_code(ret[0])
-        if ret[0] == 0 and len(ret) > 6:
-            self._position = [filter_invaild_number(ret[i], 6, default=self._position[i-1]) for i in range(1, 7)]
+        if self.__query_cache_is_fresh('position', self._last_update_position_time, max_age):
+            ret = [0]
+        else:
+            ret = self.arm_cmd.get_tcp_pose()
+            ret[0] = self._check_code(ret[0])
+            if ret[0] == 0 and len(ret) > 6:
+                self._position = [filter_invaild_number(ret[i], 6, default=self._position[i-1]) for i in range(1, 7)]
+                self._last_update_position_time = time.monotonic()
         return ret[0], [float(
             '{:.6f}'.format(math.degrees(self._position[i]) if 2 < i < 6 and not is_radian else self._position[i])) for
                         i in range(len(self._position))]
 
     @xarm_is_connected(_type='get')
-    def get_servo_angle(self, servo_id=None, is_radian=None, is_real=False):
+    def get_servo_angle(self, servo_id=None, is_radian=None, is_real=False, max_age=None):
         is_radian = self._default_is_radian if is_radian is None else is_radian
-        if is_real and self.version_is_ge(1, 9, 110):
+        if is_real and self._capability.supports_real_joint_states:
             ret = self.arm_cmd.get_joint_states(num=1)
+        elif self.__query_cache_is_fresh('angles', self._last_update_angles_time, max_age):
+            ret = [0]
         else:
             ret = self.arm_cmd.get_joint_pos()
         ret[0] = self._check_code(ret[0])
         if ret[0] == 0 and len(ret) > 7:
             self._angles = [filter_invaild_number(ret[i], 6, default=self._angles[i-1]) for i in range(1, 8)]
+            if not is_real:
+                self._last_update_angles_time = time.monotonic()
         if servo_id is None or servo_id == 8 or len(self._angles) < servo_id:
             return ret[0], list(
                 map(lambda x: float('{:.6f}'.format(x if is_radian else math.degrees(x))), self._angles))
@@ -2095,7 +2496,7 @@ class Base(BaseObject, Events):
     @xarm_is_connected(_type='get')
     def get_joint_states(self, is_radian=None, num=3):
         is_radian = self._default_is_radian if is_radian is None else is_radian
-        num = num if self.version_is_ge(2, 6, 107) else (num & 0x0F)
+        num = num if self._capability.supports_joint_states_num else (num & 0x0F)
         ret = self.arm_cmd.get_joint_states(num=num)
         ret[0] = self._check_code(ret[0])
         positon = ret[1:8]
@@ -2142,8 +2543,36 @@ class Base(BaseObject, Events):
         self.get_state()
         return self._state == 1
 
+    def __query_cache_is_fresh(self, name, update_time, max_age):
+        """
+        Read-through cache of the queries, the value decoded from the report (or the last query) is used
+        if it was updated within max_age seconds, max_age=None means always query the controller
+        """
+        if max_age is None:
+            return False
+        if time.monotonic() - update_time <= max_age:
+            self._query_cache_stats[name]['hits'] += 1
+            return True
+        self._query_cache_stats[name]['misses'] += 1
+        return False
+
+    def _reset_query_cache_stats(self):
+        self._query_cache_stats = {name: {'hits': 0, 'misses': 0} for name in ['state', 'position', 'angles']}
+
+    def get_query_cache_stats(self, reset=False):
+        """
+        :return: tuple((code, stats)), stats: {'state': {'hits': n, 'misses': n}, 'position': {...}, 'angles': {...}}
+            only the queries with max_age are counted
+        """
+        stats = {name: dict(item) for name, item in self._query_cache_stats.items()}
+        if reset:
+            self._reset_query_cache_stats()
+        return 0, stats
+
     @xarm_is_connected(_type='get')
-    def get_state(self):
+    def get_state(self, max_age=None):
+        if self.__query_cache_is_fresh('state', self._last_update_state_time, max_age):
+            return 0, self._state
         ret = self.arm_cmd.get_state()
         ret[0] = self._check_code(ret[0])
         if ret[0] == 0:
@@ -2179,18 +2608,18 @@ class Base(BaseObject, Events):
             if not self._is_ready:
                 pretty_print('[set_state], xArm is ready to move', color='green')
             self._is_ready = True
-        self.log_api_info('API -> set_state({}) -> code={}, state={}'.format(state, ret[0], self._state), code=ret[0])
+        self.log_api_info('API -> set_state(%s) -> code=%s, state=%s', state, ret[0], self._state, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_mode(self, mode=0, detection_param=0):
-        if self.version_is_ge(1, 10, 0):
+        if self._capability.supports_mode_detection:
             detection_param = detection_param if detection_param >= 0 else 0
         else:
             detection_param = -1
         ret = self.arm_cmd.set_mode(mode, detection_param=detection_param)
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_mode({}) -> code={}'.format(mode, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_mode(%s) -> code=%s', mode, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -2227,13 +2656,13 @@ class Base(BaseObject, Events):
                 '错误码' if lang == 'cn' else 'ErrorCode',
                 controller_error.code,
                 '信息' if lang == 'cn' else 'Info',
-                controller_error.title[lang]),
+                controller_error.get_title(lang)),
                          color='red' if self._error_code != 0 else 'white')
             pretty_print('* {}: {}, {}: {}'.format(
                 '警告码' if lang == 'cn' else 'WarnCode',
                 controller_warn.code,
                 '信息' if lang == 'cn' else 'Info',
-                controller_warn.title[lang]),
+                controller_warn.get_title(lang)),
                          color='yellow' if self._warn_code != 0 else 'white')
             pretty_print('*' * 50, color='light_blue')
         return ret[0], ret[1:3] if ret[0] == 0 else [self._error_code, self._warn_code]
@@ -2251,13 +2680,13 @@ class Base(BaseObject, Events):
             if not self._is_ready:
                 pretty_print('[clean_error], xArm is ready to move', color='green')
             self._is_ready = True
-        self.log_api_info('API -> clean_error -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> clean_error -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def clean_warn(self):
         ret = self.arm_cmd.clean_war()
-        self.log_api_info('API -> clean_warn -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> clean_warn -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -2281,7 +2710,7 @@ class Base(BaseObject, Events):
             if not self._is_ready:
                 pretty_print('[motion_enable], xArm is ready to move', color='green')
             self._is_ready = True
-        self.log_api_info('API -> motion_enable -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> motion_enable -> code=%s', ret[0], code=ret[0])
         return ret[0]
     
     def _gen_feedback_key(self, wait, **kwargs):
@@ -2315,9 +2744,9 @@ class Base(BaseObject, Events):
             if self.error_code != 0:
                 self._fb_transid_result_map.clear()
                 if not ignore_log:
-                    self.log_api_info('wait_feedback, xarm has error, error={}'.format(self.error_code), code=APIState.HAS_ERROR)
+                    self.log_api_info('wait_feedback, xarm has error, error=%s', self.error_code, code=APIState.HAS_ERROR)
                 return APIState.HAS_ERROR, -1
-            code, state = self.get_state()
+            code, state = self.get_state(max_age=self._WAIT_POLL_MAX_AGE)
             if code != 0:
                 return code, -1
             if state >= 4:
@@ -2327,7 +2756,7 @@ class Base(BaseObject, Events):
                 if state != 5 or state5_cnt >= 20:
                     self._fb_transid_result_map.clear()
                     if not ignore_log:
-                        self.log_api_info('wait_feedback, xarm is stop, state={}'.format(state), code=APIState.EMERGENCY_STOP)
+                        self.log_api_info('wait_feedback, xarm is stop, state=%s', state, code=APIState.EMERGENCY_STOP)
                     return APIState.EMERGENCY_STOP, -1
             else:
                 state5_cnt = 0
@@ -2352,11 +2781,11 @@ class Base(BaseObject, Events):
                 self.log_api_info('wait_move, xarm is disconnect', code=APIState.NOT_CONNECTED)
                 return APIState.NOT_CONNECTED
             if self.error_code != 0:
-                self.log_api_info('wait_move, xarm has error, error={}'.format(self.error_code), code=APIState.HAS_ERROR)
+                self.log_api_info('wait_move, xarm has error, error=%s', self.error_code, code=APIState.HAS_ERROR)
                 return APIState.HAS_ERROR
             if self.mode != 0 and self.mode != 11:
                 return 0
-            code, state = self.get_state()
+            code, state = self.get_state(max_age=self._WAIT_POLL_MAX_AGE)
             if code != 0:
                 return code
             if state >= 4:
@@ -2364,7 +2793,7 @@ class Base(BaseObject, Events):
                 if state == 5:
                     state5_cnt += 1
                 if state != 5 or state5_cnt >= 20:
-                    self.log_api_info('wait_move, xarm is stop, state={}'.format(state), code=APIState.EMERGENCY_STOP)
+                    self.log_api_info('wait_move, xarm is stop, state=%s', state, code=APIState.EMERGENCY_STOP)
                     return APIState.EMERGENCY_STOP
             else:
                 state5_cnt = 0
@@ -2447,12 +2876,12 @@ class Base(BaseObject, Events):
                 except Exception as e:
                     self._ignore_error = False
                     self._ignore_state = False
-                    logger.error('checkset_modbus_baud error: {}'.format(e))
+                    logger.error('checkset_modbus_baud error: %s', e)
                     return APIState.API_EXCEPTION
                 self._ignore_error = False
                 self._ignore_state = False
                 ret, cur_baud_inx = self._get_modbus_baudrate_inx(host_id=host_id)
-                self.log_api_info('API -> checkset_modbus_baud -> code={}, baud_inx={}'.format(ret, cur_baud_inx), code=ret)
+                self.log_api_info('API -> checkset_modbus_baud -> code=%s, baud_inx=%s', ret, cur_baud_inx, code=ret)
             # if ret == 0 and cur_baud_inx < len(self.arm_cmd.BAUDRATES):
             #     self.modbus_baud = self.arm_cmd.BAUDRATES[cur_baud_inx]
         if host_id == XCONF.TGPIO_HOST_ID:
@@ -2488,13 +2917,13 @@ class Base(BaseObject, Events):
     @xarm_is_connected(_type='set')
     def set_tgpio_modbus_timeout(self, timeout, is_transparent_transmission=False, **kwargs):
         ret = self.arm_cmd.set_modbus_timeout(timeout, is_transparent_transmission=kwargs.get('is_tt', is_transparent_transmission))
-        self.log_api_info('API -> set_tgpio_modbus_timeout -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> set_tgpio_modbus_timeout -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_tgpio_modbus_baudrate(self, baud):
         code = self.checkset_modbus_baud(baud, check=False)
-        self.log_api_info('API -> set_tgpio_modbus_baudrate -> code={}'.format(code), code=code)
+        self.log_api_info('API -> set_tgpio_modbus_baudrate -> code=%s', code, code=code)
         return code
 
     @xarm_is_connected(_type='get')
@@ -2507,14 +2936,14 @@ class Base(BaseObject, Events):
     @xarm_is_connected(_type='set')
     def set_control_modbus_baudrate(self, baud):
         code = self.checkset_modbus_baud(baud, check=False, host_id=XCONF.LINEAR_MOTOR_HOST_ID)
-        self.log_api_info('API -> set_control_modbus_baudrate -> code={}'.format(code), code=code)
+        self.log_api_info('API -> set_control_modbus_baudrate -> code=%s', code, code=code)
         return code
     
     def set_tgpio_modbus_use_503_port(self, use_503_port=True):
         if use_503_port:
             if not self.connected_503 and self.connect_503() != 0:
                 self.arm_cmd.tgpio_set_modbus_func = self.arm_cmd.tgpio_set_modbus
-                self.log_api_info('API -> set_tgpio_modbus_use_503_port -> code={}'.format(APIState.RET_IS_INVALID), code=APIState.RET_IS_INVALID)
+                self.log_api_info('API -> set_tgpio_modbus_use_503_port -> code=%s', APIState.RET_IS_INVALID, code=APIState.RET_IS_INVALID)
                 return APIState.RET_IS_INVALID
             self.arm_cmd.tgpio_set_modbus_func = self.arm_cmd_503.tgpio_set_modbus
         else:
@@ -2545,14 +2974,14 @@ class Base(BaseObject, Events):
             ret = self.arm_cmd.tgpio_set_modbus_func(datas, len(datas), host_id=host_id, is_transparent_transmission=is_tt)
         ret[0] = self._check_modbus_code(ret, min_res_len + 2, host_id=host_id)
         if not ignore_log:
-            self.log_api_info('API -> getset_tgpio_modbus_data -> code={}, response={}'.format(ret[0], ret[2:]), code=ret[0])
+            self.log_api_info('API -> getset_tgpio_modbus_data -> code=%s, response=%s', ret[0], ret[2:], code=ret[0])
         return ret[0], ret[2:]
 
     @xarm_is_connected(_type='set')
     def set_simulation_robot(self, on_off):
         ret = self.arm_cmd.set_simulation_robot(on_off)
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_simulation_robot({}) -> code={}'.format(on_off, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_simulation_robot(%s) -> code=%s', on_off, ret[0], code=ret[0])
         return ret[0]
     
     @xarm_wait_until_not_pause
@@ -2567,7 +2996,7 @@ class Base(BaseObject, Events):
         ret = self.arm_cmd.set_tcp_load(weight, _center_of_gravity, feedback_key=feedback_key)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait)
         ret[0] = self._check_code(ret[0], is_move_cmd=True)
-        self.log_api_info('API -> set_tcp_load -> code={}, weight={}, center={}'.format(ret[0], weight, _center_of_gravity), code=ret[0])
+        self.log_api_info('API -> set_tcp_load -> code=%s, weight=%s, center=%s', ret[0], weight, _center_of_gravity, code=ret[0])
         if wait and ret[0] == 0:
             return self.wait_move(None, trans_id=trans_id)
         return ret[0]
@@ -2588,7 +3017,7 @@ class Base(BaseObject, Events):
         return ret[0]
     
     def _feedback_thread_handle(self):
-        while self.connected:
+        while self.connected or self._reconnecting:
             try:
                 data = self._feedback_que.get(timeout=1)
             except:
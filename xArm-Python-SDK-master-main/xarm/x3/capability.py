@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+
+class Capability(object):
+    """
+    Firmware capability table, computed once from the firmware version (see Base._check_version)
+    The hot paths read the boolean attributes instead of comparing the version on every call
+    """
+    # name: the minimum firmware version (major, minor, revision)
+    FEATURES = {
+        'supports_reduced_states_v2': (1, 2, 11),  # get_reduced_states returns the joint ranges, playback_traj with double_speed
+        'supports_skip_ready_check': (1, 5, 20),  # no need to check the ready state before the motion cmd
+        'supports_joint_radius': (1, 5, 20),  # move_jointb (set_servo_angle with radius)
+        'supports_vc_duration': (1, 8, 0),  # the duration param of the velocity control
+        'supports_ft_data_v2': (1, 8, 3),  # new FTSENSOR_GET_DATA register
+        'supports_protocol_v3': (1, 8, 6),  # protocol identifier 3 (heartbeat)
+        'supports_relative_move': (1, 8, 100),  # move_relative cmd
+        'supports_iden_estimated_mass': (1, 9, 100),  # iden_tcp_load with estimated_mass
+        'supports_real_joint_states': (1, 9, 110),  # get_servo_angle(is_real=True)
+        'supports_mode_detection': (1, 10, 0),  # the detection_param of set_mode
+        'supports_move_line_common': (1, 11, 100),  # common move line cmd (radius/motion_type/feedback)
+        'supports_feedback': (2, 0, 102),  # motion feedback
+        'supports_inf_position': (2, 4, 101),  # the position/angle keeps unchanged if the value is inf
+        'supports_io_sync': (2, 4, 101),  # the sync param of the tgpio/cgpio set interfaces
+        'supports_joint_states_num': (2, 6, 107),  # the high bits of the num of get_joint_states
+        'supports_ft_raw': (2, 6, 109),  # get_ft_sensor_data(is_raw=True)
+    }
+
+    __slots__ = ['version'] + sorted(FEATURES.keys())
+
+    def __init__(self, version=(0, 0, 0)):
+        self.update(version)
+
+    def update(self, version):
+        self.version = tuple(version)
+        for name, min_version in self.FEATURES.items():
+            setattr(self, name, self.version >= min_version)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in sorted(self.FEATURES.keys())}
+
+    def __repr__(self):
+        return 'Capability(version={}, {})'.format(
+            '.'.join(map(str, self.version)), ', '.join(name for name, val in self.to_dict().items() if val))
@@ -21,7 +21,7 @@ def check_modbus_baud(baud=2000000, _type='set', default=None, host_id=XCONF.TGP
         def decorator(self, *args, **kwargs):
             code = self.checkset_modbus_baud(baud, host_id=host_id)
             if code != 0:
-                logger.error('check modbus baud is failed, code={}'.format(code))
+                logger.error('check modbus baud is failed, code=%s', code)
                 return code if _type == 'set' else (code, default if default != -99 else [])
             else:
                 return func(self, *args, **kwargs)
@@ -42,7 +42,10 @@ def xarm_is_connected(_type='set'):
     return _xarm_is_connected
 
 
-def xarm_is_ready(_type='set'):
+def xarm_is_ready(_type='set', batch=False):
+    """
+    :param batch: the motion cmd of the batch (set_positions/set_servo_angles), the failure returns (code, [])
+    """
     def _xarm_is_ready(func):
         @functools.wraps(func)
         def decorator(self, *args, **kwargs):
@@ -58,9 +61,13 @@ def xarm_is_ready(_type='set'):
                     logger.error('xArm is not ready')
                     logger.info('Please check the arm for errors. If so, please clear the error first. '
                                 'Then enable the motor, set the mode and set the state')
+                    if batch:
+                        return APIState.NOT_READY, []
                     return APIState.NOT_READY if _type == 'set' else (APIState.NOT_READY, 'xArm is not ready')
             else:
                 logger.error('xArm is not connected')
+                if batch:
+                    return APIState.NOT_CONNECTED, []
                 return APIState.NOT_CONNECTED if _type == 'set' else (APIState.NOT_CONNECTED, 'xArm is not connect')
         return decorator
     return _xarm_is_ready
@@ -98,7 +105,7 @@ def api_log(func):
     @functools.wraps(func)
     def decorator(self, *args, **kwargs):
         ret = func(self, *args, **kwargs)
-        logger.info('{}, ret={}, args={}, kwargs={}'.format(func.__name__, ret, args[1:], kwargs))
+        logger.info('%s, ret=%s, args=%s, kwargs=%s', func.__name__, ret, args[1:], kwargs)
         return ret
     return decorator
 
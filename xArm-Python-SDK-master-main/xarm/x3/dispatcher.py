@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import time
+import threading
+from collections import deque
+from ..core.utils.log import logger
+
+# the callbacks of these names only care about the latest value (coalesced), others are lossless
+COALESCE_CALLBACK_NAMES = ['location', 'report']
+
+
+class _CallbackChannel(object):
+    def __init__(self, callback, name, coalesce):
+        self.callback = callback
+        self.name = name
+        self.coalesce = coalesce
+        self.items = deque()
+        self.not_full = None
+        self.scheduled = False
+        self.removed = False
+        self.submitted = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_pending = 0
+        self.failed = 0
+        self.total_latency = 0
+        self.max_latency = 0
+
+    def get_stats(self):
+        return {
+            'name': self.name,
+            'coalesce': self.coalesce,
+            'pending': len(self.items),
+            'submitted': self.submitted,
+            'delivered': self.delivered,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'max_pending': self.max_pending,
+            'failed': self.failed,
+            'avg_latency': self.total_latency / self.delivered if self.delivered else 0,
+            'max_latency': self.max_latency,
+        }
+
+
+class CallbackDispatcher(object):
+    """
+    Bounded callback dispatcher
+    Every callback has its own queue and is called by at most one worker at a time (in order):
+        1. coalesce callbacks (location/report): only the latest msg is kept, the replaced msgs are counted as coalesced
+        2. lossless callbacks (state, error/warn, ...): bounded queue (maxsize), the producer (report thread) waits
+            up to block_timeout when the queue is full, then the msg is dropped and counted
+    The dispatch latency (submit to call) of every callback is recorded
+    The channel of a callback is removed by remove() when the callback is released
+    """
+    def __init__(self, workers=1, maxsize=256, block_timeout=0.01):
+        self.maxsize = max(1, maxsize)
+        self.block_timeout = block_timeout
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._channels = {}
+        self._ready = deque()
+        self._alive = True
+        self._threads = []
+        for i in range(max(1, workers)):
+            t = threading.Thread(target=self.__worker_handle, name='xarm-callback-{}'.format(i), daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def __get_channel(self, callback, name):
+        key = (id(callback), name)
+        channel = self._channels.get(key, None)
+        if channel is None:
+            # the channel keeps a reference to the callback, so the id is not reused until the channel is removed
+            channel = _CallbackChannel(callback, name, name in COALESCE_CALLBACK_NAMES)
+            channel.not_full = threading.Condition(self._lock)
+            self._channels[key] = channel
+        return channel
+
+    def remove(self, callback):
+        """
+        Remove the channels (and the pending msgs) of the callback
+        :return: the number of the removed channels
+        """
+        with self._lock:
+            keys = [key for key, channel in self._channels.items() if channel.callback == callback]
+            for key in keys:
+                channel = self._channels.pop(key)
+                channel.removed = True
+                channel.items.clear()
+                channel.not_full.notify_all()
+                try:
+                    self._ready.remove(channel)
+                    channel.scheduled = False
+                except ValueError:
+                    pass
+            return len(keys)
+
+    def submit(self, callback, msg, name=''):
+        with self._lock:
+            if not self._alive:
+                return False
+            channel = self.__get_channel(callback, name)
+            channel.submitted += 1
+            if channel.coalesce:
+                if channel.items:
+                    channel.items.clear()
+                    channel.coalesced += 1
+            elif len(channel.items) >= self.maxsize:
+                expired = time.monotonic() + self.block_timeout
+                while self._alive and not channel.removed and len(channel.items) >= self.maxsize:
+                    remaining = expired - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    channel.not_full.wait(remaining)
+                if channel.removed or not self._alive:
+                    return False
+                if len(channel.items) >= self.maxsize:
+                    channel.dropped += 1
+                    if channel.dropped == 1 or channel.dropped % 100 == 0:
+                        logger.warning('%s callback queue is full, dropped=%s', name, channel.dropped)
+                    return False
+            channel.items.append((time.monotonic(), msg))
+            pending = len(channel.items)
+            if pending > channel.max_pending:
+                channel.max_pending = pending
+            if not channel.scheduled:
+                channel.scheduled = True
+                self._ready.append(channel)
+                self._cond.notify()
+        return True
+
+    def __worker_handle(self):
+        while True:
+            with self._lock:
+                while self._alive and not self._ready:
+                    self._cond.wait()
+                if not self._ready:
+                    return
+                channel = self._ready.popleft()
+                submit_time, msg = channel.items.popleft()
+                channel.not_full.notify()
+            latency = time.monotonic() - submit_time
+            failed = False
+            try:
+                channel.callback(msg)
+            except Exception as e:
+                failed = True
+                logger.error('run %s callback exception: %s', channel.name, e)
+            with self._lock:
+                channel.failed += int(failed)
+                channel.delivered += 1
+                channel.total_latency += latency
+                channel.max_latency = max(channel.max_latency, latency)
+                if channel.items and not channel.removed:
+                    self._ready.append(channel)
+                    self._cond.notify()
+                else:
+                    channel.scheduled = False
+
+    def get_stats(self):
+        with self._lock:
+            return [channel.get_stats() for channel in self._channels.values()]
+
+    def reset_stats(self):
+        with self._lock:
+            for channel in self._channels.values():
+                channel.submitted = channel.delivered = channel.coalesced = channel.dropped = channel.max_pending = channel.failed = 0
+                channel.total_latency = channel.max_latency = 0
+
+    def close(self, timeout=1):
+        with self._lock:
+            self._alive = False
+            self._cond.notify_all()
+            for channel in self._channels.values():
+                channel.not_full.notify_all()
+        expired = time.monotonic() + timeout
+        for t in self._threads:
+            t.join(max(0, expired - time.monotonic()))
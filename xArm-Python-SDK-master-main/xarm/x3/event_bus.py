@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+import time
+import queue
+import threading
+from ..core.utils.log import logger
+
+TOPIC_CGPIO_STATE = 'cgpio_state'
+TOPIC_COUNT = 'count'
+TOPIC_TGPIO_DIGITAL = 'tgpio_digital'
+TOPIC_TGPIO_ANALOG = 'tgpio_analog'
+TOPIC_HOLDING_REGISTER = 'holding_register'  # holding_register:{addr}
+
+# topics fed by the report (rich), only polled when the report does not publish them
+REPORT_TOPICS = [TOPIC_CGPIO_STATE, TOPIC_COUNT]
+
+
+class _Listener(object):
+    __slots__ = ('topic', 'callback')
+
+    def __init__(self, topic, callback):
+        self.topic = topic
+        self.callback = callback
+
+
+class EventBus(object):
+    """
+    Shared event bus of the arm
+    Topics:
+        cgpio_state: value is the same as get_cgpio_state()[1], fed by the rich report
+        count: counter value, fed by the rich report
+        tgpio_digital: [io0, io1, io2, io3, io4], polled
+        tgpio_analog: [io0, io1], polled
+        holding_register:{addr}: the value of the holding register, polled
+    The callback is called with (value, prev_value) in one dispatcher thread when the value of the topic changed,
+    prev_value is None for the first value. All the polled topics share one poll thread, it runs while there are
+    listeners (polling is skipped while disconnected), the report topics are also polled if the report stops
+    publishing them.
+    """
+    def __init__(self, arm, poll_interval=0.01, report_timeout=1.0):
+        self._arm = arm
+        self.poll_interval = poll_interval
+        self.report_timeout = report_timeout
+        self._lock = threading.Lock()
+        self._listeners = {}
+        self._values = {}
+        self._report_times = {}
+        self._que = queue.Queue()
+        self._dispatch_thread = None
+        self._poll_thread = None
+
+    def subscribe(self, topic, callback):
+        """
+        :return: listener, use it to unsubscribe
+        """
+        assert callable(callback)
+        listener = _Listener(topic, callback)
+        with self._lock:
+            if topic in self._values:
+                # a late listener gets the current value as the first value
+                self._que.put((listener, self._values[topic], None))
+            self._listeners.setdefault(topic, []).append(listener)
+            if self._dispatch_thread is None or not self._dispatch_thread.is_alive():
+                self._dispatch_thread = threading.Thread(target=self.__dispatch_thread_handle, daemon=True)
+                self._dispatch_thread.start()
+            if self._poll_thread is None or not self._poll_thread.is_alive():
+                self._poll_thread = threading.Thread(target=self.__poll_thread_handle, daemon=True)
+                self._poll_thread.start()
+        return listener
+
+    def unsubscribe(self, listener):
+        with self._lock:
+            listeners = self._listeners.get(listener.topic, [])
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                self._listeners.pop(listener.topic, None)
+                self._values.pop(listener.topic, None)
+
+    def has_listener(self, topic):
+        return bool(self._listeners.get(topic, None))
+
+    def publish(self, topic, value, from_report=False):
+        with self._lock:
+            listeners = self._listeners.get(topic, None)
+            if not listeners:
+                return
+            if from_report:
+                self._report_times[topic] = time.monotonic()
+            prev = self._values.get(topic, None)
+            if prev == value:
+                return
+            self._values[topic] = value
+            for listener in listeners:
+                self._que.put((listener, value, prev))
+
+    def __dispatch_thread_handle(self):
+        while True:
+            with self._lock:
+                # checked with the lock, subscribe starts a new thread once this one is cleared
+                if not self._listeners and self._que.empty():
+                    self._dispatch_thread = None
+                    break
+            try:
+                listener, value, prev = self._que.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                listener.callback(value, prev)
+            except Exception as e:
+                logger.error('event bus callback exception, topic=%s, exception=%s', listener.topic, e)
+
+    def __poll_topic(self, topic):
+        arm = self._arm
+        if topic == TOPIC_TGPIO_DIGITAL:
+            code, values = arm.get_tgpio_digital()
+            code2, value2 = arm.get_tgpio_digital(2)
+            if code == 0 and code2 == 0:
+                values = list(values)
+                values.insert(2, value2)
+                self.publish(topic, values)
+        elif topic == TOPIC_TGPIO_ANALOG:
+            code, values = arm.get_tgpio_analog()
+            if code == 0:
+                self.publish(topic, list(values))
+        elif topic == TOPIC_CGPIO_STATE:
+            code, values = arm.get_cgpio_state()
+            if code == 0:
+                self.publish(topic, values)
+        elif topic == TOPIC_COUNT:
+            self.publish(topic, arm.count)
+        elif topic.startswith(TOPIC_HOLDING_REGISTER):
+            code, values = arm.read_holding_registers(int(topic.split(':')[1]), 1)
+            if code == 0:
+                self.publish(topic, values[0])
+
+    def __poll_thread_handle(self):
+        while True:
+            with self._lock:
+                if not self._listeners:
+                    self._poll_thread = None
+                    break
+                topics = list(self._listeners.keys())
+            if not self._arm.connected:
+                # keep the thread while disconnected, polling resumes after the (auto) reconnect
+                time.sleep(max(self.poll_interval, 0.1))
+                continue
+            curr_time = time.monotonic()
+            for topic in topics:
+                if topic in REPORT_TOPICS and curr_time - self._report_times.get(topic, 0) < self.report_timeout:
+                    continue
+                try:
+                    self.__poll_topic(topic)
+                except Exception as e:
+                    logger.error('event bus poll exception, topic=%s, exception=%s', topic, e)
+            time.sleep(self.poll_interval)
@@ -10,6 +10,7 @@ from collections.abc import Iterable
 from ..core.utils.log import logger
 from ..core.utils import convert
 from .base import Base
+from .ft_stream import FtStream
 from .code import APIState
 from .decorator import xarm_is_connected
 
@@ -38,20 +39,20 @@ class FtSensor(Base):
                         M_RANGGE = [0.02, 1.0] if i < 3 else [0.0001, 0.01]
                         K_RANGGE = [0, 2000] if i < 3 else [0, 20]
                         if M[i] < M_RANGGE[0] or M[i] > M_RANGGE[1]:
-                            logger.error('set_ft_sensor_admittance_parameters, (the third parameter) M[{}] over range, range={}'.format(i, M_RANGGE))
+                            logger.error('set_ft_sensor_admittance_parameters, (the third parameter) M[%s] over range, range=%s', i, M_RANGGE)
                             return APIState.API_EXCEPTION
                         if K[i] < K_RANGGE[0] or K[i] > K_RANGGE[1]:
-                            logger.error('set_ft_sensor_admittance_parameters, (the 4th parameter) K[{}] over range, range={}'.format(i, K_RANGGE))
+                            logger.error('set_ft_sensor_admittance_parameters, (the 4th parameter) K[%s] over range, range=%s', i, K_RANGGE)
                             return APIState.API_EXCEPTION
                         if B[i] < 0:
-                            logger.error('set_ft_sensor_admittance_parameters, (the 5th parameter) B[{}] must be greater than or equal to 0'.format(i))
+                            logger.error('set_ft_sensor_admittance_parameters, (the 5th parameter) B[%s] must be greater than or equal to 0', i)
                             return APIState.API_EXCEPTION
                 ret = self.arm_cmd.set_admittance(coord, c_axis, M, K, B)
-                self.log_api_info('API -> set_ft_sensor_admittance_parameters(coord, c_axis, M, K, B) -> code={}'.format(ret[0]), code=ret[0])
+                self.log_api_info('API -> set_ft_sensor_admittance_parameters(coord, c_axis, M, K, B) -> code=%s', ret[0], code=ret[0])
                 return self._check_code(ret[0])
             else:
                 ret = self.arm_cmd.set_admittance_config(coord, c_axis)
-                self.log_api_info('API -> set_ft_sensor_admittance_parameters(coord, c_axis) -> code={}'.format(ret[0]), code=ret[0])
+                self.log_api_info('API -> set_ft_sensor_admittance_parameters(coord, c_axis) -> code=%s', ret[0], code=ret[0])
                 return self._check_code(ret[0])
         elif isinstance(coord, Iterable):
             # 当第一个参数为大小为6的数组时, 参数顺序为 M/K/B/coord/c_axis
@@ -69,24 +70,24 @@ class FtSensor(Base):
                     M_RANGGE = [0.02, 1.0] if i < 3 else [0.0001, 0.01]
                     K_RANGGE = [0, 2000] if i < 3 else [0, 20]
                     if M[i] < M_RANGGE[0] or M[i] > M_RANGGE[1]:
-                        logger.error('set_ft_sensor_admittance_parameters, (the first parameter) M[{}] over range, range={}'.format(i, M_RANGGE))
+                        logger.error('set_ft_sensor_admittance_parameters, (the first parameter) M[%s] over range, range=%s', i, M_RANGGE)
                         return APIState.API_EXCEPTION
                     if K[i] < K_RANGGE[0] or K[i] > K_RANGGE[1]:
-                        logger.error('set_ft_sensor_admittance_parameters, (the second parameter) K[{}] over range, range={}'.format(i, K_RANGGE))
+                        logger.error('set_ft_sensor_admittance_parameters, (the second parameter) K[%s] over range, range=%s', i, K_RANGGE)
                         return APIState.API_EXCEPTION
                     if B[i] < 0:
-                        logger.error('set_ft_sensor_admittance_parameters, (the third parameter) B[{}] must be greater than or equal to 0'.format(i))
+                        logger.error('set_ft_sensor_admittance_parameters, (the third parameter) B[%s] must be greater than or equal to 0', i)
                         return APIState.API_EXCEPTION
             if coord is not None or c_axis is not None:
                 if not isinstance(coord, int) or not isinstance(c_axis, Iterable) or len(c_axis) < 6:
                     logger.error('set_ft_sensor_admittance_parameters: the 4th and 5th parameters are either None or an integer and an array of size 6 respectively when the first parameter is an array.')
                     return APIState.API_EXCEPTION
                 ret = self.arm_cmd.set_admittance(coord, c_axis, M, K, B)
-                self.log_api_info('API -> set_ft_sensor_admittance_parameters(coord, c_axis, M, K, B) -> code={}'.format(ret[0]), code=ret[0])
+                self.log_api_info('API -> set_ft_sensor_admittance_parameters(coord, c_axis, M, K, B) -> code=%s', ret[0], code=ret[0])
                 return self._check_code(ret[0])
             else:
                 ret = self.arm_cmd.set_admittance_mbk(M, K, B)
-                self.log_api_info('API -> set_ft_sensor_admittance_parameters(M, K, B) -> code={}'.format(ret[0]), code=ret[0])
+                self.log_api_info('API -> set_ft_sensor_admittance_parameters(M, K, B) -> code=%s', ret[0], code=ret[0])
                 return self._check_code(ret[0])
         elif coord is None and c_axis is None:
             if not isinstance(M, Iterable) or len(M) < 6 \
@@ -99,16 +100,16 @@ class FtSensor(Base):
                     M_RANGGE = [0.02, 1.0] if i < 3 else [0.0001, 0.01]
                     K_RANGGE = [0, 2000] if i < 3 else [0, 20]
                     if M[i] < M_RANGGE[0] or M[i] > M_RANGGE[1]:
-                        logger.error('set_ft_sensor_admittance_parameters, (the third parameter) M[{}] over range, range={}'.format(i, M_RANGGE))
+                        logger.error('set_ft_sensor_admittance_parameters, (the third parameter) M[%s] over range, range=%s', i, M_RANGGE)
                         return APIState.API_EXCEPTION
                     if K[i] < K_RANGGE[0] or K[i] > K_RANGGE[1]:
-                        logger.error('set_ft_sensor_admittance_parameters, (the 4th parameter) K[{}] over range, range={}'.format(i, K_RANGGE))
+                        logger.error('set_ft_sensor_admittance_parameters, (the 4th parameter) K[%s] over range, range=%s', i, K_RANGGE)
                         return APIState.API_EXCEPTION
                     if B[i] < 0:
-                        logger.error('set_ft_sensor_admittance_parameters, (the 5th parameter) B[{}] must be greater than or equal to 0'.format(i))
+                        logger.error('set_ft_sensor_admittance_parameters, (the 5th parameter) B[%s] must be greater than or equal to 0', i)
                         return APIState.API_EXCEPTION
             ret = self.arm_cmd.set_admittance_mbk(M, K, B)
-            self.log_api_info('API -> set_ft_sensor_admittance_parameters(M, K, B) -> code={}'.format(ret[0]), code=ret[0])
+            self.log_api_info('API -> set_ft_sensor_admittance_parameters(M, K, B) -> code=%s', ret[0], code=ret[0])
             return self._check_code(ret[0])
         else:
             logger.error('set_ft_sensor_admittance_parameters: parameters error')
@@ -129,7 +130,7 @@ class FtSensor(Base):
                 max_f_ref = [150, 150, 200, 4, 4, 4]
                 for i in range(6):
                     if f_ref[i] < -max_f_ref[i] or f_ref[i] > max_f_ref[i]:
-                        logger.error('set_ft_sensor_force_parameters, (the third parameter)  f_ref[{}] over range, range=[{}, {}]'.format(i, -max_f_ref[i], max_f_ref[i]))
+                        logger.error('set_ft_sensor_force_parameters, (the third parameter)  f_ref[%s] over range, range=[%s, %s]', i, -max_f_ref[i], max_f_ref[i])
                         return APIState.API_EXCEPTION
             code = 0
             if kp is not None or ki is not None or kd is not None or xe_limit is not None:
@@ -146,22 +147,22 @@ class FtSensor(Base):
                     xe_limit_RANGGE = [0, 200]
                     for i in range(6):
                         if kp[i] < kp_RANGGE[0] or kp[i] > kp_RANGGE[1]:
-                            logger.error('set_ft_sensor_force_parameters, (the 5th parameter) kp[{}] over range, range={}'.format(i, kp_RANGGE))
+                            logger.error('set_ft_sensor_force_parameters, (the 5th parameter) kp[%s] over range, range=%s', i, kp_RANGGE)
                             return APIState.API_EXCEPTION
                         if ki[i] < ki_RANGGE[0] or ki[i] > ki_RANGGE[1]:
-                            logger.error('set_ft_sensor_force_parameters, (the 6th parameter) ki[{}] over range, range={}'.format(i, ki_RANGGE))
+                            logger.error('set_ft_sensor_force_parameters, (the 6th parameter) ki[%s] over range, range=%s', i, ki_RANGGE)
                             return APIState.API_EXCEPTION
                         if kd[i] < kd_RANGGE[0] or kd[i] > kd_RANGGE[1]:
-                            logger.error('set_ft_sensor_force_parameters, (the 7th parameter) kd[{}] over range, range={}'.format(i, kd_RANGGE))
+                            logger.error('set_ft_sensor_force_parameters, (the 7th parameter) kd[%s] over range, range=%s', i, kd_RANGGE)
                             return APIState.API_EXCEPTION
                         if xe_limit[i] < xe_limit_RANGGE[0] or xe_limit[i] > xe_limit_RANGGE[1]:
-                            logger.error('set_ft_sensor_force_parameters, (the 8th parameter) xe_limit[{}] over range, range={}'.format(i, xe_limit_RANGGE))
+                            logger.error('set_ft_sensor_force_parameters, (the 8th parameter) xe_limit[%s] over range, range=%s', i, xe_limit_RANGGE)
                             return APIState.API_EXCEPTION
                 ret = self.arm_cmd.set_force_control_pid(kp, ki, kd, xe_limit)
-                self.log_api_info('API -> set_ft_sensor_force_parameters(kp, ki, kd, xe_limit) -> code={}'.format(ret[0]), code=ret[0])
+                self.log_api_info('API -> set_ft_sensor_force_parameters(kp, ki, kd, xe_limit) -> code=%s', ret[0], code=ret[0])
                 code = self._check_code(ret[0])
             ret = self.arm_cmd.config_force_control(coord, c_axis, f_ref, limits)
-            self.log_api_info('API -> set_ft_sensor_force_parameters(coord, c_axis, f_ref, limits) -> code={}'.format(ret[0]), code=ret[0])
+            self.log_api_info('API -> set_ft_sensor_force_parameters(coord, c_axis, f_ref, limits) -> code=%s', ret[0], code=ret[0])
             code1 = self._check_code(ret[0])
             return code1 if code1 else code
         elif isinstance(coord, Iterable):
@@ -183,16 +184,16 @@ class FtSensor(Base):
                 xe_limit_RANGGE = [0, 200]
                 for i in range(6):
                     if kp[i] < kp_RANGGE[0] or kp[i] > kp_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the first parameter) kp[{}] over range, range={}'.format(i, kp_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the first parameter) kp[%s] over range, range=%s', i, kp_RANGGE)
                         return APIState.API_EXCEPTION
                     if ki[i] < ki_RANGGE[0] or ki[i] > ki_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the second parameter) ki[{}] over range, range={}'.format(i, ki_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the second parameter) ki[%s] over range, range=%s', i, ki_RANGGE)
                         return APIState.API_EXCEPTION
                     if kd[i] < kd_RANGGE[0] or kd[i] > kd_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the third parameter) kd[{}] over range, range={}'.format(i, kd_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the third parameter) kd[%s] over range, range=%s', i, kd_RANGGE)
                         return APIState.API_EXCEPTION
                     if xe_limit[i] < xe_limit_RANGGE[0] or xe_limit[i] > xe_limit_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the 4th parameter) xe_limit[{}] over range, range={}'.format(i, xe_limit_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the 4th parameter) xe_limit[%s] over range, range=%s', i, xe_limit_RANGGE)
                         return APIState.API_EXCEPTION
             code = 0
             if coord is not None or c_axis is not None or f_ref is not None or limits is not None:
@@ -203,13 +204,13 @@ class FtSensor(Base):
                     max_f_ref = [150, 150, 200, 4, 4, 4]
                     for i in range(6):
                         if f_ref[i] < -max_f_ref[i] or f_ref[i] > max_f_ref[i]:
-                            logger.error('set_ft_sensor_force_parameters, (the 7th parameter)  f_ref[{}] over range, range=[{}, {}]'.format(i, -max_f_ref[i], max_f_ref[i]))
+                            logger.error('set_ft_sensor_force_parameters, (the 7th parameter)  f_ref[%s] over range, range=[%s, %s]', i, -max_f_ref[i], max_f_ref[i])
                             return APIState.API_EXCEPTION
                 ret = self.arm_cmd.config_force_control(coord, c_axis, f_ref, limits)
-                self.log_api_info('API -> set_ft_sensor_force_parameters(coord, c_axis, f_ref, limits) -> code={}'.format(ret[0]), code=ret[0])
+                self.log_api_info('API -> set_ft_sensor_force_parameters(coord, c_axis, f_ref, limits) -> code=%s', ret[0], code=ret[0])
                 code = self._check_code(ret[0])
             ret = self.arm_cmd.set_force_control_pid(kp, ki, kd, xe_limit)
-            self.log_api_info('API -> set_ft_sensor_force_parameters(kp, ki, kd, xe_limit) -> code={}'.format(ret[0]), code=ret[0])
+            self.log_api_info('API -> set_ft_sensor_force_parameters(kp, ki, kd, xe_limit) -> code=%s', ret[0], code=ret[0])
             code1 = self._check_code(ret[0])
             return code1 if code1 else code
         elif coord is None and c_axis is None and f_ref is None and limits is None:
@@ -226,19 +227,19 @@ class FtSensor(Base):
                 xe_limit_RANGGE = [0, 200]
                 for i in range(6):
                     if kp[i] < kp_RANGGE[0] or kp[i] > kp_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the 5th parameter) kp[{}] over range, range={}'.format(i, kp_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the 5th parameter) kp[%s] over range, range=%s', i, kp_RANGGE)
                         return APIState.API_EXCEPTION
                     if ki[i] < ki_RANGGE[0] or ki[i] > ki_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the 6th parameter) ki[{}] over range, range={}'.format(i, ki_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the 6th parameter) ki[%s] over range, range=%s', i, ki_RANGGE)
                         return APIState.API_EXCEPTION
                     if kd[i] < kd_RANGGE[0] or kd[i] > kd_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the 7th parameter) kd[{}] over range, range={}'.format(i, kd_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the 7th parameter) kd[%s] over range, range=%s', i, kd_RANGGE)
                         return APIState.API_EXCEPTION
                     if xe_limit[i] < xe_limit_RANGGE[0] or xe_limit[i] > xe_limit_RANGGE[1]:
-                        logger.error('set_ft_sensor_force_parameters, (the 8th parameter) xe_limit[{}] over range, range={}'.format(i, xe_limit_RANGGE))
+                        logger.error('set_ft_sensor_force_parameters, (the 8th parameter) xe_limit[%s] over range, range=%s', i, xe_limit_RANGGE)
                         return APIState.API_EXCEPTION
             ret = self.arm_cmd.set_force_control_pid(kp, ki, kd, xe_limit)
-            self.log_api_info('API -> set_ft_sensor_force_parameters(kp, ki, kd, xe_limit) -> code={}'.format(ret[0]), code=ret[0])
+            self.log_api_info('API -> set_ft_sensor_force_parameters(kp, ki, kd, xe_limit) -> code=%s', ret[0], code=ret[0])
             return self._check_code(ret[0])
         else:
             logger.error('set_ft_sensor_force_parameters: parameters error')
@@ -359,7 +360,7 @@ class FtSensor(Base):
     @xarm_is_connected(_type='set')
     def set_ft_sensor_zero(self):
         ret = self.arm_cmd.ft_sensor_set_zero()
-        self.log_api_info('API -> set_ft_sensor_zero -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> set_ft_sensor_zero -> code=%s', ret[0], code=ret[0])
         return self._check_code(ret[0])
 
     @xarm_is_connected(_type='get')
@@ -370,7 +371,7 @@ class FtSensor(Base):
         ret = self.arm_cmd.ft_sensor_iden_load()
         self.arm_cmd.set_protocol_identifier(protocol_identifier)
         self._keep_heart = True
-        self.log_api_info('API -> iden_ft_sensor_load_offset -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> iden_ft_sensor_load_offset -> code=%s', ret[0], code=ret[0])
         code = self._check_code(ret[0])
         if code == 0 or len(ret) > 5:
             ret[2] = ret[2] * 1000  # x_centroid, 从m转成mm
@@ -387,7 +388,7 @@ class FtSensor(Base):
         params[2] = params[2] / 1000.0  # y_centroid, 从mm转成m
         params[3] = params[3] / 1000.0  # z_centroid, 从mm转成m
         ret = self.arm_cmd.ft_sensor_cali_load(params)
-        self.log_api_info('API -> set_ft_sensor_load_offset -> code={}, iden_result_list={}'.format(ret[0], iden_result_list), code=ret[0])
+        self.log_api_info('API -> set_ft_sensor_load_offset -> code=%s, iden_result_list=%s', ret[0], iden_result_list, code=ret[0])
         ret[0] = self._check_code(ret[0])
         if ret[0] == 0 and association_setting_tcp_load:
             m = kwargs.get('m', 0.270)  # 0.325
@@ -407,14 +408,14 @@ class FtSensor(Base):
     @xarm_is_connected(_type='set')
     def set_ft_sensor_enable(self, on_off):
         ret = self.arm_cmd.ft_sensor_enable(on_off)
-        self.log_api_info('API -> set_ft_sensor_enable -> code={}, on_off={}'.format(ret[0], on_off), code=ret[0])
+        self.log_api_info('API -> set_ft_sensor_enable -> code=%s, on_off=%s', ret[0], on_off, code=ret[0])
         return self._check_code(ret[0])
 
     @xarm_is_connected(_type='get')
     def set_ft_sensor_mode(self, mode, **kwargs):
         mode = kwargs.get('app_code', mode)
         ret = self.arm_cmd.ft_sensor_app_set(mode)
-        self.log_api_info('API -> set_ft_sensor_mode -> code={}, app_code={}'.format(ret[0], mode), code=ret[0])
+        self.log_api_info('API -> set_ft_sensor_mode -> code=%s, app_code=%s', ret[0], mode, code=ret[0])
         return self._check_code(ret[0])
 
     @xarm_is_connected(_type='get')
@@ -424,10 +425,23 @@ class FtSensor(Base):
 
     @xarm_is_connected(_type='get')
     def get_ft_sensor_data(self, is_raw=False):
-        is_raw = is_raw if self.version_is_ge(2, 6, 109) else False
-        ret = self.arm_cmd.ft_sensor_get_data(self.version_is_ge(1, 8, 3), is_raw)
+        is_raw = is_raw if self._capability.supports_ft_raw else False
+        ret = self.arm_cmd.ft_sensor_get_data(self._capability.supports_ft_data_v2, is_raw)
         return self._check_code(ret[0]), ret[1:7]
 
+    def start_ft_sensor_stream(self, size=1000):
+        if not self._enable_report or self._report_type not in ['real', 'rich']:
+            logger.warning('start_ft_sensor_stream: the ft data is only reported when enable_report=True and report_type is real or rich')
+        if self._ft_stream is None or self._ft_stream.size != size:
+            self._ft_stream = FtStream(self, size=size)
+        self.log_api_info('API -> start_ft_sensor_stream(size=%s) -> code=0', size, code=0)
+        return 0, self._ft_stream
+
+    def stop_ft_sensor_stream(self):
+        self._ft_stream = None
+        self.log_api_info('API -> stop_ft_sensor_stream -> code=0', code=0)
+        return 0
+
     @xarm_is_connected(_type='get')
     def get_ft_sensor_config(self):
         ret = self.arm_cmd.ft_sensor_get_config()
@@ -455,7 +469,7 @@ class FtSensor(Base):
                 if ret[0] != 0:
                     break
                 time.sleep(0.05)
-        self.log_api_info('API -> set_ft_sensor_sn -> code={}, sn={}'.format(ret[0], sn), code=ret[0])
+        self.log_api_info('API -> set_ft_sensor_sn -> code=%s, sn=%s', ret[0], sn, code=ret[0])
         return ret[0]
 
     def get_ft_sensor_sn(self):
@@ -476,7 +490,7 @@ class FtSensor(Base):
             else:
                 rd_sn = ''.join([rd_sn, '*'])
             time.sleep(0.05)
-        self.log_api_info('API -> get_ft_sensor_sn -> code={}, sn={}'.format(ret[0], rd_sn), code=ret[0])
+        self.log_api_info('API -> get_ft_sensor_sn -> code=%s, sn=%s', ret[0], rd_sn, code=ret[0])
         return ret[0], rd_sn
 
     def get_ft_sensor_version(self):
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Stream of the Six-axis Force Torque Sensor, fed by the report (report_type='real' or 'rich')
+Every reported sample is kept in a fixed-size ring buffer with the receive timestamp, so the filters and
+the statistics work on the history without any query to the controller.
+NumPy is used if installed (imported when the stream is created), otherwise the same results are computed in pure python (slower).
+"""
+
+import math
+import time
+import threading
+from ..core.utils.log import logger
+from ..core.utils.optional import import_numpy
+
+# columns of the ring buffer: [timestamp, ext_force(6), raw_force(6)]
+_COLUMNS = 13
+_EXT_SLICE = slice(1, 7)
+_RAW_SLICE = slice(7, 13)
+
+
+class FtTrigger(object):
+    """
+    Threshold trigger, fired once when the value goes over the threshold, re-armed when the value
+    goes back under (threshold - hysteresis)
+    value: abs(data[axis]) if axis is an integer, else the norm of the data on the axes
+    """
+    __slots__ = ('callback', 'threshold', 'axes', 'is_raw', 'hysteresis', 'armed', 'count')
+
+    def __init__(self, callback, threshold, axes, is_raw, hysteresis):
+        self.callback = callback
+        self.threshold = threshold
+        self.axes = axes
+        self.is_raw = is_raw
+        self.hysteresis = hysteresis
+        self.armed = True
+        self.count = 0
+
+    def value(self, data):
+        if isinstance(self.axes, int):
+            return abs(data[self.axes])
+        return math.sqrt(sum(data[i] * data[i] for i in self.axes))
+
+
+class FtStream(object):
+    def __init__(self, arm, size=1000):
+        assert size > 0
+        self._arm = arm
+        self._size = int(size)
+        self._lock = threading.Lock()
+        self._triggers = []
+        self._count = 0
+        # numpy is imported when the stream is created, not at import
+        self._np = np = import_numpy()
+        if np is not None:
+            self._buf = np.zeros((self._size, _COLUMNS), dtype=np.float64)
+        else:
+            self._buf = [None] * self._size
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def count(self):
+        """
+        the total number of the samples pushed since created (or cleared), may be greater than the size
+        """
+        return self._count
+
+    def __len__(self):
+        return min(self._count, self._size)
+
+    def clear(self):
+        with self._lock:
+            self._count = 0
+
+    def push(self, ext_force, raw_force, timestamp=None):
+        """
+        Called by the report thread for every report with the ft data
+        """
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        with self._lock:
+            index = self._count % self._size
+            if self._np is not None:
+                row = self._buf[index]
+                row[0] = timestamp
+                row[_EXT_SLICE] = ext_force
+                row[_RAW_SLICE] = raw_force
+            else:
+                self._buf[index] = [timestamp] + list(ext_force) + list(raw_force)
+            self._count += 1
+            triggers = self._triggers
+        for trigger in triggers:
+            self.__check_trigger(trigger, timestamp, raw_force if trigger.is_raw else ext_force)
+
+    def __check_trigger(self, trigger, timestamp, data):
+        try:
+            value = trigger.value(data)
+        except Exception as e:
+            logger.error('ft trigger exception: %s', e)
+            return
+        if trigger.armed and value >= trigger.threshold:
+            trigger.armed = False
+            trigger.count += 1
+            msg = {
+                'timestamp': timestamp,
+                'value': value,
+                'threshold': trigger.threshold,
+                'data': list(data),
+            }
+            self._arm._run_callback(trigger.callback, msg, name='ft_trigger')
+        elif not trigger.armed and value < trigger.threshold - trigger.hysteresis:
+            trigger.armed = True
+
+    def add_trigger(self, callback, threshold, axes=(0, 1, 2), is_raw=False, hysteresis=0.0):
+        """
+        :param callback: callback(msg), msg: {'timestamp': t, 'value': v, 'threshold': threshold, 'data': [fx, fy, fz, tx, ty, tz]}
+        :param threshold: the threshold (N or Nm)
+        :param axes: int (0~5) means abs(data[axes]), list means the norm of the data on the axes, default is (0, 1, 2) (the force norm)
+        :param is_raw: check the raw data or not, default is False (the external force)
+        :param hysteresis: the trigger is re-armed when the value < threshold - hysteresis
+        :return: trigger, use it to remove the trigger
+        """
+        assert callable(callback)
+        if not isinstance(axes, int):
+            axes = tuple(axes)
+        trigger = FtTrigger(callback, threshold, axes, is_raw, max(hysteresis, 0))
+        with self._lock:
+            # copy on write, the report thread iterates the list without the lock
+            self._triggers = self._triggers + [trigger]
+        return trigger
+
+    def remove_trigger(self, trigger=None):
+        """
+        :param trigger: the trigger returned by add_trigger, None means remove all the triggers
+        """
+        with self._lock:
+            if trigger is None:
+                self._triggers = []
+            else:
+                self._triggers = [item for item in self._triggers if item is not trigger]
+
+    def __snapshot(self, n=None):
+        # the rows in order (oldest first), copied under the lock
+        np = self._np
+        with self._lock:
+            length = min(self._count, self._size)
+            n = length if n is None else max(0, min(int(n), length))
+            end = self._count % self._size
+            if self._count <= self._size:
+                rows = self._buf[length - n:length]
+                return rows.copy() if np is not None else [list(row) for row in rows]
+            if np is not None:
+                return self._buf.take(np.arange(end - n, end) % self._size, axis=0)
+            return [list(self._buf[i % self._size]) for i in range(end - n, end)]
+
+    def get_samples(self, n=None, is_raw=False):
+        """
+        :param n: the number of the latest samples, None means all the samples in the buffer
+        :param is_raw: the raw data or the external force
+        :return: tuple((timestamps, data)), oldest first
+            timestamps: the time.monotonic() when the samples were received
+            data: [[fx, fy, fz, tx, ty, tz], ...]
+            numpy arrays with the shape (n,) and (n, 6) if numpy is installed, else lists
+        """
+        rows = self.__snapshot(n)
+        cols = _RAW_SLICE if is_raw else _EXT_SLICE
+        if self._np is not None:
+            return rows[:, 0], rows[:, cols]
+        return [row[0] for row in rows], [row[cols] for row in rows]
+
+    def latest(self, is_raw=False):
+        """
+        :return: tuple((timestamp, data)) of the latest sample, (None, None) if empty
+        """
+        timestamps, data = self.get_samples(1, is_raw=is_raw)
+        if len(timestamps) == 0:
+            return None, None
+        return timestamps[0], data[0]
+
+    def low_pass(self, alpha=0.2, n=None, is_raw=False):
+        """
+        First-order low-pass filter (exponential moving average): y[i] = y[i-1] + alpha * (x[i] - y[i-1])
+        Note: alpha = dt / (dt + 1 / (2 * pi * cutoff)), dt is the report interval
+
+        :param alpha: smoothing factor, (0, 1]
+        :return: tuple((timestamps, filtered_data)), same as get_samples
+        """
+        assert 0 < alpha <= 1
+        timestamps, data = self.get_samples(n, is_raw=is_raw)
+        if len(data) == 0 or alpha == 1:
+            return timestamps, data
+        np = self._np
+        if np is None:
+            filtered, y = [], data[0]
+            for x in data:
+                y = [y[i] + alpha * (x[i] - y[i]) for i in range(6)]
+                filtered.append(y)
+            return timestamps, filtered
+        # closed form of the recursion in blocks, the block length keeps decay ** -length <= 1e30
+        decay = 1.0 - alpha
+        block = len(data) if decay == 0 else max(1, min(len(data), int(-30 / math.log10(decay))))
+        powers = decay ** np.arange(block + 1, dtype=np.float64)
+        filtered = np.empty_like(data)
+        y = data[0]
+        for start in range(0, len(data), block):
+            x = data[start:start + block]
+            k = len(x)
+            weighted = np.cumsum(x / powers[:k, None], axis=0) * powers[:k, None]
+            filtered[start:start + k] = powers[1:k + 1, None] * y + alpha * weighted
+            y = filtered[start + k - 1]
+        return timestamps, filtered
+
+    def median(self, window=5, n=None, is_raw=False):
+        """
+        Causal median filter, the first (window - 1) samples use the available samples
+
+        :param window: the window size (samples)
+        :return: tuple((timestamps, filtered_data)), same as get_samples
+        """
+        window = max(1, int(window))
+        timestamps, data = self.get_samples(n, is_raw=is_raw)
+        if len(data) == 0 or window == 1:
+            return timestamps, data
+        np = self._np
+        if np is None:
+            filtered = []
+            for i in range(len(data)):
+                rows = data[max(0, i - window + 1):i + 1]
+                filtered.append([_median([row[j] for row in rows]) for j in range(6)])
+            return timestamps, filtered
+        # pad the front with nan, nanmedian ignores them
+        padded = np.concatenate((np.full((window - 1, 6), np.nan), data))
+        strides = (padded.strides[0], padded.strides[0], padded.strides[1])
+        windows = np.lib.stride_tricks.as_strided(padded, shape=(len(data), window, 6), strides=strides, writeable=False)
+        return timestamps, np.nanmedian(windows, axis=1)
+
+    def stats(self, window=None, is_raw=False):
+        """
+        Statistics of the latest samples
+
+        :param window: None means all the samples in the buffer, int means the latest samples, float means the latest seconds
+        :return: dict, None if empty
+            {
+                'count': the number of the samples,
+                'duration': the seconds between the first and the last sample,
+                'mean': [6], 'rms': [6], 'peak': [6] (max abs), 'min': [6], 'max': [6]
+            }
+        """
+        np = self._np
+        if isinstance(window, float):
+            timestamps, data = self.get_samples(is_raw=is_raw)
+            if len(timestamps) > 0:
+                begin = timestamps[-1] - window
+                if np is not None:
+                    index = int(np.searchsorted(timestamps, begin, side='left'))
+                else:
+                    index = next(i for i, t in enumerate(timestamps) if t >= begin)
+                timestamps, data = timestamps[index:], data[index:]
+        else:
+            timestamps, data = self.get_samples(window, is_raw=is_raw)
+        count = len(timestamps)
+        if count == 0:
+            return None
+        if np is not None:
+            return {
+                'count': count,
+                'duration': float(timestamps[-1] - timestamps[0]),
+                'mean': data.mean(axis=0).tolist(),
+                'rms': np.sqrt((data * data).mean(axis=0)).tolist(),
+                'peak': np.abs(data).max(axis=0).tolist(),
+                'min': data.min(axis=0).tolist(),
+                'max': data.max(axis=0).tolist(),
+            }
+        columns = list(zip(*data))
+        return {
+            'count': count,
+            'duration': timestamps[-1] - timestamps[0],
+            'mean': [sum(col) / count for col in columns],
+            'rms': [math.sqrt(sum(v * v for v in col) / count) for col in columns],
+            'peak': [max(abs(v) for v in col) for col in columns],
+            'min': [min(col) for col in columns],
+            'max': [max(col) for col in columns],
+        }
+
+
+def _median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
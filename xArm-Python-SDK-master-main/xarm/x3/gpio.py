@@ -140,12 +140,12 @@ class GPIO(Base):
             if not sync:
                 logger.warning('The sync parameter is ignored when delay_sec is non-zero')
             ret = self.arm_cmd.tgpio_delay_set_digital(ionum if ionum < 2 else ionum-1, value, delay_sec)
-            self.log_api_info('API -> set_tgpio_digital(ionum={}, value={}, delay_sec={}) -> code={}'.format(ionum, value, delay_sec, ret[0]), code=ret[0])
+            self.log_api_info('API -> set_tgpio_digital(ionum=%s, value=%s, delay_sec=%s) -> code=%s', ionum, value, delay_sec, ret[0], code=ret[0])
         else:
-            if not sync and not self.version_is_ge(2, 4, 101):
+            if not sync and not self._capability.supports_io_sync:
                 logger.warning('The current firmware does not support sync to False. If necessary, please upgrade the firmware to 2.4.101 or later.')
-            ret = self.arm_cmd.tgpio_set_digital(ionum+1, value, sync=sync if self.version_is_ge(2, 4, 101) else None)
-            self.log_api_info('API -> set_tgpio_digital(ionum={}, value={}) -> code={}'.format(ionum, value, ret[0]), code=ret[0])
+            ret = self.arm_cmd.tgpio_set_digital(ionum+1, value, sync=sync if self._capability.supports_io_sync else None)
+            self.log_api_info('API -> set_tgpio_digital(ionum=%s, value=%s) -> code=%s', ionum, value, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -225,12 +225,12 @@ class GPIO(Base):
             if not sync:
                 logger.warning('The sync parameter is ignored when delay_sec is non-zero')
             ret = self.arm_cmd.cgpio_delay_set_digital(ionum, value, delay_sec)
-            self.log_api_info('API -> set_cgpio_digital(ionum={}, value={}, delay_sec={}) -> code={}'.format(ionum, value, delay_sec, ret[0]), code=ret[0])
+            self.log_api_info('API -> set_cgpio_digital(ionum=%s, value=%s, delay_sec=%s) -> code=%s', ionum, value, delay_sec, ret[0], code=ret[0])
         else:
-            if not sync and not self.version_is_ge(2, 4, 101):
+            if not sync and not self._capability.supports_io_sync:
                 logger.warning('The current firmware does not support sync to False. If necessary, please upgrade the firmware to 2.4.101 or later.')
-            ret = self.arm_cmd.cgpio_set_auxdigit(ionum, value, sync=sync if self.version_is_ge(2, 4, 101) else None)
-            self.log_api_info('API -> set_cgpio_digital(ionum={}, value={}) -> code={}'.format(ionum, value, ret[0]), code=ret[0])
+            ret = self.arm_cmd.cgpio_set_auxdigit(ionum, value, sync=sync if self._capability.supports_io_sync else None)
+            self.log_api_info('API -> set_cgpio_digital(ionum=%s, value=%s) -> code=%s', ionum, value, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -239,27 +239,27 @@ class GPIO(Base):
     @xarm_is_not_simulation_mode(ret=0)
     def set_cgpio_analog(self, ionum, value, sync=True):
         assert ionum == 0 or ionum == 1, 'The value of parameter ionum can only be 0 or 1.'
-        if not sync and not self.version_is_ge(2, 4, 101):
+        if not sync and not self._capability.supports_io_sync:
             logger.warning('The current firmware does not support sync to False. If necessary, please upgrade the firmware to 2.4.101 or later.')
         if ionum == 0:
-            ret = self.arm_cmd.cgpio_set_analog1(value, sync=sync if self.version_is_ge(2, 4, 101) else None)
+            ret = self.arm_cmd.cgpio_set_analog1(value, sync=sync if self._capability.supports_io_sync else None)
         else:
-            ret = self.arm_cmd.cgpio_set_analog2(value, sync=sync if self.version_is_ge(2, 4, 101) else None)
-        self.log_api_info('API -> set_cgpio_analog(ionum={}, value={}) -> code={}'.format(ionum, value, ret[0]), code=ret[0])
+            ret = self.arm_cmd.cgpio_set_analog2(value, sync=sync if self._capability.supports_io_sync else None)
+        self.log_api_info('API -> set_cgpio_analog(ionum=%s, value=%s) -> code=%s', ionum, value, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_cgpio_digital_input_function(self, ionum, fun):
         assert isinstance(ionum, int) and 15 >= ionum >= 0
         ret = self.arm_cmd.cgpio_set_infun(ionum, fun)
-        self.log_api_info('API -> set_cgpio_digital_input_function(ionum={}, fun={}) -> code={}'.format(ionum, fun, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_cgpio_digital_input_function(ionum=%s, fun=%s) -> code=%s', ionum, fun, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_cgpio_digital_output_function(self, ionum, fun):
         assert isinstance(ionum, int) and 15 >= ionum >= 0
         ret = self.arm_cmd.cgpio_set_outfun(ionum, fun)
-        self.log_api_info('API -> set_cgpio_digital_output_function(ionum={}, fun={}) -> code={}'.format(ionum, fun, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_cgpio_digital_output_function(ionum=%s, fun=%s) -> code=%s', ionum, fun, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -385,7 +385,7 @@ class GPIO(Base):
                     code = APIState.EMERGENCY_STOP
                     break
                 time.sleep(0.1)
-        self.log_api_info('API -> set_vacuum_gripper(on={}, wait={}, delay_sec={}) -> code={}'.format(on, wait, delay_sec, code), code=code)
+        self.log_api_info('API -> set_vacuum_gripper(on=%s, wait=%s, delay_sec=%s) -> code=%s', on, wait, delay_sec, code, code=code)
         return code
 
     @xarm_is_connected(_type='get')
@@ -405,7 +405,7 @@ class GPIO(Base):
         assert isinstance(ionum, int) and (1 >= ionum >= 0 or 4 >= ionum >= 3)
         assert fault_tolerance_radius >= 0, 'The value of parameter fault_tolerance_radius must be greater than or equal to 0.'
         ret = self.arm_cmd.tgpio_position_set_digital(ionum - 1 if ionum >= 3 else ionum, value, xyz, fault_tolerance_radius)
-        self.log_api_info('API -> set_tgpio_digital_with_xyz(ionum={}, value={}, xyz={}, fault_tolerance_radius={}) -> code={}'.format(ionum, value, xyz, fault_tolerance_radius, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_tgpio_digital_with_xyz(ionum=%s, value=%s, xyz=%s, fault_tolerance_radius=%s) -> code=%s', ionum, value, xyz, fault_tolerance_radius, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -416,7 +416,7 @@ class GPIO(Base):
         assert isinstance(ionum, int) and 15 >= ionum >= 0
         assert fault_tolerance_radius >= 0, 'The value of parameter fault_tolerance_radius must be greater than or equal to 0.'
         ret = self.arm_cmd.cgpio_position_set_digital(ionum, value, xyz, fault_tolerance_radius)
-        self.log_api_info('API -> set_cgpio_digital_with_xyz(ionum={}, value={}, xyz={}, fault_tolerance_radius={}) -> code={}'.format(ionum, value, xyz, fault_tolerance_radius, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_cgpio_digital_with_xyz(ionum=%s, value=%s, xyz=%s, fault_tolerance_radius=%s) -> code=%s', ionum, value, xyz, fault_tolerance_radius, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -427,7 +427,7 @@ class GPIO(Base):
         assert ionum == 0 or ionum == 1, 'The value of parameter ionum can only be 0 or 1.'
         assert fault_tolerance_radius >= 0, 'The value of parameter fault_tolerance_radius must be greater than or equal to 0.'
         ret = self.arm_cmd.cgpio_position_set_analog(ionum, value, xyz, fault_tolerance_radius)
-        self.log_api_info('API -> set_cgpio_analog_with_xyz(ionum={}, value={}, xyz={}, fault_tolerance_radius={}) -> code={}'.format(ionum, value, xyz, fault_tolerance_radius, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_cgpio_analog_with_xyz(ionum=%s, value=%s, xyz=%s, fault_tolerance_radius=%s) -> code=%s', ionum, value, xyz, fault_tolerance_radius, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
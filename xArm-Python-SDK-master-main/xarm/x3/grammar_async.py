@@ -6,13 +6,13 @@
 #
 # Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
 
-import asyncio
 from ..core.utils.log import logger
 
 class AsyncObject(object):
     async def _asyncio_loop_func(self):
+        import asyncio
         logger.debug('asyncio thread start ...')
-        while self.connected:
+        while self.connected or self._reconnecting:
             await asyncio.sleep(0.001)
         logger.debug('asyncio thread exit ...')
     
@@ -14,7 +14,7 @@ class CoroutineObject(object):
     @asyncio.coroutine
     def _asyncio_loop_func(self):
         logger.debug('asyncio thread start ...')
-        while self.connected:
+        while self.connected or self._reconnecting:
             yield from asyncio.sleep(0.001)
         logger.debug('asyncio thread exit ...')
     
@@ -190,26 +190,26 @@ class Gripper(GPIO):
             code1 = self.set_tgpio_digital(ionum=0, value=0, delay_sec=delay_sec, sync=sync)
             code2 = self.set_tgpio_digital(ionum=1, value=1, delay_sec=delay_sec, sync=sync)
         code = code1 if code2 == 0 else code2
-        self.log_api_info('API -> set_gripper_status(status={}, delay_sec={}) -> code={}'.format(status, delay_sec, code), code=code)
+        self.log_api_info('API -> set_gripper_status(status=%s, delay_sec=%s) -> code=%s', status, delay_sec, code, code=code)
         return code
 
     ########################### Old Protocol #################################
     @xarm_is_connected(_type='set')
     def _set_gripper_enable(self, enable):
         ret = self.arm_cmd.gripper_set_en(int(enable))
-        self.log_api_info('API -> set_gripper_enable(enable={}) -> code={}'.format(enable, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_gripper_enable(enable=%s) -> code=%s', enable, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def _set_gripper_mode(self, mode):
         ret = self.arm_cmd.gripper_set_mode(mode)
-        self.log_api_info('API -> set_gripper_mode(mode={}) -> code={}'.format(mode, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_gripper_mode(mode=%s) -> code=%s', mode, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def _set_gripper_speed(self, speed):
         ret = self.arm_cmd.gripper_set_posspd(speed)
-        self.log_api_info('API -> set_gripper_speed(speed={}) -> code={}'.format(speed, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_gripper_speed(speed=%s) -> code=%s', speed, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -243,7 +243,7 @@ class Gripper(GPIO):
         if speed is not None:
             self.arm_cmd.gripper_set_posspd(speed)
         ret = self.arm_cmd.gripper_set_pos(pos)
-        self.log_api_info('API -> set_gripper_position(pos={}) -> code={}'.format(pos, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_gripper_position(pos=%s) -> code=%s', pos, ret[0], code=ret[0])
         if wait:
             is_add = True
             last_pos = 0
@@ -315,7 +315,7 @@ class Gripper(GPIO):
     @xarm_is_connected(_type='set')
     def _clean_gripper_error(self):
         ret = self.arm_cmd.gripper_clean_err()
-        self.log_api_info('API -> clean_gripper_error -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> clean_gripper_error -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -325,7 +325,7 @@ class Gripper(GPIO):
         :return: 
         """
         ret = self.arm_cmd.gripper_set_zero()
-        self.log_api_info('API -> set_gripper_zero -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> set_gripper_zero -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     ########################### Modbus Protocol #################################
@@ -333,7 +333,7 @@ class Gripper(GPIO):
     def _set_modbus_gripper_enable(self, enable):
         ret = self.arm_cmd.gripper_modbus_set_en(int(enable))
         _, err = self._get_modbus_gripper_err_code()
-        self.log_api_info('API -> set_modbus_gripper_enable(enable={}) -> code={}, code2={}, err={}'.format(enable, ret[0], _, err), code=ret[0])
+        self.log_api_info('API -> set_modbus_gripper_enable(enable=%s) -> code=%s, code2=%s, err=%s', enable, ret[0], _, err, code=ret[0])
         ret[0] = self._check_modbus_code(ret, only_check_code=True)
         if ret[0] == 0 and self.gripper_error_code == 0:
             self.gripper_is_enabled = True
@@ -343,7 +343,7 @@ class Gripper(GPIO):
     def _set_modbus_gripper_mode(self, mode):
         ret = self.arm_cmd.gripper_modbus_set_mode(mode)
         _, err = self._get_modbus_gripper_err_code()
-        self.log_api_info('API -> set_modbus_gripper_mode(mode={}) -> code={}, code2={}, err={}'.format(mode, ret[0], _, err), code=ret[0])
+        self.log_api_info('API -> set_modbus_gripper_mode(mode=%s) -> code=%s, code2=%s, err=%s', mode, ret[0], _, err, code=ret[0])
         ret[0] = self._check_modbus_code(ret, only_check_code=True)
         return ret[0] if self._gripper_error_code == 0 else APIState.END_EFFECTOR_HAS_FAULT
 
@@ -351,7 +351,7 @@ class Gripper(GPIO):
     def _set_modbus_gripper_speed(self, speed):
         ret = self.arm_cmd.gripper_modbus_set_posspd(speed)
         _, err = self._get_modbus_gripper_err_code()
-        self.log_api_info('API -> set_modbus_gripper_speed(speed={}) -> code={}, code2={}, err={}'.format(speed, ret[0], _, err), code=ret[0])
+        self.log_api_info('API -> set_modbus_gripper_speed(speed=%s) -> code=%s, code2=%s, err=%s', speed, ret[0], _, err, code=ret[0])
         ret[0] = self._check_modbus_code(ret, only_check_code=True)
         if ret[0] == 0 and self.gripper_error_code == 0:
             self.gripper_speed = speed
@@ -509,7 +509,7 @@ class Gripper(GPIO):
             if ret[0] == 0:
                 self.gripper_speed = speed
         ret = self.arm_cmd.gripper_modbus_set_pos(pos)
-        self.log_api_info('API -> set_modbus_gripper_position(pos={}) -> code={}'.format(pos, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_modbus_gripper_position(pos=%s) -> code=%s', pos, ret[0], code=ret[0])
         _, err = self._get_modbus_gripper_err_code()
         if self._gripper_error_code != 0:
             print('xArm Gripper ErrorCode: {}'.format(self._gripper_error_code))
@@ -540,7 +540,7 @@ class Gripper(GPIO):
         ret = self.arm_cmd.gripper_modbus_clean_err()
         self._gripper_error_code = 0
         _, err = self._get_modbus_gripper_err_code()
-        self.log_api_info('API -> clean_modbus_gripper_error -> code={}, code2={}, err={}'.format(ret[0], _, err), code=ret[0])
+        self.log_api_info('API -> clean_modbus_gripper_error -> code=%s, code2=%s, err=%s', ret[0], _, err, code=ret[0])
         ret[0] = self._check_modbus_code(ret, only_check_code=True)
         return ret[0] if self._gripper_error_code == 0 else APIState.END_EFFECTOR_HAS_FAULT
 
@@ -552,7 +552,7 @@ class Gripper(GPIO):
         """
         ret = self.arm_cmd.gripper_modbus_set_zero()
         _, err = self._get_modbus_gripper_err_code()
-        self.log_api_info('API -> set_modbus_gripper_zero -> code={}, code2={}, err={}'.format(ret[0], _, err), code=ret[0])
+        self.log_api_info('API -> set_modbus_gripper_zero -> code=%s, code2=%s, err=%s', ret[0], _, err, code=ret[0])
         ret[0] = self._check_modbus_code(ret, only_check_code=True)
         return ret[0] if self._gripper_error_code == 0 else APIState.END_EFFECTOR_HAS_FAULT
 
@@ -613,7 +613,7 @@ class Gripper(GPIO):
         code, _ = self.__bio_gripper_send_modbus(data_frame, 6)
         if code == 0 and enable and wait:
             code = self.__bio_gripper_wait_enable_completed(timeout=timeout)
-        self.log_api_info('API -> set_bio_gripper_enable(enable={}, wait={}, timeout={}) ->code={}'.format(enable, wait, timeout, code), code=code)
+        self.log_api_info('API -> set_bio_gripper_enable(enable=%s, wait=%s, timeout=%s) ->code=%s', enable, wait, timeout, code, code=code)
         # self.bio_gripper_is_enabled = True if code == 0 else self.bio_gripper_is_enabled
         self.get_bio_gripper_sn()
         return code
@@ -676,7 +676,7 @@ class Gripper(GPIO):
         force = 1 if force < 1 else 100 if force > 100 else force
         data_frame = [0x08, 0x06, 0x05, 0x06, 0x00, force]
         code, _ = self.__bio_gripper_send_modbus(data_frame, 6)
-        self.log_api_info('API -> set_bio_gripper_force(force={}) ->code={}'.format(force, code), code=code)
+        self.log_api_info('API -> set_bio_gripper_force(force=%s) ->code=%s', force, code, code=code)
         self.bio_gripper_force = force if code == 0 else self.bio_gripper_force
         return code
 
@@ -685,7 +685,7 @@ class Gripper(GPIO):
     def set_bio_gripper_speed(self, speed):
         data_frame = [0x08, 0x06, 0x03, 0x03, speed // 256 % 256, speed % 256]
         code, _ = self.__bio_gripper_send_modbus(data_frame, 6)
-        self.log_api_info('API -> set_bio_gripper_speed(speed={}) ->code={}'.format(speed, code), code=code)
+        self.log_api_info('API -> set_bio_gripper_speed(speed=%s) ->code=%s', speed, code, code=code)
         self.bio_gripper_speed = speed if code == 0 else self.bio_gripper_speed
         return code
 
@@ -724,7 +724,7 @@ class Gripper(GPIO):
         if code == 0 and wait:
             code = self.__bio_gripper_wait_motion_completed(timeout=timeout)
         self.log_api_info(
-            'API -> set_bio_gripper_position(pos={}, wait={}, timeout={}) ->code={}'.format(pos, wait, timeout, code),
+            'API -> set_bio_gripper_position(pos=%s, wait=%s, timeout=%s) ->code=%s', pos, wait, timeout, code,
             code=code)
         return code
 
@@ -814,7 +814,7 @@ class Gripper(GPIO):
     def clean_bio_gripper_error(self):
         data_frame = [0x08, 0x06, 0x00, 0x0F, 0x00, 0x00]
         code, _ = self.__bio_gripper_send_modbus(data_frame, 6)
-        self.log_api_info('API -> clean_bio_gripper_error -> code={}'.format(code), code=code)
+        self.log_api_info('API -> clean_bio_gripper_error -> code=%s', code, code=code)
         self.get_bio_gripper_status()
         return code
 
@@ -867,7 +867,7 @@ class Gripper(GPIO):
         data_frame.extend(list(struct.pack('>h', force))) # force // 256 % 256, force % 256
         data_frame.extend(list(struct.pack('>i', pos)))
         ret = self.getset_tgpio_modbus_data(data_frame, min_res_len=6, ignore_log=True)
-        self.log_api_info('API -> set_g2_gripper_position(pos={}, speed={}, force={}) -> code={}'.format(pos, speed, force, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_g2_gripper_position(pos=%s, speed=%s, force=%s) -> code=%s', pos, speed, force, ret[0], code=ret[0])
         _, err = self._get_modbus_gripper_err_code()
         if self._gripper_error_code != 0:
             print('xArm Gripper G2 ErrorCode: {}'.format(self._gripper_error_code))
@@ -911,6 +911,6 @@ class Gripper(GPIO):
             # res[2] == 2: Illegal data address, BIO version does not support
             return self.set_bio_gripper_position(pos, speed, force, wait, timeout, wait_motion=False, is_g2=False, **kwargs)
         self.log_api_info(
-            'API -> set_bio_gripper_g2_position(pos={}, speed={}, force={}, wait={}, timeout={}) -> code={}'.format(pos, speed, force, wait, timeout, code),
+            'API -> set_bio_gripper_g2_position(pos=%s, speed=%s, force=%s, wait=%s, timeout=%s) -> code=%s', pos, speed, force, wait, timeout, code,
             code=code)
         return code
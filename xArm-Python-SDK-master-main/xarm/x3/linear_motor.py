@@ -122,8 +122,8 @@ class LinearMotor(GPIO):
             self.linear_motor_is_enabled = self._linear_motor_status['is_enabled'] == 1
         else:
             self.linear_motor_is_enabled = False
-        self.log_api_info('API -> set_linear_motor_enable(enable={}) -> code1={}, code2={}, err={}, enabled={}, zero={}'.format(
-            enable, ret[0], code2, status['error'], status['is_enabled'], status['on_zero']), code=ret[0])
+        self.log_api_info('API -> set_linear_motor_enable(enable=%s) -> code1=%s, code2=%s, err=%s, enabled=%s, zero=%s',
+            enable, ret[0], code2, status['error'], status['is_enabled'], status['on_zero'], code=ret[0])
         return ret[0] if self.linear_motor_error_code == 0 else APIState.LINEAR_MOTOR_HAS_FAULT
 
     @xarm_is_connected(_type='set')
@@ -139,8 +139,8 @@ class LinearMotor(GPIO):
         # get_status: error, is_enable, on_zero
         code2, status = self.get_linear_motor_registers(addr=0x0A23, number_of_registers=3)
         self.log_api_info(
-            'API -> set_linear_motor_back_origin() -> code1={}, code2={}, err={}, enabled={}, zero={}'.format(
-                ret[0], code2, status['error'], status['is_enabled'], status['on_zero']), code=ret[0])
+            'API -> set_linear_motor_back_origin() -> code1=%s, code2=%s, err=%s, enabled=%s, zero=%s',
+                ret[0], code2, status['error'], status['is_enabled'], status['on_zero'], code=ret[0])
         if ret[0] == 0 and wait:
             ret[0] = self.__wait_linear_motor_back_origin(timeout)
         if auto_enable:
@@ -167,9 +167,9 @@ class LinearMotor(GPIO):
         ret = self.arm_cmd.linear_motor_modbus_w16s(XCONF.ServoConf.TAGET_POS, value, 2)
         self.get_linear_motor_registers(addr=0x0A23, number_of_registers=3)
         ret[0] = self._check_modbus_code(ret, length=8, host_id=XCONF.LINEAR_MOTOR_HOST_ID)
-        self.log_api_info('API -> set_linear_motor_pos(pos={}) -> code={}, err={}, enabled={}, zero={}'.format(
+        self.log_api_info('API -> set_linear_motor_pos(pos=%s) -> code=%s, err=%s, enabled=%s, zero=%s',
             pos, ret[0], self._linear_motor_status['error'],
-            self._linear_motor_status['is_enabled'], self._linear_motor_status['on_zero']), code=ret[0])
+            self._linear_motor_status['is_enabled'], self._linear_motor_status['on_zero'], code=ret[0])
         if ret[0] == 0 and wait:
             return self.__wait_linear_motor_stop(timeout)
         return ret[0] if self.linear_motor_error_code == 0 else APIState.LINEAR_MOTOR_HAS_FAULT
@@ -185,7 +185,7 @@ class LinearMotor(GPIO):
         ret[0] = self._check_modbus_code(ret, length=8, host_id=XCONF.LINEAR_MOTOR_HOST_ID)
         if ret[0] == 0:
             self.linear_motor_speed = speed
-        self.log_api_info('API -> set_linear_motor_speed(speed={}) -> code={}'.format(speed, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_linear_motor_speed(speed=%s) -> code=%s', speed, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -199,8 +199,8 @@ class LinearMotor(GPIO):
         ret[0] = self._check_modbus_code(ret, length=8, host_id=XCONF.LINEAR_MOTOR_HOST_ID)
         # get_status: error, is_enable, on_zero
         code2, status = self.get_linear_motor_registers(addr=0x0A22, number_of_registers=2)
-        self.log_api_info('API -> set_linear_motor_stop() -> code={}, code2={}, status={}, err={}'.format(
-            ret[0], code2, status['status'], status['error']), code=ret[0])
+        self.log_api_info('API -> set_linear_motor_stop() -> code=%s, code2=%s, status=%s, err=%s',
+            ret[0], code2, status['status'], status['error'], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -213,7 +213,7 @@ class LinearMotor(GPIO):
         self.linear_motor_error_code = 0
         ret = self.arm_cmd.linear_motor_modbus_w16s(XCONF.ServoConf.RESET_ERR, value, 1)
         _, err = self.get_linear_motor_error()
-        self.log_api_info('API -> clean_linear_motor_error -> code={}, code2={}, err={}'.format(ret[0], _, err),
+        self.log_api_info('API -> clean_linear_motor_error -> code=%s, code2=%s, err=%s', ret[0], _, err,
                           code=ret[0])
         ret[0] = self._check_modbus_code(ret, length=8, host_id=XCONF.LINEAR_MOTOR_HOST_ID)
         return ret[0] if self.linear_motor_error_code == 0 else APIState.LINEAR_MOTOR_HAS_FAULT
@@ -6,15 +6,16 @@
 #
 # Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
 
+import os
 import json
 import time
 import uuid
-from urllib import request
 from .code import APIState
 from ..core.config.x_config import XCONF
 from ..core.utils.log import logger
+from ..tools.trajectory import TrajectoryWriter, TrajectoryReader, TrajectoryPlayer, copy_trajectory, DEFAULT_SCALE, DEFAULT_CHUNK_SIZE
 from .base import Base
-from .decorator import xarm_is_connected
+from .decorator import xarm_is_connected, xarm_is_ready
 
 
 class Record(Base):
@@ -28,6 +29,7 @@ class Record(Base):
         else:
             url = 'http://{}:18333/cmd'.format(ip)
         try:
+            from urllib import request
             data = {'cmd': 'xarm_list_trajs'}
             req = request.Request(url, headers={'Content-Type': 'application/json'}, data=json.dumps(data).encode('utf-8'))
             res = request.urlopen(req)
@@ -42,7 +44,7 @@ class Record(Base):
     @xarm_is_connected(_type='set')
     def start_record_trajectory(self):
         ret = self.arm_cmd.set_record_traj(1)
-        self.log_api_info('API -> start_record_trajectory -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> start_record_trajectory -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -52,7 +54,7 @@ class Record(Base):
             ret2 = self.save_record_trajectory(filename, wait=True, timeout=10, **kwargs)
             if ret2 != 0:
                 return ret2
-        self.log_api_info('API -> stop_record_trajectory -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> stop_record_trajectory -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -67,26 +69,26 @@ class Record(Base):
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
         ret = self.arm_cmd.save_traj(full_filename, wait_time=0, feedback_key=feedback_key)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait)
-        self.log_api_info('API -> save_record_trajectory -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> save_record_trajectory -> code=%s', ret[0], code=ret[0])
         ret[0] = self._check_code(ret[0])
         if ret[0] == 0 and wait:
             return self.__wait_save_traj(timeout, trans_id, filename)
         if ret[0] != 0:
-            logger.error('Save {} failed, ret={}'.format(filename, ret))
+            logger.error('Save %s failed, ret=%s', filename, ret)
         return ret[0]
     
     def __check_traj_status(self, status, filename='unknown'):
         if status == XCONF.TrajState.LOAD_SUCCESS:
-            logger.info('Load {} success'.format(filename))
+            logger.info('Load %s success', filename)
             return 0
         elif status == XCONF.TrajState.LOAD_FAIL:
-            logger.error('Load {} failed'.format(filename))
+            logger.error('Load %s failed', filename)
             return APIState.TRAJ_RW_FAILED
         elif status == XCONF.TrajState.SAVE_SUCCESS:
-            logger.info('Save {} success'.format(filename))
+            logger.info('Save %s success', filename)
             return 0
         elif status == XCONF.TrajState.SAVE_FAIL:
-            logger.error('Save {} failed'.format(filename))
+            logger.error('Save %s failed', filename)
             return APIState.TRAJ_RW_FAILED
         return -1
     
@@ -109,13 +111,13 @@ class Record(Base):
                     if status == XCONF.TrajState.IDLE:
                         idle_cnts += 1
                         if idle_cnts >= 5:
-                            logger.info('{} {} failed, idle'.format(op, filename))
+                            logger.info('%s %s failed, idle', op, filename)
                             return APIState.TRAJ_RW_FAILED
                     else:
                         code = self.__check_traj_status(status, filename)
                         if code >= 0:
                             return code
-            logger.warning('{} {} timeout'.format(op, filename))
+            logger.warning('%s %s timeout', op, filename)
             return APIState.TRAJ_RW_TOUT
     
     def __wait_load_traj(self, timeout, trans_id, filename='unknown'):
@@ -182,11 +184,11 @@ class Record(Base):
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
         ret = self.arm_cmd.load_traj(full_filename, wait_time=0, feedback_key=feedback_key)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait)
-        self.log_api_info('API -> load_trajectory -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> load_trajectory -> code=%s', ret[0], code=ret[0])
         if ret[0] == 0 and wait:
             return self.__wait_load_traj(timeout, trans_id, filename)
         if ret[0] != 0:
-            logger.error('Load {} failed, ret={}'.format(filename, ret))
+            logger.error('Load %s failed, ret=%s', filename, ret)
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -200,12 +202,12 @@ class Record(Base):
         if self.state in [4]:
             return APIState.NOT_READY
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
-        if self.version_is_ge(1, 2, 11):
+        if self._capability.supports_reduced_states_v2:
             ret = self.arm_cmd.playback_traj(times, double_speed, feedback_key=feedback_key)
         else:
             ret = self.arm_cmd.playback_traj_old(times)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait)
-        self.log_api_info('API -> playback_trajectory -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> playback_trajectory -> code=%s', ret[0], code=ret[0])
         if ret[0] == 0 and wait:
             return self.__wait_play_traj(None, trans_id, times)
         return ret[0]
@@ -214,3 +216,153 @@ class Record(Base):
     def get_trajectory_rw_status(self):
         ret = self.arm_cmd.get_traj_rw_status()
         return ret[0], ret[1]
+
+    @staticmethod
+    def __get_local_traj_filename(filename):
+        filename = os.path.expanduser(filename.strip())
+        if not os.path.splitext(filename)[1]:
+            filename = '{}.xtraj'.format(filename)
+        return filename
+
+    @xarm_is_connected(_type='get')
+    def start_local_record_trajectory(self, filename, scale=DEFAULT_SCALE, chunk_size=DEFAULT_CHUNK_SIZE):
+        assert isinstance(filename, str) and filename.strip()
+        if not self._enable_report or not self._stream_report:
+            logger.error('start local record failed, report is disabled')
+            return APIState.NOT_CONNECTED
+        if self._traj_recorder is not None:
+            logger.warning('local record already started, file=%s', self._traj_recorder.filename)
+            return APIState.API_EXCEPTION
+        filename = self.__get_local_traj_filename(filename)
+        try:
+            dirname = os.path.dirname(filename)
+            if dirname and not os.path.exists(dirname):
+                os.makedirs(dirname)
+            self._traj_recorder = TrajectoryWriter(filename, columns=self.axis, scale=scale, chunk_size=chunk_size, meta={
+                'axis': self.axis,
+                'device_type': self.device_type,
+                'version': self.version,
+                'report_type': self._report_type,
+            })
+        except Exception as e:
+            logger.error('start local record failed, file=%s, exception=%s', filename, e)
+            return APIState.API_EXCEPTION
+        self.log_api_info('API -> start_local_record_trajectory -> code=0, file=%s', filename, code=0)
+        return 0
+
+    def stop_local_record_trajectory(self):
+        recorder = self._traj_recorder
+        if recorder is None:
+            return APIState.API_EXCEPTION, 0
+        self._traj_recorder = None
+        try:
+            recorder.close()
+        except Exception as e:
+            logger.error('stop local record failed, file=%s, exception=%s', recorder.filename, e)
+            return APIState.API_EXCEPTION, recorder.count
+        self.log_api_info('API -> stop_local_record_trajectory -> code=0, file=%s, samples=%s', recorder.filename, recorder.count, code=0)
+        return 0, recorder.count
+
+    def get_local_record_count(self):
+        recorder = self._traj_recorder
+        return 0, recorder.count if recorder is not None else 0
+
+    def load_local_trajectory(self, filename):
+        try:
+            return 0, TrajectoryReader(self.__get_local_traj_filename(filename))
+        except Exception as e:
+            logger.error('load local trajectory failed, file=%s, exception=%s', filename, e)
+            return APIState.API_EXCEPTION, None
+
+    def copy_local_trajectory(self, src, dst, chunk_callback=None):
+        try:
+            size = copy_trajectory(self.__get_local_traj_filename(src), self.__get_local_traj_filename(dst), chunk_callback=chunk_callback)
+            return 0, size
+        except Exception as e:
+            logger.error('copy local trajectory failed, src=%s, dst=%s, exception=%s', src, dst, e)
+            return APIState.API_EXCEPTION, 0
+
+    @xarm_is_ready(_type='set')
+    def playback_local_trajectory(self, filename, time_scale=1.0, rate=100, wait=True, start_time=0, end_time=None, start_tolerance=0.1):
+        if self._traj_player is not None and self._traj_player.is_alive():
+            logger.warning('local playback is running')
+            return APIState.API_EXCEPTION
+        if self.mode != 1:
+            logger.error('local playback need servo mode (mode=1), mode=%s', self.mode)
+            return APIState.MODE_IS_NOT_CORRECT
+        code, reader = self.load_local_trajectory(filename)
+        if code != 0:
+            return code
+        if len(reader) == 0 or reader.columns < self.axis:
+            logger.error('local trajectory is not match, samples=%s, columns=%s, axis=%s', len(reader), reader.columns, self.axis)
+            reader.close()
+            return APIState.PARAM_ERROR
+        _, start_angles = reader[reader.index_of(start_time)]
+        if max(abs(start_angles[i] - self._angles[i]) for i in range(self.axis)) > start_tolerance:
+            logger.error('local playback failed, the arm is not at the start of the trajectory, start=%s, curr=%s',
+                start_angles[:self.axis], self._angles[:self.axis])
+            reader.close()
+            return APIState.OUT_OF_RANGE
+
+        def _send(angles):
+            return self.set_servo_angle_j(angles[:self.axis], is_radian=True)
+
+        self._traj_player = TrajectoryPlayer(reader, _send, rate=rate, time_scale=time_scale, start_time=start_time, end_time=end_time)
+        self._traj_player.start()
+        self.log_api_info('API -> playback_local_trajectory -> code=0, file=%s, time_scale=%s, rate=%s',
+            reader.filename, time_scale, rate, code=0)
+        if wait:
+            return self.wait_local_playback()
+        return 0
+
+    def wait_local_playback(self, timeout=None):
+        player = self._traj_player
+        if player is None:
+            return 0
+        player.join(timeout)
+        if player.is_alive():
+            return APIState.TRAJ_PLAYBACK_TOUT
+        player.reader.close()
+        if player.code != 0:
+            logger.error('local playback failed, code=%s, time=%.3f', player.code, player.time)
+            return APIState.TRAJ_PLAYBACK_FAILED
+        return 0
+
+    def pause_local_playback(self):
+        if self._traj_player is None or not self._traj_player.is_alive():
+            return APIState.API_EXCEPTION
+        self._traj_player.pause()
+        return 0
+
+    def resume_local_playback(self):
+        if self._traj_player is None or not self._traj_player.is_alive():
+            return APIState.API_EXCEPTION
+        self._traj_player.resume()
+        return 0
+
+    def stop_local_playback(self):
+        if self._traj_player is None:
+            return 0
+        self._traj_player.stop()
+        return self.wait_local_playback(timeout=1)
+
+    def set_local_playback_time_scale(self, time_scale):
+        if time_scale <= 0:
+            return APIState.PARAM_ERROR
+        if self._traj_player is None or not self._traj_player.is_alive():
+            return APIState.API_EXCEPTION
+        self._traj_player.set_time_scale(time_scale)
+        return 0
+
+    def get_local_playback_status(self):
+        player = self._traj_player
+        if player is None:
+            return 0, {'playing': False, 'paused': False, 'time': 0, 'duration': 0, 'time_scale': 1, 'late_count': 0}
+        return 0, {
+            'playing': player.is_alive(),
+            'paused': player.paused,
+            'time': player.time,
+            'duration': player.duration,
+            'time_scale': player.time_scale,
+            'late_count': player.late_count,
+        }
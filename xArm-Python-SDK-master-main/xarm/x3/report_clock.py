@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# Software License Agreement (BSD License)
+#
+# Copyright (c) 2024, UFACTORY, Inc.
+# All rights reserved.
+#
+# Author: Vinman <vinman.wen@ufactory.cc> <vinman.cub@gmail.com>
+
+"""
+Mapping between the controller timestamp of the reports (microseconds) and the host time.monotonic()
+Every report gives a sample (controller time c, host receive time h), h - c = offset + drift * c + delay,
+the delay (network, socket buffer) is never negative, so the samples with the minimum delay lie on the lower
+envelope of h - c. The minimum of every block (1s of controller time) is kept and the envelope is fitted with
+a line through the minima of the last blocks, a new minimum under the line moves the line down immediately.
+"""
+
+import threading
+from collections import deque
+
+
+class ReportClock(object):
+    def __init__(self, block_time=1.0, window=60):
+        """
+        :param block_time: the duration of a block in seconds (controller time), one minimum per block
+        :param window: the number of the blocks used to fit the offset and the drift
+        """
+        assert block_time > 0 and window >= 2
+        self._block_time = block_time
+        self._lock = threading.Lock()
+        self._blocks = deque(maxlen=window)
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._blocks.clear()
+            self._block_start = None
+            self._block_min = None
+            self._last_ctrl = None
+            self._delay = 0
+            self._count = 0
+            # (c0, a, b): host - ctrl = a + b * (ctrl - c0), replaced as a whole, read without the lock
+            self._model = None
+
+    @property
+    def ready(self):
+        return self._model is not None
+
+    @property
+    def count(self):
+        """
+        the number of the samples since the last reset
+        """
+        return self._count
+
+    @property
+    def offset(self):
+        """
+        host time - controller time (seconds) at the last sample, None if not ready
+        """
+        model = self._model
+        if model is None or self._last_ctrl is None:
+            return None
+        c0, a, b = model
+        return a + b * (self._last_ctrl - c0)
+
+    @property
+    def drift(self):
+        """
+        the rate of the host clock relative to the controller clock - 1, ex: 2e-5 means 20ppm faster
+        """
+        model = self._model
+        return 0 if model is None else model[2]
+
+    @property
+    def delay(self):
+        """
+        the delay (seconds) of the last sample over the estimated envelope, that is the network + queueing delay
+        above the minimum, large values mean the report was received late
+        """
+        return self._delay
+
+    def update(self, ctrl_us, host_time):
+        """
+        Called by the report thread for every report with the controller timestamp
+        :param ctrl_us: the controller timestamp of the report in microseconds
+        :param host_time: the time.monotonic() when the report was received
+        :return: the estimated host time of the controller timestamp
+        """
+        c = ctrl_us / 1000000.0
+        d = host_time - c
+        with self._lock:
+            if self._last_ctrl is not None and (c < self._last_ctrl
+                                                or c - self._last_ctrl > self._block_time * self._blocks.maxlen):
+                # the controller restarted or the reports were lost for a long time
+                self._blocks.clear()
+                self._block_start = None
+                self._block_min = None
+                self._model = None
+            self._last_ctrl = c
+            self._count += 1
+            if self._block_start is None or c - self._block_start >= self._block_time:
+                if self._block_min is not None and self._block_start is not None:
+                    self._blocks.append(self._block_min)
+                self._block_start = c
+                self._block_min = (c, d)
+                self._fit()
+            elif d < self._block_min[1]:
+                self._block_min = (c, d)
+            model = self._model
+            if model is None:
+                model = self._model = (c, d, 0)
+            c0, a, b = model
+            est = a + b * (c - c0)
+            if d < est:
+                # under the envelope, move the line down through the sample
+                a += d - est
+                self._model = (c0, a, b)
+                est = d
+            self._delay = d - est
+        return c + est
+
+    def _fit(self):
+        # only the completed blocks, the first sample of a new block may be a late one
+        points = self._blocks
+        n = len(points)
+        if n < 2:
+            return
+        c0 = sum(p[0] for p in points) / n
+        dm = sum(p[1] for p in points) / n
+        scc = sum((p[0] - c0) * (p[0] - c0) for p in points)
+        b = sum((p[0] - c0) * (p[1] - dm) for p in points) / scc if scc > 0 else 0
+        # shift down to the lower envelope, no minimum is under the line
+        a = dm - max(0, max(dm + b * (p[0] - c0) - p[1] for p in points))
+        self._model = (c0, a, b)
+
+    def to_host(self, ctrl_us):
+        """
+        Convert a controller timestamp (microseconds) to the host time.monotonic()
+        :return: the host time in seconds, None if not ready
+        """
+        model = self._model
+        if model is None:
+            return None
+        c0, a, b = model
+        c = ctrl_us / 1000000.0
+        return c + a + b * (c - c0)
+
+    def to_controller(self, host_time):
+        """
+        Convert a host time.monotonic() to the controller timestamp
+        :return: the controller timestamp in microseconds, None if not ready
+        """
+        model = self._model
+        if model is None:
+            return None
+        c0, a, b = model
+        return (host_time - a + b * c0) / (1 + b) * 1000000.0
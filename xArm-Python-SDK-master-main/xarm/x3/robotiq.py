@@ -82,7 +82,7 @@ class RobotIQ(Base):
     def robotiq_reset(self):
         params = [0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
         code, ret = self.__robotiq_set(params)
-        self.log_api_info('API -> robotiq_reset -> code={}, response={}'.format(code, ret), code=code)
+        self.log_api_info('API -> robotiq_reset -> code=%s, response=%s', code, ret, code=code)
         return code, ret
 
     @xarm_is_connected(_type='get')
@@ -92,7 +92,7 @@ class RobotIQ(Base):
         code, ret = self.__robotiq_set(params)
         if wait and code == 0:
             code = self.robotiq_wait_activation_completed(timeout)
-        self.log_api_info('API -> robotiq_set_activate ->code={}, response={}'.format(code, ret), code=code)
+        self.log_api_info('API -> robotiq_set_activate ->code=%s, response=%s', code, ret, code=code)
         if code == 0:
             self.robotiq_is_activated = True
         return code, ret
@@ -115,7 +115,7 @@ class RobotIQ(Base):
         code, ret = self.__robotiq_set(params)
         if wait and code == 0:
             code = self.robotiq_wait_motion_completed(timeout, **kwargs)
-        self.log_api_info('API -> robotiq_set_position ->code={}, response={}'.format(code, ret), code=code)
+        self.log_api_info('API -> robotiq_set_position ->code=%s, response=%s', code, ret, code=code)
         return code, ret
 
     def robotiq_open(self, speed=0xFF, force=0xFF, wait=True, timeout=5, **kwargs):
@@ -11,12 +11,71 @@ from ..core.config.x_code import ServoError
 from ..core.utils.log import logger, pretty_print
 from .base import Base
 from .decorator import xarm_is_connected
+from ..core.utils.optional import import_numpy
+
+# the registers never change on the same arm (versions, harmonic type), cached per robot sn
+SERVO_IMMUTABLE_ADDRS = {0x0801, 0x0802, 0x0803, 0x081F}
 
 
 class Servo(Base):
+    # {robot_sn: {(servo_id, addr, width): value}}
+    _servo_register_cache = {}
+
     def __init__(self):
         super(Servo, self).__init__()
 
+    def _read_servo_registers(self, regs, window=16, use_cache=True):
+        regs = [(int(servo_id), int(addr), 32 if width == 32 else 16) for servo_id, addr, width in regs]
+        cache = None
+        if use_cache and any(reg[1] in SERVO_IMMUTABLE_ADDRS for reg in regs):
+            if not self._robot_sn:
+                self.get_robot_sn()
+            if self._robot_sn:
+                cache = Servo._servo_register_cache.setdefault(self._robot_sn, {})
+        rets = [None] * len(regs)
+        indexes = []
+        for i, reg in enumerate(regs):
+            if cache is not None and reg in cache:
+                rets[i] = [0, cache[reg]]
+            else:
+                indexes.append(i)
+        if indexes:
+            results = self.arm_cmd.servo_addr_r_batch([regs[i] for i in indexes], window=window)
+            for i, ret in zip(indexes, results):
+                rets[i] = ret
+                if cache is not None and ret[0] == 0 and regs[i][1] in SERVO_IMMUTABLE_ADDRS:
+                    cache[regs[i]] = ret[1]
+        return regs, rets
+
+    @xarm_is_connected(_type='get')
+    def get_servo_registers(self, regs, window=16, use_cache=True):
+        """
+        Read many servo registers, the requests are pipelined (TCP)
+        :param regs: list of (servo_id, addr, width), width is 16 or 32
+        :param window: the max number of the requests waiting for the response
+        :param use_cache: use the cached value of the immutable registers (versions, harmonic type) or not
+        :return: tuple((code, table)), table has one row [servo_id, addr, width, code, value] for each register,
+            numpy array (int64) if numpy is installed, else list
+        """
+        regs, rets = self._read_servo_registers(regs, window=window, use_cache=use_cache)
+        code = 0
+        table = []
+        for reg, ret in zip(regs, rets):
+            if ret[0] != 0:
+                code = ret[0]
+            table.append([reg[0], reg[1], reg[2], ret[0], ret[1]])
+        np = import_numpy()
+        if np is not None:
+            table = np.array(table, dtype=np.int64).reshape(-1, 5)
+        return code, table
+
+    @staticmethod
+    def clear_servo_register_cache(robot_sn=None):
+        if robot_sn is None:
+            Servo._servo_register_cache.clear()
+        else:
+            Servo._servo_register_cache.pop(robot_sn, None)
+
     @xarm_is_connected(_type='get')
     def get_servo_debug_msg(self, show=False, lang='en'):
         ret = self.arm_cmd.servo_get_dbmsg()
@@ -31,8 +90,8 @@ class Servo(Base):
                     'servo_id': i,
                     'status': servo_error.status,
                     'code': servo_error.code,
-                    'title': servo_error.title[lang],
-                    'desc': servo_error.description[lang]
+                    'title': servo_error.get_title(lang),
+                    'desc': servo_error.get_description(lang)
                 })
         if show:
             pretty_print('************* {}, {}: {} **************'.format(
@@ -61,7 +120,7 @@ class Servo(Base):
         """
         assert isinstance(servo_id, int) and 1 <= servo_id <= 8, 'The value of parameter servo_id can only be 1-8.'
         ret = self.arm_cmd.servo_set_zero(servo_id)
-        self.log_api_info('API -> set_servo_zero(servo_id={}) -> code={}'.format(servo_id, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_servo_zero(servo_id=%s) -> code=%s', servo_id, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -79,7 +138,7 @@ class Servo(Base):
         assert addr is not None, 'The value of parameter addr cannot be None.'
         assert value is not None, 'The value of parameter value cannot be None.'
         ret = self.arm_cmd.servo_addr_w16(servo_id, addr, value)
-        self.log_api_info('API -> set_servo_addr_16(servo_id={}, addr={}, value={}) -> code={}'.format(servo_id, addr, value, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_servo_addr_16(servo_id=%s, addr=%s, value=%s) -> code=%s', servo_id, addr, value, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -110,7 +169,7 @@ class Servo(Base):
         assert addr is not None, 'The value of parameter addr cannot be None.'
         assert value is not None, 'The value of parameter value cannot be None.'
         ret = self.arm_cmd.servo_addr_w32(servo_id, addr, value)
-        self.log_api_info('API -> set_servo_addr_32(servo_id={}, addr={}, value={}) -> code={}'.format(servo_id, addr, value, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_servo_addr_32(servo_id=%s, addr=%s, value=%s) -> code=%s', servo_id, addr, value, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -345,42 +404,17 @@ class Servo(Base):
         """
         assert isinstance(servo_id, int) and 1 <= servo_id <= 8, 'The value of parameter servo_id can only be 1-8.'
 
-        def _get_servo_version(id_num):
-            versions = ['*', '*', '*']
-            ret1 = self.get_servo_addr_16(id_num, 0x0801)
-            ret2 = self.get_servo_addr_16(id_num, 0x0802)
-            ret3 = self.get_servo_addr_16(id_num, 0x0803)
-            code = 0
-            if ret1[0] == 0:
-                versions[0] = ret1[1]
-            else:
-                code = ret1[0]
-            if ret2[0] == 0:
-                versions[1] = ret2[1]
-            else:
-                code = ret2[0]
-            if ret3[0] == 0:
-                versions[2] = ret3[1]
-            else:
-                code = ret3[0]
-            # if code != 0:
-            #     _, err_warn = self.get_err_warn_code()
-            #     if _ in [0, 1, 2]:
-            #         if err_warn[0] not in [10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 28]:
-            #             versions = [ret1[1], ret2[1], ret3[1]]
-            return code, '.'.join(map(str, versions))
-
-        if servo_id > self.axis:
-            code = 0
-            versions = []
-            for i in range(1, self.axis + 1):
-                ret = _get_servo_version(i)
+        ids = list(range(1, self.axis + 1)) if servo_id > self.axis else [servo_id]
+        _, rets = self._read_servo_registers([(i, addr, 16) for i in ids for addr in [0x0801, 0x0802, 0x0803]])
+        code = 0
+        versions = []
+        for i in range(len(ids)):
+            items = rets[i * 3:i * 3 + 3]
+            for ret in items:
                 if ret[0] != 0:
                     code = ret[0]
-                versions.append(ret[1])
-            return code, versions
-        else:
-            return _get_servo_version(servo_id)
+            versions.append('.'.join(str(ret[1]) if ret[0] == 0 else '*' for ret in items))
+        return code, versions if servo_id > self.axis else versions[0]
 
     @xarm_is_connected(_type='get')
     def get_harmonic_type(self, servo_id=1):
@@ -391,17 +425,15 @@ class Servo(Base):
         """
         assert isinstance(servo_id, int) and 1 <= servo_id <= 8, 'The value of parameter servo_id can only be 1-8.'
 
-        if servo_id > self.axis:
-            code = 0
-            types = []
-            for i in range(1, self.axis + 1):
-                ret = self.get_servo_addr_16(i, 0x081F)
-                if ret[0] != 0:
-                    code = ret[0]
-                types.append(ret[1])
-            return code, types
-        else:
-            return self.get_servo_addr_16(servo_id, 0x081F)
+        ids = list(range(1, self.axis + 1)) if servo_id > self.axis else [servo_id]
+        _, rets = self._read_servo_registers([(i, 0x081F, 16) for i in ids])
+        if servo_id <= self.axis:
+            return rets[0][0], rets[0][1]
+        code = 0
+        for ret in rets:
+            if ret[0] != 0:
+                code = ret[0]
+        return code, [ret[1] for ret in rets]
 
     @xarm_is_connected(_type='get')
     def get_servo_error_code(self, servo_id=None):
@@ -409,36 +441,26 @@ class Servo(Base):
             'The value of parameter servo_id must be greater than 1 or None.'
         code = 0
         if servo_id is None or servo_id > self.axis:
-            count = 7 if servo_id == 8 else self.axis
-            errcodes = [0] * count
-            for i in range(count):
-                ret = self.get_servo_addr_32(i + 1, XCONF.ServoConf.CURR_POS)
+            ids = list(range(1, (7 if servo_id == 8 else self.axis) + 1))
+        else:
+            ids = [servo_id]
+        _, rets = self._read_servo_registers([(i, XCONF.ServoConf.CURR_POS, 32) for i in ids])
+        errcodes = [0] * len(ids)
+        if any(ret[0] == XCONF.UxbusState.ERR_CODE for ret in rets):
+            # the controller error code tells which servo is in error, query it once for all the servos
+            _, err_warn = self.get_err_warn_code()
+            if _ != 0:
+                code = _
+                logger.error('Get controller errwarn: ret=%s, errwarn=%s', code, err_warn)
+            for i, ret in enumerate(rets):
                 if ret[0] == XCONF.UxbusState.ERR_CODE:
-                    _, err_warn = self.get_err_warn_code()
                     if _ == 0:
-                        if i + 11 == err_warn[0]:
-                            errcodes[i] = ret[1]
-                        else:
-                            errcodes[i] = 0
+                        errcodes[i] = ret[1] if ids[i] + 10 == err_warn[0] else 0
                     else:
-                        code = _
-                        logger.error('Get controller errwarn: ret={}, errwarn={}'.format(code, err_warn))
                         errcodes[i] = ret[1]
-        else:
-            errcodes = 0
-            ret = self.get_servo_addr_32(servo_id, XCONF.ServoConf.CURR_POS)
-            if ret[0] == XCONF.UxbusState.ERR_CODE:
-                _, err_warn = self.get_err_warn_code()
-                if _ == 0:
-                    if servo_id + 10 == err_warn[0]:
-                        errcodes = ret[1]
-                    else:
-                        errcodes = 0
-                else:
-                    code = _
-                    logger.error('Get controller errwarn: ret={}, errwarn={}'.format(code, err_warn))
-                    errcodes = ret[1]
-        return code, errcodes
+        if servo_id is None or servo_id > self.axis:
+            return code, errcodes
+        return code, errcodes[0]
 
     @xarm_is_connected(_type='set')
     def clean_servo_pvl_err(self, servo_id=None):
@@ -471,15 +493,9 @@ class Servo(Base):
         ]
         if servo_id is None or servo_id > self.axis:
             count = 7 if servo_id == 8 else self.axis
-            pids = [[9999] * len(addrs) for _ in range(count)]
-            for i in range(count):
-                for j, addr in enumerate(addrs):
-                    _, data = self.get_servo_addr_16(i + 1, addr)
-                    if _ == 0:
-                        pids[i][j] = data
+            _, rets = self._read_servo_registers([(i + 1, addr, 16) for i in range(count) for addr in addrs])
+            pids = [[ret[1] if ret[0] == 0 else 9999 for ret in rets[i * len(addrs):(i + 1) * len(addrs)]] for i in range(count)]
         else:
-            pids = [9999] * len(addrs)
-            for j, addr in enumerate(addrs):
-                _, data = self.get_servo_addr_16(servo_id, addr)
-                pids[j] = data
+            _, rets = self._read_servo_registers([(servo_id, addr, 16) for addr in addrs])
+            pids = [ret[1] for ret in rets]
         return 0, pids
@@ -8,6 +8,7 @@
 
 import time
 import math
+import random
 import functools
 from ..core.utils.log import logger
 from .code import APIState
@@ -32,6 +33,15 @@ def compare_version(v1, v2):
     return False
 
 
+def get_backoff_delay(attempt, base=0.1, max_delay=5.0):
+    """
+    Exponential backoff with jitter, the delay of the attempt (starts from 0) is in [cap / 2, cap]
+    where cap = min(max_delay, base * 2 ^ attempt), the jitter avoids many clients retrying at the same time
+    """
+    cap = min(max_delay, base * (2 ** min(attempt, 32)))
+    return cap / 2 + random.uniform(0, cap / 2)
+
+
 def filter_invaild_number(num, ndigits=3, default=0.0):
     if math.isnan(num) or math.isinf(num):
         return round(default, 0) if ndigits < 0 else round(default, ndigits)
@@ -26,18 +26,20 @@ from .record import Record
 from .robotiq import RobotIQ
 from .ft_sensor import FtSensor
 from .modbus_tcp import ModbusTcp
-from .parse import GcodeParser
 from .code import APIState
 from .decorator import xarm_is_connected, xarm_is_ready, xarm_wait_until_not_pause, xarm_wait_until_cmdnum_lt_max
 from .utils import to_radian
-try:
-    # from ..tools.blockly_tool import BlocklyTool
-    from ..tools.blockly import BlocklyTool
-except:
-    print('import BlocklyTool module failed')
-    BlocklyTool = None
 
-gcode_p = GcodeParser()
+_gcode_parser = None
+
+
+def _get_gcode_parser():
+    # created on the first gcode cmd (send_cmd_sync), not at import
+    global _gcode_parser
+    if _gcode_parser is None:
+        from .parse import GcodeParser
+        _gcode_parser = GcodeParser()
+    return _gcode_parser
 
 
 class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, ModbusTcp):
@@ -61,7 +63,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             if limit[0] == limit[1]:
                 return False
             if value < limit[0] - math.radians(0.1) or value > limit[1] + math.radians(0.1):
-                self.log_api_info('API -> set_position -> out_of_tcp_range -> code={}, i={} value={}'.format(APIState.OUT_OF_RANGE, i, value), code=APIState.OUT_OF_RANGE)
+                self.log_api_info('API -> set_position -> out_of_tcp_range -> code=%s, i=%s value=%s', APIState.OUT_OF_RANGE, i, value, code=APIState.OUT_OF_RANGE)
                 return True
         return False
 
@@ -73,7 +75,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         if i < len(joint_limit):
             angle_range = joint_limit[i]
             if angle < angle_range[0] - math.radians(0.1) or angle > angle_range[1] + math.radians(0.1):
-                self.log_api_info('API -> set_servo_angle -> out_of_joint_range -> code={}, i={} value={}'.format(APIState.OUT_OF_RANGE, i, angle), code=APIState.OUT_OF_RANGE)
+                self.log_api_info('API -> set_servo_angle -> out_of_joint_range -> code=%s, i=%s value=%s', APIState.OUT_OF_RANGE, i, angle, code=APIState.OUT_OF_RANGE)
                 return True
         return False
     
@@ -131,17 +133,78 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         mvt = self._mvtime if mvtime is None else mvtime
         return spd, acc, mvt
 
+    @staticmethod
+    def __to_batch_list(value, n, default=None):
+        if value is None:
+            return [default] * n
+        if hasattr(value, 'tolist'):
+            value = value.tolist()
+        if isinstance(value, Iterable):
+            value = list(value)
+            return value if len(value) == n else None
+        return [value] * n
+
+    def __get_cmd_space(self, refresh=False):
+        if not self._check_cmdnum_limit:
+            return self._max_cmd_num
+        if refresh:
+            last_report_time = self._last_report_time
+            if self._enable_report and time.monotonic() - last_report_time < 0.4:
+                # wait the next report which contains the cmdnum after the sent cmds
+                expired = time.monotonic() + 0.1
+                while self.connected and self._last_report_time == last_report_time and time.monotonic() < expired:
+                    time.sleep(0.002)
+            else:
+                self.get_cmdnum()
+        return self._max_cmd_num - self._cmd_num
+
+    def __send_batch(self, send_func, count):
+        """
+        Send the batch in chunks, the chunk size is limited by the free space of the cmd cache (max_cmdnum - cmdnum)
+        :param send_func: send_func(start, end), return list of [code, state_is_ready]
+        :return: code, codes
+        """
+        codes = [None] * count
+        code = 0
+        index = 0
+        space = self.__get_cmd_space()
+        while index < count:
+            if not self.connected:
+                code = APIState.NOT_CONNECTED
+                break
+            if space <= 0:
+                space = self.__get_cmd_space(refresh=True)
+                if space <= 0:
+                    time.sleep(0.01)
+                continue
+            end = min(count, index + space)
+            rets = send_func(index, end)
+            for i, ret in enumerate(rets):
+                if ret[0] in [0, XCONF.UxbusState.WAR_CODE]:
+                    codes[index + i] = 0 if ret[1] else XCONF.UxbusState.STATE_NOT_READY
+                else:
+                    codes[index + i] = ret[0]
+                if codes[index + i] != 0:
+                    code = codes[index + i]
+            if code != 0 or len(rets) < end - index:
+                code = code if code != 0 else APIState.NO_TCP
+                break
+            space -= end - index
+            index = end
+        return code, codes
+
     def _set_position_absolute(self, x=None, y=None, z=None, roll=None, pitch=None, yaw=None, radius=None,
                                speed=None, mvacc=None, mvtime=None, is_radian=None, wait=False, timeout=None, **kwargs):
         is_radian = self._default_is_radian if is_radian is None else is_radian
         only_check_type = kwargs.get('only_check_type', self._only_check_type)
+        supports_inf = self._capability.supports_inf_position
         tcp_pos = [
-            (math.inf if self.version_is_ge(2, 4, 101) else self._last_position[0]) if x is None else float(x),
-            (math.inf if self.version_is_ge(2, 4, 101) else self._last_position[1]) if y is None else float(y),
-            (math.inf if self.version_is_ge(2, 4, 101) else self._last_position[2]) if z is None else float(z),
-            (math.inf if self.version_is_ge(2, 4, 101) else self._last_position[3]) if roll is None else to_radian(roll, is_radian),
-            (math.inf if self.version_is_ge(2, 4, 101) else self._last_position[4]) if pitch is None else to_radian(pitch, is_radian),
-            (math.inf if self.version_is_ge(2, 4, 101) else self._last_position[5]) if yaw is None else to_radian(yaw, is_radian),
+            (math.inf if supports_inf else self._last_position[0]) if x is None else float(x),
+            (math.inf if supports_inf else self._last_position[1]) if y is None else float(y),
+            (math.inf if supports_inf else self._last_position[2]) if z is None else float(z),
+            (math.inf if supports_inf else self._last_position[3]) if roll is None else to_radian(roll, is_radian),
+            (math.inf if supports_inf else self._last_position[4]) if pitch is None else to_radian(pitch, is_radian),
+            (math.inf if supports_inf else self._last_position[5]) if yaw is None else to_radian(yaw, is_radian),
         ]
         motion_type = kwargs.get('motion_type', False)
         for i in range(3):
@@ -155,7 +218,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         spd, acc, mvt = self.__get_tcp_motion_params(speed, mvacc, mvtime, **kwargs)
         radius = radius if radius is not None else -1
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
-        if self.version_is_ge(1, 11, 100) or kwargs.get('debug', False):
+        if self._capability.supports_move_line_common or kwargs.get('debug', False):
             ret = self.arm_cmd.move_line_common(tcp_pos, spd, acc, mvt, radius, coord=0, is_axis_angle=False, only_check_type=only_check_type, motion_type=motion_type, feedback_key=feedback_key)
         else:
             if radius >= 0:
@@ -164,8 +227,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 ret = self.arm_cmd.move_line(tcp_pos, spd, acc, mvt, only_check_type, motion_type=motion_type)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait, kwargs.get('is_pop', True))
         ret[0] = self._check_code(ret[0], is_move_cmd=True)
-        self.log_api_info('API -> set_position -> code={}, pos={}, radius={}, velo={}, acc={}'.format(
-            ret[0], tcp_pos, radius, spd, acc), code=ret[0])
+        self.log_api_info('API -> set_position -> code=%s, pos=%s, radius=%s, velo=%s, acc=%s',
+            ret[0], tcp_pos, radius, spd, acc, code=ret[0])
         self._is_set_move = True
         self._only_check_result = 0
         if only_check_type > 0 and ret[0] == 0:
@@ -185,7 +248,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         is_radian = self._default_is_radian if is_radian is None else is_radian
         only_check_type = kwargs.get('only_check_type', self._only_check_type)
         motion_type = kwargs.get('motion_type', False)
-        if self.version_is_ge(1, 8, 100):
+        if self._capability.supports_relative_move:
             # use relative api
             tcp_pos = [
                 0 if x is None else float(x),
@@ -202,8 +265,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             ret = self.arm_cmd.move_relative(tcp_pos, spd, acc, mvt, radius, False, False, only_check_type, motion_type=motion_type, feedback_key=feedback_key)
             trans_id = self._get_feedback_transid(feedback_key, studio_wait, kwargs.get('is_pop', True))
             ret[0] = self._check_code(ret[0], is_move_cmd=True)
-            self.log_api_info('API -> set_relative_position -> code={}, pos={}, radius={}, velo={}, acc={}'.format(
-                ret[0], tcp_pos, radius, spd, acc), code=ret[0])
+            self.log_api_info('API -> set_relative_position -> code=%s, pos=%s, radius=%s, velo=%s, acc=%s',
+                ret[0], tcp_pos, radius, spd, acc, code=ret[0])
             self._is_set_move = True
             self._only_check_result = 0
             if only_check_type > 0 and ret[0] == 0:
@@ -253,6 +316,67 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                                                speed=speed, mvacc=mvacc, mvtime=mvtime, is_radian=is_radian,
                                                wait=wait, timeout=timeout, **kwargs)
 
+    @xarm_wait_until_not_pause
+    @xarm_is_ready(_type='set', batch=True)
+    def set_positions(self, poses, speeds=None, mvacc=None, mvtime=None, radii=None, is_radian=None,
+                      wait=False, timeout=None, window=16, **kwargs):
+        n = len(poses)
+        if n == 0:
+            return 0, []
+        is_radian = self._default_is_radian if is_radian is None else is_radian
+        poses = poses.tolist() if hasattr(poses, 'tolist') else poses
+        speeds = self.__to_batch_list(speeds, n)
+        radii = self.__to_batch_list(radii, n)
+        if speeds is None or radii is None or any(len(pose) < 6 for pose in poses):
+            return APIState.PARAM_ERROR, []
+        if not self._capability.supports_move_line_common:
+            # the controller does not support the common move line cmd, send one by one
+            codes = [self.set_position(*pose[:6], radius=radii[i], speed=speeds[i], mvacc=mvacc, mvtime=mvtime,
+                                       is_radian=is_radian, wait=False, **kwargs) for i, pose in enumerate(poses)]
+            code = next((c for c in codes if c != 0), 0)
+            if code == 0 and wait:
+                code = self.wait_move(timeout)
+            return code, codes
+        code = self.__wait_sync()
+        if code != 0:
+            return code, [None] * n
+        tcp_poses = []
+        last_pos = self._last_position
+        for i, pose in enumerate(poses):
+            # None keeps the value of the previous pose (like set_position)
+            tcp_pos = [last_pos[j] if pose[j] is None else float(pose[j]) for j in range(3)] \
+                + [last_pos[j] if pose[j] is None else to_radian(pose[j], is_radian) for j in range(3, 6)]
+            for j in range(3, 6):
+                if self._is_out_of_tcp_range(tcp_pos[j], j):
+                    return APIState.OUT_OF_RANGE, [APIState.OUT_OF_RANGE if k == i else None for k in range(n)]
+            tcp_poses.append(tcp_pos)
+            last_pos = tcp_pos
+        spds = [self._last_tcp_speed if speed is None else min(max(float(speed), self._min_tcp_speed), 1000) for speed in speeds]
+        _, acc, mvt = self.__get_tcp_motion_params(None, mvacc, mvtime)
+        accs = [acc] * n
+        mvts = [mvt] * n
+        motion_type = kwargs.get('motion_type', 0)
+        self._has_motion_cmd = True
+
+        def _send(start, end):
+            return self.arm_cmd.move_line_common_batch(tcp_poses[start:end], spds[start:end], accs[start:end],
+                                                       mvts[start:end], radii[start:end], motion_type=motion_type, window=window)
+
+        code, codes = self.__send_batch(_send, n)
+        self.log_api_info('API -> set_positions -> code=%s, count=%s, sent=%s, last_pos=%s',
+            code, n, sum(1 for c in codes if c == 0), tcp_poses[-1], code=code)
+        self._is_set_move = True
+        self._only_check_result = 0
+        if code == 0 and wait:
+            code = self.wait_move(timeout)
+            self.__update_tcp_motion_params(spds[-1], acc, mvt)
+            self._sync()
+            return code, codes
+        sent = [i for i in range(n) if codes[i] == 0]
+        if sent:
+            self.__update_tcp_motion_params(spds[sent[-1]], acc, mvt, tcp_poses[sent[-1]])
+        return code, codes
+
     @xarm_wait_until_not_pause
     @xarm_wait_until_cmdnum_lt_max
     @xarm_is_ready(_type='set')
@@ -277,14 +401,14 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         radius = radius if radius is not None else -1
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
 
-        if self.version_is_ge(1, 11, 100) or kwargs.get('debug', False):
+        if self._capability.supports_move_line_common or kwargs.get('debug', False):
             ret = self.arm_cmd.move_line_common(tcp_pos, spd, acc, mvt, radius, coord=1, is_axis_angle=False, only_check_type=only_check_type, motion_type=motion_type, feedback_key=feedback_key)
         else:
             ret = self.arm_cmd.move_line_tool(tcp_pos, spd, acc, mvt, only_check_type, motion_type=motion_type)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait, kwargs.get('is_pop', True))
         ret[0] = self._check_code(ret[0], is_move_cmd=True)
-        self.log_api_info('API -> set_tool_position -> code={}, pos={}, velo={}, acc={}'.format(
-            ret[0], tcp_pos, spd, acc), code=ret[0])
+        self.log_api_info('API -> set_tool_position -> code=%s, pos=%s, velo=%s, acc=%s',
+            ret[0], tcp_pos, spd, acc, code=ret[0])
         self._is_set_move = True
         self._only_check_result = 0
         if only_check_type > 0 and ret[0] == 0:
@@ -318,7 +442,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         motion_type = kwargs.get('motion_type', False)
         radius = radius if radius is not None else -1
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
-        if self.version_is_ge(1, 11, 100) or kwargs.get('debug', False):
+        if self._capability.supports_move_line_common or kwargs.get('debug', False):
             if not is_tool_coord and relative:
                 ret = self.arm_cmd.move_relative(tcp_pos, spd, acc, mvt, radius, False, True, only_check_type, motion_type=motion_type, feedback_key=feedback_key)
             else:
@@ -327,8 +451,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             ret = self.arm_cmd.move_line_aa(tcp_pos, spd, acc, mvt, mvcoord, int(relative), only_check_type, motion_type=motion_type)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait)
         ret[0] = self._check_code(ret[0], is_move_cmd=True)
-        self.log_api_info('API -> set_position_aa -> code={}, pos={}, velo={}, acc={}'.format(
-            ret[0], tcp_pos, spd, acc), code=ret[0])
+        self.log_api_info('API -> set_position_aa -> code=%s, pos=%s, velo=%s, acc=%s',
+            ret[0], tcp_pos, spd, acc, code=ret[0])
         self._is_set_move = True
         self._only_check_result = 0
         if only_check_type > 0 and ret[0] == 0:
@@ -356,9 +480,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         self._has_motion_cmd = True
         ret = self.arm_cmd.move_servo_cart_aa(mvpose=tcp_pos, mvvelo=spd, mvacc=acc, tool_coord=tool_coord, relative=int(relative))
         ret[0] = self._check_code(ret[0], is_move_cmd=True, mode=1)
-        self.log_api_info('API -> set_servo_cartesian_aa -> code={}, pose={}, velo={}, acc={}'.format(
-            ret[0], tcp_pos, spd, acc
-        ), code=ret[0])
+        self.log_api_info('API -> set_servo_cartesian_aa -> code=%s, pose=%s, velo=%s, acc=%s',
+            ret[0], tcp_pos, spd, acc, code=ret[0])
         self._is_set_move = True
         return ret[0]
 
@@ -382,15 +505,14 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         spd, acc, mvt = self.__get_joint_motion_params(speed, mvacc, mvtime, is_radian=is_radian, **kwargs)
         self._has_motion_cmd = True
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
-        if self.version_is_ge(1, 5, 20) and radius is not None and radius >= 0:
+        if self._capability.supports_joint_radius and radius is not None and radius >= 0:
             ret = self.arm_cmd.move_jointb(joints, spd, acc, radius, only_check_type, feedback_key=feedback_key)
         else:
             ret = self.arm_cmd.move_joint(joints, spd, acc, mvt, only_check_type, feedback_key=feedback_key)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait, kwargs.get('is_pop', True))
         ret[0] = self._check_code(ret[0], is_move_cmd=True)
-        self.log_api_info('API -> set_servo_angle -> code={}, angles={}, velo={}, acc={}, radius={}'.format(
-            ret[0], joints, spd, acc, radius
-        ), code=ret[0])
+        self.log_api_info('API -> set_servo_angle -> code=%s, angles=%s, velo=%s, acc=%s, radius=%s',
+            ret[0], joints, spd, acc, radius, code=ret[0])
         self._is_set_move = True
         self._only_check_result = 0
         if only_check_type > 0 and ret[0] == 0:
@@ -409,7 +531,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                                   is_radian=None, wait=False, timeout=None, radius=None, **kwargs):
         is_radian = self._default_is_radian if is_radian is None else is_radian
         only_check_type = kwargs.get('only_check_type', self._only_check_type)
-        if self.version_is_ge(1, 8, 100):
+        if self._capability.supports_relative_move:
             # use relative api
             joints = [0] * 7
             for i in range(min(7, len(angles))):
@@ -425,9 +547,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             ret = self.arm_cmd.move_relative(joints, spd, acc, mvt, radius, True, False, only_check_type, feedback_key=feedback_key)
             trans_id = self._get_feedback_transid(feedback_key, studio_wait)
             ret[0] = self._check_code(ret[0], is_move_cmd=True)
-            self.log_api_info('API -> set_relative_servo_angle -> code={}, angles={}, velo={}, acc={}, radius={}'.format(
-                ret[0], joints, spd, acc, radius
-            ), code=ret[0])
+            self.log_api_info('API -> set_relative_servo_angle -> code=%s, angles=%s, velo=%s, acc=%s, radius=%s',
+                ret[0], joints, spd, acc, radius, code=ret[0])
             self._is_set_move = True
             self._only_check_result = 0
             if only_check_type > 0 and ret[0] == 0:
@@ -464,7 +585,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         if servo_id is not None and servo_id != 8:
             if servo_id > self.axis or servo_id <= 0:
                 return APIState.SERVO_NOT_EXIST
-            angles = [math.inf if self.version_is_ge(2, 4, 101) else None] * 7
+            angles = [math.inf if self._capability.supports_inf_position else None] * 7
             angles[servo_id - 1] = angle
         else:
             angles = angle
@@ -483,6 +604,65 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             return self._set_servo_angle_absolute(angles, speed=speed, mvacc=mvacc, mvtime=mvtime, is_radian=is_radian,
                                                   wait=wait, timeout=timeout, radius=radius, **kwargs)
 
+    @xarm_wait_until_not_pause
+    @xarm_is_ready(_type='set', batch=True)
+    def set_servo_angles(self, angles, speeds=None, mvacc=None, mvtime=None, radii=None, is_radian=None,
+                         wait=False, timeout=None, window=16, **kwargs):
+        n = len(angles)
+        if n == 0:
+            return 0, []
+        is_radian = self._default_is_radian if is_radian is None else is_radian
+        angles = angles.tolist() if hasattr(angles, 'tolist') else angles
+        speeds = self.__to_batch_list(speeds, n)
+        radii = self.__to_batch_list(radii, n)
+        if speeds is None or radii is None:
+            return APIState.PARAM_ERROR, []
+        if not self._capability.supports_joint_radius:
+            radii = [None] * n
+        code = self.__wait_sync()
+        if code != 0:
+            return code, [None] * n
+        joints_list = []
+        last_joints = self._last_angles
+        for i, point in enumerate(angles):
+            joints = last_joints.copy()
+            for j in range(min(len(joints), len(point), self.axis)):
+                if point[j] is None:
+                    continue
+                joints[j] = to_radian(point[j], is_radian)
+                if self._is_out_of_joint_range(joints[j], j):
+                    return APIState.OUT_OF_RANGE, [APIState.OUT_OF_RANGE if k == i else None for k in range(n)]
+            joints[5] = 0 if self.axis <= 5 else joints[5]
+            joints[6] = 0 if self.axis <= 6 else joints[6]
+            joints_list.append(joints)
+            last_joints = joints
+        spds = []
+        for speed in speeds:
+            spd, acc, mvt = self.__get_joint_motion_params(speed, mvacc, mvtime, is_radian=is_radian)
+            spds.append(spd)
+        accs = [acc] * n
+        mvts = [mvt] * n
+        self._has_motion_cmd = True
+
+        def _send(start, end):
+            return self.arm_cmd.move_joint_batch(joints_list[start:end], spds[start:end], accs[start:end],
+                                                 mvts[start:end], radii[start:end], window=window)
+
+        code, codes = self.__send_batch(_send, n)
+        self.log_api_info('API -> set_servo_angles -> code=%s, count=%s, sent=%s, last_angles=%s',
+            code, n, sum(1 for c in codes if c == 0), joints_list[-1], code=code)
+        self._is_set_move = True
+        self._only_check_result = 0
+        if code == 0 and wait:
+            code = self.wait_move(timeout)
+            self.__update_joint_motion_params(spds[-1], acc, mvt)
+            self._sync()
+            return code, codes
+        sent = [i for i in range(n) if codes[i] == 0]
+        if sent:
+            self.__update_joint_motion_params(spds[sent[-1]], acc, mvt, joints_list[sent[-1]])
+        return code, codes
+
     @xarm_is_ready(_type='set')
     def set_servo_angle_j(self, angles, speed=None, mvacc=None, mvtime=None, is_radian=None, **kwargs):
         # if not self._check_mode_is_correct(1):
@@ -500,9 +680,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         self._has_motion_cmd = True
         ret = self.arm_cmd.move_servoj(angs, spd, acc, mvt)
         ret[0] = self._check_code(ret[0], is_move_cmd=True, mode=1)
-        self.log_api_info('API -> set_servo_angle_j -> code={}, angles={}, velo={}, acc={}'.format(
-            ret[0], angs, spd, acc
-        ), code=ret[0])
+        self.log_api_info('API -> set_servo_angle_j -> code=%s, angles=%s, velo=%s, acc=%s',
+            ret[0], angs, spd, acc, code=ret[0])
         self._is_set_move = True
         return ret[0]
 
@@ -517,9 +696,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         self._has_motion_cmd = True
         ret = self.arm_cmd.move_servo_cartesian(tcp_pos, spd, acc, int(is_tool_coord))
         ret[0] = self._check_code(ret[0], is_move_cmd=True, mode=1)
-        self.log_api_info('API -> set_servo_cartisian -> code={}, pose={}, velo={}, acc={}, is_tool_coord={}'.format(
-            ret[0], tcp_pos, spd, acc, is_tool_coord
-        ), code=ret[0])
+        self.log_api_info('API -> set_servo_cartisian -> code=%s, pose=%s, velo=%s, acc=%s, is_tool_coord=%s',
+            ret[0], tcp_pos, spd, acc, is_tool_coord, code=ret[0])
         self._is_set_move = True
         return ret[0]
 
@@ -542,14 +720,14 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         spd, acc, mvt = self.__get_tcp_motion_params(speed, mvacc, mvtime, **kwargs)
         self._has_motion_cmd = True
         feedback_key, studio_wait = self._gen_feedback_key(wait, **kwargs)
-        if self.version_is_ge(1, 11, 100) or kwargs.get('debug', False):
+        if self._capability.supports_move_line_common or kwargs.get('debug', False):
             ret = self.arm_cmd.move_circle_common(pose_1, pose_2, spd, acc, mvt, percent, coord=1 if is_tool_coord else 0, is_axis_angle=is_axis_angle, only_check_type=only_check_type, feedback_key=feedback_key)
         else:
             ret = self.arm_cmd.move_circle(pose_1, pose_2, spd, acc, mvt, percent, only_check_type)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait, kwargs.get('is_pop', True))
         ret[0] = self._check_code(ret[0], is_move_cmd=True)
-        self.log_api_info('API -> move_circle -> code={}, pos1={}, pos2={}, percent={}%, velo={}, acc={}'.format(
-            ret[0], pose_1, pose_2, percent, spd, acc), code=ret[0])
+        self.log_api_info('API -> move_circle -> code=%s, pos1=%s, pos2=%s, percent=%s%%, velo=%s, acc=%s',
+            ret[0], pose_1, pose_2, percent, spd, acc, code=ret[0])
         self._is_set_move = True
         self._only_check_result = 0
         if only_check_type > 0 and ret[0] == 0:
@@ -580,9 +758,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         ret = self.arm_cmd.move_gohome(spd, acc, mvt, only_check_type, feedback_key=feedback_key)
         trans_id = self._get_feedback_transid(feedback_key, studio_wait)
         ret[0] = self._check_code(ret[0], is_move_cmd=True)
-        self.log_api_info('API -> move_gohome -> code={}, velo={}, acc={}'.format(
-            ret[0], spd, acc
-        ), code=ret[0])
+        self.log_api_info('API -> move_gohome -> code=%s, velo=%s, acc=%s',
+            ret[0], spd, acc, code=ret[0])
         self._is_set_move = True
         self._only_check_result = 0
         if only_check_type > 0 and ret[0] == 0:
@@ -604,7 +781,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         if automatic_calibration:
             _ = self.set_position(*paths[0], is_radian=is_radian, speed=spd, mvacc=acc, mvtime=mvt, wait=True)
             if _ < 0:
-                logger.error('quit, api failed, code={}'.format(_))
+                logger.error('quit, api failed, code=%s', _)
                 return
             _, angles = self.get_servo_angle(is_radian=True)
         if first_pause_time > 0:
@@ -694,26 +871,26 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         """
         assert isinstance(servo_id, int) and 1 <= servo_id <= 8, 'The value of parameter servo_id can only be 1-8.'
         ret = self.arm_cmd.set_brake(servo_id, 1)
-        self.log_api_info('API -> set_servo_detach -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> set_servo_detach -> code=%s', ret[0], code=ret[0])
         self._sync()
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def system_control(self, value=1):
         ret = self.arm_cmd.system_control(value)
-        self.log_api_info('API -> system_control({}) -> code={}'.format(value, ret[0]), code=ret[0])
+        self.log_api_info('API -> system_control(%s) -> code=%s', value, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_reduced_mode(self, on_off):
         ret = self.arm_cmd.set_reduced_mode(int(on_off))
-        self.log_api_info('API -> set_reduced_mode -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> set_reduced_mode -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_reduced_max_tcp_speed(self, speed):
         ret = self.arm_cmd.set_reduced_linespeed(speed)
-        self.log_api_info('API -> set_reduced_linespeed -> code={}, speed={}'.format(ret[0], speed), code=ret[0])
+        self.log_api_info('API -> set_reduced_linespeed -> code=%s, speed=%s', ret[0], speed, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -721,7 +898,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         is_radian = self._default_is_radian if is_radian is None else is_radian
         speed = to_radian(speed, is_radian)
         ret = self.arm_cmd.set_reduced_jointspeed(speed)
-        self.log_api_info('API -> set_reduced_linespeed -> code={}, speed={}'.format(ret[0], speed), code=ret[0])
+        self.log_api_info('API -> set_reduced_linespeed -> code=%s, speed=%s', ret[0], speed, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -733,12 +910,12 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     @xarm_is_connected(_type='get')
     def get_reduced_states(self, is_radian=None):
         is_radian = self._default_is_radian if is_radian is None else is_radian
-        ret = self.arm_cmd.get_reduced_states(79 if self.version_is_ge(1, 2, 11) else 21)
+        ret = self.arm_cmd.get_reduced_states(79 if self._capability.supports_reduced_states_v2 else 21)
         ret[0] = self._check_code(ret[0])
         if ret[0] == 0:
             if not is_radian:
                 ret[4] = round(math.degrees(ret[4]), 1)
-                if self.version_is_ge(1, 2, 11):
+                if self._capability.supports_reduced_states_v2:
                     # ret[5] = list(map(math.degrees, ret[5]))
                     ret[5] = list(map(lambda x: round(math.degrees(x), 2), ret[5]))
         return ret[0], ret[1:]
@@ -752,7 +929,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         limits[2:4] = boundary[2:4] if boundary[2] >= boundary[3] else boundary[2:4][::-1]
         limits[4:6] = boundary[4:6] if boundary[4] >= boundary[5] else boundary[4:6][::-1]
         ret = self.arm_cmd.set_xyz_limits(limits)
-        self.log_api_info('API -> set_reduced_tcp_boundary -> code={}, boundary={}'.format(ret[0], limits), code=ret[0])
+        self.log_api_info('API -> set_reduced_tcp_boundary -> code=%s, boundary=%s', ret[0], limits, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -783,19 +960,19 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 if limits[i * 2 + 1] <= angle_range[0]:
                     return APIState.OUT_OF_RANGE
         ret = self.arm_cmd.set_reduced_jrange(limits)
-        self.log_api_info('API -> set_reduced_joint_range -> code={}, boundary={}'.format(ret[0], limits), code=ret[0])
+        self.log_api_info('API -> set_reduced_joint_range -> code=%s, boundary=%s', ret[0], limits, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_fense_mode(self, on_off):
         ret = self.arm_cmd.set_fense_on(int(on_off))
-        self.log_api_info('API -> set_fense_mode -> code={}, on={}'.format(ret[0], on_off), code=ret[0])
+        self.log_api_info('API -> set_fense_mode -> code=%s, on=%s', ret[0], on_off, code=ret[0])
         return ret
 
     @xarm_is_connected(_type='set')
     def set_collision_rebound(self, on_off):
         ret = self.arm_cmd.set_collis_reb(int(on_off))
-        self.log_api_info('API -> set_collision_rebound -> code={}, on={}'.format(ret[0], on_off), code=ret[0])
+        self.log_api_info('API -> set_collision_rebound -> code=%s, on=%s', ret[0], on_off, code=ret[0])
         return ret
 
     @xarm_is_connected(_type='set')
@@ -822,7 +999,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             else:
                 self.wait_move()
         ret = self.arm_cmd.set_world_offset(world_offset)
-        self.log_api_info('API -> set_world_offset -> code={}, offset={}'.format(ret[0], world_offset), code=ret[0])
+        self.log_api_info('API -> set_world_offset -> code=%s, offset=%s', ret[0], world_offset, code=ret[0])
         return ret[0]
 
     def reset(self, speed=None, mvacc=None, mvtime=None, is_radian=None, wait=False, timeout=None):
@@ -885,7 +1062,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 self._sleep_finish_time = time.monotonic() + sltime
             else:
                 self._sleep_finish_time += sltime
-        self.log_api_info('API -> set_pause_time -> code={}, sltime={}'.format(ret[0], sltime), code=ret[0])
+        self.log_api_info('API -> set_pause_time -> code=%s, sltime=%s', ret[0], sltime, code=ret[0])
         return ret[0]
 
     def set_sleep_time(self, sltime, wait=False):
@@ -905,7 +1082,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             else:
                 self.wait_move()
         ret = self.arm_cmd.set_tcp_offset(tcp_offset)
-        self.log_api_info('API -> set_tcp_offset -> code={}, offset={}'.format(ret[0], tcp_offset), code=ret[0])
+        self.log_api_info('API -> set_tcp_offset -> code=%s, offset=%s', ret[0], tcp_offset, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -913,7 +1090,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     @xarm_is_ready(_type='set')
     def set_tcp_jerk(self, jerk):
         ret = self.arm_cmd.set_tcp_jerk(jerk)
-        self.log_api_info('API -> set_tcp_jerk -> code={}, jerk={}'.format(ret[0], jerk), code=ret[0])
+        self.log_api_info('API -> set_tcp_jerk -> code=%s, jerk=%s', ret[0], jerk, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -921,7 +1098,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     @xarm_is_ready(_type='set')
     def set_tcp_maxacc(self, acc):
         ret = self.arm_cmd.set_tcp_maxacc(acc)
-        self.log_api_info('API -> set_tcp_maxacc -> code={}, maxacc={}'.format(ret[0], acc), code=ret[0])
+        self.log_api_info('API -> set_tcp_maxacc -> code=%s, maxacc=%s', ret[0], acc, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -931,7 +1108,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         is_radian = self._default_is_radian if is_radian is None else is_radian
         jerk = to_radian(jerk, is_radian)
         ret = self.arm_cmd.set_joint_jerk(jerk)
-        self.log_api_info('API -> set_joint_jerk -> code={}, jerk={}'.format(ret[0], jerk), code=ret[0])
+        self.log_api_info('API -> set_joint_jerk -> code=%s, jerk=%s', ret[0], jerk, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -941,7 +1118,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         is_radian = self._default_is_radian if is_radian is None else is_radian
         maxacc = to_radian(maxacc, is_radian)
         ret = self.arm_cmd.set_joint_maxacc(maxacc)
-        self.log_api_info('API -> set_joint_maxacc -> code={}, maxacc={}'.format(ret[0], maxacc), code=ret[0])
+        self.log_api_info('API -> set_joint_maxacc -> code=%s, maxacc=%s', ret[0], maxacc, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -954,7 +1131,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             self.wait_move()
         ret = self.arm_cmd.set_collis_sens(value)
         self.set_state(0)
-        self.log_api_info('API -> set_collision_sensitivity -> code={}, sensitivity={}'.format(ret[0], value), code=ret[0])
+        self.log_api_info('API -> set_collision_sensitivity -> code=%s, sensitivity=%s', ret[0], value, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -967,7 +1144,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             else:
                 self.wait_move()
         ret = self.arm_cmd.set_teach_sens(value)
-        self.log_api_info('API -> set_teach_sensitivity -> code={}, sensitivity={}'.format(ret[0], value), code=ret[0])
+        self.log_api_info('API -> set_teach_sensitivity -> code=%s, sensitivity=%s', ret[0], value, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -979,7 +1156,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             else:
                 self.wait_move()
         ret = self.arm_cmd.set_gravity_dir(direction[:3])
-        self.log_api_info('API -> set_gravity_direction -> code={}, direction={}'.format(ret[0], direction), code=ret[0])
+        self.log_api_info('API -> set_gravity_direction -> code=%s, direction=%s', ret[0], direction, code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -1013,19 +1190,19 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             g_new[i] = Rot[i * 3 + 0] * G_normal[0] + Rot[i * 3 + 1] * G_normal[1] + Rot[i * 3 + 2] * G_normal[2]
 
         ret = self.arm_cmd.set_gravity_dir(g_new)
-        self.log_api_info('API -> set_mount_direction -> code={}, tilt={}, rotation={}, direction={}'.format(ret[0], base_tilt_deg, rotation_deg, g_new), code=ret[0])
+        self.log_api_info('API -> set_mount_direction -> code=%s, tilt=%s, rotation=%s, direction=%s', ret[0], base_tilt_deg, rotation_deg, g_new, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def clean_conf(self):
         ret = self.arm_cmd.clean_conf()
-        self.log_api_info('API -> clean_conf -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> clean_conf -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def save_conf(self):
         ret = self.arm_cmd.save_conf()
-        self.log_api_info('API -> save_conf -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> save_conf -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -1069,7 +1246,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         assert len(pose) >= 6
         tcp_pose = [to_radian(pose[i], is_radian or i <= 2, self._last_position[i]) for i in range(6)]
         ret = self.arm_cmd.is_tcp_limit(tcp_pose)
-        self.log_api_info('API -> is_tcp_limit -> code={}, limit={}'.format(ret[0], ret[1]), code=ret[0])
+        self.log_api_info('API -> is_tcp_limit -> code=%s, limit=%s', ret[0], ret[1], code=ret[0])
         ret[0] = self._check_code(ret[0])
         if ret[0] == 0:
             return ret[0], bool(ret[1])
@@ -1085,7 +1262,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             joints[i] = to_radian(joint[i], is_radian, self._last_angles[i])
 
         ret = self.arm_cmd.is_joint_limit(joints)
-        self.log_api_info('API -> is_joint_limit -> code={}, limit={}'.format(ret[0], ret[1]), code=ret[0])
+        self.log_api_info('API -> is_joint_limit -> code=%s, limit=%s', ret[0], ret[1], code=ret[0])
         ret[0] = self._check_code(ret[0])
         if ret[0] == 0:
             return ret[0], bool(ret[1])
@@ -1113,6 +1290,8 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         return self._handle_gcode(command)
 
     def _handle_gcode(self, command):
+        gcode_p = _get_gcode_parser()
+
         def __handle_gcode_g(num):
             if num == 1:  # G1 move_line, ex: G1 X{} Y{} Z{} A{roll} B{pitch} C{yaw} F{speed} Q{acc} T{}
                 mvvelo = gcode_p.get_mvvelo(command)
@@ -1160,7 +1339,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 time.sleep(mvtime)
                 ret = 0
             else:
-                logger.debug('command {} is not exist'.format(command))
+                logger.debug('command %s is not exist', command)
                 ret = APIState.CMD_NOT_EXIST, 'command {} is not exist'.format(command)
             return ret
 
@@ -1269,7 +1448,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 addr = gcode_p.get_addr(command)
                 ret = self.arm_cmd.servo_error_addr_r32(axis=servo_id, addr=addr)
             else:
-                logger.debug('command {} is not exist'.format(command))
+                logger.debug('command %s is not exist', command)
                 ret = APIState.CMD_NOT_EXIST, 'command {} is not exist'.format(command)
             return ret
 
@@ -1311,7 +1490,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             elif num == 135:
                 return self.get_tgpio_version()
             else:
-                logger.debug('command {} is not exist'.format(command))
+                logger.debug('command %s is not exist', command)
                 ret = APIState.CMD_NOT_EXIST, 'command {} is not exist'.format(command)
             return ret
 
@@ -1338,7 +1517,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 self.clean_servo_pvl_err(id_num)
                 ret = self.get_servo_error_code(id_num)
             else:
-                logger.debug('command {} is not exist'.format(command))
+                logger.debug('command %s is not exist', command)
                 ret = APIState.CMD_NOT_EXIST, 'command {} is not exist'.format(command)
             return ret
 
@@ -1350,7 +1529,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 id_num = gcode_p.get_id_num(command, default=1)
                 ret = self.get_servo_version(servo_id=id_num)
             else:
-                logger.debug('command {} is not exist'.format(command))
+                logger.debug('command %s is not exist', command)
                 ret = APIState.CMD_NOT_EXIST, 'command {} is not exist'.format(command)
             return ret
 
@@ -1386,7 +1565,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             elif num == 139:  # C139 get_cgpio_state, ex: C139
                 ret = self.get_cgpio_state()
             else:
-                logger.debug('command {} is not exist'.format(command))
+                logger.debug('command %s is not exist', command)
                 ret = APIState.CMD_NOT_EXIST, 'command {} is not exist'.format(command)
             return ret
 
@@ -1408,7 +1587,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         cmd_num = gcode_p.get_gcode_cmd_num(command, 'C')
         if cmd_num >= 0:
             return __handle_gcode_c(cmd_num)
-        logger.debug('command {} is not exist'.format(command))
+        logger.debug('command %s is not exist', command)
         return APIState.CMD_NOT_EXIST, 'command {} is not exist'.format(command)
 
     @xarm_is_connected(_type='set')
@@ -1464,8 +1643,23 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 path = os.path.join(path, 'app.xml')
             if not os.path.exists(path):
                 raise FileNotFoundError('{} is not found'.format(path))
-            blockly_tool = BlocklyTool(path)
-            succeed = blockly_tool.to_python(arm=self._api_instance, **kwargs)
+            # the blockly tool is imported on first use, not at import
+            from ..tools.blockly import BlocklyTool, BlocklyCache
+            cache = BlocklyCache(kwargs.get('blockly_cache_dir', None), max_entries=kwargs.get('blockly_cache_max_entries', None)) if kwargs.get('blockly_cache', True) else None
+            cache_key = cache.get_key(path, arm=self._api_instance, **kwargs) if cache is not None else None
+            cached = cache.load(cache_key) if cache is not None else None
+            if cached is not None:
+                succeed, codes, code_obj = cached
+            else:
+                blockly_tool = BlocklyTool(path)
+                succeed = blockly_tool.to_python(arm=self._api_instance, **kwargs)
+                codes = blockly_tool.codes
+                try:
+                    code_obj = compile(codes, path, 'exec') if succeed else None
+                except SyntaxError:
+                    code_obj = None
+                if succeed and code_obj is not None and cache is not None:
+                    cache.save(cache_key, succeed, codes, code_obj)
             if succeed:
                 times = kwargs.get('times', 1)
                 highlight_callback = kwargs.get('highlight_callback', None)
@@ -1479,7 +1673,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 code = APIState.NORMAL
                 try:
                     for _ in range(times):
-                        exec(blockly_tool.codes, {'arm': self._api_instance, 'highlight_callback': highlight_callback,
+                        exec(code_obj if code_obj is not None else codes, {'arm': self._api_instance, 'highlight_callback': highlight_callback,
                                                   'print': blockly_print, 'run_blockly': blockly_exec, 
                                                   'start_run_blockly': blockly_exec, 'start_run_gcode':blockly_run_gcode})
                 except Exception as e:
@@ -1506,7 +1700,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     def reload_dynamics(self):
         ret = self.arm_cmd.reload_dynamics()
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> reload_dynamics -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> reload_dynamics -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -1515,7 +1709,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     def set_counter_reset(self):
         ret = self.arm_cmd.cnter_reset()
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_counter_reset -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> set_counter_reset -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_wait_until_not_pause
@@ -1524,14 +1718,14 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     def set_counter_increase(self, val=1):
         ret = self.arm_cmd.cnter_plus()
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_counter_increase -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> set_counter_increase -> code=%s', ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_report_tau_or_i(self, tau_or_i=0):
         ret = self.arm_cmd.set_report_tau_or_i(int(tau_or_i))
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_report_tau_or_i({}) -> code={}'.format(tau_or_i, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_report_tau_or_i(%s) -> code=%s', tau_or_i, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -1543,7 +1737,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     def set_self_collision_detection(self, on_off):
         ret = self.arm_cmd.set_self_collision_detection(int(on_off))
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_self_collision_detection({}) -> code={}'.format(on_off, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_self_collision_detection(%s) -> code=%s', on_off, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -1572,7 +1766,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             params = [] if tool_type < XCONF.CollisionToolType.USE_PRIMITIVES else list(args)
         ret = self.arm_cmd.set_collision_tool_model(tool_type, params)
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_collision_tool_model({}, {}) -> code={}'.format(tool_type, params, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_collision_tool_model(%s, %s) -> code=%s', tool_type, params, ret[0], code=ret[0])
         return ret[0]
 
     def get_firmware_config(self):
@@ -1687,11 +1881,10 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
                 break
             jnt_v[i] = to_radian(spd, is_radian)
 
-        ret = self.arm_cmd.vc_set_jointv(jnt_v, 1 if is_sync else 0, duration if self.version_is_ge(1, 8, 0) else -1)
+        ret = self.arm_cmd.vc_set_jointv(jnt_v, 1 if is_sync else 0, duration if self._capability.supports_vc_duration else -1)
         ret[0] = self._check_code(ret[0], is_move_cmd=True, mode=4)
-        self.log_api_info('API -> vc_set_joint_velocity -> code={}, speeds={}, is_sync={}'.format(
-            ret[0], jnt_v, is_sync
-        ), code=ret[0])
+        self.log_api_info('API -> vc_set_joint_velocity -> code=%s, speeds=%s, is_sync=%s',
+            ret[0], jnt_v, is_sync, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
@@ -1704,11 +1897,10 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
             if i >= 6:
                 break
             line_v[i] = spd if i <= 2 else to_radian(spd, is_radian)
-        ret = self.arm_cmd.vc_set_linev(line_v, 1 if is_tool_coord else 0, duration if self.version_is_ge(1, 8, 0) else -1)
+        ret = self.arm_cmd.vc_set_linev(line_v, 1 if is_tool_coord else 0, duration if self._capability.supports_vc_duration else -1)
         ret[0] = self._check_code(ret[0], is_move_cmd=True, mode=5)
-        self.log_api_info('API -> vc_set_cartesian_velocity -> code={}, speeds={}, is_tool_coord={}'.format(
-            ret[0], line_v, is_tool_coord
-        ), code=ret[0])
+        self.log_api_info('API -> vc_set_cartesian_velocity -> code=%s, speeds=%s, is_tool_coord=%s',
+            ret[0], line_v, is_tool_coord, code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
@@ -1757,7 +1949,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
     @xarm_is_connected(_type='set')
     def get_tcp_rotation_radius(self, value=6):
         ret = self.arm_cmd.get_tcp_rotation_radius(value)
-        self.log_api_info('API -> get_tcp_rotation_radius -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> get_tcp_rotation_radius -> code=%s', ret[0], code=ret[0])
         ret[0] = self._check_code(ret[0])
         return ret[0], ret[1][0]
 
@@ -1783,33 +1975,33 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         protocol_identifier = self.arm_cmd.get_protocol_identifier()
         self.arm_cmd.set_protocol_identifier(2)
         self._keep_heart = False
-        if self.version_is_ge(1, 9, 100) and estimated_mass <= 0:
+        if self._capability.supports_iden_estimated_mass and estimated_mass <= 0:
             estimated_mass = 0.5
         ret = self.arm_cmd.iden_tcp_load(estimated_mass)
         self.arm_cmd.set_protocol_identifier(protocol_identifier)
         self._keep_heart = True
-        self.log_api_info('API -> iden_tcp_load -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> iden_tcp_load -> code=%s', ret[0], code=ret[0])
         return self._check_code(ret[0]), ret[1:5]
 
     @xarm_is_connected(_type='set')
     def set_cartesian_velo_continuous(self, on_off):
         ret = self.arm_cmd.set_cartesian_velo_continuous(int(on_off))
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_cartesian_velo_continuous({}) -> code={}'.format(on_off, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_cartesian_velo_continuous(%s) -> code=%s', on_off, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='set')
     def set_allow_approx_motion(self, on_off):
         ret = self.arm_cmd.set_allow_approx_motion(int(on_off))
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> set_allow_approx_motion({}) -> code={}'.format(on_off, ret[0]), code=ret[0])
+        self.log_api_info('API -> set_allow_approx_motion(%s) -> code=%s', on_off, ret[0], code=ret[0])
         return ret[0]
 
     @xarm_is_connected(_type='get')
     def get_allow_approx_motion(self):
         ret = self.arm_cmd.get_allow_approx_motion()
         ret[0] = self._check_code(ret[0])
-        self.log_api_info('API -> get_allow_approx_motion() -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> get_allow_approx_motion() -> code=%s', ret[0], code=ret[0])
         return ret[0], ret[-1]
     
     @xarm_is_connected(_type='get')
@@ -1817,10 +2009,10 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         if sn is None:
             code, sn = self.get_robot_sn()
             if code != 0:
-                self.log_api_info('iden_joint_friction -> get_robot_sn failed, code={}'.format(code), code=code)
+                self.log_api_info('iden_joint_friction -> get_robot_sn failed, code=%s', code, code=code)
                 return APIState.API_EXCEPTION, -1
         if len(sn) != 14:
-            self.log_api_info('iden_joint_friction, sn is not correct, sn={}'.format(sn), code=APIState.API_EXCEPTION)
+            self.log_api_info('iden_joint_friction, sn is not correct, sn=%s', sn, code=APIState.API_EXCEPTION)
             return APIState.API_EXCEPTION, -1
         sn = sn.upper()
         axis_map = {5: 'F', 6: 'I', 7: 'S'}
@@ -1829,7 +2021,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         valid_xarm7t = not self.is_850 and not self.is_lite6 and sn[0] == 'C' and sn[1] == 'S'
         valid_xarm = not self.is_850 and not self.is_lite6 and sn[0] == 'X' and sn[1] == axis_map.get(self.axis, '')
         if not (valid_850 or valid_lite or valid_xarm or valid_xarm7t):
-            self.log_api_info('iden_joint_friction, sn is not correct, axis={}, type={}, sn={}'.format(self.axis, self.device_type, sn), code=APIState.API_EXCEPTION)
+            self.log_api_info('iden_joint_friction, sn is not correct, axis=%s, type=%s, sn=%s', self.axis, self.device_type, sn, code=APIState.API_EXCEPTION)
             return APIState.API_EXCEPTION, -1
 
         protocol_identifier = self.arm_cmd.get_protocol_identifier()
@@ -1838,7 +2030,7 @@ class XArm(Gripper, Servo, Record, RobotIQ, BaseBoard, LinearMotor, FtSensor, Mo
         ret = self.arm_cmd.iden_joint_friction(sn)
         self.arm_cmd.set_protocol_identifier(protocol_identifier)
         self._keep_heart = True
-        self.log_api_info('API -> iden_joint_friction -> code={}'.format(ret[0]), code=ret[0])
+        self.log_api_info('API -> iden_joint_friction -> code=%s', ret[0], code=ret[0])
         return self._check_code(ret[0]), 0 if int(ret[1]) == 0 else -1
 
     @xarm_wait_until_not_pause